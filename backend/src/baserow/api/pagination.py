@@ -1,9 +1,20 @@
-from rest_framework.exceptions import APIException, NotFound
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Any, List
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+
+from rest_framework.exceptions import APIException, NotFound, ValidationError
 from rest_framework.pagination import (
     PageNumberPagination as RestFrameworkPageNumberPagination,
 )
+from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
 
+from baserow.core.db import KeysetPaginator
+
 
 class PageNumberPagination(RestFrameworkPageNumberPagination):
     # Please keep the default page size in sync with the default prop pageSize in
@@ -39,3 +50,100 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
             exception = APIException({"error": "ERROR_INVALID_PAGE", "detail": str(e)})
             exception.status_code = HTTP_400_BAD_REQUEST
             raise exception
+
+
+class KeysetCursorPagination:
+    """
+    Opt-in pagination that seeks through the queryset using an opaque cursor
+    containing the ordering values of the last row of the previous page. Contrary
+    to the page and limit/offset paginations, the cost of a page doesn't grow with
+    its depth, and the queryset is never counted.
+    """
+
+    # Please keep the default page size in sync with `PageNumberPagination`.
+    page_size = 100
+    page_size_query_param = "size"
+    cursor_query_param = "cursor"
+
+    def __init__(self, limit_page_size=None):
+        self.limit_page_size = limit_page_size
+        self.next_cursor = None
+
+    @classmethod
+    def is_requested(cls, request) -> bool:
+        """
+        Returns whether the client opted in to the cursor pagination by providing
+        the cursor query parameter. An empty value requests the first page.
+        """
+
+        return cls.cursor_query_param in request.GET
+
+    def _raise(self, error, detail):
+        exception = APIException({"error": error, "detail": detail})
+        exception.status_code = HTTP_400_BAD_REQUEST
+        raise exception
+
+    def get_page_size(self, request):
+        page_size = request.GET.get(self.page_size_query_param, self.page_size)
+        try:
+            page_size = int(page_size)
+        except (TypeError, ValueError):
+            page_size = 0
+
+        if page_size <= 0:
+            self._raise(
+                "ERROR_INVALID_PAGE_SIZE", "The page size must be a positive integer."
+            )
+
+        if self.limit_page_size and page_size > self.limit_page_size:
+            self._raise(
+                "ERROR_PAGE_SIZE_LIMIT",
+                f"The page size is limited to {self.limit_page_size}.",
+            )
+
+        return page_size
+
+    def encode_cursor(self, paginator: KeysetPaginator, values: List[Any]) -> str:
+        data = json.dumps(
+            {"o": paginator.fingerprint, "v": values},
+            cls=DjangoJSONEncoder,
+            separators=(",", ":"),
+        )
+        return urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, paginator: KeysetPaginator, cursor: str) -> List[Any]:
+        try:
+            padding = "=" * (-len(cursor) % 4)
+            data = json.loads(urlsafe_b64decode(cursor + padding))
+            fingerprint, values = data["o"], data["v"]
+        except (TypeError, ValueError, KeyError, binascii.Error):
+            fingerprint, values = None, None
+
+        if fingerprint != paginator.fingerprint or not isinstance(values, list):
+            self._raise(
+                "ERROR_INVALID_CURSOR",
+                "The provided cursor is invalid or has been generated for a "
+                "different ordering.",
+            )
+
+        return values
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        paginator = KeysetPaginator(queryset)
+
+        cursor = request.GET.get(self.cursor_query_param, "")
+        after = self.decode_cursor(paginator, cursor) if cursor else None
+
+        try:
+            page, next_values = paginator.get_page(after, page_size)
+        except (ValueError, ValidationError, DjangoValidationError):
+            self._raise("ERROR_INVALID_CURSOR", "The provided cursor is invalid.")
+
+        if next_values is not None:
+            self.next_cursor = self.encode_cursor(paginator, next_values)
+
+        return page
+
+    def get_paginated_response(self, data):
+        return Response({"next_cursor": self.next_cursor, "results": data})
@@ -211,6 +211,12 @@ CHANNEL_LAYERS = {
         },
     },
 }
+# The realtime row events of a table are buffered in Redis for this number of
+# milliseconds and then sent as coalesced messages to the table page. Set to 0 to
+# send a message for every change right away.
+BASEROW_WS_ROW_EVENTS_COALESCE_MS = int(
+    os.getenv("BASEROW_WS_ROW_EVENTS_COALESCE_MS", "0")
+)
 
 # Database
 # https://docs.djangoproject.com/en/2.2/ref/settings/#databases
@@ -952,6 +958,11 @@ DEFAULT_APPLICATION_TEMPLATE = "project-tracker"
 BASEROW_SYNC_TEMPLATES_PATTERN = os.getenv("BASEROW_SYNC_TEMPLATES_PATTERN", None)
 
 MAX_FIELD_LIMIT = int(os.getenv("BASEROW_MAX_FIELD_LIMIT", 600))
+# The number of rows of which the values are converted per transaction when the
+# type of a field is converted online.
+BASEROW_ONLINE_FIELD_CONVERSION_BATCH_SIZE = int(
+    os.getenv("BASEROW_ONLINE_FIELD_CONVERSION_BATCH_SIZE", 10000)
+)
 
 INITIAL_MIGRATION_FULL_TEXT_SEARCH_MAX_FIELD_LIMIT = int(
     os.getenv(
@@ -972,6 +983,18 @@ HOURS_UNTIL_TRASH_PERMANENTLY_DELETED = int(
     os.getenv("HOURS_UNTIL_TRASH_PERMANENTLY_DELETED", 24 * 3)
 )
 OLD_TRASH_CLEANUP_CHECK_INTERVAL_MINUTES = 5
+# The maximum number of trash entries that are permanently deleted in one
+# transaction. It's halved automatically if the deletion exceeds the
+# `max_locks_per_transaction` of PostgreSQL.
+BASEROW_PERMANENT_TRASH_DELETION_BATCH_SIZE = int(
+    os.getenv("BASEROW_PERMANENT_TRASH_DELETION_BATCH_SIZE", 20)
+)
+# The number of tasks that permanently delete the marked trash in parallel. Every
+# application is only processed by one task at a time, and deleting a workspace or
+# application waits until no task is processing the workspace.
+BASEROW_PERMANENT_TRASH_DELETION_CONCURRENCY = int(
+    os.getenv("BASEROW_PERMANENT_TRASH_DELETION_CONCURRENCY", 1)
+)
 
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
@@ -1033,6 +1056,21 @@ BASEROW_WEBHOOKS_URL_REGEX_BLACKLIST = [
 BASEROW_WEBHOOKS_URL_CHECK_TIMEOUT_SECS = int(
     os.getenv("BASEROW_WEBHOOKS_URL_CHECK_TIMEOUT_SECS", "10")
 )
+# If enabled, webhook calls are stored as pending calls and sent in batches by a
+# single dispatcher task over a pooled async HTTP client, instead of running a
+# Celery task for every call.
+BASEROW_WEBHOOKS_BATCH_DISPATCH = str_to_bool(
+    os.getenv("BASEROW_WEBHOOKS_BATCH_DISPATCH", "false")
+)
+BASEROW_WEBHOOKS_BATCH_SIZE = int(os.getenv("BASEROW_WEBHOOKS_BATCH_SIZE", 500))
+# The maximum number of concurrent connections of the batched dispatcher in total
+# and per target host.
+BASEROW_WEBHOOKS_BATCH_MAX_CONNECTIONS = int(
+    os.getenv("BASEROW_WEBHOOKS_BATCH_MAX_CONNECTIONS", 100)
+)
+BASEROW_WEBHOOKS_BATCH_MAX_CONNECTIONS_PER_HOST = int(
+    os.getenv("BASEROW_WEBHOOKS_BATCH_MAX_CONNECTIONS_PER_HOST", 10)
+)
 
 # ======== WARNING ========
 # Please read and understand everything at:
@@ -1173,6 +1211,18 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 APPEND_SLASH = False
 
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# The maximum number of formula parse trees every process keeps in memory.
+BASEROW_FORMULA_PARSE_TREE_CACHE_SIZE = int(
+    os.getenv("BASEROW_FORMULA_PARSE_TREE_CACHE_SIZE", 512)
+)
+# The maximum number of generated table model classes every process keeps in memory.
+# Zero disables the in-process cache and only the Redis cache is used.
+BASEROW_MODEL_L1_CACHE_SIZE = int(os.getenv("BASEROW_MODEL_L1_CACHE_SIZE", 0))
+# If enabled, the UPDATE statements of dependant fields of all the tables at the same
+# dependency level are executed in a single query instead of one query per table.
+BASEROW_PIPELINE_FIELD_UPDATE_STATEMENTS = str_to_bool(
+    os.getenv("BASEROW_PIPELINE_FIELD_UPDATE_STATEMENTS", "true")
+)
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
@@ -1201,9 +1251,25 @@ CELERY_SEARCH_UPDATE_HARD_TIME_LIMIT = int(
 USE_PG_FULLTEXT_SEARCH = str_to_bool(
     (os.getenv("BASEROW_USE_PG_FULLTEXT_SEARCH", "true"))
 )
+# If enabled, the search vectors of newly created tables are stored in a narrow
+# companion table keyed by row id instead of a `tsvector` column per field. Existing
+# tables can be migrated with the `migrate_table_tsvectors` management command.
+USE_PG_FULLTEXT_SEARCH_TABLE = str_to_bool(
+    os.getenv("BASEROW_USE_PG_FULLTEXT_SEARCH_TABLE", "false")
+)
 PG_SEARCH_CONFIG = os.getenv("BASEROW_PG_SEARCH_CONFIG", "simple")
 AUTO_VACUUM_AFTER_SEARCH_UPDATE = str_to_bool(os.getenv("BASEROW_AUTO_VACUUM", "true"))
 TSV_UPDATE_CHUNK_SIZE = int(os.getenv("BASEROW_TSV_UPDATE_CHUNK_SIZE", "2000"))
+# When set to a value larger than 0 and the cache is backed by Redis, the tsvector
+# update requests of a table are coalesced and only executed after no new requests
+# came in for this number of seconds, but at most the max latency after the first
+# request. Defaults to 0, which enqueues an update for every change.
+TSV_UPDATE_DEBOUNCE_SECONDS = float(
+    os.getenv("BASEROW_TSV_UPDATE_DEBOUNCE_SECONDS", "0")
+)
+TSV_UPDATE_MAX_LATENCY_SECONDS = float(
+    os.getenv("BASEROW_TSV_UPDATE_MAX_LATENCY_SECONDS", "30")
+)
 
 POSTHOG_PROJECT_API_KEY = os.getenv("POSTHOG_PROJECT_API_KEY", "")
 POSTHOG_HOST = os.getenv("POSTHOG_HOST", "")
@@ -1218,6 +1284,18 @@ BASEROW_BUILDER_DOMAINS = os.getenv("BASEROW_BUILDER_DOMAINS", None)
 BASEROW_BUILDER_DOMAINS = (
     BASEROW_BUILDER_DOMAINS.split(",") if BASEROW_BUILDER_DOMAINS is not None else []
 )
+# The number of threads used to dispatch the data sources of a page. Data sources
+# that don't depend on each other are dispatched concurrently, each thread using its
+# own database connection. One dispatches them sequentially.
+BASEROW_BUILDER_DATA_SOURCES_DISPATCH_WORKERS = int(
+    os.getenv("BASEROW_BUILDER_DATA_SOURCES_DISPATCH_WORKERS", 1)
+)
+# The number of seconds the result of a local Baserow list rows data source dispatch
+# is shared between the visitors of an application. The cached results of a table are
+# invalidated when its rows, fields or views change. Zero disables the cache.
+BASEROW_LOCAL_BASEROW_DISPATCH_CACHE_TTL = int(
+    os.getenv("BASEROW_LOCAL_BASEROW_DISPATCH_CACHE_TTL", 0)
+)
 
 # Indicates whether we are running the tests or not. Set to True in the test.py settings
 # file used by pytest.ini
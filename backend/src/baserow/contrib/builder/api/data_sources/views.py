@@ -1,5 +1,7 @@
+from contextlib import nullcontext
 from typing import Dict
 
+from django.conf import settings
 from django.db import transaction
 
 from drf_spectacular.types import OpenApiTypes
@@ -488,7 +490,6 @@ class DispatchDataSourcesView(APIView):
             ),
         },
     )
-    @transaction.atomic
     @map_exceptions(
         {
             PageDoesNotExist: ERROR_PAGE_DOES_NOT_EXIST,
@@ -498,16 +499,24 @@ class DispatchDataSourcesView(APIView):
     )
     def post(self, request, page_id: int):
         """
-        Call the given data_source related service dispatch method.
+        Call the given data_source related service dispatch method. The data sources
+        are dispatched in one transaction, unless they're dispatched concurrently,
+        because every worker then needs its own database connection.
         """
 
-        page = PageHandler().get_page(page_id)
+        if settings.BASEROW_BUILDER_DATA_SOURCES_DISPATCH_WORKERS > 1:
+            atomic = nullcontext()
+        else:
+            atomic = transaction.atomic()
 
-        dispatch_context = BuilderDispatchContext(request, page)
+        with atomic:
+            page = PageHandler().get_page(page_id)
 
-        service_contents = DataSourceService().dispatch_page_data_sources(
-            request.user, page, dispatch_context
-        )
+            dispatch_context = BuilderDispatchContext(request, page)
+
+            service_contents = DataSourceService().dispatch_page_data_sources(
+                request.user, page, dispatch_context
+            )
 
         responses = {}
 
@@ -1,7 +1,12 @@
-from typing import Any, Dict, Iterable, Optional, Union
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from copy import copy
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 from zipfile import ZipFile
 
+from django.conf import settings
 from django.core.files.storage import Storage
+from django.db import connection, connections
 from django.db.models import QuerySet
 
 from baserow.contrib.builder.data_sources.builder_dispatch_context import (
@@ -13,6 +18,7 @@ from baserow.contrib.builder.data_sources.exceptions import (
 )
 from baserow.contrib.builder.data_sources.models import DataSource
 from baserow.contrib.builder.formula_importer import import_formula
+from baserow.contrib.builder.formula_references import get_formula_data_paths
 from baserow.contrib.builder.pages.models import Page
 from baserow.contrib.builder.types import DataSourceDict
 from baserow.core.integrations.models import Integration
@@ -20,7 +26,7 @@ from baserow.core.integrations.registries import integration_type_registry
 from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.models import Service
 from baserow.core.services.registries import ServiceType
-from baserow.core.utils import find_unused_name
+from baserow.core.utils import find_unused_name, to_path
 
 from .types import DataSourceForUpdate
 
@@ -320,7 +326,12 @@ class DataSourceHandler:
         self, data_sources, dispatch_context: BuilderDispatchContext
     ):
         """
-        Dispatch the service related to the data_sources.
+        Dispatch the service related to the data_sources. When more than one worker
+        is configured with the `BASEROW_BUILDER_DATA_SOURCES_DISPATCH_WORKERS`
+        setting, the data sources that don't depend on each other are dispatched
+        concurrently. This only happens outside of an atomic block, because the
+        worker threads use their own database connections, which can't see the
+        uncommitted changes of the current transaction.
 
         :param data_sources: The data sources to be dispatched.
         :param dispatch_context: The context used for the dispatch.
@@ -329,20 +340,142 @@ class DataSourceHandler:
             result for this data source.
         """
 
+        max_workers = settings.BASEROW_BUILDER_DATA_SOURCES_DISPATCH_WORKERS
+        if max_workers > 1 and len(data_sources) > 1 and not connection.in_atomic_block:
+            return self._dispatch_data_sources_concurrently(
+                data_sources, dispatch_context, max_workers
+            )
+
         data_sources_dispatch = {}
         for data_source in data_sources:
-            # Add the initial call to the call stack
-            dispatch_context.add_call(data_source.id)
-            try:
-                data_sources_dispatch[data_source.id] = self.dispatch_data_source(
-                    data_source, dispatch_context
-                )
-            except Exception as e:
-                data_sources_dispatch[data_source.id] = e
+            data_sources_dispatch[data_source.id] = self._dispatch_data_source_safe(
+                data_source, dispatch_context
+            )
+
+        return data_sources_dispatch
+
+    def _dispatch_data_source_safe(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> Any:
+        """
+        Dispatches the data source with a new call stack and returns the exception
+        instead of raising it if the dispatch fails.
+        """
+
+        # Add the initial call to the call stack
+        dispatch_context.add_call(data_source.id)
+        try:
+            return self.dispatch_data_source(data_source, dispatch_context)
+        except Exception as e:
+            return e
+        finally:
             # Reset the stack as we are starting a new dispatch
             dispatch_context.reset_call_stack()
 
-        return data_sources_dispatch
+    def _dispatch_data_source_in_thread(
+        self, data_source: DataSource, dispatch_context: BuilderDispatchContext
+    ) -> Any:
+        """
+        Dispatches the data source from a worker thread. The thread gets its own
+        call stack to detect recursions, but shares the cache of the dispatch
+        context so that the results are available to the other data sources.
+        """
+
+        thread_dispatch_context = copy(dispatch_context)
+        thread_dispatch_context.reset_call_stack()
+        try:
+            return self._dispatch_data_source_safe(data_source, thread_dispatch_context)
+        finally:
+            # Every thread uses its own database connection, it must be closed
+            # because the thread is not reused by Django.
+            connections.close_all()
+
+    def _dispatch_data_sources_concurrently(
+        self,
+        data_sources: List[DataSource],
+        dispatch_context: BuilderDispatchContext,
+        max_workers: int,
+    ) -> Dict[int, Union[Any, Exception]]:
+        """
+        Dispatches the data sources on a thread pool. A data source is only
+        dispatched when all the data sources it depends on have been dispatched, so
+        that their result can be taken from the cache. Data sources with circular
+        dependencies are dispatched sequentially to report the recursion error.
+        """
+
+        data_sources_by_id = {
+            data_source.id: data_source for data_source in data_sources
+        }
+        graph = {
+            data_source.id: self.get_data_source_dependencies(data_source)
+            & data_sources_by_id.keys()
+            for data_source in data_sources
+        }
+
+        sorter = TopologicalSorter(graph)
+        try:
+            sorter.prepare()
+        except CycleError:
+            return {
+                data_source.id: self._dispatch_data_source_safe(
+                    data_source, dispatch_context
+                )
+                for data_source in data_sources
+            }
+
+        dispatch_context.cache.setdefault("data_source_contents", {})
+        data_sources_dispatch = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
+            while sorter.is_active():
+                for data_source_id in sorter.get_ready():
+                    future = executor.submit(
+                        self._dispatch_data_source_in_thread,
+                        data_sources_by_id[data_source_id],
+                        dispatch_context,
+                    )
+                    pending[future] = data_source_id
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    data_source_id = pending.pop(future)
+                    data_sources_dispatch[data_source_id] = future.result()
+                    sorter.done(data_source_id)
+
+        return {
+            data_source.id: data_sources_dispatch[data_source.id]
+            for data_source in data_sources
+        }
+
+    def get_data_source_dependencies(self, data_source: DataSource) -> Set[int]:
+        """
+        Returns the IDs of the data sources used by the formulas of the service of
+        the given data source.
+
+        :param data_source: The data source we want the dependencies for.
+        :return: The set of data source IDs.
+        """
+
+        from baserow.contrib.builder.data_providers.data_provider_types import (
+            DataSourceDataProviderType,
+        )
+
+        if not data_source.service_id:
+            return set()
+
+        service = data_source.service.specific
+        dependencies = set()
+        for formula in service.get_type().formula_generator(service):
+            for path in get_formula_data_paths(formula):
+                data_provider_name, *rest = to_path(path)
+                if data_provider_name != DataSourceDataProviderType.type or not rest:
+                    continue
+                try:
+                    dependencies.add(int(rest[0]))
+                except ValueError:
+                    pass
+
+        return dependencies
 
     def dispatch_data_source(
         self, data_source: DataSource, dispatch_context: BuilderDispatchContext
@@ -0,0 +1,61 @@
+from typing import Set
+
+from baserow.core.formula import BaserowFormula, BaserowFormulaVisitor
+from baserow.core.formula.parser.exceptions import BaserowFormulaSyntaxError
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+
+
+class BaserowFormulaDataPathsExtractor(BaserowFormulaVisitor):
+    """
+    This visitor collects the paths of all the `get()` function calls with a
+    literal string argument, for instance `data_source.2.field_25`.
+    """
+
+    def __init__(self):
+        self.paths = set()
+
+    def visitFunctionCall(self, ctx: BaserowFormula.FunctionCallContext):
+        function_name = ctx.func_name().getText().lower()
+        function_argument_expressions = ctx.expr()
+
+        if (
+            function_name == "get"
+            and function_argument_expressions
+            and isinstance(
+                function_argument_expressions[0], BaserowFormula.StringLiteralContext
+            )
+        ):
+            self.paths.add(self.process_string(function_argument_expressions[0]))
+
+        return self.visitChildren(ctx)
+
+    def process_string(self, ctx):
+        literal_without_outer_quotes = ctx.getText()[1:-1]
+        if ctx.SINGLEQ_STRING_LITERAL() is not None:
+            literal = literal_without_outer_quotes.replace("\\'", "'")
+        else:
+            literal = literal_without_outer_quotes.replace('\\"', '"')
+        return literal
+
+
+def get_formula_data_paths(formula: str) -> Set[str]:
+    """
+    Returns the paths of all the data used by the given formula. For example, the
+    formula `concat(get('data_source.2.field_25'), get('page_parameter.id'))`
+    uses the paths `data_source.2.field_25` and `page_parameter.id`.
+
+    :param formula: The formula to extract the paths from.
+    :return: The set of paths. Invalid formulas don't use any data.
+    """
+
+    if not formula:
+        return set()
+
+    try:
+        tree = get_parse_tree_for_formula(formula)
+    except BaserowFormulaSyntaxError:
+        return set()
+
+    extractor = BaserowFormulaDataPathsExtractor()
+    extractor.visit(tree)
+    return extractor.paths
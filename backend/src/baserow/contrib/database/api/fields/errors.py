@@ -167,3 +167,9 @@ ERROR_TABLE_HAS_NO_PRIMARY_FIELD = (
     HTTP_400_BAD_REQUEST,
     "The provided table does not have a primary field.",
 )
+ERROR_ONLINE_FIELD_CONVERSION_NOT_SUPPORTED = (
+    "ERROR_ONLINE_FIELD_CONVERSION_NOT_SUPPORTED",
+    HTTP_400_BAD_REQUEST,
+    "The field can't be converted online to the provided type and values. Update "
+    "the field directly instead.",
+)
@@ -472,6 +472,7 @@ class FieldView(APIView):
                 ]
             ),
             404: get_error_schema(["ERROR_FIELD_DOES_NOT_EXIST"]),
+            409: get_error_schema(["ERROR_FAILED_TO_LOCK_FIELD_DUE_TO_CONFLICT"]),
         },
     )
     @transaction.atomic
@@ -481,6 +482,7 @@ class FieldView(APIView):
             UserNotInWorkspace: ERROR_USER_NOT_IN_GROUP,
             CannotDeletePrimaryField: ERROR_CANNOT_DELETE_PRIMARY_FIELD,
             CannotDeleteAlreadyDeletedItem: ERROR_CANNOT_DELETE_ALREADY_DELETED_ITEM,
+            FailedToLockFieldDueToConflict: ERROR_FAILED_TO_LOCK_FIELD_DUE_TO_CONFLICT,
         }
     )
     def delete(self, request, field_id):
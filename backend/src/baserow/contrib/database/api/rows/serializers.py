@@ -1,11 +1,14 @@
 from copy import deepcopy
-from typing import Dict, List
+from typing import Any, Dict, Iterable, List, Optional
 
 from django.conf import settings
 from django.db.models.base import ModelBase
+from django.db.models.manager import BaseManager
 
 from loguru import logger
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject, RelatedField
 
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.utils import get_serializer_class
@@ -13,6 +16,7 @@ from baserow.contrib.database.api.rows.fields import UserFieldNamesField
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.models import RowHistory
 from baserow.contrib.database.rows.registries import row_metadata_registry
+from baserow.contrib.database.rows.serialized_rows_cache import SerializedRowsCache
 
 
 class RowSerializer(serializers.ModelSerializer):
@@ -24,13 +28,44 @@ class RowSerializer(serializers.ModelSerializer):
         extra_kwargs = {"id": {"read_only": True}, "order": {"read_only": True}}
 
 
-def serialize_rows_for_response(rows, model, user_field_names=False, many=True):
-    return get_row_serializer_class(
-        model,
-        RowSerializer,
-        is_response=True,
-        user_field_names=user_field_names,
-    )(rows, many=many).data
+def serialize_rows_for_response(
+    rows,
+    model,
+    user_field_names=False,
+    many=True,
+    field_ids=None,
+    serialized_rows_cache: Optional[SerializedRowsCache] = None,
+):
+    """
+    Serializes the rows in the same way as the response row serializer generated
+    by `get_row_serializer_class(model, RowSerializer, is_response=True)`, but using
+    the compiled row serializer of the model, which is a lot faster.
+
+    :param rows: The rows to serialize, or a single row if `many` is False.
+    :param model: The generated table model of the rows.
+    :param user_field_names: Whether the keys must be the names of the fields.
+    :param many: Indicates whether a list of rows is provided.
+    :param field_ids: If provided, only these fields are included.
+    :param serialized_rows_cache: If provided, rows that have already been serialized
+        with the same fields are taken from this cache and the newly serialized
+        rows are added to it.
+    :return: A list of serialized rows or a single serialized row.
+    """
+
+    serializer = get_compiled_row_serializer(
+        model, field_ids=field_ids, user_field_names=user_field_names
+    )
+    if serialized_rows_cache is not None:
+        serialized_rows = serialized_rows_cache.get_or_serialize(
+            model,
+            get_compiled_row_serializer_cache_key(field_ids, user_field_names),
+            rows if many else [rows],
+            serializer.to_representation,
+        )
+        return serialized_rows if many else serialized_rows[0]
+    if many:
+        return serializer.to_representation_many(rows)
+    return serializer.to_representation(rows)
 
 
 def get_row_serializer_class(
@@ -130,6 +165,124 @@ def get_row_serializer_class(
     )
 
 
+class CompiledRowSerializer:
+    """
+    Serializes rows of a generated table model exactly like the response row
+    serializer, but without the generic DRF serializer machinery for every cell. The
+    serializer fields are only created and bound once, and every value is then
+    converted by the plain function provided by the
+    `get_response_serializer_extractor` method of its field type.
+    """
+
+    def __init__(self, model, serializer_class):
+        field_objects_by_name = {
+            field_object["name"]: field_object
+            for field_object in model._field_objects.values()
+        }
+
+        self.fields = []
+        for serializer_field in serializer_class().fields.values():
+            if serializer_field.write_only:
+                continue
+
+            field_object = field_objects_by_name.get(serializer_field.source)
+            if field_object is not None:
+                extractor = field_object["type"].get_response_serializer_extractor(
+                    field_object["field"], serializer_field
+                )
+            else:
+                extractor = serializer_field.to_representation
+
+            # The value can directly be read from the row if it's not a related
+            # field or a field with a nested source.
+            attribute_name = (
+                serializer_field.source_attrs[0]
+                if len(serializer_field.source_attrs) == 1
+                and not isinstance(serializer_field, RelatedField)
+                else None
+            )
+            self.fields.append(
+                (
+                    serializer_field.field_name,
+                    serializer_field,
+                    attribute_name,
+                    extractor,
+                )
+            )
+
+    def _get_attribute(self, serializer_field, attribute_name: Optional[str], row):
+        if attribute_name is not None:
+            try:
+                value = getattr(row, attribute_name)
+                # Related managers are callable, but never called by DRF.
+                if not callable(value) or isinstance(value, BaseManager):
+                    return value
+            except AttributeError:
+                pass
+
+        attribute = serializer_field.get_attribute(row)
+        if isinstance(attribute, PKOnlyObject) and attribute.pk is None:
+            return None
+        return attribute
+
+    def to_representation(self, row) -> Dict[str, Any]:
+        representation = {}
+        for field_name, serializer_field, attribute_name, extractor in self.fields:
+            try:
+                value = self._get_attribute(serializer_field, attribute_name, row)
+            except SkipField:
+                continue
+
+            representation[field_name] = None if value is None else extractor(value)
+
+        return representation
+
+    def to_representation_many(self, rows: Iterable) -> List[Dict[str, Any]]:
+        return [self.to_representation(row) for row in rows]
+
+
+def get_compiled_row_serializer_cache_key(
+    field_ids: Optional[Iterable[int]], user_field_names: bool
+):
+    return (
+        None if field_ids is None else tuple(sorted(set(field_ids))),
+        user_field_names,
+    )
+
+
+def get_compiled_row_serializer(
+    model, field_ids: Optional[Iterable[int]] = None, user_field_names: bool = False
+) -> CompiledRowSerializer:
+    """
+    Returns the compiled response row serializer of the model for the provided
+    fields. The compiled serializers are cached on the model, so they only have to
+    be generated once for every model and field selection.
+
+    :param model: The generated table model.
+    :param field_ids: If provided only these fields are included.
+    :param user_field_names: Whether the keys must be the names of the fields.
+    :return: The compiled row serializer.
+    """
+
+    cache_key = get_compiled_row_serializer_cache_key(field_ids, user_field_names)
+    compiled_serializers = model.__dict__.get("_compiled_row_serializers")
+    if compiled_serializers is None:
+        compiled_serializers = {}
+        model._compiled_row_serializers = compiled_serializers
+
+    if cache_key not in compiled_serializers:
+        serializer_class = get_row_serializer_class(
+            model,
+            RowSerializer,
+            is_response=True,
+            field_ids=field_ids,
+            user_field_names=user_field_names,
+        )
+        compiled_serializers[cache_key] = CompiledRowSerializer(model, serializer_class)
+
+    return compiled_serializers[cache_key]
+
+
 def get_batch_row_serializer_class(row_serializer_class):
     class_name = "BatchRowSerializer"
 
@@ -159,6 +312,15 @@ class BatchDeleteRowsSerializer(serializers.Serializer):
     )
 
 
+class BatchMoveRowsSerializer(serializers.Serializer):
+    items = serializers.ListField(
+        child=serializers.IntegerField(),
+        min_length=1,
+        max_length=settings.BATCH_ROWS_SIZE_LIMIT,
+    )
+    before_id = serializers.IntegerField(required=False, allow_null=True)
+
+
 def get_example_row_serializer_class(example_type="get", user_field_names=False):
     """
     Generates a serializer containing a field for each field type. It is only used for
@@ -2,6 +2,7 @@ from django.urls import re_path
 
 from .views import (
     BatchDeleteRowsView,
+    BatchMoveRowsView,
     BatchRowsView,
     RowAdjacentView,
     RowHistoryView,
@@ -35,6 +36,11 @@ urlpatterns = [
         BatchDeleteRowsView.as_view(),
         name="batch-delete",
     ),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/batch-move/$",
+        BatchMoveRowsView.as_view(),
+        name="batch-move",
+    ),
     re_path(
         r"table/(?P<table_id>[0-9]+)/(?P<row_id>[0-9]+)/move/$",
         RowMoveView.as_view(),
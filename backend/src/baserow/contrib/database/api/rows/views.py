@@ -24,7 +24,7 @@ from baserow.api.exceptions import (
     QueryParameterValidationException,
     RequestBodyValidationException,
 )
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import KeysetCursorPagination, PageNumberPagination
 from baserow.api.schemas import (
     CLIENT_SESSION_ID_SCHEMA_PARAMETER,
     CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
@@ -74,6 +74,7 @@ from baserow.contrib.database.rows.actions import (
     DeleteRowActionType,
     DeleteRowsActionType,
     MoveRowActionType,
+    MoveRowsActionType,
     UpdateRowsActionType,
 )
 from baserow.contrib.database.rows.exceptions import RowDoesNotExist, RowIdsNotUnique
@@ -114,6 +115,7 @@ from .schemas import row_names_response_schema
 from .serializers import (
     BatchCreateRowsQueryParamsSerializer,
     BatchDeleteRowsSerializer,
+    BatchMoveRowsSerializer,
     CreateRowQueryParamsSerializer,
     ListRowsQueryParamsSerializer,
     MoveRowQueryParamsSerializer,
@@ -302,6 +304,16 @@ class RowsView(APIView):
                 type=OpenApiTypes.INT,
                 description="Includes all the filters and sorts of the provided view.",
             ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="If provided, the rows are paginated by cursor instead "
+                "of by page. An empty value returns the first page and the "
+                "`next_cursor` of the response can be provided to fetch the next "
+                "page. The rows are not counted in this mode, which keeps deep pages "
+                "fast. The `size` parameter defines how many rows are returned.",
+            ),
             SEARCH_MODE_API_PARAM,
         ],
         tags=["Database table rows"],
@@ -309,7 +321,7 @@ class RowsView(APIView):
         description=(
             "Lists all the rows of the table related to the provided parameter if the "
             "user has access to the related database's workspace. The response is "
-            "paginated by a page/size style. It is also possible to provide an "
+            "paginated by a page/size or cursor style. It is also possible to provide an "
             "optional search query, only rows where the data matches the search query "
             "are going to be returned then. The properties of the returned rows "
             "depends on which fields the table has. For a complete overview of fields "
@@ -328,6 +340,8 @@ class RowsView(APIView):
                     "ERROR_REQUEST_BODY_VALIDATION",
                     "ERROR_PAGE_SIZE_LIMIT",
                     "ERROR_INVALID_PAGE",
+                    "ERROR_INVALID_PAGE_SIZE",
+                    "ERROR_INVALID_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
@@ -447,7 +461,14 @@ class RowsView(APIView):
         if order_by:
             queryset = queryset.order_by_fields_string(order_by, user_field_names)
 
-        paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        if KeysetCursorPagination.is_requested(request):
+            paginator = KeysetCursorPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT
+            )
+        else:
+            paginator = PageNumberPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT
+            )
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
             model,
@@ -1378,6 +1399,99 @@ class BatchDeleteRowsView(APIView):
         return Response(status=204)
 
 
+class BatchMoveRowsView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Moves the rows in the table related to the value.",
+            ),
+            OpenApiParameter(
+                name="user_field_names",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "A flag query parameter that, if provided with one of the "
+                    "following values: `y`, `yes`, `true`, `t`, `on`, `1`, or an "
+                    "empty value, will cause the returned JSON to use the "
+                    "user-specified field names instead of the internal Baserow "
+                    "field names (e.g., field_123)."
+                ),
+            ),
+            CLIENT_SESSION_ID_SCHEMA_PARAMETER,
+            CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
+        ],
+        tags=["Database table rows"],
+        operation_id="batch_move_database_table_rows",
+        description="Moves the rows related to the provided `items` ids to another "
+        "position at once, in the order of the ids. If the `before_id` is provided "
+        "then the rows are moved before that row. If the `before_id` is not "
+        "provided, then the rows will be moved to the end.",
+        request=BatchMoveRowsSerializer,
+        responses={
+            200: get_example_batch_rows_serializer_class(
+                example_type="get", user_field_names=True
+            ),
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_ROW_IDS_NOT_UNIQUE",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(
+                ["ERROR_TABLE_DOES_NOT_EXIST", "ERROR_ROW_DOES_NOT_EXIST"]
+            ),
+        },
+    )
+    @transaction.atomic
+    @validate_body(BatchMoveRowsSerializer)
+    @map_exceptions(
+        {
+            UserNotInWorkspace: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            RowDoesNotExist: ERROR_ROW_DOES_NOT_EXIST,
+            RowIdsNotUnique: ERROR_ROW_IDS_NOT_UNIQUE,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+        }
+    )
+    def patch(self, request: Request, table_id: int, data: Dict[str, Any]) -> Response:
+        """Moves the rows to another position at once."""
+
+        table = TableHandler().get_table(table_id)
+        TokenHandler().check_table_permissions(request, "update", table, False)
+
+        user_field_names = extract_user_field_names_from_params(request.GET)
+
+        model = table.get_model()
+
+        before_id = data.get("before_id")
+        before_row = (
+            RowHandler().get_row(request.user, table, before_id, model=model)
+            if before_id
+            else None
+        )
+
+        rows = action_type_registry.get_by_type(MoveRowsActionType).do(
+            request.user, table, data["items"], before_row=before_row, model=model
+        )
+
+        response_row_serializer_class = get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=user_field_names
+        )
+        response_serializer_class = get_batch_row_serializer_class(
+            response_row_serializer_class
+        )
+        response_serializer = response_serializer_class({"items": rows})
+        return Response(response_serializer.data)
+
+
 class RowAdjacentView(APIView):
     permission_classes = (IsAuthenticated,)
 
@@ -15,7 +15,7 @@ from baserow.api.decorators import (
     validate_query_parameters,
 )
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import KeysetCursorPagination, PageNumberPagination
 from baserow.api.schemas import get_error_schema
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.serializers import get_example_pagination_serializer_class
@@ -32,6 +32,7 @@ from baserow.contrib.database.api.rows.serializers import (
     get_example_row_metadata_field_serializer,
     get_example_row_serializer_class,
     get_row_serializer_class,
+    serialize_rows_for_response,
 )
 from baserow.contrib.database.api.utils import get_include_exclude_field_ids
 from baserow.contrib.database.api.views.errors import (
@@ -156,6 +157,16 @@ class GridViewView(APIView):
                 description="Can only be used in combination with the `page` parameter "
                 "and defines how many rows should be returned.",
             ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="If provided, the rows are paginated by cursor instead "
+                "of by page or offset. An empty value returns the first page and the "
+                "`next_cursor` of the response can be provided to fetch the next "
+                "page. The rows are not counted in this mode, which keeps deep pages "
+                "fast. The `size` parameter defines how many rows are returned.",
+            ),
             OpenApiParameter(
                 name="search",
                 location=OpenApiParameter.QUERY,
@@ -257,9 +268,9 @@ class GridViewView(APIView):
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`view_id` if the authorized user has access to the database's workspace. "
-            "The response is paginated either by a limit/offset or page/size style. "
-            "The style depends on the provided GET parameters. The properties of the "
-            "returned rows depends on which fields the table has. For a complete "
+            "The response is paginated either by a limit/offset, page/size or cursor "
+            "style. The style depends on the provided GET parameters. The properties "
+            "of the returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
             "list them all. In the example all field types are listed, but normally "
             "the number in field_{id} key is going to be the id of the field. "
@@ -293,6 +304,8 @@ class GridViewView(APIView):
                     "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
                     "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
                     "ERROR_FILTERS_PARAM_VALIDATION_ERROR",
+                    "ERROR_INVALID_CURSOR",
+                    "ERROR_INVALID_PAGE_SIZE",
                 ]
             ),
             404: get_error_schema(
@@ -316,9 +329,10 @@ class GridViewView(APIView):
     @validate_query_parameters(SearchQueryParamSerializer, return_validated=True)
     def get(self, request, view_id, field_options, row_metadata, query_params):
         """
-        Lists all the rows of a grid view, paginated either by a page or offset/limit.
-        If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        Lists all the rows of a grid view, paginated either by a page, offset/limit
+        or cursor. If the cursor get parameter is provided the cursor pagination will
+        be used, if the limit get parameter is provided the limit/offset pagination
+        will be used, else the page number pagination.
 
         Optionally the field options can also be included in the response if the
         `field_options` are provided in the include GET parameter.
@@ -370,21 +384,17 @@ class GridViewView(APIView):
         if "count" in request.GET:
             return Response({"count": queryset.count()})
 
-        if LimitOffsetPagination.limit_query_param in request.GET:
+        if KeysetCursorPagination.is_requested(request):
+            paginator = KeysetCursorPagination()
+        elif LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPagination()
         else:
             paginator = PageNumberPagination()
 
         page = paginator.paginate_queryset(queryset, request, self)
-        serializer_class = get_row_serializer_class(
-            model,
-            RowSerializer,
-            is_response=True,
-            field_ids=field_ids,
-        )
-        serializer = serializer_class(page, many=True)
+        serialized_rows = serialize_rows_for_response(page, model, field_ids=field_ids)
 
-        response = paginator.get_paginated_response(serializer.data)
+        response = paginator.get_paginated_response(serialized_rows)
 
         if view_type.can_group_by and view.viewgroupby_set.all():
             group_by_fields = [
@@ -1198,11 +1208,8 @@ class PublicGridViewRowsView(APIView):
             paginator = PageNumberPagination()
 
         page = paginator.paginate_queryset(queryset, request, self)
-        serializer_class = get_row_serializer_class(
-            model, RowSerializer, is_response=True, field_ids=field_ids
-        )
-        serializer = serializer_class(page, many=True)
-        response = paginator.get_paginated_response(serializer.data)
+        serialized_rows = serialize_rows_for_response(page, model, field_ids=field_ids)
+        response = paginator.get_paginated_response(serialized_rows)
 
         if field_options:
             context = {"field_options": publicly_visible_field_options}
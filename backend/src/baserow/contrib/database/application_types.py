@@ -15,6 +15,8 @@ from django.urls import include, path
 from django.utils import timezone, translation
 from django.utils.translation import gettext as _
 
+from psycopg2 import sql
+
 from baserow.contrib.database.api.serializers import DatabaseSerializer
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.field_cache import FieldCache
@@ -38,6 +40,11 @@ from .db.atomic import read_repeatable_single_database_atomic_transaction
 from .export_serialized import DatabaseExportSerializedStructure
 from .fields.utils import DeferredFieldImporter, DeferredForeignKeyUpdater
 from .search.handler import SearchHandler
+from .table.constants import (
+    CREATED_BY_COLUMN_NAME,
+    LAST_MODIFIED_BY_COLUMN_NAME,
+    ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
+)
 from .table.models import GeneratedTableModel, Table
 
 
@@ -117,6 +124,16 @@ class DatabaseApplicationType(ApplicationType):
                     view_type.export_serialized(view, table_cache, files_zip, storage)
                 )
 
+            # If the export is imported in the same database right away and all the
+            # field values can be copied with SQL, the rows don't have to be
+            # serialized because they're copied from this table while importing.
+            copy_rows_in_database = import_export_config.copy_rows_in_database and all(
+                field_type_registry.get_by_model(
+                    field.specific
+                ).can_copy_rows_in_database
+                for field in fields
+            )
+
             model = table.get_model(fields=fields, add_dependencies=False)
             serialized_rows = []
             row_queryset = model.objects.all()
@@ -124,6 +141,8 @@ class DatabaseApplicationType(ApplicationType):
                 row_queryset = row_queryset.select_related("created_by")
             if table.last_modified_by_column_added:
                 row_queryset = row_queryset.select_related("last_modified_by")
+            if copy_rows_in_database:
+                row_queryset = row_queryset.none()
             for row in row_queryset:
                 serialized_row = DatabaseExportSerializedStructure.row(
                     id=row.id,
@@ -148,6 +167,7 @@ class DatabaseApplicationType(ApplicationType):
                 fields=serialized_fields,
                 views=serialized_views,
                 rows=serialized_rows,
+                copy_rows_in_database=copy_rows_in_database,
             )
 
             for serialized_structure in serialization_processor_registry.get_all():
@@ -582,6 +602,15 @@ class DatabaseApplicationType(ApplicationType):
                     else:
                         already_filled_up_through_table_names.add(db_table)
 
+            if serialized_table.get("copy_rows_in_database", False):
+                self._copy_table_rows_in_database(
+                    serialized_table,
+                    user_email_mapping,
+                    m2m_fields_to_not_import_as_already_done,
+                    id_mapping,
+                    table_cache,
+                )
+
             for serialized_row in serialized_table["rows"]:
                 (
                     created_on,
@@ -651,6 +680,210 @@ class DatabaseApplicationType(ApplicationType):
         # total progress of this import.
         self._after_rows_imported(imported_fields, progress)
 
+    def _copy_table_rows_in_database(
+        self,
+        serialized_table: Dict[str, Any],
+        user_email_mapping: Dict[str, Any],
+        m2m_fields_to_not_import_as_already_done: Set[str],
+        id_mapping: Dict[str, Any],
+        cache: Dict[str, Any],
+    ):
+        """
+        Copies the rows and the many to many relationships of the exported table
+        into the imported table using `INSERT INTO ... SELECT` queries, instead of
+        inserting the serialized rows. This only works for tables exported with the
+        `copy_rows_in_database` config because the exported table must still exist in
+        the same database. Referenced ids, like select options and users, are mapped
+        using the `get_copy_rows_in_database_mapping` method of the field types.
+
+        :param serialized_table: The serialized table to copy the rows for.
+        :param user_email_mapping: A mapping of user emails to user instances.
+        :param m2m_fields_to_not_import_as_already_done: The names of the many to many
+            fields of which the through table has already been filled up.
+        :param id_mapping: A mapping of any ids that might be referenced in the
+            serialized table to their new ids.
+        :param cache: An in memory dictionary that is shared between all tables.
+        """
+
+        table_model = serialized_table["_model"]
+        source_table = Table.objects.get(id=serialized_table["id"])
+        source_model = source_table.get_model(
+            field_ids=[f["id"] for f in serialized_table["fields"]],
+            add_dependencies=False,
+        )
+        source_field_ids = {
+            id_mapping["database_fields"][f["id"]]: f["id"]
+            for f in serialized_table["fields"]
+        }
+        source_field_names = {f.name for f in source_model._meta.concrete_fields}
+        target_field_names = {f.name for f in table_model._meta.concrete_fields}
+        user_ids_mapping = {user.id: user.id for user in user_email_mapping.values()}
+
+        columns = []
+        joins = []
+        params = []
+
+        def source_column_with_mapping(source_column, mapping):
+            if mapping is None:
+                return sql.SQL("source.{column}").format(
+                    column=sql.Identifier(source_column)
+                )
+
+            alias = sql.Identifier(f"mapping_{len(joins)}")
+            joins.append(
+                sql.SQL(
+                    "LEFT JOIN unnest(%s::bigint[], %s::bigint[]) "
+                    "AS {alias}(source_id, target_id) "
+                    "ON {alias}.source_id = source.{column}"
+                ).format(alias=alias, column=sql.Identifier(source_column))
+            )
+            params.extend([list(mapping.keys()), list(mapping.values())])
+            return sql.SQL("{alias}.target_id").format(alias=alias)
+
+        for name in ["id", "order", "created_on", "updated_on"]:
+            columns.append((name, source_column_with_mapping(name, None)))
+        columns.append(("trashed", sql.Literal(False)))
+        if ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME in target_field_names:
+            columns.append((ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME, sql.Literal(True)))
+        for name in [CREATED_BY_COLUMN_NAME, LAST_MODIFIED_BY_COLUMN_NAME]:
+            if name in target_field_names and name in source_field_names:
+                column = table_model._meta.get_field(name).column
+                columns.append(
+                    (column, source_column_with_mapping(column, user_ids_mapping))
+                )
+
+        m2m_fields = []
+        for field_object in table_model._field_objects.values():
+            field = field_object["field"]
+            model_field = table_model._meta.get_field(field_object["name"])
+            source_model_field = source_model._meta.get_field(
+                f"field_{source_field_ids[field.id]}"
+            )
+            mapping = field_object["type"].get_copy_rows_in_database_mapping(
+                field, id_mapping, cache
+            )
+            if isinstance(model_field, models.ManyToManyField):
+                if model_field.name not in m2m_fields_to_not_import_as_already_done:
+                    m2m_fields.append((model_field, source_model_field, mapping))
+            else:
+                columns.append(
+                    (
+                        model_field.column,
+                        source_column_with_mapping(source_model_field.column, mapping),
+                    )
+                )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    """
+                    INSERT INTO {target_table} ({target_columns})
+                    SELECT {source_columns} FROM {source_table} AS source {joins}
+                    WHERE NOT source.trashed
+                    """
+                ).format(
+                    target_table=sql.Identifier(table_model._meta.db_table),
+                    target_columns=sql.SQL(", ").join(
+                        sql.Identifier(column) for column, _ in columns
+                    ),
+                    source_columns=sql.SQL(", ").join(
+                        source_column for _, source_column in columns
+                    ),
+                    source_table=sql.Identifier(source_model._meta.db_table),
+                    joins=sql.SQL(" ").join(joins),
+                ),
+                params,
+            )
+
+            for model_field, source_model_field, mapping in m2m_fields:
+                self._copy_m2m_relations_in_database(
+                    cursor, model_field, source_model_field, mapping, id_mapping
+                )
+
+    def _copy_m2m_relations_in_database(
+        self,
+        cursor,
+        model_field: models.ManyToManyField,
+        source_model_field: models.ManyToManyField,
+        mapping: Optional[Dict[int, int]],
+        id_mapping: Dict[str, Any],
+    ):
+        """
+        Copies the relations of the through table of the exported many to many field
+        into the through table of the imported one. Only the relations of rows that
+        are not trashed are copied, the referenced ids are mapped if a mapping is
+        provided and relations to ids that are not in the mapping are skipped.
+        """
+
+        source_row_model = source_model_field.model
+        related_model = source_model_field.remote_field.model
+        joins = [
+            sql.SQL(
+                "INNER JOIN {table} AS source_row "
+                "ON source_row.id = relation.{column} AND NOT source_row.trashed"
+            ).format(
+                table=sql.Identifier(source_row_model._meta.db_table),
+                column=sql.Identifier(source_model_field.m2m_column_name()),
+            )
+        ]
+        params = []
+        reverse_column = sql.SQL("relation.{column}").format(
+            column=sql.Identifier(source_model_field.m2m_reverse_name())
+        )
+
+        # The trashed rows of a related table are not copied, so relations to them
+        # must be skipped. If the related table is not copied, like when a single
+        # table is duplicated, the relations to its rows are kept.
+        if issubclass(related_model, GeneratedTableModel):
+            related_table_id = related_model.baserow_table_id
+            new_related_table_id = id_mapping["database_tables"].get(
+                related_table_id, related_table_id
+            )
+            if new_related_table_id != related_table_id:
+                joins.append(
+                    sql.SQL(
+                        "INNER JOIN {table} AS related_row "
+                        "ON related_row.id = {column} AND NOT related_row.trashed"
+                    ).format(
+                        table=sql.Identifier(related_model._meta.db_table),
+                        column=reverse_column,
+                    )
+                )
+
+        if mapping is not None:
+            joins.append(
+                sql.SQL(
+                    "INNER JOIN unnest(%s::bigint[], %s::bigint[]) "
+                    "AS mapping(source_id, target_id) ON mapping.source_id = {column}"
+                ).format(column=reverse_column)
+            )
+            params.extend([list(mapping.keys()), list(mapping.values())])
+            reverse_column = sql.SQL("mapping.target_id")
+
+        cursor.execute(
+            sql.SQL(
+                """
+                INSERT INTO {target_table} ({target_column}, {target_reverse_column})
+                SELECT relation.{source_column}, {source_reverse_column}
+                FROM {source_table} AS relation {joins}
+                ORDER BY relation.id
+                """
+            ).format(
+                target_table=sql.Identifier(
+                    model_field.remote_field.through._meta.db_table
+                ),
+                target_column=sql.Identifier(model_field.m2m_column_name()),
+                target_reverse_column=sql.Identifier(model_field.m2m_reverse_name()),
+                source_table=sql.Identifier(
+                    source_model_field.remote_field.through._meta.db_table
+                ),
+                source_column=sql.Identifier(source_model_field.m2m_column_name()),
+                source_reverse_column=reverse_column,
+                joins=sql.SQL(" ").join(joins),
+            ),
+            params,
+        )
+
     def _import_serialized_fields_values_to_row(
         self,
         row_instance: GeneratedTableModel,
@@ -797,6 +1030,9 @@ class DatabaseApplicationType(ApplicationType):
                     if getattr(date_field, attr, False):
                         setattr(date_field, attr, False)
 
+        if table.search_table_added:
+            SearchHandler.create_search_table(table)
+
     def _import_table_views(
         self,
         serialized_table: Dict[str, Any],
@@ -848,6 +1084,7 @@ class DatabaseApplicationType(ApplicationType):
                 order=serialized_table["order"],
                 needs_background_update_column_added=True,
                 last_modified_by_column_added=True,
+                search_table_added=SearchHandler.search_table_enabled(),
             )
             id_mapping["database_tables"][serialized_table["id"]] = table_instance.id
             serialized_table["_object"] = table_instance
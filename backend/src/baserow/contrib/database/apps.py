@@ -84,6 +84,7 @@ class DatabaseConfig(AppConfig):
             DeleteRowsActionType,
             ImportRowsActionType,
             MoveRowActionType,
+            MoveRowsActionType,
             UpdateRowActionType,
             UpdateRowsActionType,
         )
@@ -94,6 +95,7 @@ class DatabaseConfig(AppConfig):
         action_type_registry.register(DeleteRowActionType())
         action_type_registry.register(DeleteRowsActionType())
         action_type_registry.register(MoveRowActionType())
+        action_type_registry.register(MoveRowsActionType())
         action_type_registry.register(UpdateRowActionType())
         action_type_registry.register(UpdateRowsActionType())
 
@@ -544,7 +546,10 @@ class DatabaseConfig(AppConfig):
         from baserow.core.jobs.registries import job_type_registry
 
         from .airtable.job_types import AirtableImportJobType
-        from .fields.job_types import DuplicateFieldJobType
+        from .fields.job_types import (
+            DuplicateFieldJobType,
+            OnlineFieldConversionJobType,
+        )
         from .file_import.job_types import FileImportJobType
         from .table.job_types import DuplicateTableJobType
 
@@ -552,6 +557,7 @@ class DatabaseConfig(AppConfig):
         job_type_registry.register(FileImportJobType())
         job_type_registry.register(DuplicateTableJobType())
         job_type_registry.register(DuplicateFieldJobType())
+        job_type_registry.register(OnlineFieldConversionJobType())
 
         post_migrate.connect(safely_update_formula_versions, sender=self)
         pre_migrate.connect(clear_generated_model_cache_receiver, sender=self)
@@ -826,6 +832,7 @@ class DatabaseConfig(AppConfig):
         import baserow.contrib.database.search.tasks  # noqa: F401
         import baserow.contrib.database.table.receivers  # noqa: F401
         import baserow.contrib.database.views.tasks  # noqa: F401
+        import baserow.contrib.database.ws.rows.tasks  # noqa: F401
 
 
 # noinspection PyPep8Naming
@@ -19,3 +19,47 @@ sql_create_try_cast = """
     $FUNCTION$
     language plpgsql;
 """
+
+# Same as `try_cast`, but created as a regular function so that the trigger keeping
+# the shadow column of an online field conversion up to date can also use it.
+sql_create_online_conversion_cast = """
+    create or replace function %(function)s(
+        p_in text,
+        p_default int default null
+    )
+        returns %(type)s
+    as
+    $FUNCTION$
+    begin
+        begin
+            %(alter_column_prepare_old_value)s
+            %(alter_column_prepare_new_value)s
+            return %(return_value)s;
+        exception when others then
+            return %(error_value)s;
+        end;
+    end;
+    $FUNCTION$
+    language plpgsql;
+"""
+sql_create_online_conversion_trigger = """
+    create or replace function %(trigger_function)s()
+        returns trigger
+    as
+    $FUNCTION$
+    begin
+        NEW.%(shadow_column)s := %(function)s(NEW.%(column)s::text);
+        return NEW;
+    end;
+    $FUNCTION$
+    language plpgsql;
+
+    create trigger %(trigger)s
+    before insert or update of %(column)s on %(table)s
+    for each row execute function %(trigger_function)s();
+"""
+sql_drop_online_conversion = """
+    drop trigger if exists %(trigger)s on %(table)s;
+    drop function if exists %(trigger_function)s();
+    drop function if exists %(function)s(text, int);
+"""
@@ -2,7 +2,6 @@ import abc
 import time
 from typing import Any, Callable
 
-from django.core.paginator import Paginator
 from django.db.models import QuerySet
 
 import unicodecsv as csv
@@ -11,6 +10,7 @@ from baserow.contrib.database.export.exceptions import ExportJobCanceledExceptio
 from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.db import KeysetPaginator
 
 
 class FileWriter(abc.ABC):
@@ -61,12 +61,16 @@ class FileWriter(abc.ABC):
 
 class PaginatedExportJobFileWriter(FileWriter):
     """
-    Uses Django's built-in paginator to write querysets to files in a memory efficient
-    manner. Also updates the provided job as it progresses through any queryset writes
-    every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
+    Uses the keyset paginator to write querysets to files in a memory efficient
+    manner. Every chunk seeks past the ordering values of the previous one instead
+    of using an offset, so the cost of a chunk doesn't grow with the number of
+    exported rows. Views sorted by values that can't be compared, like lookup fields,
+    are exported in offset chunks instead. Also updates the provided job as it
+    progresses through any queryset writes every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
     """
 
     EXPORT_JOB_UPDATE_FREQUENCY_SECONDS = 1
+    CHUNK_SIZE = 2000
 
     def __init__(self, file, job):
         super().__init__(file)
@@ -94,14 +98,20 @@ class PaginatedExportJobFileWriter(FileWriter):
         """
 
         self.last_check = time.perf_counter()
-        paginator = Paginator(queryset.all(), 2000)
+        # The total is only used to report the progress, the last row is detected
+        # by the paginator.
+        total_rows = queryset.count()
+        paginator = KeysetPaginator(queryset.all())
         i = 0
-        for page in paginator.page_range:
-            for row in paginator.page(page).object_list:
+        for rows, is_last_page in paginator.iterate_pages(self.CHUNK_SIZE):
+            for index, row in enumerate(rows):
                 i = i + 1
-                is_last_row = i == paginator.count
+                is_last_row = is_last_page and index == len(rows) - 1
                 write_row(row, is_last_row)
-                self._check_and_update_job(i, paginator.count)
+                # Rows can be created or deleted while exporting, so make sure the
+                # progress is complete exactly when the last row has been written.
+                total_rows = i if is_last_row else max(total_rows, i + 1)
+                self._check_and_update_job(i, total_rows)
 
     def _check_and_update_job(self, current_row, total_rows):
         """
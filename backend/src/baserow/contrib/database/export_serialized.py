@@ -4,7 +4,12 @@ class DatabaseExportSerializedStructure:
         return {"tables": tables}
 
     @staticmethod
-    def table(id, name, order, fields, views, rows):
+    def table(id, name, order, fields, views, rows, copy_rows_in_database=False):
+        optional = {}
+
+        if copy_rows_in_database:
+            optional["copy_rows_in_database"] = True
+
         return {
             "id": id,
             "name": name,
@@ -12,6 +17,7 @@ class DatabaseExportSerializedStructure:
             "fields": fields,
             "views": views,
             "rows": rows,
+            **optional,
         }
 
     @staticmethod
@@ -0,0 +1,412 @@
+"""
+Keeps a snapshot of the field dependency graph of a database in memory, so that the
+dependants of a field can be found without recursively querying the
+`FieldDependency` table every time a cell or field changes.
+
+The snapshot is cached per process and in Redis under a version which is bumped
+every time the dependencies of a field in the database are changed by the dependency
+rebuilder. Because a snapshot must only ever contain committed dependencies, the
+version is bumped again when the transaction that changed them commits, and the
+transaction itself works with a private snapshot that is never shared in the
+meantime.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+# (dependant_id, dependency_id, via_id, dependant_table_id, dependency_table_id,
+# via_link_row_related_field_id)
+Edge = Tuple[int, Optional[int], Optional[int], int, Optional[int], Optional[int]]
+# (content_type_id, name, table_id) of a dependant field.
+Node = Tuple[int, str, int]
+
+FIELD_DEPENDENCY_GRAPH_VERSION_KEY = "field_dependency_graph_version_{database_id}"
+FIELD_DEPENDENCY_GRAPH_KEY = "field_dependency_graph_{database_id}_{version}"
+# Outdated snapshots are never read again, so they only have to live long enough to
+# be reused by the other processes.
+FIELD_DEPENDENCY_GRAPH_CACHE_TIMEOUT = 60 * 60 * 24
+FIELD_DEPENDENCY_GRAPH_L1_CACHE_SIZE = 64
+
+
+@dataclass
+class DependantFieldPath:
+    """
+    A dependant field reached via a specific path of link row fields, containing
+    the same information as a row of the recursive dependency query it replaces.
+    """
+
+    id: int
+    dependency_ids: List[int]
+    via_ids: List[int]
+    content_type_id: int
+    name: str
+    table_id: int
+    depth: int
+
+
+def _concat_ws(*values: Optional[str]) -> str:
+    # Mimics postgres' `concat_ws('|', ...)` which skips `NULL` values, but not
+    # empty strings.
+    return "|".join(value for value in values if value is not None)
+
+
+def _split_ids(value: Optional[str]) -> List[int]:
+    return [int(v) for v in value.split("|") if v] if value else []
+
+
+class FieldDependencyGraph:
+    """
+    The adjacency lists of all the field dependencies in a database.
+    """
+
+    def __init__(self, edges: List[Edge], nodes: Dict[int, Node]):
+        self.edges = edges
+        self.nodes = nodes
+        self.edges_by_dependency = defaultdict(list)
+        self.edges_by_via = defaultdict(list)
+        self.edges_by_via_related_field = defaultdict(list)
+
+        for edge in edges:
+            _, dependency_id, via_id, _, _, via_related_field_id = edge
+            if dependency_id is not None:
+                self.edges_by_dependency[dependency_id].append(edge)
+            if via_id is not None:
+                self.edges_by_via[via_id].append(edge)
+            if via_related_field_id is not None:
+                self.edges_by_via_related_field[via_related_field_id].append(edge)
+
+    @classmethod
+    def build(cls, database_id: int) -> "FieldDependencyGraph":
+        """
+        Builds the graph of the provided database with a single query.
+
+        :param database_id: The id of the database to build the graph for.
+        :return: The graph containing all the dependencies of the database.
+        """
+
+        from baserow.contrib.database.fields.dependencies.models import FieldDependency
+
+        edges = []
+        nodes = {}
+        for (
+            dependant_id,
+            dependency_id,
+            via_id,
+            dependant_table_id,
+            dependency_table_id,
+            via_related_field_id,
+            dependant_content_type_id,
+            dependant_name,
+        ) in FieldDependency.objects.filter(
+            dependant__table__database_id=database_id
+        ).values_list(
+            "dependant_id",
+            "dependency_id",
+            "via_id",
+            "dependant__table_id",
+            "dependency__table_id",
+            "via__link_row_related_field_id",
+            "dependant__content_type_id",
+            "dependant__name",
+        ):
+            edges.append(
+                (
+                    dependant_id,
+                    dependency_id,
+                    via_id,
+                    dependant_table_id,
+                    dependency_table_id,
+                    via_related_field_id,
+                )
+            )
+            nodes[dependant_id] = (
+                dependant_content_type_id,
+                dependant_name,
+                dependant_table_id,
+            )
+
+        return cls(edges, nodes)
+
+    def get_dependants(
+        self,
+        table_id: int,
+        field_ids: Iterable[int],
+        associated_relations_changed: bool,
+        max_depth: Optional[int] = None,
+    ) -> List[DependantFieldPath]:
+        """
+        Finds all the direct and indirect dependants of the provided fields, once for
+        every unique path of link row fields leading back to the starting table. The
+        result is exactly what the recursive dependency query used to return.
+
+        :param table_id: The table that the provided field_ids are all part of.
+        :param field_ids: The field ids for which we need to find the dependent fields.
+        :param associated_relations_changed: If true any relations associated with any
+            provided field ids will be treated as having changed also and dependants on
+            the relations themselves will be additionally returned.
+        :param max_depth: The maximum depth of the dependants to return. Defaults to
+            the `MAX_FIELD_REFERENCE_DEPTH` setting.
+        :return: The dependants ordered by their depth.
+        """
+
+        if max_depth is None:
+            max_depth = settings.MAX_FIELD_REFERENCE_DEPTH
+
+        field_ids = set(field_ids)
+        starting_edges = {
+            edge
+            for field_id in field_ids
+            for edge in self.edges_by_dependency.get(field_id, [])
+        }
+        if associated_relations_changed:
+            for field_id in field_ids:
+                for edge in self.edges_by_via.get(
+                    field_id, []
+                ) + self.edges_by_via_related_field.get(field_id, []):
+                    if edge[0] not in field_ids:
+                        starting_edges.add(edge)
+
+        level = set()
+        for edge in starting_edges:
+            (
+                dependant_id,
+                dependency_id,
+                via_id,
+                dependant_table_id,
+                dependency_table_id,
+                _,
+            ) = edge
+            # Via's are only added to the path if they are a valid join required to
+            # get from the dependant cell to the dependency, which isn't the case for
+            # dependants in the same row.
+            if via_id is not None and (
+                dependant_table_id != table_id or dependency_table_id == table_id
+            ):
+                via_path = str(via_id)
+            else:
+                via_path = ""
+            dependency_path = None if dependency_id is None else str(dependency_id)
+            level.add((dependant_id, dependency_path, via_path))
+
+        # Every unique path to a dependant collects the paths of its dependencies and
+        # the deepest level it has been found at.
+        paths: Dict[Tuple[int, str], Tuple[List[str], int]] = {}
+        depth = 1
+        while level and depth <= max_depth:
+            next_level: Set[Tuple[int, Optional[str], str]] = set()
+            for dependant_id, dependency_path, via_path in level:
+                # The levels are visited in order, so the last depth is the deepest.
+                dependency_paths, _ = paths.get((dependant_id, via_path), ([], None))
+                if dependency_path is not None:
+                    dependency_paths.append(dependency_path)
+                paths[(dependant_id, via_path)] = (dependency_paths, depth)
+
+                for (
+                    next_dependant_id,
+                    dependency_id,
+                    via_id,
+                    *_,
+                ) in self.edges_by_dependency.get(dependant_id, []):
+                    next_level.add(
+                        (
+                            next_dependant_id,
+                            _concat_ws(dependency_path, str(dependency_id)),
+                            _concat_ws(
+                                via_path, None if via_id is None else str(via_id)
+                            ),
+                        )
+                    )
+            level = next_level
+            depth += 1
+
+        dependants = []
+        for (dependant_id, via_path), (dependency_paths, depth) in paths.items():
+            content_type_id, name, dependant_table_id = self.nodes[dependant_id]
+            dependants.append(
+                DependantFieldPath(
+                    id=dependant_id,
+                    dependency_ids=_split_ids("|".join(dependency_paths)),
+                    via_ids=_split_ids(via_path),
+                    content_type_id=content_type_id,
+                    name=name,
+                    table_id=dependant_table_id,
+                    depth=depth,
+                )
+            )
+        dependants.sort(key=lambda d: (d.depth, d.id, d.via_ids))
+        return dependants
+
+
+class _FieldDependencyGraphInvalidation:
+    """
+    Registered as an on commit callback by every transaction that changes the
+    dependencies of a database. While pending, it marks that the transaction must
+    not use the shared snapshot of the database, and holds the private snapshot the
+    transaction uses instead.
+    """
+
+    def __init__(self, database_id: int):
+        self.database_id = database_id
+        self.pending = True
+        self.graph = None
+        self.graph_savepoint_ids = ()
+
+    def __call__(self):
+        self.pending = False
+        self.graph = None
+        _bump_field_dependency_graph_version(self.database_id)
+
+
+class FieldDependencyGraphL1Cache:
+    """
+    A thread-safe, bounded LRU cache of dependency graphs keyed by the database id,
+    which sits in front of the Redis cached snapshots.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._graphs: OrderedDict[int, Tuple[str, FieldDependencyGraph]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, database_id: int, version: str) -> Optional[FieldDependencyGraph]:
+        with self._lock:
+            entry = self._graphs.get(database_id)
+            if entry is None or entry[0] != version:
+                return None
+            self._graphs.move_to_end(database_id)
+            return entry[1]
+
+    def set(self, database_id: int, version: str, graph: FieldDependencyGraph):
+        with self._lock:
+            self._graphs[database_id] = (version, graph)
+            self._graphs.move_to_end(database_id)
+            while len(self._graphs) > self.max_size:
+                self._graphs.popitem(last=False)
+
+    def evict(self, database_id: int):
+        with self._lock:
+            self._graphs.pop(database_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._graphs.clear()
+
+
+field_dependency_graph_l1_cache = FieldDependencyGraphL1Cache(
+    FIELD_DEPENDENCY_GRAPH_L1_CACHE_SIZE
+)
+
+
+@lru_cache(maxsize=4096)
+def get_database_id_of_table(table_id: int) -> int:
+    """
+    Returns the id of the database the table belongs to. Tables never move to another
+    database, so the result can safely be remembered.
+    """
+
+    from baserow.contrib.database.table.models import Table
+
+    return Table.objects_and_trash.values_list("database_id", flat=True).get(
+        id=table_id
+    )
+
+
+def _get_pending_invalidation(
+    database_id: int,
+) -> Optional[_FieldDependencyGraphInvalidation]:
+    for _, callback, *_ in connection.run_on_commit:
+        if (
+            isinstance(callback, _FieldDependencyGraphInvalidation)
+            and callback.database_id == database_id
+            and callback.pending
+        ):
+            return callback
+    return None
+
+
+def _bump_field_dependency_graph_version(database_id: int):
+    field_dependency_graph_l1_cache.evict(database_id)
+    cache.set(
+        FIELD_DEPENDENCY_GRAPH_VERSION_KEY.format(database_id=database_id),
+        uuid.uuid4().hex,
+        timeout=None,
+    )
+
+
+def invalidate_field_dependency_graph(database_id: int):
+    """
+    Invalidates the cached dependency graph of the database because the dependencies
+    of one of its fields have changed. The current transaction will use a private
+    snapshot of the graph until it commits, after which the other processes will
+    rebuild their snapshot.
+
+    :param database_id: The id of the database whose dependencies have changed.
+    """
+
+    # Bump straight away so that no other process keeps on reusing a snapshot that
+    # could be cached by this process within the current transaction.
+    _bump_field_dependency_graph_version(database_id)
+
+    pending_invalidation = _get_pending_invalidation(database_id)
+    if pending_invalidation is not None:
+        pending_invalidation.graph = None
+    else:
+        transaction.on_commit(_FieldDependencyGraphInvalidation(database_id))
+
+
+def get_field_dependency_graph(database_id: int) -> FieldDependencyGraph:
+    """
+    Returns the dependency graph of the database, from the in-process cache if it's
+    up to date, otherwise from Redis or by building it.
+
+    :param database_id: The id of the database to get the dependency graph for.
+    :return: The dependency graph of the database.
+    """
+
+    pending_invalidation = _get_pending_invalidation(database_id)
+    if pending_invalidation is not None:
+        # The snapshot is only reused if no savepoint it was built in has been rolled
+        # back or released in the meantime.
+        savepoint_ids = tuple(connection.savepoint_ids)
+        built_in = pending_invalidation.graph_savepoint_ids
+        if (
+            pending_invalidation.graph is None
+            or savepoint_ids[: len(built_in)] != built_in
+        ):
+            pending_invalidation.graph = FieldDependencyGraph.build(database_id)
+            pending_invalidation.graph_savepoint_ids = savepoint_ids
+        return pending_invalidation.graph
+
+    version = cache.get_or_set(
+        FIELD_DEPENDENCY_GRAPH_VERSION_KEY.format(database_id=database_id),
+        lambda: uuid.uuid4().hex,
+        timeout=None,
+    )
+    graph = field_dependency_graph_l1_cache.get(database_id, version)
+    if graph is not None:
+        return graph
+
+    graph_key = FIELD_DEPENDENCY_GRAPH_KEY.format(
+        database_id=database_id, version=version
+    )
+    cached_graph = cache.get(graph_key)
+    if cached_graph is not None:
+        graph = FieldDependencyGraph(*cached_graph)
+    else:
+        graph = FieldDependencyGraph.build(database_id)
+        cache.set(
+            graph_key,
+            (graph.edges, graph.nodes),
+            timeout=FIELD_DEPENDENCY_GRAPH_CACHE_TIMEOUT,
+        )
+
+    field_dependency_graph_l1_cache.set(database_id, version, graph)
+    return graph
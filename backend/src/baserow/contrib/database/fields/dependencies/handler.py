@@ -2,10 +2,9 @@ from collections import defaultdict
 from graphlib import CycleError, TopologicalSorter
 from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q, QuerySet
+from django.db.models import Q
 
 from baserow.contrib.database.fields.dependencies.dependency_rebuilder import (
     break_dependencies_for_field,
@@ -15,6 +14,13 @@ from baserow.contrib.database.fields.dependencies.dependency_rebuilder import (
 from baserow.contrib.database.fields.dependencies.exceptions import (
     CircularFieldDependencyError,
 )
+from baserow.contrib.database.fields.dependencies.graph import (
+    DependantFieldPath,
+    FieldDependencyGraph,
+    get_database_id_of_table,
+    get_field_dependency_graph,
+    invalidate_field_dependency_graph,
+)
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.registries import FieldType, field_type_registry
@@ -79,10 +85,11 @@ class FieldDependencyHandler:
         field_ids: Iterable[int],
         field_cache: FieldCache,
         associated_relations_changed: bool,
-    ) -> Tuple[QuerySet[FieldDependency], Dict[int, Field]]:
+    ) -> Tuple[List[DependantFieldPath], Dict[int, Field]]:
         """
         # Recursively fetches field dependants and retrieves specific field types in a
-        query-efficient and performant manner.
+        query-efficient and performant manner. The dependants are found by traversing
+        the cached dependency graph of the database the table belongs to.
 
         :param table_id: The table that the provided field_ids are all part of.
         :param field_ids: The field ids for which we need to find the dependent fields,
@@ -92,127 +99,53 @@ class FieldDependencyHandler:
         :param associated_relations_changed: If true any relations associated with any
            provided field ids will be treated as having changed also and dependants on
            the relations themselves will be additionally returned.
-        :return: A tuple containing the queryset of the dependencies and a dictionary of
-            the specific fields.
+        :return: A tuple containing the dependants, once for every unique path of link
+            row fields to the starting table, and a dictionary of the specific fields.
         """
 
         if len(field_ids) == 0:
             return []
 
-        query_parameters = {
-            "pks": tuple(field_ids),
-            "max_depth": settings.MAX_FIELD_REFERENCE_DEPTH,
-            "table_id": table_id,
-        }
-        relationship_table = FieldDependency._meta.db_table
-        linkrowfield_table = LinkRowField._meta.db_table
-        field_table = Field._meta.db_table
-
-        if associated_relations_changed:
-            associated_relations_changed_query = f"""
-                OR (
-                    first.via_id IN %(pks)s
-                    OR linkrowfield.link_row_related_field_id IN %(pks)s
-                )
-                AND NOT (
-                    first.dependant_id IN %(pks)s
-                )
-            """
-        else:
-            associated_relations_changed_query = ""
-
-        # Raw query that traverses through the dependencies, and will find the
-        # dependants of the provided fields ids recursively.
-        raw_query = f"""
-            WITH RECURSIVE traverse(id, dependency_ids, via_ids, depth) AS (
-                SELECT
-                    first.dependant_id,
-                    first.dependency_id::text,
-                    /*
-                    We only want to add via's to the path which are valid joins
-                    required to get from the dependant cell to the dependency. The
-                    queryset can return dependencies with via's for dependants in the
-                    same row, which don't need a join, so we filter those out here.
-                    */
-                    CASE
-                        WHEN (
-                            first.via_id IS NOT NULL
-                            AND (
-                                dependant.table_id != %(table_id)s
-                                OR dependency.table_id = %(table_id)s
-                            )
-                        ) THEN first.via_id::text
-                        ELSE ''
-                    END as via_id,
-                    1
-                FROM {relationship_table} AS first
-                LEFT OUTER JOIN {relationship_table} AS second
-                    ON first.dependant_id = second.dependency_id
-                LEFT OUTER JOIN {linkrowfield_table} as linkrowfield
-                    ON first.via_id = linkrowfield.field_ptr_id
-                LEFT OUTER JOIN {field_table} as dependant
-                    ON first.dependant_id = dependant.id
-                LEFT OUTER JOIN {field_table} as dependency
-                    ON first.dependency_id = dependency.id
-                WHERE
-                    first.dependency_id IN %(pks)s
-                    {associated_relations_changed_query}
-                -- LIMITING_FK_EDGES_CLAUSE_1
-                -- DISALLOWED_ANCESTORS_NODES_CLAUSE_1
-                -- ALLOWED_ANCESTORS_NODES_CLAUSE_1
-                UNION
-                SELECT DISTINCT
-                    dependant_id,
-                    coalesce(concat_ws('|', dependency_ids::text, dependency_id::text), ''),
-                    coalesce(concat_ws('|', via_ids::text, via_id::text), ''),
-                    traverse.depth + 1
-                FROM traverse
-                INNER JOIN {relationship_table}
-                    ON {relationship_table}.dependency_id = traverse.id
-                WHERE 1 = 1
-                -- LIMITING_FK_EDGES_CLAUSE_2
-                -- DISALLOWED_ANCESTORS_NODES_CLAUSE_2
-                -- ALLOWED_ANCESTORS_NODES_CLAUSE_2
+        database_id = get_database_id_of_table(table_id)
+        try:
+            return cls._get_all_dependent_fields_from_graph(
+                get_field_dependency_graph(database_id),
+                table_id,
+                field_ids,
+                field_cache,
+                associated_relations_changed,
+            )
+        except Field.DoesNotExist:
+            # A field in the cached graph doesn't exist anymore or has changed type
+            # without its dependencies being rebuilt, so the graph is outdated.
+            invalidate_field_dependency_graph(database_id)
+            return cls._get_all_dependent_fields_from_graph(
+                get_field_dependency_graph(database_id),
+                table_id,
+                field_ids,
+                field_cache,
+                associated_relations_changed,
             )
-            SELECT
-                traverse.id,
-                STRING_AGG(traverse.dependency_ids, '|') AS dependency_ids,
-                traverse.via_ids,
-                field.content_type_id,
-                field.name,
-                field.table_id,
-                MAX(depth) as depth
-            FROM traverse
-            LEFT OUTER JOIN {field_table} as field
-                ON traverse.id = field.id
-            WHERE depth <= %(max_depth)s
-            GROUP BY traverse.id, traverse.via_ids, field.content_type_id, field.name, field.table_id
-            ORDER BY MAX(depth) ASC, id ASC
-        """  # nosec b608
-
-        queryset = FieldDependency.objects.raw(raw_query, query_parameters)
+
+    @classmethod
+    def _get_all_dependent_fields_from_graph(
+        cls,
+        graph: FieldDependencyGraph,
+        table_id: int,
+        field_ids: Iterable[int],
+        field_cache: FieldCache,
+        associated_relations_changed: bool,
+    ) -> Tuple[List[DependantFieldPath], Dict[int, Field]]:
+        dependants = graph.get_dependants(
+            table_id, field_ids, associated_relations_changed
+        )
         link_row_field_content_type = ContentType.objects.get_for_model(LinkRowField)
         fields_to_fetch = set()
         fields_in_cache = {}
 
-        # Unpacks the dependant field id, the link row via fields, and adds them to the
-        # `fields_to_fetch` list, so that we can later query efficiently fetch the
-        # specific objects.
-        for dependency in queryset:
-            if dependency.via_ids:
-                dependency.via_ids = [
-                    int(v) for v in dependency.via_ids.split("|") if v
-                ]
-            else:
-                dependency.via_ids = []
-
-            if dependency.dependency_ids:
-                dependency.dependency_ids = [
-                    int(v) for v in dependency.dependency_ids.split("|") if v
-                ]
-            else:
-                dependency.dependency_ids = []
-
+        # Adds the dependant field and the link row via fields to the `fields_to_fetch`
+        # list, so that we can later query efficiently fetch the specific objects.
+        for dependency in dependants:
             field = Field(
                 id=dependency.id,
                 content_type_id=dependency.content_type_id,
@@ -224,7 +157,9 @@ class FieldDependencyHandler:
                 cached_field = field_cache.lookup_specific(
                     field, fetch_if_missing=False
                 )
-                if cached_field is not None:
+                # The field is looked up by name, which could have changed since the
+                # graph was cached.
+                if cached_field is not None and cached_field.id == field.id:
                     fields_in_cache[cached_field.id] = cached_field
                 else:
                     fields_to_fetch.add(field)
@@ -264,7 +199,7 @@ class FieldDependencyHandler:
                 )
             }
 
-        return queryset, {**specific_fields, **fields_in_cache}
+        return dependants, {**specific_fields, **fields_in_cache}
 
     @classmethod
     def group_dependencies_by_level(
@@ -373,7 +308,9 @@ class FieldDependencyHandler:
                 dependency_map[dependant_field.id].append(
                     (starting_table_id, dependant_field)
                 )
-                dependencies[dependant_field.id] = set(dependency.dependency_ids)
+                # A field can be reached via multiple paths, and it must be placed
+                # after all the dependencies of every path.
+                dependencies[dependant_field.id].update(dependency.dependency_ids)
 
         dependencies_gouped_by_level = cls.group_dependencies_by_level(dependencies)
 
@@ -454,7 +391,9 @@ class FieldDependencyHandler:
                 )
             )
 
-            dependencies[dependant_field.id] = set(dependency.dependency_ids)
+            # A field can be reached via multiple paths, and it must be placed after
+            # all the dependencies of every path.
+            dependencies[dependant_field.id].update(dependency.dependency_ids)
 
         dependencies_gouped_by_level = cls.group_dependencies_by_level(dependencies)
 
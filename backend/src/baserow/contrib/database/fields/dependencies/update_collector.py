@@ -1,7 +1,14 @@
+import time
 from collections import defaultdict
-from typing import Dict, List, Optional, Set, Tuple, cast
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple, Type, cast
 
-from django.db.models import Expression, Q, Value
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, Expression, F, Q, QuerySet, Value, When
+from django.db.models.sql import UpdateQuery
+
+from opentelemetry import metrics
 
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
@@ -10,11 +17,206 @@ from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.constants import (
     ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
 )
-from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.table.models import GeneratedTableModel, Table
 from baserow.contrib.database.table.signals import table_updated
 
 StartingRowIdsType = Optional[List[int]]
 
+meter = metrics.get_meter(__name__)
+update_collector_statements_histogram = meter.create_histogram(
+    "baserow.field_update_collector.statements",
+    unit="1",
+    description="The number of UPDATE statements executed to apply the updates of a "
+    "field update collector.",
+)
+update_collector_duration_histogram = meter.create_histogram(
+    "baserow.field_update_collector.duration",
+    unit="s",
+    description="The time it took to execute the UPDATE statements of a field update "
+    "collector.",
+)
+
+
+@dataclass
+class PendingUpdateStatement:
+    """
+    An UPDATE statement collected for a table and a path of link row fields back to
+    the starting table, which is ready to be executed.
+    """
+
+    model: Type[GeneratedTableModel]
+    # The filter for the rows to update, or None if all rows must be updated.
+    row_filter: Optional[Q]
+    update_statements: Dict[str, Optional[Expression]]
+    update_changes_only: bool = False
+
+    def get_queryset(self) -> QuerySet:
+        qs = self.model.objects_and_trash.all()
+        if self.row_filter is not None:
+            qs = qs.filter(self.row_filter)
+
+        # If we are only updating changes, we need to filter out rows that don't
+        # need to be updated. Because of how postgres works, this could save a lot
+        # of disk space and IO, at the cost of a more complex query and a longer
+        # execution time, but if we're updating an entire field or only certain
+        # rows, it's better to skip this optimization.
+        if self.update_changes_only:
+            annotations, filters = {}, Q()
+            for field, expr in self.update_statements.items():
+                if expr is None or not field.startswith("field_"):
+                    continue
+
+                annotated_field = f"{field}_expr"
+                annotations[annotated_field] = expr
+                # Because the expression can evaluate to null and because of how the
+                # comparison with null should be handle in SQL
+                # (https://www.postgresql.org/docs/15/functions-comparison.html), we
+                # need to properly filter rows to correctly update only the ones
+                # that need to be updated.
+                filters |= Q(
+                    **{
+                        f"{field}__isnull": False,
+                        f"{annotated_field}__isnull": True,
+                    }
+                ) | ~Q(**{field: expr})
+            qs = qs.annotate(**annotations).filter(filters)
+
+        return qs
+
+    def execute(self) -> int:
+        """
+        Executes the update statement and returns the number of updated rows.
+        """
+
+        return self.get_queryset().update(**self.update_statements)
+
+    def as_sql(self) -> Tuple[str, Tuple]:
+        """
+        Compiles the update statement the same way `QuerySet.update` does, without
+        executing it.
+        """
+
+        queryset = self.get_queryset()
+        query = queryset.query.chain(UpdateQuery)
+        query.add_update_values(self.update_statements)
+        query.annotations = {}
+        return query.get_compiler(queryset.db).as_sql()
+
+    @classmethod
+    def merge_per_table(
+        cls, update_statements: List["PendingUpdateStatement"]
+    ) -> List["PendingUpdateStatement"]:
+        """
+        Merges the update statements targeting the same table via different paths
+        into a single multi-column UPDATE statement. Every column is only changed for
+        the rows connected via the path of the statement it comes from, so the result
+        is the same as executing them one after the other. This is only possible if
+        the statements don't depend on each other's results, which is the case for
+        the updates of fields at the same dependency level.
+
+        :param update_statements: The update statements to merge.
+        :return: One update statement per table, in the order in which the tables
+            were first encountered.
+        """
+
+        per_table = defaultdict(list)
+        for update_statement in update_statements:
+            per_table[update_statement.model._meta.db_table].append(update_statement)
+
+        merged = []
+        for statements in per_table.values():
+            if len(statements) == 1:
+                merged.append(statements[0])
+                continue
+
+            model = statements[0].model
+            row_filter, row_conditions = Q(), []
+            for statement in statements:
+                if statement.row_filter is None:
+                    condition = None
+                else:
+                    condition = Q(
+                        id__in=model.objects_and_trash.filter(
+                            statement.row_filter
+                        ).values("id")
+                    )
+                row_conditions.append(condition)
+                if row_filter is not None:
+                    row_filter = None if condition is None else row_filter | condition
+
+            update_statements_per_column = defaultdict(list)
+            for statement, condition in zip(statements, row_conditions):
+                for column, expr in statement.update_statements.items():
+                    update_statements_per_column[column].append((condition, expr))
+
+            merged_update_statements = {}
+            for column, conditional_exprs in update_statements_per_column.items():
+                unconditional_exprs = [
+                    expr for condition, expr in conditional_exprs if condition is None
+                ]
+                if unconditional_exprs or (
+                    column == ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME
+                ):
+                    # The expressions recalculate the entire cell value, so one that
+                    # applies to all rows makes the others redundant. Every updated
+                    # row also needs a background update.
+                    merged_update_statements[column] = (
+                        unconditional_exprs or [conditional_exprs[0][1]]
+                    )[0]
+                    continue
+
+                merged_update_statements[column] = Case(
+                    *[
+                        When(condition, then=Value(None) if expr is None else expr)
+                        for condition, expr in conditional_exprs
+                    ],
+                    default=F(column),
+                    output_field=model._meta.get_field(column),
+                )
+
+            merged.append(
+                cls(
+                    model=model,
+                    row_filter=row_filter,
+                    update_statements=merged_update_statements,
+                )
+            )
+
+        return merged
+
+    @classmethod
+    def execute_pipelined(
+        cls, update_statements: List["PendingUpdateStatement"]
+    ) -> int:
+        """
+        Executes the update statements as data-modifying CTEs of a single query, to
+        avoid a round trip to the database per statement. All statements see the
+        same snapshot of the data, so they must not depend on each other's results
+        and must all target different tables.
+
+        :param update_statements: The update statements to execute.
+        :return: The total number of updated rows.
+        """
+
+        ctes, counts, params = [], [], []
+        for index, update_statement in enumerate(update_statements):
+            update_sql, update_params = update_statement.as_sql()
+            if not update_sql:
+                continue
+            ctes.append(f"update_{index} AS ({update_sql} RETURNING 1)")
+            counts.append(f"(SELECT COUNT(*) FROM update_{index})")
+            params.extend(update_params)
+
+        if not ctes:
+            return 0
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"WITH {', '.join(ctes)} SELECT {' + '.join(counts)}",  # nosec B608
+                params,
+            )
+            return cursor.fetchone()[0]
+
 
 class PathBasedUpdateStatementCollector:
     def __init__(
@@ -133,34 +335,69 @@ class PathBasedUpdateStatementCollector:
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
     ) -> int:
         updated_rows = 0
+        for update_statement in self.get_pending_update_statements(
+            field_cache,
+            starting_row_ids,
+            path_to_starting_table,
+            deleted_m2m_rels_per_link_field,
+        ):
+            updated_rows += update_statement.execute()
+        return updated_rows
+
+    def get_pending_update_statements(
+        self,
+        field_cache: FieldCache,
+        starting_row_ids: StartingRowIdsType = None,
+        path_to_starting_table: StartingRowIdsType = None,
+        deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
+    ) -> List["PendingUpdateStatement"]:
+        """
+        Returns the update statements of this collector and all the collectors of its
+        sub paths in the order they must be executed in, which is this collector
+        first and then the sub paths.
+        """
+
         path_to_starting_table = path_to_starting_table or []
         if self.connection_here is not None:
             path_to_starting_table = [self.connection_here] + path_to_starting_table
-        updated_rows += self._execute_pending_update_statements(
+
+        update_statements = []
+        update_statement = self._get_pending_update_statement(
             field_cache,
             path_to_starting_table,
             starting_row_ids,
             deleted_m2m_rels_per_link_field,
         )
+        if update_statement is not None:
+            update_statements.append(update_statement)
 
         for sub_path in self.sub_paths.values():
-            updated_rows += sub_path.execute_all(
+            update_statements += sub_path.get_pending_update_statements(
                 starting_row_ids=starting_row_ids,
                 path_to_starting_table=path_to_starting_table,
                 field_cache=field_cache,
                 deleted_m2m_rels_per_link_field=deleted_m2m_rels_per_link_field,
             )
-        return updated_rows
+        return update_statements
 
-    def _execute_pending_update_statements(
+    def _get_pending_update_statement(
         self,
         field_cache: FieldCache,
         path_to_starting_table: List[LinkRowField],
         starting_row_ids: StartingRowIdsType,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]],
-    ) -> int:
-        model = field_cache.get_model(self.table)
-        qs = model.objects_and_trash
+    ) -> Optional["PendingUpdateStatement"]:
+        if starting_row_ids is None:
+            # We aren't updating individual rows but instead entire columns, so don't
+            # set this per row attribute.
+            self.update_statements.pop(ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME, None)
+
+        # Collectors which are only part of the path to other collectors don't have
+        # anything to update themselves.
+        if not self.update_statements:
+            return None
+
+        row_filter = None
         # If the connection is broken back to the starting table then there is no
         # way to join back to these starting rows. So we just update all cells.
         if starting_row_ids is not None and not self.connection_is_broken:
@@ -172,53 +409,19 @@ class PathBasedUpdateStatementCollector:
                 )
             path_to_starting_table_id_column += "__in"
 
-            filter_for_rows_connected_to_starting_row = Q(
+            row_filter = Q(
                 **{path_to_starting_table_id_column: starting_row_ids}
             ) | self._include_rows_connected_to_deleted_m2m_relationships(
                 deleted_m2m_rels_per_link_field,
                 path_to_starting_table,
             )
 
-            qs = qs.filter(filter_for_rows_connected_to_starting_row)
-        if starting_row_ids is None:
-            # We aren't updating individual rows but instead entire columns, so don't
-            # set this per row attribute.
-            self.update_statements.pop(ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME, None)
-
-        updated_rows = 0
-        if self.update_statements:
-            annotations, filters = {}, Q()
-
-            # If we are only updating changes, we need to filter out rows that don't
-            # need to be updated. Because of how postgres works, this could save a lot
-            # of disk space and IO, at the cost of a more complex query and a longer
-            # execution time, but if we're updating an entire field or only certain
-            # rows, it's better to skip this optimization.
-            if self.update_changes_only:
-                for field, expr in self.update_statements.items():
-                    if expr is None or not field.startswith("field_"):
-                        continue
-
-                    annotated_field = f"{field}_expr"
-                    annotations[annotated_field] = expr
-                    # Because the expression can evaluate to null and because of how the
-                    # comparison with null should be handle in SQL
-                    # (https://www.postgresql.org/docs/15/functions-comparison.html), we
-                    # need to properly filter rows to correctly update only the ones
-                    # that need to be updated.
-                    filters |= Q(
-                        **{
-                            f"{field}__isnull": False,
-                            f"{annotated_field}__isnull": True,
-                        }
-                    ) | ~Q(**{field: expr})
-
-            updated_rows = (
-                qs.annotate(**annotations)
-                .filter(filters)
-                .update(**self.update_statements)
-            )
-        return updated_rows
+        return PendingUpdateStatement(
+            model=field_cache.get_model(self.table),
+            row_filter=row_filter,
+            update_statements=self.update_statements,
+            update_changes_only=self.update_changes_only,
+        )
 
     def _include_rows_connected_to_deleted_m2m_relationships(
         self,
@@ -297,6 +500,7 @@ class FieldUpdateCollector:
         starting_row_ids: StartingRowIdsType = None,
         deleted_m2m_rels_per_link_field: Optional[Dict[int, Set[int]]] = None,
         update_changes_only: bool = False,
+        batch_updates: bool = False,
     ):
         """
         :param starting_table: The table where the triggering field update begins.
@@ -312,17 +516,26 @@ class FieldUpdateCollector:
             rows in the table. Because of how Postgres works, this could save a lot of
             disk space and IO, at the cost of a more complex query and a longer
             execution time.
+        :param batch_updates: If True then the update statements targeting the same
+            table are merged into one statement every time the updates are applied,
+            and if the `BASEROW_PIPELINE_FIELD_UPDATE_STATEMENTS` setting is enabled
+            the statements of all tables are executed in a single query. This must
+            only be used if the updates are applied once per dependency level, so
+            that no update depends on the result of another.
         """
 
         # Track the fields which have been updated since last call to apply_updates
         self._pending_field_updates = FieldUpdatesTracker()
         # Track all fields which have been updated in this collector
         self._all_field_updates = FieldUpdatesTracker()
+        # Track the number of rows updated by all the calls to apply_updates
+        self.updated_rows_count = 0
 
         self._starting_row_ids = starting_row_ids
         self._starting_table = starting_table
         self._deleted_m2m_rels_per_link_field = deleted_m2m_rels_per_link_field
         self.update_changes_only = update_changes_only
+        self.batch_updates = batch_updates
 
         self._update_statement_collector = self._init_update_statement_collector()
 
@@ -396,11 +609,43 @@ class FieldUpdateCollector:
         update queries as possible and return the number of updated rows.
         """
 
-        updated_rows_count = self._update_statement_collector.execute_all(
-            field_cache,
-            self._starting_row_ids,
-            deleted_m2m_rels_per_link_field=self._deleted_m2m_rels_per_link_field,
+        start = time.perf_counter()
+        update_statements = (
+            self._update_statement_collector.get_pending_update_statements(
+                field_cache,
+                self._starting_row_ids,
+                deleted_m2m_rels_per_link_field=self._deleted_m2m_rels_per_link_field,
+            )
         )
+        if self.batch_updates:
+            update_statements = PendingUpdateStatement.merge_per_table(
+                update_statements
+            )
+
+        if (
+            self.batch_updates
+            and settings.BASEROW_PIPELINE_FIELD_UPDATE_STATEMENTS
+            and len(update_statements) > 1
+        ):
+            updated_rows_count = PendingUpdateStatement.execute_pipelined(
+                update_statements
+            )
+            executed_statements_count = 1
+        else:
+            updated_rows_count = sum(
+                update_statement.execute() for update_statement in update_statements
+            )
+            executed_statements_count = len(update_statements)
+
+        if executed_statements_count > 0:
+            attributes = {"batched": self.batch_updates}
+            update_collector_statements_histogram.record(
+                executed_statements_count, attributes
+            )
+            update_collector_duration_histogram.record(
+                time.perf_counter() - start, attributes
+            )
+        self.updated_rows_count += updated_rows_count
         return updated_rows_count
 
     def apply_updates_and_get_updated_fields(
@@ -276,3 +276,10 @@ class TableHasNoPrimaryField(Exception):
     """
     Raised when the table doesn't have a primary field.
     """
+
+
+class OnlineFieldConversionNotSupported(Exception):
+    """
+    Raised when a field can't be converted to the new type or with the new values
+    using the online field conversion.
+    """
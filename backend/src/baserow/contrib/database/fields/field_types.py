@@ -40,6 +40,7 @@ from django.db.models.functions import Coalesce, RowNumber
 from dateutil import parser
 from dateutil.parser import ParserError
 from loguru import logger
+from opentelemetry import metrics
 from rest_framework import serializers
 
 from baserow.contrib.database.api.fields.errors import (
@@ -225,11 +226,84 @@ from .utils.duration import (
 
 User = get_user_model()
 
+meter = metrics.get_meter(__name__)
+periodic_update_rows_histogram = meter.create_histogram(
+    "baserow.periodic_field_update.updated_rows",
+    unit="1",
+    description="The number of rows rewritten per workspace by a periodic update of "
+    "the formula fields.",
+)
 
 if TYPE_CHECKING:
     from baserow.contrib.database.table.models import FieldObject, GeneratedTableModel
 
 
+def _get_import_workspace_user_ids_mapping(
+    id_mapping: Dict[str, Any], cache: Dict[str, Any]
+) -> Dict[int, int]:
+    """
+    Returns an identity mapping of the ids of the users that are a member of the
+    workspace the rows are imported in, so that references to other users are not
+    copied.
+    """
+
+    cache_key = "import_workspace_user_ids_mapping"
+    if cache_key not in cache:
+        user_ids = WorkspaceUser.objects.filter(
+            workspace_id=id_mapping["import_workspace_id"]
+        ).values_list("user_id", flat=True)
+        cache[cache_key] = {user_id: user_id for user_id in user_ids}
+    return cache[cache_key]
+
+
+def _represent_many(represent_item: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Returns a function representing every item of a related manager or list in the
+    same way as the DRF `ListSerializer`.
+    """
+
+    def represent(value):
+        iterable = (
+            value.all() if isinstance(value, models.manager.BaseManager) else value
+        )
+        return [represent_item(item) for item in iterable]
+
+    return represent
+
+
+def _represent_select_option(option) -> Dict[str, Any]:
+    """
+    Gives the same output as the `SelectOptionSerializer`.
+    """
+
+    option_id, value, color = option.id, option.value, option.color
+    return {
+        "id": None if option_id is None else int(option_id),
+        "value": None if value is None else str(value),
+        "color": None if color is None else str(color),
+    }
+
+
+def _represent_link_row_value(related_row) -> Dict[str, Any]:
+    """
+    Gives the same output as the `LinkRowValueSerializer`.
+    """
+
+    related_row_id = related_row.id
+    return {
+        "id": None if related_row_id is None else int(related_row_id),
+        "value": str(related_row),
+    }
+
+
+class CharFieldResponseExtractorMixin:
+    def get_response_serializer_extractor(self, instance, serializer_field):
+        # The `CharField` representation of a value is the value as a string.
+        if type(serializer_field) is serializers.CharField:
+            return str
+        return super().get_response_serializer_extractor(instance, serializer_field)
+
+
 class CollationSortMixin:
     def get_order(
         self, field, field_name, order_direction
@@ -244,7 +318,7 @@ class CollationSortMixin:
         return OptionallyAnnotatedOrderBy(order=field_order_by, can_be_indexed=True)
 
 
-class TextFieldMatchingRegexFieldType(FieldType, ABC):
+class TextFieldMatchingRegexFieldType(CharFieldResponseExtractorMixin, FieldType, ABC):
     """
     This is an abstract FieldType you can extend to create a field which is a TextField
     but restricted to only allow values passing a regex. Please implement the
@@ -259,6 +333,8 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
           altering a column to being an email type.
     """
 
+    can_copy_rows_in_database = True
+
     @property
     @abstractmethod
     def regex(self):
@@ -373,9 +449,10 @@ class ManyToManyFieldTypeSerializeToInputValueMixin:
         return value
 
 
-class TextFieldType(CollationSortMixin, FieldType):
+class TextFieldType(CollationSortMixin, CharFieldResponseExtractorMixin, FieldType):
     type = "text"
     model_class = TextField
+    can_copy_rows_in_database = True
     allowed_fields = ["text_default"]
     serializer_field_names = ["text_default"]
     _can_group_by = True
@@ -419,9 +496,10 @@ class TextFieldType(CollationSortMixin, FieldType):
         return collate_expression(Value(value))
 
 
-class LongTextFieldType(CollationSortMixin, FieldType):
+class LongTextFieldType(CollationSortMixin, CharFieldResponseExtractorMixin, FieldType):
     type = "long_text"
     model_class = LongTextField
+    can_copy_rows_in_database = True
     allowed_fields = ["long_text_enable_rich_text"]
     serializer_field_names = ["long_text_enable_rich_text"]
 
@@ -513,6 +591,7 @@ class NumberFieldType(FieldType):
 
     type = "number"
     model_class = NumberField
+    can_copy_rows_in_database = True
     allowed_fields = ["number_decimal_places", "number_negative"]
     serializer_field_names = ["number_decimal_places", "number_negative", "number_type"]
     serializer_field_overrides = {
@@ -664,6 +743,7 @@ class NumberFieldType(FieldType):
 class RatingFieldType(FieldType):
     type = "rating"
     model_class = RatingField
+    can_copy_rows_in_database = True
     allowed_fields = ["max_value", "color", "style"]
     serializer_field_names = ["max_value", "color", "style"]
     _can_group_by = True
@@ -786,6 +866,7 @@ class RatingFieldType(FieldType):
 class BooleanFieldType(FieldType):
     type = "boolean"
     model_class = BooleanField
+    can_copy_rows_in_database = True
     _can_group_by = True
 
     def get_alter_column_prepare_new_value(self, connection, from_field, to_field):
@@ -834,6 +915,7 @@ class BooleanFieldType(FieldType):
 class DateFieldType(FieldType):
     type = "date"
     model_class = DateField
+    can_copy_rows_in_database = True
     allowed_fields = [
         "date_format",
         "date_include_time",
@@ -1333,6 +1415,7 @@ class CreatedOnFieldType(CreatedOnLastModifiedBaseFieldType):
 class LastModifiedByFieldType(ReadOnlyFieldType):
     type = "last_modified_by"
     model_class = LastModifiedByField
+    can_copy_rows_in_database = True
     can_be_in_form_view = False
     keep_data_on_duplication = True
     update_always = True
@@ -1451,6 +1534,9 @@ class LastModifiedByFieldType(ReadOnlyFieldType):
     ) -> Any:
         return getattr(row, field_name)
 
+    def get_copy_rows_in_database_mapping(self, field, id_mapping, cache):
+        return _get_import_workspace_user_ids_mapping(id_mapping, cache)
+
     def get_export_value(
         self, value: Any, field_object: "FieldObject", rich_value: bool = False
     ) -> Any:
@@ -1539,6 +1625,7 @@ class LastModifiedByFieldType(ReadOnlyFieldType):
 class CreatedByFieldType(ReadOnlyFieldType):
     type = "created_by"
     model_class = CreatedByField
+    can_copy_rows_in_database = True
     can_be_in_form_view = False
     keep_data_on_duplication = True
 
@@ -1656,6 +1743,9 @@ class CreatedByFieldType(ReadOnlyFieldType):
     ) -> Any:
         return getattr(row, field_name)
 
+    def get_copy_rows_in_database_mapping(self, field, id_mapping, cache):
+        return _get_import_workspace_user_ids_mapping(id_mapping, cache)
+
     def get_export_value(
         self, value: Any, field_object: "FieldObject", rich_value: bool = False
     ) -> Any:
@@ -1744,6 +1834,7 @@ class CreatedByFieldType(ReadOnlyFieldType):
 class DurationFieldType(FieldType):
     type = "duration"
     model_class = DurationField
+    can_copy_rows_in_database = True
     allowed_fields = ["duration_format"]
     serializer_field_names = ["duration_format"]
     _can_group_by = True
@@ -1904,6 +1995,7 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
 
     type = "link_row"
     model_class = LinkRowField
+    can_copy_rows_in_database = True
     allowed_fields = [
         "link_row_table_id",
         "link_row_related_field",
@@ -2386,6 +2478,15 @@ class LinkRowFieldType(ManyToManyFieldTypeSerializeToInputValueMixin, FieldType)
             child=inner_serializer(), **{"required": False, **kwargs}
         )
 
+    def get_response_serializer_extractor(self, instance, serializer_field):
+        # Only the values without joined target fields have a fast representation.
+        if (
+            type(serializer_field) is serializers.ListSerializer
+            and type(serializer_field.child) is LinkRowValueSerializer
+        ):
+            return _represent_many(_represent_link_row_value)
+        return super().get_response_serializer_extractor(instance, serializer_field)
+
     def get_serializer_help_text(self, instance):
         return (
             "This field accepts an `array` containing the ids or the names of the "
@@ -3167,6 +3268,7 @@ class EmailFieldType(CollationSortMixin, CharFieldMatchingRegexFieldType):
 class FileFieldType(FieldType):
     type = "file"
     model_class = FileField
+    can_copy_rows_in_database = True
     can_be_in_form_view = True
     can_get_unique_values = False
 
@@ -3466,6 +3568,7 @@ class FileFieldType(FieldType):
 
 class SelectOptionBaseFieldType(FieldType):
     can_have_select_options = True
+    can_copy_rows_in_database = True
     allowed_fields = ["select_options"]
     serializer_field_names = ["select_options"]
     serializer_field_overrides = {
@@ -3504,6 +3607,14 @@ class SelectOptionBaseFieldType(FieldType):
         # If there are any deleted options we need to backup
         return old_field.select_options.exclude(id__in=updated_ids).exists()
 
+    def get_copy_rows_in_database_mapping(self, field, id_mapping, cache):
+        select_option_ids = set(field.select_options.values_list("id", flat=True))
+        return {
+            old_id: new_id
+            for old_id, new_id in id_mapping["database_field_select_options"].items()
+            if new_id in select_option_ids
+        }
+
     def enhance_queryset_in_bulk(self, queryset, field_objects, **kwargs):
         existing_multi_field_prefetches = queryset.get_multi_field_prefetches()
         select_model_prefetch = None
@@ -3562,6 +3673,11 @@ class SingleSelectFieldType(SelectOptionBaseFieldType):
             }
         )
 
+    def get_response_serializer_extractor(self, instance, serializer_field):
+        if type(serializer_field) is SelectOptionSerializer:
+            return _represent_select_option
+        return super().get_response_serializer_extractor(instance, serializer_field)
+
     def enhance_queryset(self, queryset, field, name, **kwargs):
         # It's important that this individual enhance_queryset method exists, even
         # though the enhance queryset in bulk exists, because the link_row field can
@@ -3924,6 +4040,14 @@ class MultipleSelectFieldType(
             }
         )
 
+    def get_response_serializer_extractor(self, instance, serializer_field):
+        if (
+            type(serializer_field) is serializers.ListSerializer
+            and type(serializer_field.child) is SelectOptionSerializer
+        ):
+            return _represent_many(_represent_select_option)
+        return super().get_response_serializer_extractor(instance, serializer_field)
+
     def enhance_queryset(self, queryset, field, name, **kwargs):
         # It's important that this individual enhance_queryset method exists, even
         # though the enhance queryset in bulk exists, because the link_row field can
@@ -4357,6 +4481,7 @@ class FormulaFieldType(
 ):
     type = "formula"
     model_class = FormulaField
+    can_copy_rows_in_database = True
     _db_column_fields = []
 
     can_be_in_form_view = False
@@ -4726,14 +4851,43 @@ class FormulaFieldType(
                     field_cache,
                     via_path_to_starting_table,
                 )
-            updated_fields |= set(
-                update_collector.apply_updates_and_get_updated_fields(field_cache)
-            )
+            for update_collector in update_collectors.values():
+                updated_fields |= set(
+                    update_collector.apply_updates_and_get_updated_fields(field_cache)
+                )
 
-        update_collector.send_force_refresh_signals_for_all_updated_tables()
+        updated_rows_count = 0
+        for update_collector in update_collectors.values():
+            update_collector.send_force_refresh_signals_for_all_updated_tables()
+            updated_rows_count += update_collector.updated_rows_count
+        periodic_update_rows_histogram.record(updated_rows_count)
 
         return list(updated_fields)
 
+    def filter_fields_due_for_periodic_update(
+        self, queryset: QuerySet, now: datetime
+    ) -> QuerySet:
+        return queryset.filter(
+            Q(next_periodic_update_at__isnull=True)
+            | Q(next_periodic_update_at__lte=now)
+        )
+
+    def schedule_next_periodic_update(
+        self, fields: List[FormulaField], updated_at: datetime
+    ):
+        field_ids_per_next_update_at = defaultdict(list)
+        for field in fields:
+            next_update_at = FormulaHandler.get_next_periodic_update_at(
+                field.cached_typed_internal_expression, updated_at
+            )
+            if next_update_at != field.next_periodic_update_at:
+                field_ids_per_next_update_at[next_update_at].append(field.id)
+
+        for next_update_at, field_ids in field_ids_per_next_update_at.items():
+            FormulaField.objects.filter(id__in=field_ids).update(
+                next_periodic_update_at=next_update_at
+            )
+
     def row_of_dependency_updated(
         self,
         field: FormulaField,
@@ -5560,6 +5714,7 @@ class MultipleCollaboratorsFieldType(
 ):
     type = "multiple_collaborators"
     model_class = MultipleCollaboratorsField
+    can_copy_rows_in_database = True
     can_get_unique_values = False
     can_be_in_form_view = False
     allowed_fields = ["notify_user_when_added"]
@@ -5671,6 +5826,9 @@ class MultipleCollaboratorsFieldType(
             "directly along with its id."
         )
 
+    def get_copy_rows_in_database_mapping(self, field, id_mapping, cache):
+        return _get_import_workspace_user_ids_mapping(id_mapping, cache)
+
     def get_export_value(self, value, field_object, rich_value=False):
         if value is None:
             return [] if rich_value else ""
@@ -5901,6 +6059,7 @@ class UUIDFieldType(ReadOnlyFieldType):
 
     type = "uuid"
     model_class = UUIDField
+    can_copy_rows_in_database = True
     can_get_unique_values = False
     can_be_in_form_view = False
     keep_data_on_duplication = True
@@ -5985,6 +6144,7 @@ class AutonumberFieldType(ReadOnlyFieldType):
 
     type = "autonumber"
     model_class = AutonumberField
+    can_copy_rows_in_database = True
     can_be_in_form_view = False
     keep_data_on_duplication = True
     request_serializer_field_names = ["view_id"]
@@ -6204,6 +6364,7 @@ class PasswordFieldType(FieldType):
 
     type = "password"
     model_class = PasswordField
+    can_copy_rows_in_database = True
     can_be_in_form_view = True
     keep_data_on_duplication = True
     _can_order_by = False
@@ -86,8 +86,13 @@ from .exceptions import (
     TableHasNoPrimaryField,
 )
 from .field_cache import FieldCache
-from .models import Field, SelectOption, SpecificFieldForUpdate
-from .registries import field_converter_registry, field_type_registry
+from .models import (
+    Field,
+    OnlineFieldConversionJob,
+    SelectOption,
+    SpecificFieldForUpdate,
+)
+from .registries import FieldConverter, field_converter_registry, field_type_registry
 from .signals import (
     before_field_deleted,
     field_created,
@@ -262,6 +267,8 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
         :param field_id: The field to lock and retrieve the specific instance of.
         :param field_model: The field_model to query using, provide a specific one if
             you want an exception raised if the field is not of this field_model type.
+        :raises FailedToLockFieldDueToConflict: When the field is locked by another
+            operation or is being converted online.
         :return: A specific locked field instance
         """
 
@@ -279,11 +286,31 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
             else:
                 raise e
 
+        self.raise_if_field_is_being_converted(specific_field)
+
         return cast(
             SpecificFieldForUpdate,
             specific_field,
         )
 
+    def raise_if_field_is_being_converted(self, field: Field):
+        """
+        Raises an exception if the field is being converted by an online field
+        conversion job. The column of the field must not be changed or removed until
+        the conversion has finished, because the trigger filling the shadow column
+        depends on it.
+
+        :param field: The field to check.
+        :raises FailedToLockFieldDueToConflict: When the field is being converted.
+        """
+
+        if (
+            OnlineFieldConversionJob.objects.filter(field_id=field.id)
+            .is_pending_or_running()
+            .exists()
+        ):
+            raise FailedToLockFieldDueToConflict()
+
     def create_field(
         self,
         user: AbstractUser,
@@ -467,6 +494,7 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
         after_schema_change_callback: Optional[
             Callable[[SpecificFieldForUpdate], None]
         ] = None,
+        field_converter: Optional[FieldConverter] = None,
         **kwargs,
     ) -> Union[SpecificFieldForUpdate, Tuple[SpecificFieldForUpdate, List[Field]]]:
         """
@@ -486,6 +514,9 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
         :param after_schema_change_callback: If specified this callback is called
             after the field has had it's schema updated but before any dependant
             fields have been updated.
+        :param field_converter: If provided, this converter is used to alter the
+            field instead of an applicable converter from the registry or the lenient
+            schema editor.
         :param kwargs: The field values that need to be updated
         :raises ValueError: When the provided field is not an instance of Field.
         :raises CannotChangeFieldType: When the database server responds with an
@@ -592,8 +623,10 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
         )
 
         # Try to find a data converter that can be applied.
-        converter = field_converter_registry.find_applicable_converter(
-            from_model, old_field, field
+        converter = field_converter or (
+            field_converter_registry.find_applicable_converter(
+                from_model, old_field, field
+            )
         )
 
         if converter:
@@ -845,6 +878,8 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
         :raises ValueError: When the provided field is not an instance of Field.
         :raises CannotDeletePrimaryField: When we try to delete the primary
             field which cannot be deleted.
+        :raises FailedToLockFieldDueToConflict: When the field is being converted
+            online.
         :return: A list of fields that have been updated because of the deleted
             field.
         """
@@ -862,6 +897,8 @@ class FieldHandler(metaclass=baserow_trace_methods(tracer)):
                 "Cannot delete the primary field of a table."
             )
 
+        self.raise_if_field_is_being_converted(field)
+
         field = field.specific
         if update_collector is None:
             update_collector = FieldUpdateCollector(field.table)
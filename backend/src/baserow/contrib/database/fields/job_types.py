@@ -1,6 +1,16 @@
+import contextlib
+
+from django.utils.functional import lazy
+
 from rest_framework import serializers
 
 from baserow.api.errors import ERROR_GROUP_DOES_NOT_EXIST, ERROR_USER_NOT_IN_GROUP
+from baserow.contrib.database.api.fields.errors import (
+    ERROR_FAILED_TO_LOCK_FIELD_DUE_TO_CONFLICT,
+    ERROR_FIELD_DOES_NOT_EXIST,
+    ERROR_INCOMPATIBLE_PRIMARY_FIELD_TYPE,
+    ERROR_ONLINE_FIELD_CONVERSION_NOT_SUPPORTED,
+)
 from baserow.contrib.database.api.fields.serializers import (
     FieldSerializer,
     FieldSerializerWithRelatedFields,
@@ -9,12 +19,29 @@ from baserow.contrib.database.db.atomic import (
     read_repeatable_read_single_table_transaction,
 )
 from baserow.contrib.database.fields.actions import DuplicateFieldActionType
+from baserow.contrib.database.fields.exceptions import (
+    FailedToLockFieldDueToConflict,
+    FieldDoesNotExist,
+    IncompatiblePrimaryFieldTypeError,
+    OnlineFieldConversionNotSupported,
+)
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.fields.models import DuplicateFieldJob
-from baserow.contrib.database.fields.operations import DuplicateFieldOperationType
+from baserow.contrib.database.fields.models import (
+    DuplicateFieldJob,
+    OnlineFieldConversionJob,
+)
+from baserow.contrib.database.fields.online_conversion import (
+    OnlineFieldConversionHandler,
+)
+from baserow.contrib.database.fields.operations import (
+    DuplicateFieldOperationType,
+    UpdateFieldOperationType,
+)
+from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.core.action.registries import action_type_registry
 from baserow.core.exceptions import UserNotInWorkspace, WorkspaceDoesNotExist
 from baserow.core.handler import CoreHandler
+from baserow.core.jobs.constants import JOB_FINISHED
 from baserow.core.jobs.registries import JobType
 
 
@@ -81,3 +108,95 @@ class DuplicateFieldJobType(JobType):
         job.save(update_fields=("duplicated_field",))
 
         return new_field_clone, updated_fields
+
+
+class OnlineFieldConversionJobType(JobType):
+    type = "online_field_conversion"
+    model_class = OnlineFieldConversionJob
+    max_count = 1
+
+    api_exceptions_map = {
+        UserNotInWorkspace: ERROR_USER_NOT_IN_GROUP,
+        WorkspaceDoesNotExist: ERROR_GROUP_DOES_NOT_EXIST,
+        FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
+        FailedToLockFieldDueToConflict: ERROR_FAILED_TO_LOCK_FIELD_DUE_TO_CONFLICT,
+        IncompatiblePrimaryFieldTypeError: ERROR_INCOMPATIBLE_PRIMARY_FIELD_TYPE,
+        OnlineFieldConversionNotSupported: ERROR_ONLINE_FIELD_CONVERSION_NOT_SUPPORTED,
+    }
+
+    request_serializer_field_names = ["field_id", "new_type", "field_values"]
+
+    request_serializer_field_overrides = {
+        "field_id": serializers.IntegerField(
+            help_text="The ID of the field to convert.",
+        ),
+        "new_type": serializers.ChoiceField(
+            choices=lazy(field_type_registry.get_types, list)(),
+            help_text="The type the field must be converted to.",
+        ),
+        "field_values": serializers.DictField(
+            required=False,
+            default=dict,
+            help_text="The other values of the field that must be updated together "
+            "with the type, like the values of the update field endpoint.",
+        ),
+    }
+
+    serializer_field_names = ["field", "new_type"]
+    serializer_field_overrides = {
+        "field": FieldSerializer(read_only=True),
+    }
+
+    def transaction_atomic_context(self, job: OnlineFieldConversionJob):
+        # The rows are converted in batches that each run in their own transaction,
+        # so that the table is never locked for long.
+        return contextlib.nullcontext()
+
+    def prepare_values(self, values, user):
+        # Locking the field makes sure that only one conversion can be started.
+        field = FieldHandler().get_specific_field_for_update(values["field_id"])
+        CoreHandler().check_permissions(
+            user,
+            UpdateFieldOperationType.type,
+            workspace=field.table.database.workspace,
+            context=field,
+        )
+
+        field_values = values.get("field_values", {})
+        OnlineFieldConversionHandler().requires_online_conversion(
+            user, field, values["new_type"], field_values
+        )
+
+        return {
+            "field": field,
+            "new_type": values["new_type"],
+            "field_values": field_values,
+        }
+
+    def run(self, job, progress):
+        if job.field_id is None:
+            raise FieldDoesNotExist("The field to convert has been deleted.")
+
+        return OnlineFieldConversionHandler().convert_field(
+            job.user,
+            FieldHandler().get_field(job.field_id).specific,
+            job.new_type,
+            job.field_values,
+            progress.create_child_builder(represents_progress=progress.total),
+        )
+
+    def on_error(self, job, error):
+        # The conversion cleans up after itself, unless it failed while starting or
+        # cleaning up.
+        if job.field_id is not None:
+            OnlineFieldConversionHandler().clean_up_conversion(job.field)
+
+    def on_expired(self, job):
+        # The job might never finish, so the shadow column and trigger must be
+        # removed before the field can be changed again.
+        if job.field_id is not None:
+            OnlineFieldConversionHandler().clean_up_conversion(job.field)
+
+    def before_delete(self, job):
+        if job.field_id is not None and job.state != JOB_FINISHED:
+            OnlineFieldConversionHandler().clean_up_conversion(job.field)
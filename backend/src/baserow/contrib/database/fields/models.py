@@ -515,6 +515,12 @@ class FormulaField(Field):
         default=False,
         help_text="Indicates if the field needs to be periodically updated.",
     )
+    next_periodic_update_at = models.DateTimeField(
+        null=True,
+        help_text="The first moment at which the value of a field that needs to be "
+        "periodically updated can change again. If not set, the field is updated with "
+        "every periodic update.",
+    )
     expand_formula_when_referenced = models.BooleanField(
         default=False,
         null=True,  # TODO zdm remove me in next release
@@ -776,4 +782,23 @@ class DuplicateFieldJob(
     )
 
 
+class OnlineFieldConversionJob(JobWithUserIpAddress, JobWithWebsocketId, Job):
+    field = models.ForeignKey(
+        Field,
+        null=True,
+        related_name="online_conversion_jobs",
+        on_delete=models.SET_NULL,
+        help_text="The Baserow field to convert.",
+    )
+    new_type = models.CharField(
+        max_length=255,
+        help_text="The type the field must be converted to.",
+    )
+    field_values = models.JSONField(
+        default=dict,
+        help_text="The other values of the field that must be updated together with "
+        "the type.",
+    )
+
+
 SpecificFieldForUpdate = NewType("SpecificFieldForUpdate", Field)
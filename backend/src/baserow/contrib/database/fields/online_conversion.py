@@ -0,0 +1,521 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth.models import AbstractUser
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.db.models import NOT_PROVIDED
+from django.db.models import Field as DjangoField
+from django.db.models import Max, Min
+
+from baserow.contrib.database.db.schema import safe_django_schema_editor
+from baserow.contrib.database.db.sql_queries import (
+    sql_create_online_conversion_cast,
+    sql_create_online_conversion_trigger,
+    sql_drop_online_conversion,
+)
+from baserow.contrib.database.table.models import GeneratedTableModel
+from baserow.core.jobs.constants import JOB_FINISHED
+from baserow.core.utils import ChildProgressBuilder, extract_allowed, set_allowed_attrs
+
+from .exceptions import (
+    IncompatiblePrimaryFieldTypeError,
+    OnlineFieldConversionNotSupported,
+)
+from .handler import FieldHandler
+from .models import Field, OnlineFieldConversionJob
+from .registries import FieldConverter, field_converter_registry, field_type_registry
+
+
+class ShadowColumnFieldConverter(FieldConverter):
+    """
+    Alters the field by replacing the column with the shadow column that has been
+    filled with the converted values by the online field conversion. Only the swap
+    of the columns happens while the table is locked, the values are not converted
+    again. If the new column must not be null, the validated check constraint of the
+    shadow column makes sure that setting it to not null doesn't scan the table.
+    """
+
+    type = "shadow_column"
+
+    def is_applicable(self, from_model, from_field, to_field):
+        # This converter is never picked from the registry, it's explicitly provided
+        # when finishing an online field conversion.
+        return False
+
+    def alter_field(
+        self,
+        from_field,
+        to_field,
+        from_model,
+        to_model,
+        from_model_field,
+        to_model_field,
+        user,
+        connection,
+    ):
+        handler = OnlineFieldConversionHandler()
+        shadow_model_field = handler.get_shadow_model_field(
+            to_field, to_model, to_model_field, null=to_model_field.null
+        )
+        sql_names = handler._get_sql_names(to_field)
+        with safe_django_schema_editor() as schema_editor:
+            handler.drop_trigger_and_functions(to_field, schema_editor)
+            schema_editor.remove_field(from_model, from_model_field)
+            if not to_model_field.null:
+                schema_editor.execute(
+                    "ALTER TABLE %(table)s ALTER COLUMN %(shadow_column)s SET NOT NULL"
+                    % sql_names
+                )
+                schema_editor.execute(
+                    "ALTER TABLE %(table)s DROP CONSTRAINT IF EXISTS "
+                    "%(not_null_constraint)s" % sql_names
+                )
+            # Renames the shadow column and changes the indexes to the ones of the
+            # new field.
+            schema_editor.alter_field(to_model, shadow_model_field, to_model_field)
+
+
+class OnlineFieldConversionHandler:
+    """
+    Converts the type of a field without rewriting the whole table while holding an
+    ACCESS EXCLUSIVE lock. The converted values are written in a shadow column that is
+    backfilled in batches of rows, while a trigger keeps it up to date with the rows
+    that are created or updated in the meantime. When the shadow column is complete,
+    the field is updated and the old column is replaced with the shadow column.
+    """
+
+    def get_shadow_column_name(self, field: Field) -> str:
+        return f"{field.db_column}_shadow"
+
+    def _get_sql_names(self, field: Field) -> Dict[str, str]:
+        quote_name = connection.ops.quote_name
+        table_name = field.table.get_database_table_name()
+        return {
+            "table": quote_name(table_name),
+            "column": quote_name(field.db_column),
+            "shadow_column": quote_name(self.get_shadow_column_name(field)),
+            "function": quote_name(f"baserow_online_conversion_{field.id}"),
+            "trigger_function": quote_name(
+                f"baserow_online_conversion_{field.id}_trigger"
+            ),
+            "trigger": quote_name(f"{table_name}_{field.db_column}_conversion"),
+            "not_null_constraint": quote_name(
+                f"{table_name}_{field.db_column}_shadow_not_null"
+            ),
+        }
+
+    def get_not_null_default(self, to_model_field: DjangoField) -> Any:
+        """
+        Returns the value that the converted values that are null are replaced with if
+        the new column must not be null, like the regular conversion does.
+        """
+
+        return connection.schema_editor().effective_default(to_model_field)
+
+    def get_converted_field(
+        self,
+        user: AbstractUser,
+        field: Field,
+        new_type_name: str,
+        field_values: Dict[str, Any],
+    ) -> Field:
+        """
+        Returns an unsaved instance of the field like it would be after updating it
+        to the new type and values, without changing the field itself.
+
+        :param user: The user on whose behalf the field is converted.
+        :param field: The specific field instance that must be converted.
+        :param new_type_name: The type the field must be converted to.
+        :param field_values: The other values of the field that will be updated.
+        :raises IncompatiblePrimaryFieldTypeError: When the field is the primary field
+            and the new type can't be a primary field.
+        :return: The converted field instance.
+        """
+
+        to_field_type = field_type_registry.get(new_type_name)
+        allowed_fields = ["name", "description"] + to_field_type.allowed_fields
+        values = extract_allowed(field_values, allowed_fields)
+
+        if field.primary and not to_field_type.can_be_primary_field(values):
+            raise IncompatiblePrimaryFieldTypeError(new_type_name)
+
+        values = to_field_type.prepare_values(values, user)
+        to_field = to_field_type.model_class(
+            **{
+                model_field.attname: getattr(field, model_field.attname)
+                for model_field in Field._meta.concrete_fields
+                if model_field.name != "content_type"
+            },
+            content_type=ContentType.objects.get_for_model(to_field_type.model_class),
+        )
+        return set_allowed_attrs(values, allowed_fields, to_field)
+
+    def get_models(
+        self, field: Field, to_field: Field
+    ) -> Tuple[GeneratedTableModel, GeneratedTableModel, DjangoField, DjangoField]:
+        """
+        Returns the generated models containing only the field before and after the
+        conversion and their model fields.
+        """
+
+        from_model = field.table.get_model(
+            field_ids=[], fields=[field], add_dependencies=False
+        )
+        to_model = field.table.get_model(
+            field_ids=[], fields=[to_field], add_dependencies=False
+        )
+        return (
+            from_model,
+            to_model,
+            from_model._meta.get_field(field.db_column),
+            to_model._meta.get_field(to_field.db_column),
+        )
+
+    def requires_online_conversion(
+        self,
+        user: AbstractUser,
+        field: Field,
+        new_type_name: str,
+        field_values: Dict[str, Any],
+    ) -> bool:
+        """
+        Checks whether the field can be converted online and whether that's needed,
+        because the update would rewrite the column.
+
+        :param user: The user on whose behalf the field is converted.
+        :param field: The specific field instance that must be converted.
+        :param new_type_name: The type the field must be converted to.
+        :param field_values: The other values of the field that will be updated.
+        :raises OnlineFieldConversionNotSupported: When the values can't be converted
+            with a shadow column, because the field types need a field converter,
+            select options or relations, are read only, or the new column must not
+            be null but has no default.
+        :return: Whether the column must be rewritten to update the field.
+        """
+
+        from_field_type = field_type_registry.get_by_model(field)
+        to_field_type = field_type_registry.get(new_type_name)
+        not_supported = OnlineFieldConversionNotSupported(
+            f"The field can't be converted online from {from_field_type.type} to "
+            f"{new_type_name}."
+        )
+        if (
+            from_field_type.read_only
+            or to_field_type.read_only
+            or from_field_type.can_have_select_options
+            or to_field_type.can_have_select_options
+        ):
+            raise not_supported
+
+        to_field = self.get_converted_field(user, field, new_type_name, field_values)
+        from_model, _, from_model_field, to_model_field = self.get_models(
+            field, to_field
+        )
+        if (
+            from_model_field.is_relation
+            or to_model_field.is_relation
+            or field_converter_registry.find_applicable_converter(
+                from_model, field, to_field
+            )
+            or (
+                not to_model_field.null
+                and self.get_not_null_default(to_model_field) is None
+            )
+        ):
+            raise not_supported
+
+        return (
+            from_field_type.type != to_field_type.type
+            or to_field_type.force_same_type_alter_column(field, to_field)
+            or from_model_field.db_parameters(connection)["type"]
+            != to_model_field.db_parameters(connection)["type"]
+        )
+
+    def get_shadow_model_field(
+        self,
+        to_field: Field,
+        to_model: GeneratedTableModel,
+        to_model_field: DjangoField,
+        null: bool = True,
+    ) -> DjangoField:
+        """
+        Returns a model field of the new type pointing to the shadow column, without
+        a default or index, so that it's cheap to add to the table. The column is
+        nullable while it's being filled.
+        """
+
+        shadow_model_field = to_model_field.clone()
+        shadow_model_field.db_column = self.get_shadow_column_name(to_field)
+        shadow_model_field.null = null
+        shadow_model_field.default = NOT_PROVIDED
+        shadow_model_field.db_index = False
+        shadow_model_field.set_attributes_from_name(to_model_field.name)
+        shadow_model_field.model = to_model
+        return shadow_model_field
+
+    def start_conversion(
+        self,
+        user: AbstractUser,
+        field: Field,
+        new_type_name: str,
+        field_values: Dict[str, Any],
+    ):
+        """
+        Adds the shadow column and the trigger that writes the converted value in it
+        for every created row and every row of which the field value is updated. Both
+        only need a short lock on the table. The leftovers of a previous conversion of
+        the field that didn't finish are removed first. If the new column must not be
+        null, the values that are converted to null are replaced with the default.
+
+        :param user: The user on whose behalf the field is converted.
+        :param field: The specific field instance that must be converted.
+        :param new_type_name: The type the field must be converted to.
+        :param field_values: The other values of the field that will be updated.
+        :return: The converted field instance.
+        """
+
+        from_field_type = field_type_registry.get_by_model(field)
+        to_field_type = field_type_registry.get(new_type_name)
+        to_field = self.get_converted_field(user, field, new_type_name, field_values)
+        _, to_model, _, to_model_field = self.get_models(field, to_field)
+        shadow_model_field = self.get_shadow_model_field(
+            to_field, to_model, to_model_field
+        )
+        sql_names = self._get_sql_names(field)
+
+        # Uses the same SQL as the lenient schema editor to convert the values.
+        variables = {}
+        prepare_values = []
+        for prepare_value in [
+            from_field_type.get_alter_column_prepare_old_value(
+                connection, field, to_field
+            ),
+            to_field_type.get_alter_column_prepare_new_value(
+                connection, field, to_field
+            ),
+        ]:
+            if isinstance(prepare_value, tuple):
+                prepare_value, prepare_variables = prepare_value
+                variables.update(
+                    {
+                        key: value.replace("$FUNCTION$", "")
+                        for key, value in prepare_variables.items()
+                    }
+                )
+            prepare_values.append(prepare_value or "")
+
+        shadow_type = shadow_model_field.db_parameters(connection)["type"]
+        return_value = f"p_in::{shadow_type}"
+        error_value = "p_default"
+        if not to_model_field.null:
+            variables["online_conversion_default"] = self.get_not_null_default(
+                to_model_field
+            )
+            return_value = f"coalesce({return_value}, %(online_conversion_default)s)"
+            error_value = "%(online_conversion_default)s"
+
+        with transaction.atomic(), safe_django_schema_editor() as schema_editor:
+            self.drop_shadow_column_and_trigger(field, schema_editor)
+            schema_editor.add_field(to_model, shadow_model_field)
+            schema_editor.execute(
+                sql_create_online_conversion_cast
+                % {
+                    "function": sql_names["function"],
+                    "type": shadow_type,
+                    "alter_column_prepare_old_value": prepare_values[0],
+                    "alter_column_prepare_new_value": prepare_values[1],
+                    "return_value": return_value,
+                    "error_value": error_value,
+                },
+                variables,
+            )
+            schema_editor.execute(sql_create_online_conversion_trigger % sql_names)
+
+        return to_field
+
+    def backfill_shadow_column(
+        self,
+        field: Field,
+        batch_size: Optional[int] = None,
+        progress_builder: Optional[ChildProgressBuilder] = None,
+    ):
+        """
+        Fills the shadow column with the converted values of the rows that existed
+        when the conversion started. Every batch of rows is updated in its own
+        transaction, so that the rows are only locked for a short time.
+
+        :param field: The field that is being converted.
+        :param batch_size: The number of rows to convert per transaction. Defaults to
+            `BASEROW_ONLINE_FIELD_CONVERSION_BATCH_SIZE`.
+        :param progress_builder: Optionally a progress builder to track the progress.
+        """
+
+        if batch_size is None:
+            batch_size = settings.BASEROW_ONLINE_FIELD_CONVERSION_BATCH_SIZE
+
+        model = field.table.get_model(field_ids=[])
+        id_range = model.objects_and_trash.aggregate(min_id=Min("id"), max_id=Max("id"))
+        min_id, max_id = id_range["min_id"], id_range["max_id"]
+        batch_starts = (
+            range(min_id, max_id + 1, batch_size) if min_id is not None else []
+        )
+        progress = ChildProgressBuilder.build(progress_builder, len(batch_starts))
+
+        # Rows that are created after this point are converted by the trigger.
+        backfill_sql = (
+            "UPDATE %(table)s SET %(shadow_column)s = %(function)s(%(column)s::text) "
+            "WHERE id >= %%s AND id < %%s"
+        ) % self._get_sql_names(field)
+        for batch_start in batch_starts:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(backfill_sql, [batch_start, batch_start + batch_size])
+            progress.increment()
+
+    def validate_shadow_column(self, field: Field, to_field: Field):
+        """
+        If the new column must not be null, adds a check constraint to the backfilled
+        shadow column and validates it. Validating doesn't block the writes to the
+        table, and allows setting the column to not null without scanning the table
+        while it's locked.
+
+        :param field: The field that is being converted.
+        :param to_field: The converted field instance.
+        """
+
+        _, _, _, to_model_field = self.get_models(field, to_field)
+        if to_model_field.null:
+            return
+
+        sql_names = self._get_sql_names(field)
+        # The constraint is only added after the backfill, because it's also checked
+        # when other columns of a row that isn't converted yet are updated.
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                "ALTER TABLE %(table)s ADD CONSTRAINT %(not_null_constraint)s "
+                "CHECK (%(shadow_column)s IS NOT NULL) NOT VALID" % sql_names
+            )
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                "ALTER TABLE %(table)s VALIDATE CONSTRAINT %(not_null_constraint)s"
+                % sql_names
+            )
+
+    def finish_conversion(
+        self,
+        user: AbstractUser,
+        field: Field,
+        new_type_name: str,
+        field_values: Dict[str, Any],
+    ) -> Tuple[Field, List[Field]]:
+        """
+        Updates the field to the new type and values, and replaces the old column with
+        the shadow column. The dependant fields are only updated at this point, because
+        before the swap the field still has its old type and values.
+
+        :param user: The user on whose behalf the field is converted.
+        :param field: The specific field instance that must be converted.
+        :param new_type_name: The type the field must be converted to.
+        :param field_values: The other values of the field that will be updated.
+        :return: The converted field and the fields that have been updated as a result.
+        """
+
+        with transaction.atomic():
+            return FieldHandler().update_field(
+                user,
+                field,
+                new_type_name,
+                return_updated_fields=True,
+                field_converter=ShadowColumnFieldConverter(),
+                **field_values,
+            )
+
+    def convert_field(
+        self,
+        user: AbstractUser,
+        field: Field,
+        new_type_name: str,
+        field_values: Dict[str, Any],
+        progress_builder: Optional[ChildProgressBuilder] = None,
+    ) -> Tuple[Field, List[Field]]:
+        """
+        Converts the field to the new type and values online. This must not be called
+        inside a transaction, because the batches of rows are converted in separate
+        transactions. If the column doesn't have to be rewritten, the field is updated
+        right away.
+
+        :param user: The user on whose behalf the field is converted.
+        :param field: The specific field instance that must be converted.
+        :param new_type_name: The type the field must be converted to.
+        :param field_values: The other values of the field that will be updated.
+        :param progress_builder: Optionally a progress builder to track the progress.
+        :raises OnlineFieldConversionNotSupported: When the field can't be converted
+            online to the new type and values.
+        :return: The converted field and the fields that have been updated as a result.
+        """
+
+        progress = ChildProgressBuilder.build(progress_builder, child_total=100)
+
+        if not self.requires_online_conversion(
+            user, field, new_type_name, field_values
+        ):
+            with transaction.atomic():
+                result = FieldHandler().update_field(
+                    user,
+                    field,
+                    new_type_name,
+                    return_updated_fields=True,
+                    **field_values,
+                )
+            progress.increment(100)
+            return result
+
+        try:
+            to_field = self.start_conversion(user, field, new_type_name, field_values)
+            progress.increment(5)
+            self.backfill_shadow_column(
+                field, progress_builder=progress.create_child_builder(90)
+            )
+            self.validate_shadow_column(field, to_field)
+            result = self.finish_conversion(user, field, new_type_name, field_values)
+        except Exception:
+            self.clean_up_conversion(field)
+            raise
+        progress.increment(5)
+        return result
+
+    def drop_trigger_and_functions(self, field: Field, schema_editor):
+        schema_editor.execute(sql_drop_online_conversion % self._get_sql_names(field))
+
+    def clean_up_conversion(self, field: Field):
+        """
+        Removes the trigger, functions and shadow column of an unfinished online
+        conversion of the field, if they exist.
+
+        :param field: The field that was being converted.
+        """
+
+        with transaction.atomic(), safe_django_schema_editor() as schema_editor:
+            self.drop_shadow_column_and_trigger(field, schema_editor)
+
+    def clean_up_unfinished_conversions(self, field: Field):
+        """
+        Removes the leftovers of the online conversions of the field that have not
+        finished, for example because the job failed or expired.
+
+        :param field: The field that might have been left behind while converting.
+        """
+
+        if (
+            OnlineFieldConversionJob.objects.filter(field_id=field.id)
+            .exclude(state=JOB_FINISHED)
+            .exists()
+        ):
+            self.clean_up_conversion(field)
+
+    def drop_shadow_column_and_trigger(self, field: Field, schema_editor):
+        self.drop_trigger_and_functions(field, schema_editor)
+        schema_editor.execute(
+            "ALTER TABLE %(table)s DROP COLUMN IF EXISTS %(shadow_column)s"
+            % self._get_sql_names(field)
+        )
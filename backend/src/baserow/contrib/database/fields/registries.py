@@ -1,4 +1,16 @@
-from typing import TYPE_CHECKING, Any, Dict, List, NoReturn, Optional, Set, Tuple, Union
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from zipfile import ZipFile
 
 from django.contrib.auth.models import AbstractUser
@@ -182,6 +194,15 @@ class FieldType(
     some fields can depend on it like the `lookup` field.
     """
 
+    can_copy_rows_in_database = False
+    """
+    Set this to True if the cell values can be copied with an SQL query from the
+    exported table when duplicating or snapshotting a database, instead of serializing
+    every row. Values referencing other objects can be remapped using the
+    `get_copy_rows_in_database_mapping` method. If any field of a table doesn't
+    support it, the rows of the table are serialized.
+    """
+
     @property
     def db_column_fields(self) -> Set[str]:
         if self._db_column_fields is not None:
@@ -456,6 +477,27 @@ class FieldType(
 
         return self.get_serializer_field(instance, **kwargs)
 
+    def get_response_serializer_extractor(
+        self, instance, serializer_field
+    ) -> Callable[[Any], Any]:
+        """
+        Returns a plain function that converts a not `None` cell value into the
+        same representation as the `to_representation` method of the provided
+        response serializer field. It's used by the compiled row serializers to
+        serialize many rows without going through the generic DRF field machinery.
+        Field types can return a faster function, but it must give exactly the
+        same output. By default the serializer field itself is used.
+
+        :param instance: The field instance for which to get the extractor.
+        :type instance: Field
+        :param serializer_field: The bound response serializer field of the field.
+        :type serializer_field: serializer.Field
+        :return: A function accepting the cell value and returning its
+            representation.
+        """
+
+        return serializer_field.to_representation
+
     def get_serializer_help_text(self, instance):
         """
         If some additional information in the documentation related to the field's type
@@ -1102,6 +1144,25 @@ class FieldType(
 
         setattr(row, field_name, value)
 
+    def get_copy_rows_in_database_mapping(
+        self, field: Field, id_mapping: Dict[str, Any], cache: Dict[str, Any]
+    ) -> Optional[Dict[int, int]]:
+        """
+        Only called if `can_copy_rows_in_database` is True. If the values of the field
+        reference other objects, like select options or users, this method should
+        return a mapping between the referenced ids in the exported table and the ids
+        to reference in the imported table. Values that are not in the mapping are
+        not copied.
+
+        :param field: The imported field instance.
+        :param id_mapping: The map of exported ids to newly created ids.
+        :param cache: An in memory dictionary that is shared between all fields while
+            copying the rows.
+        :return: The mapping or None if the values can be copied as they are.
+        """
+
+        return None
+
     def get_export_value(
         self, value: Any, field_object: "FieldObject", rich_value: bool = False
     ) -> Any:
@@ -1257,6 +1318,32 @@ class FieldType(
 
         return already_updated_fields
 
+    def filter_fields_due_for_periodic_update(
+        self, queryset: QuerySet, now: datetime
+    ) -> QuerySet:
+        """
+        Filters the fields needing a periodic update down to the ones of which the
+        value could have changed at the provided moment. The other fields are skipped
+        by the periodic update until they are due again.
+
+        :param queryset: A queryset of fields as returned by
+            `get_fields_needing_periodic_update`.
+        :param now: The moment that will be used to periodically update the fields.
+        :return: The filtered queryset.
+        """
+
+        return queryset
+
+    def schedule_next_periodic_update(self, fields: List[Field], updated_at: datetime):
+        """
+        Called after the provided fields have been periodically updated so the field
+        type can remember when their value can change again. This will be used by
+        `filter_fields_due_for_periodic_update` to skip them until then.
+
+        :param fields: The fields that have been periodically updated.
+        :param updated_at: The moment that has been used to update the fields.
+        """
+
     def get_field_depdendencies_before_import_serialized(
         self,
         serialized_field: Dict[str, Any],
@@ -9,7 +9,7 @@ from django.db.models import Q, QuerySet
 from django.utils import timezone
 
 from loguru import logger
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 
 from baserow.config.celery import app
 from baserow.contrib.database.fields.periodic_field_update_handler import (
@@ -22,6 +22,14 @@ from baserow.core.models import Workspace
 from baserow.core.telemetry.utils import add_baserow_trace_attrs, baserow_trace
 
 tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+
+periodic_field_update_fields_counter = meter.create_counter(
+    "baserow.periodic_field_update.fields",
+    unit="1",
+    description="The number of fields that were due and have been periodically "
+    "updated.",
+)
 
 
 def filter_distinct_workspace_ids_per_fields(
@@ -92,6 +100,7 @@ def _run_periodic_field_type_update_per_workspace(
 
     if update_now:
         workspace.refresh_now()
+    now = workspace.get_now_or_set_if_null()
     add_baserow_trace_attrs(update_now=update_now, workspace_id=workspace.id)
 
     all_updated_fields = []
@@ -101,10 +110,20 @@ def _run_periodic_field_type_update_per_workspace(
         table__trashed=False,
         table__database__trashed=False,
     )
+    if update_now:
+        # Skip the fields of which the value can't have changed since their last
+        # periodic update, like formulas only depending on the current date. When the
+        # previous `now` is reused, all the fields are recalculated.
+        fields = field_type_instance.filter_fields_due_for_periodic_update(fields, now)
+    fields = list(fields)
+    if not fields:
+        return
+    periodic_field_update_fields_counter.add(len(fields))
+
     # noinspection PyBroadException
     try:
         all_updated_fields = _run_periodic_field_update(
-            fields, field_type_instance, all_updated_fields
+            fields, field_type_instance, all_updated_fields, now
         )
     except Exception:
         tb = traceback.format_exc()
@@ -136,11 +155,15 @@ def delete_mentions_marked_for_deletion(self):
 
 
 @baserow_trace(tracer)
-def _run_periodic_field_update(fields, field_type_instance, all_updated_fields):
+def _run_periodic_field_update(
+    fields, field_type_instance, all_updated_fields, updated_at
+):
     with transaction.atomic():
-        return field_type_instance.run_periodic_update(
+        updated_fields = field_type_instance.run_periodic_update(
             fields, already_updated_fields=all_updated_fields
         )
+        field_type_instance.schedule_next_periodic_update(fields, updated_at)
+        return updated_fields
 
 
 @app.on_after_finalize.connect
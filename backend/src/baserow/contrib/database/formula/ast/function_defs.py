@@ -1,7 +1,7 @@
 from abc import ABC
-from datetime import timedelta
+from datetime import datetime, time, timedelta, timezone
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
 from django.contrib.postgres.aggregates import JSONBAgg
 from django.db.models import (
@@ -1606,6 +1606,10 @@ class BaserowNow(ZeroArgumentBaserowFunction):
             Value(context.get_utc_now(), output_field=fields.DateTimeField()),
         )
 
+    def get_next_periodic_update_at(self, updated_at: datetime) -> Optional[datetime]:
+        # The current time can change the result at any moment.
+        return None
+
 
 class BaserowToday(ZeroArgumentBaserowFunction):
     type = "today"
@@ -1635,6 +1639,11 @@ class BaserowToday(ZeroArgumentBaserowFunction):
             Value(context.get_utc_now(), output_field=fields.DateField()),
         )
 
+    def get_next_periodic_update_at(self, updated_at: datetime) -> Optional[datetime]:
+        # The date is calculated in UTC, so it only changes at midnight UTC.
+        next_date = updated_at.astimezone(timezone.utc).date() + timedelta(days=1)
+        return datetime.combine(next_date, time.min, tzinfo=timezone.utc)
+
 
 class BaserowToDate(TwoArgumentBaserowFunction):
     type = "todate"
@@ -1,4 +1,5 @@
 import typing
+from datetime import datetime
 from typing import Dict, Optional, Set, Tuple, Type
 
 from django.db.models import Expression, Model
@@ -361,6 +362,9 @@ class FormulaHandler(metaclass=baserow_trace_methods(tracer)):
         formula_field.version = BASEROW_FORMULA_VERSION
 
         formula_field.needs_periodic_update = _needs_periodic_update(expression)
+        # The expression might have changed, so the next periodic update can't be
+        # skipped anymore.
+        formula_field.next_periodic_update_at = None
         formula_field.expand_formula_when_referenced = _has_lookup_expressions(
             expression
         )
@@ -368,6 +372,38 @@ class FormulaHandler(metaclass=baserow_trace_methods(tracer)):
         formula_field.requires_refresh_after_insert = refresh_after_insert
         return expression
 
+    @classmethod
+    def get_next_periodic_update_at(
+        cls, expression: BaserowExpression, updated_at: datetime
+    ) -> Optional[datetime]:
+        """
+        Calculates when the value of an expression that needs to be periodically
+        updated can change again, given that it has been calculated at `updated_at`.
+        For example, an expression only using `today()` can't change before midnight.
+
+        :param expression: The typed expression of the formula.
+        :param updated_at: The moment used to calculate the current value of the
+            formula.
+        :return: The first moment at which the value can change, or None if it can
+            change at any moment.
+        """
+
+        functions_used: Set[BaserowFunctionDefinition] = expression.accept(
+            FunctionsUsedVisitor()
+        )
+        next_update_at = None
+        for function_def in functions_used:
+            if not getattr(function_def, "needs_periodic_update", False):
+                continue
+            function_next_update_at = function_def.get_next_periodic_update_at(
+                updated_at
+            )
+            if function_next_update_at is None:
+                return None
+            if next_update_at is None or function_next_update_at < next_update_at:
+                next_update_at = function_next_update_at
+        return next_update_at
+
     @classmethod
     def get_parse_tree_for_formula(cls, formula: str):
         """
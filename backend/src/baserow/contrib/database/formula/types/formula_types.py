@@ -140,7 +140,10 @@ class BaserowFormulaTextType(
 
     def get_order_by_in_array_expr(self, field, field_name, order_direction):
         return JSONBSingleKeyArrayExpression(
-            field_name, "value", "text", output_field=models.TextField()
+            field_name,
+            "value",
+            "text",
+            output_field=ArrayField(base_field=models.TextField()),
         )
 
 
@@ -157,7 +160,10 @@ class BaserowFormulaCharType(BaserowFormulaTextType, BaserowFormulaValidType):
 
     def get_order_by_in_array_expr(self, field, field_name, order_direction):
         return JSONBSingleKeyArrayExpression(
-            field_name, "value", "text", output_field=models.TextField()
+            field_name,
+            "value",
+            "text",
+            output_field=ArrayField(base_field=models.TextField()),
         )
 
     def placeholder_empty_baserow_expression(
@@ -709,7 +715,10 @@ class BaserowFormulaDurationType(
 
     def get_order_by_in_array_expr(self, field, field_name, order_direction):
         return JSONBSingleKeyArrayExpression(
-            field_name, "value", "interval", output_field=models.DurationField()
+            field_name,
+            "value",
+            "interval",
+            output_field=ArrayField(base_field=models.DurationField()),
         )
 
 
@@ -851,7 +860,10 @@ class BaserowFormulaDateType(BaserowFormulaValidType):
 
     def get_order_by_in_array_expr(self, field, field_name, order_direction):
         return JSONBSingleKeyArrayExpression(
-            field_name, "value", "timestamp", output_field=models.DateTimeField()
+            field_name,
+            "value",
+            "timestamp",
+            output_field=ArrayField(base_field=models.DateTimeField()),
         )
 
     def __str__(self) -> str:
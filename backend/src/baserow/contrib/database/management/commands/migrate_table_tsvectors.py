@@ -0,0 +1,56 @@
+import sys
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from baserow.contrib.database.search.handler import SearchHandler
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.models import Table
+
+
+class Command(BaseCommand):
+    help = (
+        "Given a table ID, this command will move its search vectors from a tsvector "
+        "column per field into the companion search table. The existing search "
+        "vectors are copied, so the table can still be searched afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "table_id",
+            type=int,
+            help="The ID of the table to migrate the tsvectors of.",
+        )
+        parser.add_argument(
+            "--to-columns",
+            action="store_true",
+            help="If true, it will move the search vectors from the search table "
+            "back into a tsvector column per field.",
+        )
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        table_id = options["table_id"]
+        to_columns = options.get("to_columns", False)
+        try:
+            table = TableHandler().get_table_for_update(table_id)
+        except Table.DoesNotExist:
+            self.stdout.write(
+                self.style.ERROR(f"The table with id {table_id} was not found.")
+            )
+            sys.exit(1)
+
+        if to_columns:
+            SearchHandler.migrate_tsvectors_to_columns(table)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    "The search vectors have been moved into the tsvector columns."
+                )
+            )
+        else:
+            SearchHandler.migrate_tsvectors_to_search_table(table)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    "The search vectors have been moved into the search table."
+                )
+            )
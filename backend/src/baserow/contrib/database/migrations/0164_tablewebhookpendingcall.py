@@ -0,0 +1,85 @@
+# Generated by Django 4.2.13 on 2026-10-18 07:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0163_alter_formulafield_expand_formula_when_referenced"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TableWebhookPendingCall",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event_id",
+                    models.UUIDField(
+                        help_text="Event ID where the call originated from."
+                    ),
+                ),
+                ("event_type", models.CharField(max_length=50)),
+                (
+                    "method",
+                    models.CharField(
+                        choices=[
+                            ("POST", "Post"),
+                            ("GET", "Get"),
+                            ("PUT", "Put"),
+                            ("PATCH", "Patch"),
+                            ("DELETE", "Delete"),
+                        ],
+                        help_text="The request method that must be used.",
+                        max_length=10,
+                    ),
+                ),
+                ("url", models.TextField(help_text="The URL that must be called.")),
+                (
+                    "headers",
+                    models.JSONField(
+                        default=dict,
+                        help_text="The headers that must be added to the request.",
+                    ),
+                ),
+                (
+                    "payload",
+                    models.JSONField(help_text="The JSON payload of the request."),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The number of failed attempts to make the call.",
+                    ),
+                ),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        help_text="The call is not made before this time, so that failed calls are retried with a backoff.",
+                    ),
+                ),
+                (
+                    "webhook",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_calls",
+                        to="database.tablewebhook",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("id",),
+            },
+        ),
+    ]
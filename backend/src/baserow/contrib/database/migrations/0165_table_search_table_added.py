@@ -0,0 +1,37 @@
+# Generated by Django 4.2.13 on 2026-10-18 07:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0164_tablewebhookpendingcall"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="table",
+            name="search_table_added",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the search vectors of the table are stored in the companion search table instead of a tsvector column per field.",
+            ),
+        ),
+        migrations.RunSQL(
+            (
+                r"""
+CREATE OR REPLACE FUNCTION baserow_delete_search_table_rows()
+RETURNS TRIGGER AS $$
+BEGIN
+    EXECUTE format(
+        'DELETE FROM %I WHERE row_id IN (SELECT id FROM deleted_rows)',
+        TG_TABLE_NAME || '_search'
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+            ),
+            "DROP FUNCTION IF EXISTS baserow_delete_search_table_rows();",
+        ),
+    ]
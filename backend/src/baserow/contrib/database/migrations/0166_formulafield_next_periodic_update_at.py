@@ -0,0 +1,20 @@
+# Generated by Django 4.2.13 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0165_table_search_table_added"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="formulafield",
+            name="next_periodic_update_at",
+            field=models.DateTimeField(
+                help_text="The first moment at which the value of a field that needs to be periodically updated can change again. If not set, the field is updated with every periodic update.",
+                null=True,
+            ),
+        ),
+    ]
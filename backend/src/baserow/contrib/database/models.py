@@ -31,6 +31,7 @@ from .webhooks.models import (
     TableWebhookCall,
     TableWebhookEvent,
     TableWebhookHeader,
+    TableWebhookPendingCall,
 )
 
 __all__ = [
@@ -61,6 +62,7 @@ __all__ = [
     "TableWebhookEvent",
     "TableWebhookHeader",
     "TableWebhookCall",
+    "TableWebhookPendingCall",
     "FieldDependency",
 ]
 
@@ -1,9 +1,11 @@
 import dataclasses
+from collections import defaultdict
 from copy import deepcopy
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple, Type
 
 from django.contrib.auth.models import AbstractUser
+from django.db.models import F, OuterRef, Subquery
 from django.utils.translation import gettext_lazy as _
 
 from baserow.contrib.database.action.scopes import (
@@ -22,6 +24,7 @@ from baserow.core.action.registries import (
     ActionTypeDescription,
     UndoableActionType,
 )
+from baserow.core.expressions import RowValueComparison
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import Progress
 
@@ -600,6 +603,159 @@ class MoveRowActionType(UndoableActionType):
         row_handler.move_row(user, table, row, before_row=before_row, model=model)
 
 
+def get_next_row_ids(
+    model: Type[GeneratedTableModel], row_ids: List[int]
+) -> List[Tuple[int, Optional[int]]]:
+    """
+    Returns for each of the provided rows the id of the first row after it that isn't
+    one of the provided rows, in a single query. Moving the rows back before these
+    rows restores their original positions.
+
+    :param model: The model of the table containing the rows.
+    :param row_ids: The ids of the rows.
+    :return: A list of tuples containing the row id and the id of the next row, or
+        `None` if it's at the end of the table, ordered like the rows in the table.
+    """
+
+    next_row = (
+        model.objects.filter(
+            RowValueComparison(
+                [F("order"), F("id")], [OuterRef("order"), OuterRef("id")], ">"
+            )
+        )
+        .exclude(id__in=row_ids)
+        .order_by("order", "id")
+        .values("id")[:1]
+    )
+    return list(
+        model.objects.filter(id__in=row_ids)
+        .annotate(next_row_id=Subquery(next_row))
+        .order_by("order", "id")
+        .values_list("id", "next_row_id")
+    )
+
+
+class MoveRowsActionType(UndoableActionType):
+    type = "move_rows"
+    description = ActionTypeDescription(
+        _("Move rows"), _("Rows (%(row_ids)s) moved"), TABLE_ACTION_CONTEXT
+    )
+    analytics_params = ["table_id", "database_id", "before_row_id"]
+
+    @dataclasses.dataclass
+    class Params:
+        table_id: int
+        table_name: str
+        database_id: int
+        database_name: str
+        row_ids: List[int]
+        before_row_id: Optional[int]
+        original_row_ids: List[int]
+        original_next_row_ids: List[Optional[int]]
+
+    @classmethod
+    def do(
+        cls,
+        user: AbstractUser,
+        table: Table,
+        row_ids: List[int],
+        before_row: Optional[GeneratedTableModel] = None,
+        model: Optional[Type[GeneratedTableModel]] = None,
+    ) -> List[GeneratedTableModelForUpdate]:
+        """
+        Moves multiple rows before another row or to the end if no before row is
+        provided. See the baserow.contrib.database.rows.handler.RowHandler.move_rows
+        for more information.
+        Undoing this action moves every row back before the row that originally
+        followed it. Redoing moves the rows before the same row again.
+
+        :param user: The user of whose behalf the rows are moved
+        :param table: The table that contains the rows that need to be moved.
+        :param row_ids: The ids of the rows that need to be moved, in the order in
+            which they must be placed.
+        :param before_row: If provided the rows will be placed right before that row
+            instance. Otherwise the rows will be moved to the end.
+        :param model: If the correct model has already been generated, it can be
+            provided so that it does not have to be generated for a second time.
+        """
+
+        if model is None:
+            model = table.get_model()
+
+        original_positions = get_next_row_ids(model, row_ids)
+        moved_rows = RowHandler().move_rows_by_id(
+            user, table, row_ids, before_row=before_row, model=model
+        )
+
+        workspace = table.database.workspace
+        params = cls.Params(
+            table.id,
+            table.name,
+            table.database.id,
+            table.database.name,
+            row_ids,
+            before_row.id if before_row else None,
+            [row_id for row_id, _ in original_positions],
+            [next_row_id for _, next_row_id in original_positions],
+        )
+        cls.register_action(user, params, cls.scope(table.id), workspace=workspace)
+        return moved_rows
+
+    @classmethod
+    def scope(cls, table_id) -> ActionScopeStr:
+        return TableActionScopeType.value(table_id)
+
+    @classmethod
+    def undo(cls, user: AbstractUser, params: Params, action_being_undone: Action):
+        table = TableHandler().get_table(params.table_id)
+        model = table.get_model()
+
+        row_handler = RowHandler()
+        rows_by_id = {
+            row.id: row
+            for row in row_handler.get_rows_for_update(model, params.original_row_ids)
+        }
+
+        # The rows that were followed by the same row are moved back before it
+        # together, in their original order.
+        rows_per_next_row_id = defaultdict(list)
+        for row_id, next_row_id in zip(
+            params.original_row_ids, params.original_next_row_ids
+        ):
+            if row_id in rows_by_id:
+                rows_per_next_row_id[next_row_id].append(rows_by_id[row_id])
+
+        next_rows_by_id = model.objects.in_bulk(
+            [row_id for row_id in rows_per_next_row_id if row_id is not None]
+        )
+        for next_row_id, rows in rows_per_next_row_id.items():
+            row_handler.move_rows(
+                user,
+                table,
+                rows,
+                before_row=next_rows_by_id.get(next_row_id),
+                model=model,
+            )
+
+    @classmethod
+    def redo(cls, user: AbstractUser, params: Params, action_being_redone: Action):
+        table = TableHandler().get_table(params.table_id)
+        model = table.get_model()
+
+        row_handler = RowHandler()
+        rows_by_id = {
+            row.id: row
+            for row in row_handler.get_rows_for_update(model, params.row_ids)
+        }
+        rows = [rows_by_id[row_id] for row_id in params.row_ids if row_id in rows_by_id]
+
+        before_row = None
+        if params.before_row_id is not None:
+            before_row = model.objects.filter(id=params.before_row_id).first()
+
+        row_handler.move_rows(user, table, rows, before_row=before_row, model=model)
+
+
 # Deprecated in favor of UpdateRowsActionType
 class UpdateRowActionType(UndoableActionType):
     type = "update_row"
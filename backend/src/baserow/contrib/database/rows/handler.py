@@ -44,8 +44,10 @@ from baserow.contrib.database.table.signals import table_updated
 from baserow.contrib.database.trash.models import TrashedRows
 from baserow.core.db import (
     get_highest_order_of_queryset,
+    get_spaced_orders_before_item,
     get_unique_orders_before_item,
     recalculate_full_orders,
+    recalculate_orders_before_item,
 )
 from baserow.core.exceptions import CannotCalculateIntermediateOrder
 from baserow.core.handler import CoreHandler
@@ -68,6 +70,7 @@ from .operations import (
     ReadDatabaseRowOperationType,
     UpdateDatabaseRowOperationType,
 )
+from .serialized_rows_cache import SerializedRowsCache
 from .signals import (
     before_rows_delete,
     before_rows_update,
@@ -387,8 +390,8 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         provided `before_row` or at the end of the table, depending on whether the
         `before_row` value is provided.
 
-        Note that this method can trigger an update of all the rows in the table in
-        the event all the orders must be recalculated.
+        Note that this method can trigger an update of the orders of the rows before
+        the `before_row` in the event there is no room left between them.
 
         :param before_row: The row instance where the before orders must be
             calculated for. If `None`, then it's assumed that the orders are for
@@ -409,20 +412,55 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             except CannotCalculateIntermediateOrder:
                 # If the `find_intermediate_order` fails with a
                 # `CannotCalculateIntermediateOrder`, it means that it's not possible
-                # calculate an intermediate fraction. Therefore, must reset all the
-                # orders of the table (while respecting their original order),
-                # so that we can then can find the fraction any many more after.
-                self.recalculate_row_orders(model.baserow_table, model)
-                # Refresh the row element as its order might have changed
-                before_row.refresh_from_db()
-                return get_unique_orders_before_item(
-                    before_row, queryset, amount=amount
+                # calculate an intermediate fraction. Therefore, we make room by
+                # spreading out the orders of the rows right before the `before_row`
+                # (while respecting their original order).
+                return self.get_spaced_orders_before_row(
+                    before_row, model, amount=amount
                 )
         else:
             # If no `before` is provided, we can just find the highest value and
             # add one to it.
             return get_highest_order_of_queryset(queryset, amount=amount)
 
+    def get_spaced_orders_before_row(
+        self,
+        before_row: GeneratedTableModel,
+        model: Type[GeneratedTableModel],
+        amount: int = 1,
+    ) -> List[Decimal]:
+        """
+        Calculates a list of orders that are evenly spaced between the provided
+        `before_row` and the row before it, so that there is room left to move or
+        insert other rows between them later.
+
+        If the orders would be too close together, only the orders of the rows right
+        before the `before_row` are recalculated to make room. The orders of all the
+        rows in the table are only recalculated if that isn't possible.
+
+        :param before_row: The row instance where the before orders must be
+            calculated for.
+        :param model: The model of the related table
+        :param amount: The number of orders that must be requested.
+        :return: A list of decimals containing safe to use orders in order.
+        """
+
+        queryset = model.objects
+
+        try:
+            return get_spaced_orders_before_item(before_row, queryset, amount=amount)
+        except CannotCalculateIntermediateOrder:
+            pass
+
+        if recalculate_orders_before_item(before_row, model, amount=amount):
+            row_orders_recalculated.send(self, table=model.baserow_table)
+        else:
+            self.recalculate_row_orders(model.baserow_table, model)
+            # Refresh the row element as its order might have changed
+            before_row.refresh_from_db(fields=["order"])
+
+        return get_spaced_orders_before_item(before_row, queryset, amount=amount)
+
     def get_row(
         self,
         user: AbstractUser,
@@ -806,6 +844,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             send_webhook_events=True,
             rows_values_refreshed_from_db=False,
             m2m_change_tracker=m2m_change_tracker,
+            serialized_rows_cache=SerializedRowsCache(),
         )
 
         return instance
@@ -993,6 +1032,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             before_return=before_return,
             updated_field_ids=updated_field_ids,
             m2m_change_tracker=m2m_change_tracker,
+            serialized_rows_cache=SerializedRowsCache(),
         )
 
         return row
@@ -1035,10 +1075,12 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             deleted_m2m_rels_per_link_field = (
                 m2m_change_tracker.get_deleted_link_row_rels_for_update_collector()
             )
+        # The updates are applied per dependency level, so they can be batched.
         update_collector = FieldUpdateCollector(
             table,
             starting_row_ids=[row.id for row in updated_rows],
             deleted_m2m_rels_per_link_field=deleted_m2m_rels_per_link_field,
+            batch_updates=True,
         )
         updated_fields = []
         for dependant_fields_group in all_dependent_fields_grouped_by_depth:
@@ -1199,6 +1241,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             send_webhook_events=send_webhook_events,
             prepared_rows_values=prepared_rows_values,
             m2m_change_tracker=m2m_change_tracker,
+            serialized_rows_cache=SerializedRowsCache(),
         )
 
         if generate_error_report:
@@ -1273,7 +1316,10 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         row_ids = [row.id for row in created_rows]
         table = model.baserow_table
-        update_collector = FieldUpdateCollector(table, starting_row_ids=row_ids)
+        # The updates are applied per dependency level, so they can be batched.
+        update_collector = FieldUpdateCollector(
+            table, starting_row_ids=row_ids, batch_updates=True
+        )
 
         field_cache = FieldCache()
         field_cache.cache_model(model)
@@ -1871,6 +1917,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             before_return=before_return,
             updated_field_ids=updated_field_ids,
             m2m_change_tracker=m2m_change_tracker,
+            serialized_rows_cache=SerializedRowsCache(),
         )
 
         fields_metadata_by_row_id = self.get_fields_metadata_for_rows(
@@ -2041,10 +2088,136 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             before_return=before_return,
             updated_field_ids=[],
             prepared_rows_values=None,
+            serialized_rows_cache=SerializedRowsCache(),
         )
 
         return row
 
+    def move_rows_by_id(
+        self,
+        user: AbstractUser,
+        table: Table,
+        row_ids: List[int],
+        before_row: Optional[GeneratedTableModel] = None,
+        model: Optional[Type[GeneratedTableModel]] = None,
+    ) -> List[GeneratedTableModelForUpdate]:
+        """
+        Moves multiple rows at once before another row or to the end of the table.
+
+        :param user: The user of whose behalf the rows are moved
+        :param table: The table that contains the rows that need to be moved.
+        :param row_ids: The ids of the rows that need to be moved, in the order in
+            which they must be placed.
+        :param before_row: If provided the rows will be placed right before that row
+            instance. Otherwise the rows will be moved to the end.
+        :param model: If the correct model has already been generated, it can be
+            provided so that it does not have to be generated for a second time.
+        :raises RowIdsNotUnique: When trying to move the same row multiple times.
+        :raises RowDoesNotExist: When any of the rows don't exist.
+        :return: The moved rows, in the order of the provided ids.
+        """
+
+        if model is None:
+            model = table.get_model()
+
+        non_unique_ids = get_non_unique_values(row_ids)
+        if len(non_unique_ids) > 0:
+            raise RowIdsNotUnique(non_unique_ids)
+
+        with transaction.atomic():
+            rows_by_id = {
+                row.id: row for row in self.get_rows_for_update(model, row_ids)
+            }
+            if len(rows_by_id) != len(row_ids):
+                raise RowDoesNotExist(sorted(list(set(row_ids) - set(rows_by_id))))
+
+            rows = [rows_by_id[row_id] for row_id in row_ids]
+            return self.move_rows(user, table, rows, before_row=before_row, model=model)
+
+    def move_rows(
+        self,
+        user: AbstractUser,
+        table: Table,
+        rows: List[GeneratedTableModelForUpdate],
+        before_row: Optional[GeneratedTableModel] = None,
+        model: Optional[Type[GeneratedTableModel]] = None,
+    ) -> List[GeneratedTableModelForUpdate]:
+        """
+        Moves multiple rows at once before another row or to the end of the table.
+        The rows get orders that are evenly spaced between the `before_row` and the
+        row before it, which are updated in a single query.
+
+        :param user: The user of whose behalf the rows are moved
+        :param table: The table that contains the rows that need to be moved.
+        :param rows: The rows that need to be moved, in the order in which they must
+            be placed.
+        :param before_row: If provided the rows will be placed right before that row
+            instance. Otherwise the rows will be moved to the end.
+        :param model: If the correct model has already been generated, it can be
+            provided so that it does not have to be generated for a second time.
+        :return: The moved rows.
+        """
+
+        workspace = table.database.workspace
+        CoreHandler().check_permissions(
+            user,
+            MoveRowDatabaseRowOperationType.type,
+            workspace=workspace,
+            context=table,
+        )
+
+        if model is None:
+            model = table.get_model()
+
+        before_return = before_rows_update.send(
+            self, rows=rows, user=user, table=table, model=model, updated_field_ids=[]
+        )
+
+        if before_row:
+            orders = self.get_spaced_orders_before_row(
+                before_row, model, amount=len(rows)
+            )
+        else:
+            orders = get_highest_order_of_queryset(model.objects, amount=len(rows))
+        updated_on_field = model._meta.get_field("updated_on")
+        for row, order in zip(rows, orders):
+            row.order = order
+            # The `updated_on` field is not updated with `bulk_update`, so we manually
+            # set the value here like `row.save()` does when moving a single row.
+            row.updated_on = updated_on_field.pre_save(row, add=False)
+        model.objects.bulk_update(rows, ["order", "updated_on"])
+
+        # All fields must be marked as updated because the lookup fields can depend
+        # on the row order, see `move_row`.
+        updated_field_ids = []
+        updated_fields = []
+        for field_id, field_object in model._field_objects.items():
+            if field_object["type"].include_in_row_move_updated_fields:
+                updated_field_ids.append(field_id)
+                updated_fields.append(field_object["field"])
+
+        dependant_fields = self.update_dependencies_of_rows_updated(
+            table, rows, model, updated_field_ids
+        )
+
+        from baserow.contrib.database.views.handler import ViewHandler
+
+        ViewHandler().field_value_updated(updated_fields + dependant_fields)
+
+        rows_updated.send(
+            self,
+            rows=rows,
+            user=user,
+            table=table,
+            model=model,
+            before_return=before_return,
+            updated_field_ids=[],
+            prepared_rows_values=None,
+            serialized_rows_cache=SerializedRowsCache(),
+        )
+
+        return rows
+
     def delete_row_by_id(
         self,
         user: AbstractUser,
@@ -2099,7 +2272,12 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             model = table.get_model()
 
         before_return = before_rows_delete.send(
-            self, rows=[row], user=user, table=table, model=model
+            self,
+            rows=[row],
+            user=user,
+            table=table,
+            model=model,
+            serialized_rows_cache=SerializedRowsCache(),
         )
 
         TrashHandler.trash(user, workspace, table.database, row)
@@ -2198,7 +2376,12 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             raise RowDoesNotExist(sorted(list(set(row_ids) - set(db_rows_ids))))
 
         before_return = before_rows_delete.send(
-            self, rows=rows, user=user, table=table, model=model
+            self,
+            rows=rows,
+            user=user,
+            table=table,
+            model=model,
+            serialized_rows_cache=SerializedRowsCache(),
         )
 
         trashed_rows = TrashedRows.objects.create(row_ids=row_ids, table=table)
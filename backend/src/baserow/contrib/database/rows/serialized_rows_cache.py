@@ -0,0 +1,52 @@
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Tuple, Type
+
+from baserow.contrib.database.table.models import GeneratedTableModel
+
+
+class SerializedRowsCache:
+    """
+    Holds the serialized rows of a single row signal invocation. The row handler
+    creates one for every `rows_created`, `rows_updated` and `before_rows_delete`
+    signal and passes it to the receivers as the `serialized_rows_cache` argument.
+    The realtime, public view and webhook receivers all serialize the same rows, so
+    sharing the result means that every row is only serialized once for every field
+    selection.
+
+    The serialized rows are shared between the receivers, so they must not be
+    modified.
+    """
+
+    def __init__(self):
+        self._serialized_rows: Dict[
+            Tuple[Type[GeneratedTableModel], Hashable, int], Dict[str, Any]
+        ] = {}
+
+    def get_or_serialize(
+        self,
+        model: Type[GeneratedTableModel],
+        key: Hashable,
+        rows: Iterable[GeneratedTableModel],
+        serialize_row: Callable[[GeneratedTableModel], Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the serialized rows from the cache and serializes the ones that
+        aren't in there yet.
+
+        :param model: The generated table model of the rows.
+        :param key: Identifies the field selection and the field names that are
+            used to serialize the rows.
+        :param rows: The rows that must be serialized.
+        :param serialize_row: The function that serializes a row which isn't in
+            the cache yet.
+        :return: The serialized rows in the same order as the provided rows.
+        """
+
+        serialized_rows = []
+        for row in rows:
+            cache_key = (model, key, row.id)
+            serialized_row = self._serialized_rows.get(cache_key)
+            if serialized_row is None:
+                serialized_row = serialize_row(row)
+                self._serialized_rows[cache_key] = serialized_row
+            serialized_rows.append(serialized_row)
+        return serialized_rows
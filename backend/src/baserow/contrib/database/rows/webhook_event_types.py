@@ -1,6 +1,4 @@
 from baserow.contrib.database.api.rows.serializers import (
-    RowSerializer,
-    get_row_serializer_class,
     remap_serialized_rows_to_user_field_names,
     serialize_rows_for_response,
 )
@@ -11,17 +9,23 @@ from .signals import rows_created, rows_deleted, rows_updated
 
 
 class RowsEventType(WebhookEventType):
-    def get_row_serializer(self, webhook, model):
-        return get_row_serializer_class(
+    def get_payload(
+        self,
+        event_id,
+        webhook,
+        model,
+        table,
+        rows,
+        serialized_rows_cache=None,
+        **kwargs,
+    ):
+        payload = super().get_payload(event_id, webhook, **kwargs)
+        payload["items"] = serialize_rows_for_response(
+            rows,
             model,
-            RowSerializer,
-            is_response=True,
             user_field_names=webhook.use_user_field_names,
+            serialized_rows_cache=serialized_rows_cache,
         )
-
-    def get_payload(self, event_id, webhook, model, table, rows, **kwargs):
-        payload = super().get_payload(event_id, webhook, **kwargs)
-        payload["items"] = self.get_row_serializer(webhook, model)(rows, many=True).data
         return payload
 
 
@@ -1,14 +1,16 @@
 import math
 import traceback
 from enum import Enum
-from typing import TYPE_CHECKING, List, NamedTuple, Optional, Type
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Type, Union
 
 from django.conf import settings
 from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import SearchVector
 from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
 from django.db import connection, transaction
 from django.db.models import Expression, Func, Q, QuerySet, TextField, Value
+from django.db.models.expressions import RawSQL
 from django.utils.encoding import force_str
 
 from loguru import logger
@@ -26,9 +28,11 @@ from baserow.contrib.database.search.regexes import (
     RE_REMOVE_ALL_PUNCTUATION_ALREADY_REMOVED_FROM_TSVS_FOR_QUERY,
     RE_REMOVE_NON_SEARCHABLE_PUNCTUATION_FROM_TSVECTOR_DATA,
 )
+from baserow.contrib.database.search.scheduler import TsvectorUpdateScheduler
 from baserow.contrib.database.table.cache import invalidate_table_in_model_cache
 from baserow.contrib.database.table.constants import (
     ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
+    get_search_table_name,
 )
 from baserow.core.telemetry.utils import baserow_trace_methods
 from baserow.core.utils import ChildProgressBuilder, exception_capturer
@@ -67,13 +71,17 @@ class FieldWithSearchVector(NamedTuple):
 
 class SearchHandler(
     metaclass=baserow_trace_methods(
-        tracer, exclude=["full_text_enabled", "search_config"]
+        tracer, exclude=["full_text_enabled", "search_table_enabled", "search_config"]
     )
 ):
     @classmethod
     def full_text_enabled(cls):
         return settings.USE_PG_FULLTEXT_SEARCH
 
+    @classmethod
+    def search_table_enabled(cls):
+        return settings.USE_PG_FULLTEXT_SEARCH_TABLE
+
     @classmethod
     def search_config(cls):
         return settings.PG_SEARCH_CONFIG
@@ -203,6 +211,11 @@ class SearchHandler(
 
     @classmethod
     def _create_tsv_column(cls, field):
+        if field.table.search_table_added:
+            # The search vectors of the field are stored in the search table, so
+            # there is no column to create.
+            return
+
         with safe_django_schema_editor(atomic=False) as schema_editor:
             to_model = field.table.get_model(
                 fields=[field], field_ids=[], add_dependencies=False
@@ -231,22 +244,130 @@ class SearchHandler(
             # The table could have been perm deleted already so don't crash if we
             # fail to delete because the table is already gone as that also means
             # the tsv has been cleaned up already.
-            cls._drop_column_if_table_exists(
-                f"database_table_{field.table_id}", field.tsv_db_column
-            )
+            cls._drop_tsv_if_table_exists(field.table_id, field)
+
+    @classmethod
+    def _drop_tsv_if_table_exists(cls, table_id: int, field: "Field"):
+        """
+        Removes the search vectors of the field from the table, regardless of whether
+        they're stored in a column or in the search table of the table.
+        """
+
+        cls._drop_column_if_table_exists(
+            f"database_table_{table_id}", field.tsv_db_column
+        )
+        with connection.cursor() as cursor:
+            search_table_name = get_search_table_name(table_id)
+            cursor.execute("SELECT to_regclass(%s)", [search_table_name])
+            if cursor.fetchone()[0] is not None:
+                cursor.execute(
+                    sql.SQL("DELETE FROM {search_table} WHERE field_id = %s").format(
+                        search_table=sql.Identifier(search_table_name)
+                    ),
+                    [field.id],
+                )
 
     @staticmethod
     def _drop_column_if_table_exists(table_name: str, column_to_drop: str):
         with connection.cursor() as cursor:
             cursor.execute(
                 sql.SQL(
-                    "ALTER TABLE IF EXISTS {table_name} DROP COLUMN {column_to_drop}"
+                    "ALTER TABLE IF EXISTS {table_name} "
+                    "DROP COLUMN IF EXISTS {column_to_drop}"
                 ).format(
                     table_name=sql.Identifier(table_name),
                     column_to_drop=sql.Identifier(column_to_drop),
                 )
             )
 
+    @classmethod
+    def create_search_table(cls, table: "Table"):
+        """
+        Creates the companion search table of the table if it doesn't exist yet. It
+        contains one row per row and field with the search vector of the cell, so
+        it stays narrow regardless of the number of fields, updating the search
+        vectors doesn't rewrite the rows of the table itself and a single GIN index
+        covers all the fields.
+
+        Instead of a foreign key, which would have to be checked for every written
+        search vector, a statement level trigger removes the search vectors of the
+        rows that are permanently deleted.
+
+        :param table: The table to create the search table for.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    """
+                    CREATE TABLE IF NOT EXISTS {search_table} (
+                        row_id integer NOT NULL,
+                        field_id integer NOT NULL,
+                        value tsvector NOT NULL,
+                        PRIMARY KEY (row_id, field_id)
+                    );
+                    CREATE INDEX IF NOT EXISTS {index_name}
+                        ON {search_table} USING gin (value);
+                    DROP TRIGGER IF EXISTS {trigger_name} ON {table_name};
+                    CREATE TRIGGER {trigger_name} AFTER DELETE ON {table_name}
+                        REFERENCING OLD TABLE AS deleted_rows
+                        FOR EACH STATEMENT
+                        EXECUTE FUNCTION baserow_delete_search_table_rows();
+                    """
+                ).format(
+                    search_table=sql.Identifier(table.get_database_search_table_name()),
+                    table_name=sql.Identifier(table.get_database_table_name()),
+                    index_name=sql.Identifier(f"tbl_search_{table.id}_idx"),
+                    trigger_name=sql.Identifier(f"tbl_search_{table.id}_delete"),
+                )
+            )
+
+    @classmethod
+    def drop_search_table_if_exists(cls, table_id: int):
+        """
+        Drops the companion search table of the table and the trigger that deletes
+        its rows. The table itself must still exist.
+
+        :param table_id: The id of the table to drop the search table for.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                sql.SQL(
+                    """
+                    DROP TRIGGER IF EXISTS {trigger_name} ON {table_name};
+                    DROP TABLE IF EXISTS {search_table};
+                    """
+                ).format(
+                    table_name=sql.Identifier(f"database_table_{table_id}"),
+                    trigger_name=sql.Identifier(f"tbl_search_{table_id}_delete"),
+                    search_table=sql.Identifier(get_search_table_name(table_id)),
+                )
+            )
+
+    @classmethod
+    def get_search_table_row_ids_query(
+        cls, table: "Table", field_ids: List[int], sanitized_search: str
+    ) -> RawSQL:
+        """
+        Returns a subquery that selects the ids of the rows where the search vector
+        of one of the provided fields matches the search in the search table of the
+        table.
+
+        :param table: The table that has the search table.
+        :param field_ids: The ids of the fields to search in.
+        :param sanitized_search: The search query escaped with
+            `escape_postgres_query`.
+        :return: The subquery that can be used with an `id__in` filter.
+        """
+
+        search_table = connection.ops.quote_name(table.get_database_search_table_name())
+        return RawSQL(
+            f"SELECT row_id FROM {search_table} "  # nosec
+            "WHERE field_id = ANY(%s) AND value @@ to_tsquery(%s::regconfig, %s)",
+            (field_ids, cls.search_config(), sanitized_search),
+        )
+
     @classmethod
     def _collect_search_vectors(
         cls,
@@ -289,6 +410,8 @@ class SearchHandler(
     def sync_tsvector_columns(cls, table: "TableForUpdate") -> "TableForUpdate":
         """
         Responsible for creating all the `tsvector` columns for each field in `table`.
+        If the table stores its search vectors in the search table, then only the
+        search table is created because the fields don't need a column.
 
         :param table: The Table we want to create a tsvector per field.
         :return: Table
@@ -316,21 +439,154 @@ class SearchHandler(
             field.tsvector_column_created = True
             fields_to_update.append(field)
 
+        if table.search_table_added:
+            cls.create_search_table(table)
+        else:
+            with safe_django_schema_editor(atomic=False) as schema_editor:
+                for field_name in fields_to_add:
+                    model_field = model._meta.get_field(field_name)
+                    logger.debug(f"Adding {field_name} to table {table.id}")
+                    schema_editor.add_field(model, model_field)
+                for field_name, index_name in indices_to_add:
+                    schema_editor.add_index(
+                        model,
+                        GinIndex(fields=[field_name], name=index_name),
+                    )
+
+        if fields_to_update:
+            invalidate_table_in_model_cache(table.id)
+            Field.objects.bulk_update(fields_to_update, ["tsvector_column_created"])
+
+        return table
+
+    @classmethod
+    def migrate_tsvectors_to_search_table(
+        cls, table: "TableForUpdate"
+    ) -> "TableForUpdate":
+        """
+        Moves the search vectors of the table from the `tsvector` column per field
+        into the search table, and drops the columns afterwards. The existing
+        search vectors are copied, so the table can be searched during and after
+        the migration without updating them again.
+
+        :param table: The table to migrate, selected for update.
+        :return: The migrated table.
+        """
+
+        if table.search_table_added:
+            return table
+
+        model = table.get_model()
+        fields = model.get_fields_with_search_index(include_trash=True)
+
+        cls.create_search_table(table)
+        if fields:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    sql.SQL(
+                        """
+                        INSERT INTO {search_table} (row_id, field_id, value)
+                        SELECT table_row.id, vectors.field_id, vectors.value
+                        FROM {table_name} table_row
+                        CROSS JOIN LATERAL (VALUES {values}) vectors (field_id, value)
+                        WHERE vectors.value IS NOT NULL AND vectors.value != ''
+                        """
+                    ).format(
+                        search_table=sql.Identifier(
+                            table.get_database_search_table_name()
+                        ),
+                        table_name=sql.Identifier(table.get_database_table_name()),
+                        values=sql.SQL(", ").join(
+                            sql.SQL("({field_id}, {column})").format(
+                                field_id=sql.Literal(field.id),
+                                column=sql.Identifier("table_row", field.tsv_db_column),
+                            )
+                            for field in fields
+                        ),
+                    )
+                )
+
         with safe_django_schema_editor(atomic=False) as schema_editor:
-            for field_name in fields_to_add:
-                model_field = model._meta.get_field(field_name)
-                logger.debug(f"Adding {field_name} to table {table.id}")
-                schema_editor.add_field(model, model_field)
-            for field_name, index_name in indices_to_add:
+            for field in fields:
+                # Removing the column also removes its GIN index.
+                schema_editor.remove_field(
+                    model, model._meta.get_field(field.tsv_db_column)
+                )
+
+        table.search_table_added = True
+        table.save(update_fields=("search_table_added",))
+        invalidate_table_in_model_cache(table.id)
+        return table
+
+    @classmethod
+    def migrate_tsvectors_to_columns(cls, table: "TableForUpdate") -> "TableForUpdate":
+        """
+        The reverse of `migrate_tsvectors_to_search_table`. Creates a `tsvector`
+        column per field, copies the search vectors from the search table into them
+        and drops the search table afterwards.
+
+        :param table: The table to migrate, selected for update.
+        :return: The migrated table.
+        """
+
+        if not table.search_table_added:
+            return table
+
+        table.search_table_added = False
+        # The cached model doesn't have the tsvector columns.
+        model = table.get_model(use_cache=False)
+        fields = model.get_fields_with_search_index(include_trash=True)
+
+        with safe_django_schema_editor(atomic=False) as schema_editor:
+            for field in fields:
+                schema_editor.add_field(
+                    model, model._meta.get_field(field.tsv_db_column)
+                )
                 schema_editor.add_index(
                     model,
-                    GinIndex(fields=[field_name], name=index_name),
+                    GinIndex(fields=[field.tsv_db_column], name=field.tsv_index_name),
                 )
 
-        if fields_to_update:
-            invalidate_table_in_model_cache(table.id)
-            Field.objects.bulk_update(fields_to_update, ["tsvector_column_created"])
+        if fields:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    sql.SQL(
+                        """
+                        UPDATE {table_name} table_row SET {assignments}
+                        FROM (
+                            SELECT row_id, {aggregates}
+                            FROM {search_table}
+                            GROUP BY row_id
+                        ) vectors
+                        WHERE table_row.id = vectors.row_id
+                        """
+                    ).format(
+                        table_name=sql.Identifier(table.get_database_table_name()),
+                        search_table=sql.Identifier(
+                            table.get_database_search_table_name()
+                        ),
+                        assignments=sql.SQL(", ").join(
+                            sql.SQL("{column} = vectors.{column}").format(
+                                column=sql.Identifier(field.tsv_db_column)
+                            )
+                            for field in fields
+                        ),
+                        aggregates=sql.SQL(", ").join(
+                            sql.SQL(
+                                "(array_agg(value) FILTER (WHERE field_id = {field_id}))"
+                                "[1] AS {column}"
+                            ).format(
+                                field_id=sql.Literal(field.id),
+                                column=sql.Identifier(field.tsv_db_column),
+                            )
+                            for field in fields
+                        ),
+                    )
+                )
 
+        cls.drop_search_table_if_exists(table.id)
+        table.save(update_fields=("search_table_added",))
+        invalidate_table_in_model_cache(table.id)
         return table
 
     @classmethod
@@ -539,7 +795,7 @@ class SearchHandler(
                     i : i + settings.TSV_UPDATE_CHUNK_SIZE
                 ]
                 next_chunk = qs.filter(id__in=next_ids).select_for_update(of=("self",))
-                total_updated += next_chunk.update(**update_query)
+                total_updated += cls._update_rows(next_chunk, update_query)
             progress.increment()
         return total_updated
 
@@ -577,12 +833,119 @@ class SearchHandler(
                 ]
                 next_ids = list(next_ids)
                 next_chunk = qs.filter(id__in=next_ids)
-                this_chunk_updated = next_chunk.update(**update_query)
+                this_chunk_updated = cls._update_rows(next_chunk, update_query)
                 progress.increment()
                 total_updated += 0
                 if this_chunk_updated == 0:
                     return total_updated
 
+    @classmethod
+    def _get_search_vectors_update_query(
+        cls, qs: QuerySet, collected_vectors: List[FieldWithSearchVector]
+    ) -> Dict[Union[str, int], Expression]:
+        """
+        Returns the update query that sets the provided search vectors. The keys are
+        the `tsvector` column names, or the field ids if the table stores its search
+        vectors in the search table.
+        """
+
+        if qs.model.baserow_table.search_table_added:
+            return {cv.field.id: cv.search_vector for cv in collected_vectors}
+        return {cv.field_tsv_db_column: cv.search_vector for cv in collected_vectors}
+
+    @classmethod
+    def _update_rows(
+        cls, qs: QuerySet, update_query: Dict[Union[str, int], Expression]
+    ) -> int:
+        """
+        Updates the rows in the queryset with the update query created by
+        `_get_search_vectors_update_query`. The search vectors keyed by field id are
+        written into the search table and the rest of the update query is applied
+        to the rows themselves.
+
+        :return: The number of updated rows, or the number of written search vectors
+            if only the search table was updated.
+        """
+
+        search_vectors = {k: v for k, v in update_query.items() if isinstance(k, int)}
+        if not search_vectors:
+            return qs.update(**update_query)
+
+        updated = cls._write_search_table_vectors(qs, search_vectors)
+        row_updates = {k: v for k, v in update_query.items() if isinstance(k, str)}
+        if row_updates:
+            updated = qs.update(**row_updates)
+        return updated
+
+    @classmethod
+    def _write_search_table_vectors(
+        cls, qs: QuerySet, search_vectors: Dict[int, Expression]
+    ) -> int:
+        """
+        Computes the search vectors of the rows in the queryset and writes them into
+        the search table in a single statement. Vectors that are empty are removed
+        and vectors that didn't change are not rewritten, so that the search table
+        only gets new tuples for the cells that actually changed.
+
+        :param qs: The rows to compute the search vectors for.
+        :param search_vectors: The search vector expression per field id.
+        :return: The number of inserted or changed search vectors.
+        """
+
+        aliases = {field_id: f"search_vector_{field_id}" for field_id in search_vectors}
+        rows_qs = (
+            qs.order_by()
+            .annotate(
+                **{
+                    aliases[field_id]: search_vector
+                    for field_id, search_vector in search_vectors.items()
+                }
+            )
+            .values_list("id", *aliases.values())
+        )
+        try:
+            rows_sql, params = rows_qs.query.sql_with_params()
+        except EmptyResultSet:
+            # The queryset can't match any rows, like the last chunk of
+            # `split_update_into_chunks_until_all_background_done`.
+            return 0
+
+        search_table = sql.Identifier(
+            qs.model.baserow_table.get_database_search_table_name()
+        )
+        query = sql.SQL(
+            """
+            WITH vectors AS (
+                SELECT table_row.id AS row_id, field_vectors.field_id,
+                    field_vectors.value
+                FROM ({rows_sql}) table_row
+                CROSS JOIN LATERAL (VALUES {values}) field_vectors (field_id, value)
+            ), removed AS (
+                DELETE FROM {search_table} search USING vectors
+                WHERE vectors.value IS NULL
+                    AND search.row_id = vectors.row_id
+                    AND search.field_id = vectors.field_id
+            )
+            INSERT INTO {search_table} AS search (row_id, field_id, value)
+            SELECT row_id, field_id, value FROM vectors WHERE value IS NOT NULL
+            ON CONFLICT (row_id, field_id) DO UPDATE SET value = EXCLUDED.value
+            WHERE search.value IS DISTINCT FROM EXCLUDED.value
+            """
+        ).format(
+            rows_sql=sql.SQL(rows_sql),
+            values=sql.SQL(", ").join(
+                sql.SQL("({field_id}, NULLIF(CAST({column} AS tsvector), ''))").format(
+                    field_id=sql.Literal(field_id),
+                    column=sql.Identifier("table_row", alias),
+                )
+                for field_id, alias in aliases.items()
+            ),
+            search_table=search_table,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.rowcount
+
     @classmethod
     def run_tsvector_update_statement(
         cls,
@@ -595,9 +958,7 @@ class SearchHandler(
         progress = ChildProgressBuilder.build(progress_builder, child_total=1000)
 
         try:
-            update_query = {
-                cv.field_tsv_db_column: cv.search_vector for cv in collected_vectors
-            }
+            update_query = cls._get_search_vectors_update_query(qs, collected_vectors)
             if set_background_updated_false:
                 update_query[ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME] = Value(False)
             if update_tsvectors_for_changed_rows_only:
@@ -671,7 +1032,7 @@ class SearchHandler(
                 if update_tsvectors_for_changed_rows_only:
                     cls.split_update_into_chunks_until_all_background_done(
                         qs,
-                        {cv.field_tsv_db_column: cv.search_vector},
+                        cls._get_search_vectors_update_query(qs, [cv]),
                         progress_builder=progress.create_child_builder(
                             represents_progress=1000
                         ),
@@ -679,7 +1040,7 @@ class SearchHandler(
                 else:
                     cls.split_update_into_chunks_by_ranges(
                         qs,
-                        {cv.field_tsv_db_column: cv.search_vector},
+                        cls._get_search_vectors_update_query(qs, [cv]),
                         progress_builder=progress.create_child_builder(
                             represents_progress=1000
                         ),
@@ -776,6 +1137,16 @@ class SearchHandler(
                 else None
             )
 
+            if TsvectorUpdateScheduler.is_enabled():
+                enqueue_task_on_commit_swallowing_any_exceptions(
+                    lambda: cls._schedule_coalesced_tsvector_update(
+                        table.id,
+                        update_tsvs_for_changed_rows_only,
+                        searchable_updated_fields_ids,
+                    )
+                )
+                return
+
             enqueue_task_on_commit_swallowing_any_exceptions(
                 lambda: async_update_tsvector_columns.delay(
                     table.id,
@@ -784,6 +1155,29 @@ class SearchHandler(
                 )
             )
 
+    @classmethod
+    def _schedule_coalesced_tsvector_update(
+        cls,
+        table_id: int,
+        update_tsvs_for_changed_rows_only: bool,
+        field_ids_to_restrict_update_to: Optional[List[int]] = None,
+    ):
+        """
+        Merges the update into the pending tsvector update of the table, and only
+        schedules a task if the table didn't have a pending update yet.
+        """
+
+        from baserow.contrib.database.search.tasks import run_scheduled_tsvector_update
+
+        if TsvectorUpdateScheduler.request_update(
+            table_id,
+            update_tsvs_for_changed_rows_only,
+            field_ids_to_restrict_update_to,
+        ):
+            run_scheduled_tsvector_update.apply_async(
+                (table_id,), countdown=settings.TSV_UPDATE_DEBOUNCE_SECONDS
+            )
+
     @classmethod
     def _search_error_handler(cls, e):
         if settings.TESTS:
@@ -797,7 +1191,5 @@ class SearchHandler(
         cls, moved_field: "Field", original_table_id: int
     ):
         if moved_field.tsvector_column_created:
-            cls._drop_column_if_table_exists(
-                f"database_table_{original_table_id}", moved_field.tsv_db_column
-            )
+            cls._drop_tsv_if_table_exists(original_table_id, moved_field)
             cls._create_tsv_column(moved_field)
@@ -0,0 +1,321 @@
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+
+from django_redis import get_redis_connection
+from loguru import logger
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+
+PENDING_TABLES_KEY = "tsvector_update_scheduler:pending"
+FIRST_REQUESTED_KEY = "tsvector_update_scheduler:first_requested"
+TABLE_STATE_KEY = "tsvector_update_scheduler:table:{table_id}"
+TABLE_FIELDS_KEY = "tsvector_update_scheduler:table:{table_id}:fields"
+TABLE_IN_FLIGHT_KEY = "tsvector_update_scheduler:table:{table_id}:in_flight"
+
+# Merges an update request into the pending update of a table. The request is
+# debounced by moving the moment the table is due, but never further than the max
+# latency after the first pending request. Returns 1 if the table didn't have a
+# pending update yet, meaning that a task must be scheduled for it.
+REQUEST_UPDATE_SCRIPT = """
+local now = tonumber(ARGV[2])
+local first = redis.call('HGET', KEYS[3], 'first_requested_at')
+local is_new = 0
+if not first then
+    first = now
+    is_new = 1
+    redis.call('HSET', KEYS[3], 'first_requested_at', now)
+    redis.call('ZADD', KEYS[2], now, ARGV[1])
+end
+if ARGV[5] == '1' then
+    redis.call('HSET', KEYS[3], 'changed_rows', 1)
+elseif ARGV[6] == '1' then
+    redis.call('HSET', KEYS[3], 'all_fields', 1)
+else
+    redis.call('HSET', KEYS[3], 'fields', 1)
+    if #ARGV > 6 then
+        redis.call('SADD', KEYS[4], unpack(ARGV, 7))
+    end
+end
+local due = math.min(now + tonumber(ARGV[3]), tonumber(first) + tonumber(ARGV[4]))
+redis.call('ZADD', KEYS[1], due, ARGV[1])
+return is_new
+"""
+
+# Atomically takes the pending update of a table, so that requests coming in while
+# it runs start a new pending update.
+CLAIM_UPDATE_SCRIPT = """
+local state = redis.call('HGETALL', KEYS[3])
+local fields = redis.call('SMEMBERS', KEYS[4])
+redis.call('DEL', KEYS[3], KEYS[4])
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('ZREM', KEYS[2], ARGV[1])
+return {state, fields}
+"""
+
+
+def _get_redis_client():
+    return get_redis_connection("default")
+
+
+@dataclass
+class PendingTsvectorUpdate:
+    """
+    The coalesced update requests of a table that are waiting to be executed.
+    """
+
+    table_id: int
+    first_requested_at: float
+    changed_rows: bool = False
+    all_fields: bool = False
+    field_ids: Set[int] = field(default_factory=set)
+
+    def get_field_ids_to_update(self) -> Optional[List[int]]:
+        """
+        Returns the field ids of which the tsvectors of all rows must be updated,
+        `None` if all the fields must be updated or an empty list if only the changed
+        rows must be updated.
+        """
+
+        if self.all_fields:
+            return None
+        return sorted(self.field_ids)
+
+    @property
+    def must_update_changed_rows(self) -> bool:
+        # Updating all the rows of all the fields also updates the changed rows.
+        return self.changed_rows and not self.all_fields
+
+
+class TsvectorUpdateScheduler:
+    """
+    Coalesces the tsvector update requests of a table in Redis. Instead of enqueueing
+    a task for every change, the requests of a table are merged into one pending
+    update, which is executed after no new requests came in for
+    `TSV_UPDATE_DEBOUNCE_SECONDS`, or at most `TSV_UPDATE_MAX_LATENCY_SECONDS` after
+    the first request. Only one update per table can be in flight at the same time.
+    """
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        # The pending updates are stored in Redis, so this only works if the cache
+        # is backed by Redis, which is the case if it supports locks.
+        return settings.TSV_UPDATE_DEBOUNCE_SECONDS > 0 and hasattr(cache, "lock")
+
+    @classmethod
+    def _get_keys(cls, table_id: int) -> List[str]:
+        return [
+            PENDING_TABLES_KEY,
+            FIRST_REQUESTED_KEY,
+            TABLE_STATE_KEY.format(table_id=table_id),
+            TABLE_FIELDS_KEY.format(table_id=table_id),
+        ]
+
+    @classmethod
+    def request_update(
+        cls,
+        table_id: int,
+        update_tsvs_for_changed_rows_only: bool,
+        field_ids_to_restrict_update_to: Optional[List[int]] = None,
+    ) -> bool:
+        """
+        Merges the update request into the pending update of the table.
+
+        :param table_id: The id of the table that must be updated.
+        :param update_tsvs_for_changed_rows_only: Whether only the rows with
+            `needs_background_update=True` must be updated.
+        :param field_ids_to_restrict_update_to: If all rows must be updated, only
+            the tsvectors of these fields will be updated. `None` means all fields.
+        :return: `True` if the table didn't have a pending update yet and a task must
+            be scheduled to execute it.
+        """
+
+        all_fields = field_ids_to_restrict_update_to is None
+        is_new = _get_redis_client().eval(
+            REQUEST_UPDATE_SCRIPT,
+            4,
+            *cls._get_keys(table_id),
+            table_id,
+            time.time(),
+            settings.TSV_UPDATE_DEBOUNCE_SECONDS,
+            settings.TSV_UPDATE_MAX_LATENCY_SECONDS,
+            int(update_tsvs_for_changed_rows_only),
+            int(all_fields),
+            *([] if all_fields else field_ids_to_restrict_update_to),
+        )
+        tsvector_update_requests_counter.add(1, {"coalesced": not is_new})
+        return bool(is_new)
+
+    @classmethod
+    def get_seconds_until_due(cls, table_id: int) -> Optional[float]:
+        """
+        Returns the number of seconds until the pending update of the table must be
+        executed, or `None` if the table doesn't have a pending update.
+        """
+
+        due = _get_redis_client().zscore(PENDING_TABLES_KEY, table_id)
+        if due is None:
+            return None
+        return max(due - time.time(), 0)
+
+    @classmethod
+    def claim_update(cls, table_id: int) -> Optional[PendingTsvectorUpdate]:
+        """
+        Removes the pending update of the table and returns it, so that it can be
+        executed. Returns `None` if there is no pending update.
+        """
+
+        state, fields = _get_redis_client().eval(
+            CLAIM_UPDATE_SCRIPT, 4, *cls._get_keys(table_id), table_id
+        )
+        state = dict(zip(state[::2], state[1::2]))
+        if not state:
+            return None
+
+        return PendingTsvectorUpdate(
+            table_id=table_id,
+            first_requested_at=float(state[b"first_requested_at"]),
+            changed_rows=b"changed_rows" in state,
+            all_fields=b"all_fields" in state,
+            field_ids={int(field_id) for field_id in fields},
+        )
+
+    @classmethod
+    def run_due_update(cls, table_id: int) -> Optional[float]:
+        """
+        Executes the pending update of the table if it's due and no other update of
+        the table is in flight.
+
+        :param table_id: The id of the table to update.
+        :return: The number of seconds after which this must be tried again, or
+            `None` if there is nothing left to do.
+        """
+
+        seconds_until_due = cls.get_seconds_until_due(table_id)
+        if seconds_until_due is None:
+            return None
+        if seconds_until_due > 0:
+            return seconds_until_due
+
+        in_flight_lock = _get_redis_client().lock(
+            TABLE_IN_FLIGHT_KEY.format(table_id=table_id),
+            timeout=settings.CELERY_SEARCH_UPDATE_HARD_TIME_LIMIT,
+        )
+        if not in_flight_lock.acquire(blocking=False):
+            # The requests are kept pending until the update that's in flight
+            # finishes, so that they're merged into a single update.
+            return settings.TSV_UPDATE_DEBOUNCE_SECONDS
+
+        try:
+            pending_update = cls.claim_update(table_id)
+            if pending_update is not None:
+                tsvector_update_staleness_histogram.record(
+                    time.time() - pending_update.first_requested_at
+                )
+                cls._execute_update(pending_update)
+        finally:
+            in_flight_lock.release()
+        return None
+
+    @classmethod
+    def _execute_update(cls, pending_update: PendingTsvectorUpdate):
+        from baserow.contrib.database.search.exceptions import (
+            PostgresFullTextSearchDisabledException,
+        )
+        from baserow.contrib.database.search.handler import SearchHandler
+        from baserow.contrib.database.table.handler import TableHandler
+        from baserow.contrib.database.table.models import Table
+
+        try:
+            table = TableHandler().get_table(pending_update.table_id)
+        except Table.DoesNotExist:
+            return
+
+        try:
+            field_ids = pending_update.get_field_ids_to_update()
+            if field_ids is None or field_ids:
+                SearchHandler.update_tsvector_columns(
+                    table,
+                    update_tsvectors_for_changed_rows_only=False,
+                    field_ids_to_restrict_update_to=field_ids,
+                )
+            if pending_update.must_update_changed_rows:
+                SearchHandler.update_tsvector_columns_locked(
+                    table, update_tsvectors_for_changed_rows_only=True
+                )
+        except PostgresFullTextSearchDisabledException:
+            logger.debug("Postgres full-text search is disabled.")
+
+    @classmethod
+    def get_overdue_table_ids(cls) -> List[int]:
+        """
+        Returns the ids of the tables of which the pending update should already have
+        been executed, because the task scheduled for it got lost.
+        """
+
+        threshold = time.time() - settings.TSV_UPDATE_MAX_LATENCY_SECONDS
+        return [
+            int(table_id)
+            for table_id in _get_redis_client().zrangebyscore(
+                PENDING_TABLES_KEY, "-inf", threshold
+            )
+        ]
+
+    @classmethod
+    def get_queue_depth(cls) -> int:
+        """
+        Returns the number of tables that have a pending update.
+        """
+
+        return _get_redis_client().zcard(PENDING_TABLES_KEY)
+
+    @classmethod
+    def get_staleness(cls) -> float:
+        """
+        Returns the number of seconds since the oldest pending update was requested.
+        """
+
+        oldest = _get_redis_client().zrange(FIRST_REQUESTED_KEY, 0, 0, withscores=True)
+        if not oldest:
+            return 0
+        return max(time.time() - oldest[0][1], 0)
+
+
+def _observe_queue_depth(options: CallbackOptions) -> Iterable[Observation]:
+    if TsvectorUpdateScheduler.is_enabled():
+        yield Observation(TsvectorUpdateScheduler.get_queue_depth())
+
+
+def _observe_staleness(options: CallbackOptions) -> Iterable[Observation]:
+    if TsvectorUpdateScheduler.is_enabled():
+        yield Observation(TsvectorUpdateScheduler.get_staleness())
+
+
+meter = metrics.get_meter(__name__)
+tsvector_update_requests_counter = meter.create_counter(
+    "baserow.search.tsvector_update_requests",
+    unit="1",
+    description="The number of tsvector update requests, and whether they have been "
+    "coalesced into an already pending update.",
+)
+tsvector_update_staleness_histogram = meter.create_histogram(
+    "baserow.search.tsvector_update_staleness",
+    unit="s",
+    description="The time between the first request of a tsvector update and the "
+    "moment it's executed.",
+)
+meter.create_observable_gauge(
+    "baserow.search.tsvector_update_queue_depth",
+    callbacks=[_observe_queue_depth],
+    unit="1",
+    description="The number of tables with a pending tsvector update.",
+)
+meter.create_observable_gauge(
+    "baserow.search.tsvector_update_pending_age",
+    callbacks=[_observe_staleness],
+    unit="s",
+    description="The age of the oldest pending tsvector update.",
+)
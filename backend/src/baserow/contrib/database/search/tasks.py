@@ -1,3 +1,4 @@
+from datetime import timedelta
 from typing import List, Optional
 
 from django.conf import settings
@@ -40,3 +41,47 @@ def async_update_tsvector_columns(
         )
     except PostgresFullTextSearchDisabledException:
         logger.debug(f"Postgres full-text search is disabled.")
+
+
+@app.task(
+    queue="export",
+    time_limit=settings.CELERY_SEARCH_UPDATE_HARD_TIME_LIMIT,
+)
+def run_scheduled_tsvector_update(table_id: int):
+    """
+    Executes the coalesced tsvector update of the table once it's due. If it isn't
+    due yet because new requests came in, or another update of the table is still
+    in flight, the task schedules itself again.
+
+    :param table_id: The ID of the table we'd like to update the tsvectors for.
+    """
+
+    from baserow.contrib.database.search.scheduler import TsvectorUpdateScheduler
+
+    countdown = TsvectorUpdateScheduler.run_due_update(table_id)
+    if countdown is not None:
+        run_scheduled_tsvector_update.apply_async((table_id,), countdown=countdown)
+
+
+@app.task(queue="export")
+def check_overdue_tsvector_updates():
+    """
+    Schedules the pending tsvector updates that should already have been executed,
+    in case the task that was scheduled for them got lost.
+    """
+
+    from baserow.contrib.database.search.scheduler import TsvectorUpdateScheduler
+
+    for table_id in TsvectorUpdateScheduler.get_overdue_table_ids():
+        run_scheduled_tsvector_update.delay(table_id)
+
+
+@app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    from baserow.contrib.database.search.scheduler import TsvectorUpdateScheduler
+
+    if TsvectorUpdateScheduler.is_enabled():
+        sender.add_periodic_task(
+            timedelta(seconds=settings.TSV_UPDATE_MAX_LATENCY_SECONDS),
+            check_overdue_tsvector_updates.s(),
+        )
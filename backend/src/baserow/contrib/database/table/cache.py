@@ -12,22 +12,43 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+On top of this Redis backed (L2) cache every worker process can keep a bounded (L1)
+LRU cache of the finished model classes, keyed by `(table_id, version)`. It is
+enabled by setting `BASEROW_MODEL_L1_CACHE_SIZE` to a value greater than zero. When
+`invalidate_table_in_model_cache` changes the version of a table, the new version is
+published on a Redis pub/sub channel. Every process listening to that channel evicts
+the table from its L1 cache, which means that as long as the listener is connected a
+present L1 entry is always up-to-date and can be used without querying the table
+version from the database first. Models generated within a transaction that has
+invalidated the table are not stored, because that transaction can still be rolled
+back. Because a cached model class is shared by all the threads of the process, its
+`baserow_table` attribute resolves to the table instance of the last `get_model` call
+of the current thread.
 """
+import json
+import threading
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple, Type
 
 from django.conf import settings
 from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+
+from loguru import logger
 
 from baserow.version import VERSION as BASEROW_VERSION
 
 if typing.TYPE_CHECKING:
-    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
+TABLE_MODEL_VERSION_CHANNEL = f"baserow-table-model-versions-{BASEROW_VERSION}"
+
 
 def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
@@ -63,6 +84,7 @@ def clear_generated_model_cache():
         raise ImproperlyConfigured(
             "Baserow must be run with a redis cache outside of " "tests."
         )
+    generated_models_l1_cache.clear()
     print("Done clearing cache.")
 
 
@@ -75,3 +97,274 @@ def invalidate_table_in_model_cache(table_id: int):
     from baserow.contrib.database.table.models import Table
 
     Table.objects_and_trash.filter(id=table_id).update(version=new_version)
+
+    if settings.BASEROW_MODEL_L1_CACHE_SIZE > 0:
+        # Evict straight away so that this process doesn't use the old model
+        # within the current transaction, and let the other processes know once the
+        # new version is actually visible to them.
+        generated_models_l1_cache.evict(table_id)
+        if transaction.get_connection().in_atomic_block:
+            _get_pending_invalidations().add(table_id)
+
+        def on_commit():
+            _get_pending_invalidations().discard(table_id)
+            publish_table_model_version(table_id, new_version)
+
+        transaction.on_commit(on_commit)
+
+
+_pending_invalidations = threading.local()
+
+
+def _get_pending_invalidations() -> Set[int]:
+    """
+    Returns the ids of the tables that have been invalidated in the current
+    transaction of this thread, but are not committed yet.
+    """
+
+    if not transaction.get_connection().in_atomic_block:
+        # The invalidations of a previous transaction that has been rolled back
+        # are never committed.
+        _pending_invalidations.table_ids = set()
+    elif not hasattr(_pending_invalidations, "table_ids"):
+        _pending_invalidations.table_ids = set()
+    return _pending_invalidations.table_ids
+
+
+def _get_redis_client():
+    from django_redis import get_redis_connection
+
+    return get_redis_connection(settings.GENERATED_MODEL_CACHE_NAME)
+
+
+def publish_table_model_version(table_id: int, version: str):
+    """
+    Broadcasts the new version of a table to all the processes that keep an L1
+    cache of generated models, so that they can evict the outdated model class.
+
+    :param table_id: The id of the table that has a new version.
+    :param version: The new version of the table.
+    """
+
+    generated_models_l1_cache.evict(table_id, version)
+    try:
+        _get_redis_client().publish(
+            TABLE_MODEL_VERSION_CHANNEL,
+            json.dumps({"table_id": table_id, "version": version}),
+        )
+    except Exception as e:  # noqa: W0718
+        # Without a working Redis connection the listeners of the other processes
+        # are disconnected as well, so they will fall back to checking the version.
+        logger.warning("Failed to publish the new table model version: {}", e)
+
+
+class ThreadBoundTable:
+    """
+    Descriptor of the `baserow_table` attribute of a model class in the L1 cache.
+    The class is shared by all threads, so every thread that gets the model from the
+    cache binds its own table instance, which can contain uncommitted changes of its
+    transaction. Threads that didn't bind a table get the table instance the model
+    has been generated for.
+    """
+
+    def __init__(self, table: "Table"):
+        self.table = table
+        self._local = threading.local()
+
+    def __get__(self, instance, owner) -> "Table":
+        return getattr(self._local, "table", self.table)
+
+    def bind(self, table: "Table"):
+        self._local.table = table
+
+
+class GeneratedModelL1Cache:
+    """
+    A thread-safe, bounded LRU cache of generated table model classes keyed by
+    `(table_id, version)`. It sits in front of the Redis backed cache of field
+    attrs and prevents rebuilding the model class for every request.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._models: typing.OrderedDict[
+            int, Tuple[str, Type["GeneratedTableModel"]]
+        ] = OrderedDict()
+        # The latest version received via the pub/sub channel for every table, used
+        # to prevent storing a model that has been invalidated while it was being
+        # generated.
+        self._latest_versions: typing.OrderedDict[int, str] = OrderedDict()
+        self._listener_thread = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self) -> int:
+        return settings.BASEROW_MODEL_L1_CACHE_SIZE
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and not settings.BASEROW_DISABLE_MODEL_CACHE
+
+    @property
+    def listening(self) -> bool:
+        """
+        Indicates whether this process is currently receiving the table version
+        broadcasts. Only if that is the case, the cached models can be trusted
+        without checking the table version in the database.
+        """
+
+        return self._listener_thread is not None and self._listener_thread.is_alive()
+
+    def get(
+        self,
+        table_id: int,
+        version: Optional[str] = None,
+        table: Optional["Table"] = None,
+    ) -> Optional[Type["GeneratedTableModel"]]:
+        """
+        Returns the cached model class of the table if available. If the version is
+        provided, the model is only returned if it has been generated for exactly
+        that version.
+
+        :param table_id: The id of the table.
+        :param version: The expected version of the table or None if the latest
+            cached version can be used.
+        :param table: If provided, the `baserow_table` of the returned model
+            resolves to this table instance in the current thread.
+        :return: The cached model class or None if there isn't a usable one.
+        """
+
+        with self._lock:
+            entry = self._models.get(table_id, None)
+            if entry is None or (version is not None and entry[0] != version):
+                self.misses += 1
+                return None
+
+            self._models.move_to_end(table_id)
+            self.hits += 1
+            model = entry[1]
+
+        if table is not None:
+            model.__dict__["baserow_table"].bind(table)
+        return model
+
+    def set(self, table_id: int, version: str, model: Type["GeneratedTableModel"]):
+        """
+        Stores the model class of the table for the provided version, evicting the
+        least recently used model if the cache is full. Nothing is stored if the
+        table has been invalidated in the current transaction, because the model
+        could have been generated for a schema that is rolled back.
+
+        :param table_id: The id of the table.
+        :param version: The version of the table the model has been generated for.
+        :param model: The generated model class.
+        """
+
+        if table_id in _get_pending_invalidations():
+            return
+
+        with self._lock:
+            latest_version = self._latest_versions.get(table_id, version)
+            if latest_version != version:
+                return
+
+            if not isinstance(model.__dict__["baserow_table"], ThreadBoundTable):
+                model.baserow_table = ThreadBoundTable(model.baserow_table)
+
+            self._models[table_id] = (version, model)
+            self._models.move_to_end(table_id)
+            while len(self._models) > self.max_size:
+                self._models.popitem(last=False)
+                self.evictions += 1
+
+    def evict(self, table_id: int, new_version: Optional[str] = None):
+        """
+        Removes the model of the table from the cache.
+
+        :param table_id: The id of the table.
+        :param new_version: If provided, the version is remembered so that models
+            generated for an older version are not stored afterward.
+        """
+
+        with self._lock:
+            if new_version is not None:
+                self._latest_versions[table_id] = new_version
+                self._latest_versions.move_to_end(table_id)
+                while len(self._latest_versions) > self.max_size * 4:
+                    self._latest_versions.popitem(last=False)
+            self._models.pop(table_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+            self._latest_versions.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the hit and miss counters of the cache.
+        """
+
+        with self._lock:
+            return {
+                "size": len(self._models),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "listening": self.listening,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def _handle_message(self, message):
+        try:
+            data = json.loads(message["data"])
+            self.evict(int(data["table_id"]), data["version"])
+        except (TypeError, ValueError, KeyError):
+            logger.warning("Invalid table model version message: {}", message)
+
+    def ensure_listening(self):
+        """
+        Starts a daemon thread subscribing to the table version broadcasts if it's
+        not running yet. If that's not possible, for example because the cache is
+        not backed by Redis, the cache keeps working, but the table version must
+        be checked before using a cached model.
+        """
+
+        if self.listening or not hasattr(generated_models_cache, "delete_pattern"):
+            return
+
+        with self._lock:
+            if self.listening:
+                return
+
+            try:
+                pubsub = _get_redis_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{TABLE_MODEL_VERSION_CHANNEL: self._handle_message})
+            except Exception as e:  # noqa: W0718
+                logger.warning("Failed to subscribe to table model versions: {}", e)
+                return
+
+            # Anything cached before the subscription could have missed a
+            # broadcast, so it can't be trusted anymore.
+            self._models.clear()
+            self._listener_thread = pubsub.run_in_thread(
+                sleep_time=1, daemon=True, exception_handler=self._on_listener_error
+            )
+
+    def _on_listener_error(self, exc, pubsub, thread):
+        logger.warning("Table model versions listener stopped: {}", exc)
+        with self._lock:
+            self._models.clear()
+            self._listener_thread = None
+        thread.stop()
+        pubsub.close()
+
+
+generated_models_l1_cache = GeneratedModelL1Cache()
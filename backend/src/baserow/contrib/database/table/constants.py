@@ -9,6 +9,10 @@ def get_tsv_vector_field_name(field_id) -> str:
     return f"tsv_field_{field_id}"
 
 
+def get_search_table_name(table_id) -> str:
+    return f"{USER_TABLE_DATABASE_NAME_PREFIX}{table_id}_search"
+
+
 # This field was introduced initially for full text search. It is added to old user
 # tables which existed prior dynamically at runtime when the table is loaded. It
 # is intended to track which user rows have been changed and hence need various
@@ -32,6 +32,7 @@ from baserow.contrib.database.operations import (
     OrderTablesDatabaseTableOperationType,
 )
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.expressions import (
     BaserowTableFileUniques,
     BaserowTableRowCount,
@@ -517,6 +518,7 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             order=last_order,
             name=name,
             needs_background_update_column_added=True,
+            search_table_added=SearchHandler.search_table_enabled(),
         )
 
         # Let's create the fields before creating the model so that the whole
@@ -561,6 +563,9 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
             model = table.get_model(managed=True)
             schema_editor.create_model(model)
 
+        if table.search_table_added:
+            SearchHandler.create_search_table(table)
+
         return table
 
     def normalize_initial_table_data(
@@ -833,7 +838,9 @@ class TableHandler(metaclass=baserow_trace_methods(tracer)):
         database_type = application_type_registry.get_by_model(database)
 
         config = ImportExportConfig(
-            include_permission_data=True, reduce_disk_space_usage=False
+            include_permission_data=True,
+            reduce_disk_space_usage=False,
+            copy_rows_in_database=True,
         )
 
         serialized_tables = database_type.export_tables_serialized([table], config)
@@ -39,6 +39,7 @@ from baserow.contrib.database.fields.registries import FieldType, field_type_reg
 from baserow.contrib.database.fields.utils import get_field_id_from_field_key
 from baserow.contrib.database.search.handler import SearchHandler, SearchModes
 from baserow.contrib.database.table.cache import (
+    generated_models_l1_cache,
     get_cached_model_field_attrs,
     set_cached_model_field_attrs,
 )
@@ -48,6 +49,7 @@ from baserow.contrib.database.table.constants import (
     ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
     TSV_FIELD_PREFIX,
     USER_TABLE_DATABASE_NAME_PREFIX,
+    get_search_table_name,
 )
 from baserow.contrib.database.views.exceptions import ViewFilterTypeNotAllowedForField
 from baserow.contrib.database.views.registries import view_filter_type_registry
@@ -141,8 +143,26 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
 
         self._add_exact_id_search(filter_builder, input_search)
 
-        for field in self.model.get_searchable_fields():
-            if only_search_by_field_ids is None or field.id in only_search_by_field_ids:
+        searchable_fields = [
+            field
+            for field in self.model.get_searchable_fields()
+            if only_search_by_field_ids is None or field.id in only_search_by_field_ids
+        ]
+        if self.model.baserow_table.search_table_added:
+            # All the search vectors are stored in the same companion table, so one
+            # lookup in its index covers all the searchable fields.
+            if searchable_fields:
+                filter_builder.filter(
+                    Q(
+                        id__in=SearchHandler.get_search_table_row_ids_query(
+                            self.model.baserow_table,
+                            [field.id for field in searchable_fields],
+                            sanitized_search,
+                        )
+                    )
+                )
+        else:
+            for field in searchable_fields:
                 filter_builder.filter(Q(**{field.tsv_db_column: search_query}))
         return filter_builder.apply_to_queryset(self)
 
@@ -470,6 +490,10 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
 class TableModelTrashAndObjectsManager(models.Manager):
     def get_queryset(self):
         qs = TableModelQuerySet(self.model, using=self._db)
+        if self.model.baserow_table.search_table_added:
+            # The search vectors are stored in the search table, so there are no
+            # columns to defer.
+            return qs
         for field in self.model.get_fields_with_search_index(include_trash=True):
             try:
                 qs = qs.defer(field.tsv_db_column)
@@ -898,6 +922,11 @@ class Table(
         null=True,
         help_text="Indicates whether the table has had the created_by column added.",
     )
+    search_table_added = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the search vectors of the table are stored in "
+        "the companion search table instead of a tsvector column per field.",
+    )
 
     class Meta:
         ordering = ("order",)
@@ -931,6 +960,9 @@ class Table(
     def get_database_table_name(self):
         return f"{USER_TABLE_DATABASE_NAME_PREFIX}{self.id}"
 
+    def get_database_search_table_name(self):
+        return get_search_table_name(self.id)
+
     @baserow_trace(tracer)
     def get_model(
         self,
@@ -973,7 +1005,9 @@ class Table(
             Only in very specific limited situations should this be enabled as
             generally Baserow itself manages most aspects of returned generated models.
         :type managed: bool
-        :param use_cache: Indicates whether a cached model can be used.
+        :param use_cache: Indicates whether a cached model can be used. If the
+            in-process L1 cache is enabled, the exact same model class can be
+            returned for consecutive calls.
         :type use_cache: bool
         :param force_add_tsvectors: gtIndicates that we want to forcibly add the table's
             `tsvector` columns.
@@ -986,6 +1020,37 @@ class Table(
         :rtype: Model
         """
 
+        # The finished model classes of full, unfiltered models can be kept in the
+        # in-process L1 cache. Any model with custom fields, app label or related
+        # models is specific to the caller and must always be generated.
+        use_l1_cache = (
+            use_cache
+            and generated_models_l1_cache.enabled
+            and not fields
+            and field_ids is None
+            and field_names is None
+            and add_dependencies is True
+            and attribute_names is False
+            and not manytomany_models
+            and not managed
+            and not force_add_tsvectors
+            and app_label is None
+        )
+        version_refreshed = False
+        if use_l1_cache:
+            generated_models_l1_cache.ensure_listening()
+            if generated_models_l1_cache.listening:
+                # The cached model is evicted as soon as a new table version is
+                # broadcast, so there is no need to check the version in the db.
+                model = generated_models_l1_cache.get(self.id, table=self)
+            else:
+                self.refresh_from_db(fields=["version"])
+                version_refreshed = True
+                model = generated_models_l1_cache.get(self.id, self.version, self)
+
+            if model is not None:
+                return model
+
         if app_label is None:
             # Generate a unique app_label to make the generation of the model thread
             # safe. Related fields generate pending operations in the `apps`
@@ -1065,7 +1130,8 @@ class Table(
         )
 
         if use_cache:
-            self.refresh_from_db(fields=["version"])
+            if not version_refreshed:
+                self.refresh_from_db(fields=["version"])
             field_attrs = get_cached_model_field_attrs(self)
         else:
             field_attrs = None
@@ -1145,9 +1211,16 @@ class Table(
         if not manytomany_models:
             self._after_model_generation(attrs, model)
 
+        if use_l1_cache:
+            generated_models_l1_cache.set(self.id, self.version, model)
+
         return model
 
     def _add_search_tsvector_fields_to_model(self, field_attrs, indexes, force_add):
+        if self.search_table_added:
+            # The search vectors are stored in the companion search table.
+            return
+
         field_objects = field_attrs["_field_objects"]
         trashed_field_objects = field_attrs["_trashed_field_objects"]
         for field_object in itertools.chain(
@@ -11,8 +11,12 @@ from baserow.contrib.database.fields.dependencies.update_collector import (
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.online_conversion import (
+    OnlineFieldConversionHandler,
+)
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.serialized_rows_cache import SerializedRowsCache
 from baserow.contrib.database.rows.signals import rows_created
 from baserow.contrib.database.table.models import (
     GeneratedTableModel,
@@ -131,6 +135,9 @@ class TableTrashableItemType(TrashableItemType):
 
         with safe_django_schema_editor() as schema_editor:
             model = trashed_item.get_model()
+            # The search table is a separate table that isn't dropped with the
+            # table itself.
+            SearchHandler.drop_search_table_if_exists(trashed_item.id)
             schema_editor.delete_model(model)
 
         trashed_item.delete()
@@ -238,6 +245,10 @@ class FieldTrashableItemType(TrashableItemType):
             raise TrashItemDoesNotExist()
         field_type = field_type_registry.get_by_model(field)
 
+        # The shadow column of an online conversion that didn't finish can't be
+        # found anymore after the field has been deleted.
+        OnlineFieldConversionHandler().clean_up_unfinished_conversions(field)
+
         # Remove the field from the table schema.
         with safe_django_schema_editor() as schema_editor:
             table = field.table
@@ -309,6 +320,7 @@ class RowTrashableItemType(TrashableItemType):
             model=model,
             before=None,
             user=None,
+            serialized_rows_cache=SerializedRowsCache(),
         )
 
     def permanently_delete_item(self, row, trash_item_lookup_cache=None):
@@ -432,6 +444,7 @@ class RowsTrashableItemType(TrashableItemType):
                 model=model,
                 before=None,
                 user=None,
+                serialized_rows_cache=SerializedRowsCache(),
             )
         else:
             # Use table signal here instead of row signal because we don't want
@@ -10,12 +10,15 @@ from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.aggregates import BoolOr
 from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import connection
 from django.db import models as django_models
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import BooleanField, Count, ExpressionWrapper, Q, Window
 from django.db.models.expressions import F, OrderBy
+from django.db.models.functions import RowNumber
 from django.db.models.query import QuerySet
 
 import jwt
@@ -32,7 +35,7 @@ from baserow.contrib.database.fields.field_filters import (
     FilterBuilder,
 )
 from baserow.contrib.database.fields.field_sortings import OptionallyAnnotatedOrderBy
-from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.operations import ReadFieldOperationType
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
@@ -173,6 +176,9 @@ FieldOptionsDict = Dict[int, Dict[str, Any]]
 
 ending_number_regex = re.compile(r"(.+) (\d+)$")
 
+AGGREGATION_PARTIALS_KEY = "partials"
+GROUP_BY_COUNT_ANNOTATION_PREFIX = "group_by_count_"
+
 tracer = trace.get_tracer(__name__)
 
 
@@ -181,6 +187,21 @@ PerViewTableIndexUpdate = namedtuple(
 )
 
 
+@dataclasses.dataclass
+class ViewAggregationsSnapshot:
+    """
+    The cached decomposable aggregations of a view right before rows change, and the
+    partial aggregations of the changed rows at that moment. This is used to apply
+    the delta of the change to the cached values once the change is committed.
+    """
+
+    view: View
+    aggregations: List[Tuple[Field, str]]
+    cached_values: Dict[str, Dict[str, Any]]
+    versions: Dict[str, int]
+    partials: Dict[str, Dict[str, Any]]
+
+
 @dataclasses.dataclass
 class UpdatedViewWithChangedAttributes:
     updated_view_instance: View
@@ -2700,6 +2721,300 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 # No cache key, we create one
                 cache.set(cache_key, 2)
 
+    def _field_values_are_row_local(self, field_object: Dict[str, Any]) -> bool:
+        """
+        Returns whether the values of the field can only change when their own row
+        is created, updated or deleted. Read only fields like formulas and lookups can
+        depend on other rows, and the values of a link row field also change when a
+        related row is updated.
+        """
+
+        return not field_object["type"].read_only and not isinstance(
+            field_object["field"], LinkRowField
+        )
+
+    def get_aggregations_with_delta_maintenance(
+        self, table: Table, model: GeneratedTableModel
+    ) -> List[Tuple[View, List[Tuple[Field, str]]]]:
+        """
+        Returns the decomposable aggregations per view of the table that can be
+        maintained incrementally when rows change. Aggregations of fields whose values
+        aren't row local, and all aggregations of views filtering on such a field, are
+        excluded because rows can change or leave the view without being updated.
+
+        :param table: The table of which the rows change.
+        :param model: The model of the table.
+        :return: A list of the views and their (field, aggregation_type) list.
+        """
+
+        from .models import GridViewFieldOptions
+
+        field_options = (
+            GridViewFieldOptions.objects.filter(
+                grid_view__table=table, grid_view__trashed=False
+            )
+            .exclude(aggregation_raw_type="")
+            .select_related("grid_view")
+        )
+
+        views = {}
+        aggregations_per_view = defaultdict(list)
+        for options in field_options:
+            field_object = model._field_objects.get(options.field_id)
+            if field_object is None or not self._field_values_are_row_local(
+                field_object
+            ):
+                continue
+
+            field = field_object["field"]
+            aggregation_type = view_aggregation_type_registry.get(
+                options.aggregation_raw_type
+            )
+            if (
+                aggregation_type.get_partial_aggregations(
+                    field.db_column, model._meta.get_field(field.db_column), field
+                )
+                is None
+            ):
+                continue
+
+            views[options.grid_view_id] = options.grid_view
+            aggregations_per_view[options.grid_view_id].append(
+                (field, options.aggregation_raw_type)
+            )
+
+        if not views:
+            return []
+
+        filtered_field_ids = defaultdict(set)
+        for view_id, field_id in ViewFilter.objects.filter(
+            view_id__in=views.keys()
+        ).values_list("view_id", "field_id"):
+            filtered_field_ids[view_id].add(field_id)
+
+        aggregations = []
+        for view_id, view in views.items():
+            if not view.filters_disabled and any(
+                field_id not in model._field_objects
+                or not self._field_values_are_row_local(model._field_objects[field_id])
+                for field_id in filtered_field_ids[view_id]
+            ):
+                continue
+            aggregations.append((view, aggregations_per_view[view_id]))
+        return aggregations
+
+    def _get_aggregation_partials_for_rows(
+        self,
+        view: View,
+        model: GeneratedTableModel,
+        aggregations: List[Tuple[Field, str]],
+        row_ids: List[int],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Computes the partial aggregations of the provided rows, only counting the
+        rows that match the filters of the view.
+        """
+
+        queryset = model.objects.filter(id__in=row_ids)
+        view_type = view_type_registry.get_by_model(view.specific_class)
+        if view_type.can_filter:
+            queryset = self.apply_filters(view, queryset)
+
+        aggregation_dict = {}
+        partial_aliases = self._add_partial_aggregations(
+            aggregation_dict, model, aggregations
+        )
+        result = self._aggregate(queryset, aggregation_dict)
+        return self._pop_partials(result, partial_aliases)
+
+    def get_aggregation_snapshots(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        row_ids: Optional[List[int]] = None,
+        versions_incremented: bool = False,
+    ) -> List[ViewAggregationsSnapshot]:
+        """
+        Takes a snapshot of the cached decomposable aggregations that are valid right
+        before rows change, together with the partial aggregations of those rows. The
+        delta of the change can then be applied with `apply_aggregation_deltas`.
+
+        :param table: The table of which the rows are going to change.
+        :param model: The model of the table.
+        :param row_ids: The ids of the rows that are going to be updated or deleted.
+            `None` if they're created and didn't exist before.
+        :param versions_incremented: Whether `field_value_updated` has already
+            incremented the cache versions for this change.
+        :return: A snapshot per view that has valid cached values.
+        """
+
+        snapshots = []
+        for view, aggregations in self.get_aggregations_with_delta_maintenance(
+            table, model
+        ):
+            names = [field.db_column for field, _ in aggregations]
+            cached = cache.get_many(
+                [self._get_aggregation_value_cache_key(view, name) for name in names]
+                + [
+                    self._get_aggregation_version_cache_key(view, name)
+                    for name in names
+                ]
+            )
+
+            valid_aggregations, cached_values, versions = [], {}, {}
+            for field, aggregation_type_name in aggregations:
+                name = field.db_column
+                cached_value = cached.get(
+                    self._get_aggregation_value_cache_key(view, name)
+                )
+                version = cached.get(
+                    self._get_aggregation_version_cache_key(view, name), 1
+                )
+                if versions_incremented:
+                    version -= 1
+                if (
+                    cached_value is None
+                    or cached_value["version"] != version
+                    or "partials" not in cached_value
+                ):
+                    continue
+
+                valid_aggregations.append((field, aggregation_type_name))
+                cached_values[name] = cached_value
+                # `field_value_updated` increments the version once for the change.
+                versions[name] = version + 1
+
+            if not valid_aggregations:
+                continue
+
+            partials = (
+                self._get_aggregation_partials_for_rows(
+                    view, model, valid_aggregations, row_ids
+                )
+                if row_ids
+                else {}
+            )
+            snapshots.append(
+                ViewAggregationsSnapshot(
+                    view=view,
+                    aggregations=valid_aggregations,
+                    cached_values=cached_values,
+                    versions=versions,
+                    partials=partials,
+                )
+            )
+        return snapshots
+
+    def apply_aggregation_deltas(
+        self,
+        model: GeneratedTableModel,
+        snapshots: List[ViewAggregationsSnapshot],
+        row_ids: Optional[List[int]] = None,
+    ):
+        """
+        Computes the partial aggregations of the changed rows, and updates the cached
+        values of the snapshots with the difference once the transaction commits. This
+        avoids recomputing the aggregations for the whole table after every change.
+
+        :param model: The model of the table.
+        :param snapshots: The snapshots taken with `get_aggregation_snapshots`.
+        :param row_ids: The ids of the rows that have been created or updated. `None`
+            if they have been deleted.
+        """
+
+        for snapshot in snapshots:
+            partials = (
+                self._get_aggregation_partials_for_rows(
+                    snapshot.view, model, snapshot.aggregations, row_ids
+                )
+                if row_ids
+                else {}
+            )
+            transaction.on_commit(
+                lambda s=snapshot, p=partials: self._apply_aggregation_delta(s, p)
+            )
+
+    def _apply_aggregation_delta(
+        self,
+        snapshot: ViewAggregationsSnapshot,
+        partials_after: Dict[str, Dict[str, Any]],
+    ):
+        """
+        Adds the difference between the partial aggregations of the changed rows
+        after and before the change to the cached values. This is only done if the
+        cached value is still the one of the snapshot and the version has only been
+        incremented for this change, otherwise another change or a recompute happened
+        in the meantime and the value is recomputed on the next request instead.
+        """
+
+        view = snapshot.view
+        use_lock = hasattr(cache, "lock")
+        if use_lock:
+            cache_lock = cache.lock(
+                self._get_aggregation_lock_cache_key(view), timeout=10
+            )
+            # If the aggregations are being recomputed, the value will be valid again
+            # anyway, so we don't wait long for the lock.
+            if not cache_lock.acquire(blocking_timeout=1):
+                return
+
+        try:
+            names = list(snapshot.cached_values.keys())
+            cached = cache.get_many(
+                [self._get_aggregation_value_cache_key(view, name) for name in names]
+                + [
+                    self._get_aggregation_version_cache_key(view, name)
+                    for name in names
+                ]
+            )
+
+            to_cache = {}
+            for field, aggregation_type_name in snapshot.aggregations:
+                name = field.db_column
+                value_cache_key = self._get_aggregation_value_cache_key(view, name)
+                version = cached.get(
+                    self._get_aggregation_version_cache_key(view, name), 1
+                )
+                cached_value = cached.get(value_cache_key)
+                if (
+                    version != snapshot.versions[name]
+                    or cached_value != snapshot.cached_values[name]
+                ):
+                    continue
+
+                before = snapshot.partials.get(name, {})
+                after = partials_after.get(name, {})
+                partials = {
+                    key: self._apply_partial_delta(
+                        value, after.get(key), before.get(key)
+                    )
+                    for key, value in cached_value["partials"].items()
+                }
+                aggregation_type = view_aggregation_type_registry.get(
+                    aggregation_type_name
+                )
+                to_cache[value_cache_key] = {
+                    "value": aggregation_type.get_value_from_partials(partials),
+                    "version": version,
+                    "partials": partials,
+                }
+
+            cache.set_many(to_cache)
+        finally:
+            if use_lock:
+                try:
+                    cache_lock.release()
+                except LockNotOwnedError:
+                    pass
+
+    def _apply_partial_delta(self, value: Any, added: Any, removed: Any) -> Any:
+        # The partial aggregations return `None` instead of 0 if there are no rows.
+        if added is not None:
+            value = added if value is None else value + added
+        if removed is not None:
+            value = -removed if value is None else value - removed
+        return value
+
     def _get_aggregations_to_compute(
         self,
         view: View,
@@ -2855,6 +3170,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             used_lock = True
 
         # Do we need to compute some aggregations?
+        use_cache = not search and not adhoc_filters.has_any_filters
         if need_computation or with_total:
             db_result = self.get_field_aggregations(
                 user,
@@ -2870,17 +3186,26 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 search_mode=search_mode,
                 skip_perm_check=skip_perm_check,
                 restrict_to_field_ids=visible_field_ids,
+                with_partials=use_cache,
             )
+            partials = db_result.pop(AGGREGATION_PARTIALS_KEY, {})
 
-            if not search and not adhoc_filters.has_any_filters:
+            if use_cache:
                 to_cache = {}
                 for key, value in db_result.items():
                     # We don't cache total value
                     if key != "total":
-                        to_cache[self._get_aggregation_value_cache_key(view, key)] = {
+                        cached_value = {
                             "value": value,
                             "version": need_computation[key]["version"],
                         }
+                        # The partials allow to maintain the value incrementally
+                        # when rows change, see `apply_aggregation_deltas`.
+                        if key in partials:
+                            cached_value["partials"] = partials[key]
+                        to_cache[
+                            self._get_aggregation_value_cache_key(view, key)
+                        ] = cached_value
 
                 # Let's cache the newly computed values
                 cache.set_many(to_cache)
@@ -2910,6 +3235,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         search_mode: Optional[SearchModes] = None,
         skip_perm_check: bool = False,
         restrict_to_field_ids: Optional[Set[int]] = None,
+        with_partials: bool = False,
     ) -> Dict[str, Any]:
         """
         Returns a dict of aggregation for given (field, aggregation_type) couple list.
@@ -2931,6 +3257,9 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_perm_check: Skips the permission check if not necessary.
         :param restrict_to_field_ids: Restrict the aggregations only to certain
             fields, for example if the aggregation is requested for public views.
+        :param with_partials: Whether the partial aggregations of the decomposable
+            aggregations must be computed as well. They're added to the result as a
+            dict per field name under the `AGGREGATION_PARTIALS_KEY` key.
         :raises FieldAggregationNotSupported: When the view type doesn't support
             field aggregation.
         :raises FieldNotInTable: When one of the field doesn't belong to the specified
@@ -2996,21 +3325,92 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 field_name, model_field, field
             )
 
+        partial_aliases = {}
+        if with_partials:
+            # The partial aggregations must come first, otherwise they would refer
+            # to the aggregations with the same name as the field instead of the
+            # field itself.
+            partial_aggregation_dict = {}
+            partial_aliases = self._add_partial_aggregations(
+                partial_aggregation_dict, model, aggregations
+            )
+            aggregation_dict = {**partial_aggregation_dict, **aggregation_dict}
+
+        # Add total to allow further calculation on the client if required
+        if with_total:
+            aggregation_dict["total"] = Count("id", distinct=True)
+
+        result = self._aggregate(queryset, aggregation_dict)
+        if with_partials:
+            result[AGGREGATION_PARTIALS_KEY] = self._pop_partials(
+                result, partial_aliases
+            )
+        return result
+
+    def _aggregate(
+        self, queryset: QuerySet, aggregation_dict: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Executes the aggregations on the queryset in a single query.
+        """
+
         # Check if the returned aggregations contain a `AnnotatedAggregation`,
         # and if so, apply the annotations and only keep the actual aggregation in
         # the dict. This is needed because some aggregations require annotated values
         # before they work.
         for key, value in aggregation_dict.items():
             if isinstance(value, AnnotatedAggregation):
-                queryset = queryset.annotate(**value.annotations)
+                annotations = {
+                    name: annotation
+                    for name, annotation in value.annotations.items()
+                    if name not in queryset.query.annotations
+                }
+                queryset = queryset.annotate(**annotations)
                 aggregation_dict[key] = value.aggregation
 
-        # Add total to allow further calculation on the client if required
-        if with_total:
-            aggregation_dict["total"] = Count("id", distinct=True)
-
         return queryset.aggregate(**aggregation_dict)
 
+    def _add_partial_aggregations(
+        self,
+        aggregation_dict: Dict[str, Any],
+        model: GeneratedTableModel,
+        aggregations: Iterable[Tuple[django_models.Field, str]],
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Adds the partial aggregations of the decomposable aggregations to the
+        aggregation dict.
+
+        :return: The aliases of the partial aggregations per field name, which can be
+            used to get the partials out of the result with `_pop_partials`.
+        """
+
+        partial_aliases = {}
+        for field_instance, aggregation_type_name in aggregations:
+            field_name = field_instance.db_column
+            aggregation_type = view_aggregation_type_registry.get(aggregation_type_name)
+            partial_aggregations = aggregation_type.get_partial_aggregations(
+                field_name,
+                model._meta.get_field(field_name),
+                model._field_objects[field_instance.id]["field"],
+            )
+            if partial_aggregations is None:
+                continue
+
+            partial_aliases[field_name] = {}
+            for key, aggregation in partial_aggregations.items():
+                alias = f"{field_name}_partial_{key}"
+                aggregation_dict[alias] = aggregation
+                partial_aliases[field_name][key] = alias
+        return partial_aliases
+
+    def _pop_partials(
+        self, result: Dict[str, Any], partial_aliases: Dict[str, Dict[str, str]]
+    ) -> Dict[str, Dict[str, Any]]:
+        return {
+            field_name: {key: result.pop(alias) for key, alias in aliases.items()}
+            for field_name, aliases in partial_aliases.items()
+        }
+
     def rotate_view_slug(
         self, user: AbstractUser, view: View, slug_field: str = "slug"
     ) -> View:
@@ -3418,10 +3818,10 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         fields: List[Field],
         rows: List["GeneratedTableModel"],
         base_queryset: QuerySet,
-    ) -> Dict[Field, QuerySet]:
+    ) -> Dict[Field, List[Dict[str, Any]]]:
         """
         This method calculates the count of each unique value within the provided rows,
-        grouped accordingly.
+        grouped accordingly. The counts of all levels are computed in a single query.
 
         :param fields: A list of the fields of the group bys in the right order.
         :param rows: The rows of the paginated query set. The unique values will be
@@ -3430,10 +3830,14 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             This is needed because the rows that must be counted can be outside of
             the paginated range.
         :return: A dictionary where the key is the grouped by field, and the value a
-            queryset containing the count per field.
+            list containing the count per unique combination of values up to that
+            field.
         :raises ValueError: if a field is provided that cannot be grouped by.
         """
 
+        if len(rows) == 0:
+            return {}
+
         qs_per_level = defaultdict(lambda: Q())
         unique_value_per_level = defaultdict(set)
         all_annotations = {}
@@ -3469,31 +3873,69 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                     qs_per_level[level] |= Q(**all_filters)
                     unique_value_per_level[level].add(all_values)
 
-        by_level = {}
-        for level, q in qs_per_level.items():
-            field_names = []
-
-            for field in fields[: level + 1]:
-                field_name = field.db_column
-                field_names.append(field_name)
-
-            # Wrap the queryset to avoid conflicts with annotations, orders, joins,
-            # etc that can have an impact on the count.
-            queryset = base_queryset.model.objects.filter(
-                id__in=base_queryset.clear_multi_field_prefetch().values("id")
-            ).values()
-
-            if len(all_annotations) > 0:
-                queryset = queryset.annotate(**all_annotations)
-
-            queryset = (
-                queryset.filter(q)
-                .values(*field_names)
-                .annotate(count=Count("id"))
-                .order_by()
+        field_names = [field.db_column for field in fields]
+        deepest_level = len(fields) - 1
+        count_names = [
+            f"{GROUP_BY_COUNT_ANNOTATION_PREFIX}{level}" for level in range(len(fields))
+        ]
+
+        # Wrap the queryset to avoid conflicts with annotations, orders, joins,
+        # etc that can have an impact on the count.
+        queryset = base_queryset.model.objects.filter(
+            id__in=base_queryset.clear_multi_field_prefetch().values("id")
+        ).values()
+
+        if len(all_annotations) > 0:
+            queryset = queryset.annotate(**all_annotations)
+
+        # The rows of the groups of every level all have one of the first level
+        # values in the page, so the counts of all levels can be computed in one pass
+        # over these rows using a window partitioned by the values up to that level.
+        # Only one row per combination of values in the page is returned, so the
+        # number of returned rows never exceeds the number of rows in the page.
+        partition_by = [F(field_name) for field_name in field_names]
+        queryset = (
+            queryset.filter(qs_per_level[0])
+            .annotate(
+                **{
+                    count_names[level]: Window(
+                        Count("id"), partition_by=partition_by[: level + 1]
+                    )
+                    for level in range(len(fields))
+                },
+                group_by_row_number=Window(RowNumber(), partition_by=partition_by),
+                group_by_in_page=Window(
+                    BoolOr(
+                        ExpressionWrapper(
+                            qs_per_level[deepest_level], output_field=BooleanField()
+                        )
+                    ),
+                    partition_by=partition_by,
+                ),
             )
+            .filter(group_by_row_number=1, group_by_in_page=True)
+            .values(*field_names, *count_names)
+            .order_by()
+        )
 
-            by_level[fields[level]] = queryset
+        by_level = {field: [] for field in fields}
+        seen_per_level = defaultdict(set)
+        for result in queryset:
+            for level, field in enumerate(fields):
+                values = {
+                    field_name: result[field_name]
+                    for field_name in field_names[: level + 1]
+                }
+                # Many to many values are lists, which can't be used as a key.
+                key = tuple(
+                    tuple(value) if isinstance(value, list) else value
+                    for value in values.values()
+                )
+                if key not in seen_per_level[level]:
+                    seen_per_level[level].add(key)
+                    by_level[field].append(
+                        {**values, "count": result[count_names[level]]}
+                    )
 
         return by_level
 
@@ -1022,6 +1022,42 @@ class ViewAggregationType(Instance):
             "Each aggregation type must have his own get_aggregation method."
         )
 
+    def get_partial_aggregations(
+        self,
+        field_name: str,
+        model_field: django_models.Field,
+        field: "Field",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Decomposable aggregations can be maintained incrementally when rows are
+        created, updated or deleted, instead of being recomputed for the whole table.
+        They must return the django aggregations of which the results can be added up
+        for different sets of rows. The aggregation value must then be computed from
+        those partials with `get_value_from_partials`. Returns `None` if the
+        aggregation isn't decomposable, like a median or a unique count.
+
+        :param field_name: The name of the field that needs to be aggregated.
+        :param model_field: The field extracted from the model.
+        :param field: The instance of the underlying baserow field.
+        :return: A dict of additive django aggregation objects, or `None`.
+        """
+
+        return None
+
+    def get_value_from_partials(self, partials: Dict[str, Any]) -> Any:
+        """
+        Computes the aggregation value from the results of the partial aggregations
+        returned by `get_partial_aggregations`.
+
+        :param partials: The result per partial aggregation.
+        :return: The aggregation value.
+        """
+
+        raise NotImplementedError(
+            "Each decomposable aggregation type must have his own "
+            "get_value_from_partials method."
+        )
+
     def field_is_compatible(self, field: "Field") -> bool:
         """
         Given a particular instance of a field returns whether the field is supported
@@ -1,6 +1,7 @@
 from django.dispatch import Signal, receiver
 
 from baserow.contrib.database.fields import signals as field_signals
+from baserow.contrib.database.rows import signals as row_signals
 
 view_loaded = Signal()
 view_created = Signal()
@@ -85,3 +86,59 @@ def view_loaded_create_indexes_and_columns(sender, view, table_model, **kwargs):
     table = view.table
     if not table.last_modified_by_column_added or not table.created_by_column_added:
         setup_created_by_and_last_modified_by_column.delay(table_id=view.table.id)
+
+
+@receiver(row_signals.before_rows_update)
+def before_rows_update_snapshot_aggregations(sender, rows, table, model, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    return ViewHandler().get_aggregation_snapshots(
+        table, model, row_ids=[row.id for row in rows]
+    )
+
+
+@receiver(row_signals.rows_updated)
+def rows_updated_apply_aggregation_deltas(
+    sender, rows, table, model, before_return, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    snapshots = dict(before_return).get(before_rows_update_snapshot_aggregations)
+    if snapshots:
+        ViewHandler().apply_aggregation_deltas(
+            model, snapshots, row_ids=[row.id for row in rows]
+        )
+
+
+@receiver(row_signals.rows_created)
+def rows_created_apply_aggregation_deltas(sender, rows, table, model, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    handler = ViewHandler()
+    snapshots = handler.get_aggregation_snapshots(
+        table, model, versions_incremented=True
+    )
+    if snapshots:
+        handler.apply_aggregation_deltas(
+            model, snapshots, row_ids=[row.id for row in rows]
+        )
+
+
+@receiver(row_signals.before_rows_delete)
+def before_rows_delete_snapshot_aggregations(sender, rows, table, model, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    return ViewHandler().get_aggregation_snapshots(
+        table, model, row_ids=[row.id for row in rows]
+    )
+
+
+@receiver(row_signals.rows_deleted)
+def rows_deleted_apply_aggregation_deltas(
+    sender, rows, table, model, before_return, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    snapshots = dict(before_return).get(before_rows_delete_snapshot_aggregations)
+    if snapshots:
+        ViewHandler().apply_aggregation_deltas(model, snapshots)
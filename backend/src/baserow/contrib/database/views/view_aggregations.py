@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import Dict
 
 from django.db.models import (
@@ -129,6 +130,12 @@ class EmptyCountViewAggregationType(ViewAggregationType):
                 filter=field_type.empty_query(field_name, model_field, field),
             )
 
+    def get_partial_aggregations(self, field_name, model_field, field):
+        return {"count": self.get_aggregation(field_name, model_field, field)}
+
+    def get_value_from_partials(self, partials):
+        return partials["count"]
+
 
 class NotEmptyCountViewAggregationType(EmptyCountViewAggregationType):
     """
@@ -266,6 +273,13 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    def get_partial_aggregations(self, field_name, model_field, field):
+        return {"sum": Sum(field_name), "count": Count(field_name)}
+
+    def get_value_from_partials(self, partials):
+        # Just like the `Sum`, the sum of no values is `None` instead of 0.
+        return partials["sum"] if partials["count"] else None
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
@@ -290,6 +304,21 @@ class AverageViewAggregationType(ViewAggregationType):
             filter=~field_type.empty_query(field_name, model_field, field),
         )
 
+    def get_partial_aggregations(self, field_name, model_field, field):
+        field_type = field_type_registry.get_by_model(field)
+        not_empty = ~field_type.empty_query(field_name, model_field, field)
+
+        return {
+            "sum": Sum(field_name, filter=not_empty),
+            "count": Count(field_name, filter=not_empty),
+        }
+
+    def get_value_from_partials(self, partials):
+        if not partials["count"]:
+            return None
+        # `Avg` returns a decimal, also for integer fields like the rating.
+        return Decimal(partials["sum"]) / partials["count"]
+
 
 class StdDevViewAggregationType(ViewAggregationType):
     """
@@ -0,0 +1,362 @@
+"""
+The batched webhook dispatcher is an alternative to the `call_webhook` task that's
+enabled with the `BASEROW_WEBHOOKS_BATCH_DISPATCH` setting. Instead of scheduling a
+Celery task for every call, the calls are stored as `TableWebhookPendingCall` and a
+single dispatcher task sends the due calls in batches. The calls of a batch are sent
+concurrently over one pooled async HTTP session that limits the number of concurrent
+connections per target, and the results of the whole batch are recorded in bulk.
+Failed calls are retried with an exponential backoff.
+"""
+import asyncio
+import json
+import socket
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+import aiohttp
+from advocate import AddrValidator, UnacceptableAddressException
+
+from .models import TableWebhook, TableWebhookCall, TableWebhookPendingCall
+from .validators import get_advocate_address_validator
+
+
+class AddressValidatingTCPConnector(aiohttp.TCPConnector):
+    """
+    A connector that only connects to the addresses that are allowed by the advocate
+    address validator. It's the async equivalent of the advocate request function
+    that's used by the `call_webhook` task, so that the internal network can't be
+    reached. Because the validation happens when resolving the host, it also applies
+    to redirects.
+    """
+
+    def __init__(self, addr_validator: AddrValidator, **kwargs):
+        super().__init__(**kwargs)
+        self._addr_validator = addr_validator
+
+    async def _resolve_host(self, host: str, port: int, traces=None):
+        hosts = await super()._resolve_host(host, port, traces=traces)
+        allowed_hosts = [
+            resolved_host
+            for resolved_host in hosts
+            if self._addr_validator.is_addrinfo_allowed(
+                (
+                    resolved_host["family"],
+                    socket.SOCK_STREAM,
+                    resolved_host["proto"],
+                    host,
+                    (resolved_host["host"], port),
+                )
+            )
+        ]
+        if not allowed_hosts:
+            raise UnacceptableAddressException((host, port))
+        return allowed_hosts
+
+
+@dataclass
+class WebhookCallResult:
+    pending_call: TableWebhookPendingCall
+    called_time: datetime
+    request: Optional[str] = None
+    response: Optional[str] = None
+    response_status: Optional[int] = None
+    error: str = ""
+
+    @property
+    def success(self) -> bool:
+        # Same as `requests.Response.ok`.
+        return self.response_status is not None and self.response_status < 400
+
+
+def format_request(method: str, url: str, headers, payload: Any) -> str:
+    """
+    Formats the request in the same way as `WebhookHandler.format_request`.
+    """
+
+    return "{}\r\n{}\r\n\r\n{}".format(
+        method + " " + url,
+        "\r\n".join("{}: {}".format(k, v) for k, v in headers.items()),
+        json.dumps(payload, indent=4),
+    )
+
+
+def format_response(headers, body: str) -> str:
+    """
+    Formats the response in the same way as `WebhookHandler.format_response`.
+    """
+
+    try:
+        body = json.dumps(json.loads(body), indent=4)
+    except ValueError:
+        pass
+
+    return "{}\r\n\r\n{}".format(
+        "\r\n".join("{}: {}".format(k, v) for k, v in headers.items()),
+        body,
+    )
+
+
+class WebhookDispatcher:
+    def enqueue_calls(self, calls: List[Dict[str, Any]]):
+        """
+        Stores the provided calls as pending calls and makes sure that the dispatcher
+        task is going to send them.
+
+        :param calls: The calls that must be made. Every call is a dict containing
+            the same keyword arguments as the `call_webhook` task.
+        """
+
+        from .tasks import schedule_pending_webhook_calls_dispatch
+
+        if not calls:
+            return
+
+        now = timezone.now()
+        TableWebhookPendingCall.objects.bulk_create(
+            [
+                TableWebhookPendingCall(
+                    webhook_id=call["webhook_id"],
+                    event_id=call["event_id"],
+                    event_type=call["event_type"],
+                    method=call["method"],
+                    url=call["url"],
+                    headers=call["headers"],
+                    payload=call["payload"],
+                    next_attempt_at=now,
+                )
+                for call in calls
+            ]
+        )
+        schedule_pending_webhook_calls_dispatch()
+
+    def dispatch_due_calls(self) -> Optional[datetime]:
+        """
+        Sends all the pending calls that are due in batches of
+        `BASEROW_WEBHOOKS_BATCH_SIZE` until there are none left, or until half of the
+        Celery soft time limit has passed so that the results of a batch are never
+        lost because the task is killed.
+
+        :return: The time when the next pending call is due or None if there are no
+            pending calls left.
+        """
+
+        # The calls of deactivated webhooks are not going to be made anymore.
+        TableWebhookPendingCall.objects.filter(webhook__active=False).delete()
+
+        deadline = time.monotonic() + settings.CELERY_SOFT_TIME_LIMIT / 2
+        while time.monotonic() < deadline:
+            pending_calls = list(
+                TableWebhookPendingCall.objects.filter(
+                    next_attempt_at__lte=timezone.now()
+                ).order_by("id")[: settings.BASEROW_WEBHOOKS_BATCH_SIZE]
+            )
+            if not pending_calls:
+                break
+
+            results = asyncio.run(self.send_calls(pending_calls))
+            self.record_call_results(results)
+
+        next_pending_call = (
+            TableWebhookPendingCall.objects.filter(webhook__active=True)
+            .order_by("next_attempt_at")
+            .first()
+        )
+        return next_pending_call.next_attempt_at if next_pending_call else None
+
+    async def send_calls(
+        self, pending_calls: List[TableWebhookPendingCall]
+    ) -> List[WebhookCallResult]:
+        """
+        Concurrently sends the provided calls using one HTTP session. The number of
+        concurrent connections is limited in total and per target host.
+
+        :param pending_calls: The calls that must be made.
+        :return: The results of the calls in the same order.
+        """
+
+        connector_kwargs = {
+            "limit": settings.BASEROW_WEBHOOKS_BATCH_MAX_CONNECTIONS,
+            "limit_per_host": settings.BASEROW_WEBHOOKS_BATCH_MAX_CONNECTIONS_PER_HOST,
+        }
+        if settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True:
+            connector = aiohttp.TCPConnector(**connector_kwargs)
+        else:
+            connector = AddressValidatingTCPConnector(
+                get_advocate_address_validator(), **connector_kwargs
+            )
+
+        # Just like the timeout of the `requests` library, the timeout applies to
+        # connecting and reading, but not to waiting for a free connection.
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=settings.BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS,
+            sock_read=settings.BASEROW_WEBHOOKS_REQUEST_TIMEOUT_SECONDS,
+        )
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout
+        ) as session:
+            return await asyncio.gather(
+                *[self.send_call(session, call) for call in pending_calls]
+            )
+
+    async def send_call(
+        self, session: aiohttp.ClientSession, pending_call: TableWebhookPendingCall
+    ) -> WebhookCallResult:
+        result = WebhookCallResult(
+            pending_call=pending_call, called_time=timezone.now()
+        )
+
+        try:
+            async with session.request(
+                pending_call.method,
+                pending_call.url,
+                headers=pending_call.headers,
+                json=pending_call.payload,
+            ) as response:
+                body = await response.text(errors="replace")
+        except UnacceptableAddressException as exception:
+            result.error = f"UnacceptableAddressException: {exception}"
+            return result
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exception:
+            result.error = str(exception) or exception.__class__.__name__
+            return result
+
+        # If there is a redirect, the request info of the first response in the
+        # history contains the original request.
+        request_info = (
+            response.history[0].request_info
+            if response.history
+            else response.request_info
+        )
+        result.request = format_request(
+            pending_call.method,
+            str(request_info.url),
+            request_info.headers,
+            pending_call.payload,
+        )
+        result.response = format_response(response.headers, body)
+        result.response_status = response.status
+        return result
+
+    def record_call_results(self, results: List[WebhookCallResult]):
+        """
+        Records the results of the calls in bulk. The call log entries are created or
+        updated, the failed triggers of the webhooks are updated in the same way as
+        the `call_webhook` task does, and the failed calls are rescheduled with an
+        exponential backoff until the maximum number of retries has been reached.
+
+        :param results: The results of the calls that have been made.
+        """
+
+        from .handler import WebhookHandler
+
+        handler = WebhookHandler()
+        now = timezone.now()
+
+        with transaction.atomic():
+            webhooks = {
+                webhook.id: webhook
+                for webhook in TableWebhook.objects.select_for_update(
+                    of=("self",)
+                ).filter(id__in={result.pending_call.webhook_id for result in results})
+            }
+            # The pending calls of deleted webhooks have been deleted with them.
+            results = [
+                result
+                for result in results
+                if result.pending_call.webhook_id in webhooks
+            ]
+
+            existing_calls = {
+                (call.event_id, call.event_type, call.webhook_id): call
+                for call in TableWebhookCall.objects.filter(
+                    webhook_id__in=webhooks.keys(),
+                    event_id__in={result.pending_call.event_id for result in results},
+                )
+            }
+            calls_to_create, calls_to_update = [], set()
+            pending_calls_to_delete, pending_calls_to_retry = [], []
+            changed_webhooks = {}
+
+            for result in results:
+                pending_call = result.pending_call
+                key = (
+                    pending_call.event_id,
+                    pending_call.event_type,
+                    pending_call.webhook_id,
+                )
+                call = existing_calls.get(key)
+                if call is None:
+                    call = TableWebhookCall(
+                        event_id=pending_call.event_id,
+                        event_type=pending_call.event_type,
+                        webhook_id=pending_call.webhook_id,
+                    )
+                    existing_calls[key] = call
+                    calls_to_create.append(call)
+                elif call.id is not None:
+                    calls_to_update.add(call)
+
+                call.called_time = result.called_time
+                call.called_url = pending_call.url
+                call.request = result.request
+                call.response = result.response
+                call.response_status = result.response_status
+                call.error = result.error
+
+                webhook = webhooks[pending_call.webhook_id]
+                if result.success and webhook.failed_triggers != 0:
+                    webhook.failed_triggers = 0
+                    changed_webhooks[webhook.id] = webhook
+                elif not result.success and (
+                    webhook.failed_triggers
+                    < settings.BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES
+                ):
+                    webhook.failed_triggers += 1
+                    changed_webhooks[webhook.id] = webhook
+                elif not result.success:
+                    webhook.active = False
+                    changed_webhooks[webhook.id] = webhook
+
+                if (
+                    not result.success
+                    and pending_call.attempts
+                    < settings.BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL
+                ):
+                    pending_call.next_attempt_at = now + timedelta(
+                        seconds=2**pending_call.attempts
+                    )
+                    pending_call.attempts += 1
+                    pending_calls_to_retry.append(pending_call)
+                else:
+                    pending_calls_to_delete.append(pending_call.id)
+
+            TableWebhookCall.objects.bulk_create(calls_to_create)
+            TableWebhookCall.objects.bulk_update(
+                calls_to_update,
+                [
+                    "called_time",
+                    "called_url",
+                    "request",
+                    "response",
+                    "response_status",
+                    "error",
+                ],
+            )
+            TableWebhookPendingCall.objects.filter(
+                id__in=pending_calls_to_delete
+            ).delete()
+            TableWebhookPendingCall.objects.bulk_update(
+                pending_calls_to_retry, ["attempts", "next_attempt_at"]
+            )
+
+            for webhook in changed_webhooks.values():
+                webhook.save()
+            for webhook in webhooks.values():
+                handler.clean_webhook_calls(webhook)
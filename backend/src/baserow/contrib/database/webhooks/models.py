@@ -109,3 +109,37 @@ class TableWebhookCall(models.Model):
 
     class Meta:
         ordering = ("-called_time",)
+
+
+class TableWebhookPendingCall(models.Model):
+    """
+    A webhook call that still has to be made by the batched webhook dispatcher. They
+    are only created if `BASEROW_WEBHOOKS_BATCH_DISPATCH` is enabled.
+    """
+
+    webhook = models.ForeignKey(
+        TableWebhook, related_name="pending_calls", on_delete=models.CASCADE
+    )
+    event_id = models.UUIDField(help_text="Event ID where the call originated from.")
+    event_type = models.CharField(max_length=50)
+    method = models.CharField(
+        max_length=10,
+        choices=WebhookRequestMethods.choices,
+        help_text="The request method that must be used.",
+    )
+    url = models.TextField(help_text="The URL that must be called.")
+    headers = models.JSONField(
+        default=dict, help_text="The headers that must be added to the request."
+    )
+    payload = models.JSONField(help_text="The JSON payload of the request.")
+    attempts = models.PositiveIntegerField(
+        default=0, help_text="The number of failed attempts to make the call."
+    )
+    next_attempt_at = models.DateTimeField(
+        db_index=True,
+        help_text="The call is not made before this time, so that failed calls are "
+        "retried with a backoff.",
+    )
+
+    class Meta:
+        ordering = ("id",)
@@ -1,5 +1,6 @@
 import uuid
 
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
 from django.dispatch.dispatcher import Signal
@@ -7,6 +8,7 @@ from django.dispatch.dispatcher import Signal
 from baserow.contrib.database.table.models import Table
 from baserow.core.registry import Instance, ModelRegistryMixin, Registry
 
+from .dispatcher import WebhookDispatcher
 from .tasks import call_webhook
 
 
@@ -124,20 +126,29 @@ class WebhookEventType(Instance):
         webhook_handler = WebhookHandler()
         webhooks = webhook_handler.find_webhooks_to_call(table.id, self.type)
         event_id = uuid.uuid4()
+        calls = []
         for webhook in webhooks:
             payload = self.get_payload(event_id, webhook, **kwargs)
             headers = webhook.header_dict
             headers.update(**webhook_handler.get_headers(self.type, event_id))
-            call_webhook.delay(
-                webhook_id=webhook.id,
-                event_id=str(event_id),
-                event_type=self.type,
-                method=webhook.request_method,
-                url=webhook.url,
-                headers=headers,
-                payload=payload,
+            calls.append(
+                {
+                    "webhook_id": webhook.id,
+                    "event_id": str(event_id),
+                    "event_type": self.type,
+                    "method": webhook.request_method,
+                    "url": webhook.url,
+                    "headers": headers,
+                    "payload": payload,
+                }
             )
 
+        if settings.BASEROW_WEBHOOKS_BATCH_DISPATCH:
+            WebhookDispatcher().enqueue_calls(calls)
+        else:
+            for call in calls:
+                call_webhook.delay(**call)
+
 
 class WebhookEventTypeRegistry(ModelRegistryMixin, Registry):
     name = "webhook_event"
@@ -1,5 +1,10 @@
+from datetime import timedelta
+
 from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
+
+from celery_singleton import DuplicateTaskError, Singleton
 
 from baserow.config.celery import app
 
@@ -125,3 +130,59 @@ def call_webhook(
         # If the task is still operating within the max retries per call limit,
         # then we want to retry the task with an exponential backoff.
         self.retry(countdown=2**self.request.retries)
+
+
+def schedule_pending_webhook_calls_dispatch():
+    """
+    Starts the batched webhook dispatcher if it isn't running already. If it's
+    running, it's going to send the new pending calls before it finishes.
+    """
+
+    try:
+        dispatch_pending_webhook_calls.delay()
+    except DuplicateTaskError:
+        pass
+
+
+@app.task(
+    base=Singleton,
+    queue="export",
+    raise_on_duplicate=True,
+    lock_expiry=settings.CELERY_TIME_LIMIT,
+)
+def dispatch_pending_webhook_calls():
+    """
+    Sends all the pending webhook calls that are due in batches. If there are
+    pending calls left that must be retried later, a check is scheduled at the time
+    the first one is due.
+    """
+
+    from .dispatcher import WebhookDispatcher
+
+    next_attempt_at = WebhookDispatcher().dispatch_due_calls()
+    if next_attempt_at is not None:
+        countdown = max((next_attempt_at - timezone.now()).total_seconds(), 1)
+        check_pending_webhook_calls.apply_async(countdown=countdown)
+
+
+@app.task(queue="export")
+def check_pending_webhook_calls():
+    """
+    Starts the batched webhook dispatcher if there are pending calls that are due.
+    This is done out of the singleton dispatcher task, so that it can also be used
+    to schedule the retries, and it runs periodically to pick up the calls that
+    have been created right before a running dispatcher finished.
+    """
+
+    from .models import TableWebhookPendingCall
+
+    if TableWebhookPendingCall.objects.filter(
+        next_attempt_at__lte=timezone.now(), webhook__active=True
+    ).exists():
+        schedule_pending_webhook_calls_dispatch()
+
+
+@app.on_after_finalize.connect
+def setup_periodic_tasks(sender, **kwargs):
+    if settings.BASEROW_WEBHOOKS_BATCH_DISPATCH:
+        sender.add_periodic_task(timedelta(minutes=1), check_pending_webhook_calls.s())
@@ -48,6 +48,29 @@ class TablePageType(PageType):
     def get_group_name(self, table_id, **kwargs):
         return f"table-{table_id}"
 
+    def broadcast(
+        self, payload, ignore_web_socket_id=None, exclude_user_ids=None, **kwargs
+    ):
+        """
+        If the row events of the table are coalesced, the event is added to the
+        buffer of the table and the buffer is flushed right away. This makes sure
+        that the row events buffered before this event are received first.
+        """
+
+        from baserow.contrib.database.ws.rows.coalescer import RowEventCoalescer
+        from baserow.contrib.database.ws.rows.tasks import flush_coalesced_row_events
+
+        if not RowEventCoalescer.is_enabled():
+            return super().broadcast(
+                payload, ignore_web_socket_id, exclude_user_ids, **kwargs
+            )
+
+        table_id = kwargs["table_id"]
+        RowEventCoalescer.buffer_event(
+            table_id, payload, ignore_web_socket_id, exclude_user_ids
+        )
+        flush_coalesced_row_events.delay(table_id)
+
     def get_permission_channel_group_name(self, table_id, **kwargs):
         return f"permissions-table-{table_id}"
 
@@ -84,6 +84,7 @@ def public_rows_created(
     model,
     send_realtime_update=True,
     send_webhook_events=True,
+    serialized_rows_cache=None,
     **kwargs,
 ):
     if not send_realtime_update:
@@ -94,7 +95,9 @@ def public_rows_created(
     )
     transaction.on_commit(
         lambda: _send_rows_created_event_to_views(
-            serialize_rows_for_response(rows, model),
+            serialize_rows_for_response(
+                rows, model, serialized_rows_cache=serialized_rows_cache
+            ),
             before,
             row_checker.get_public_views_where_rows_are_visible(rows),
         ),
@@ -103,7 +106,9 @@ def public_rows_created(
 
 @receiver(row_signals.before_rows_delete)
 @baserow_trace(tracer)
-def public_before_rows_delete(sender, rows, user, table, model, **kwargs):
+def public_before_rows_delete(
+    sender, rows, user, table, model, serialized_rows_cache=None, **kwargs
+):
     row_checker = ViewHandler().get_public_views_row_checker(
         table, model, only_include_views_which_want_realtime_events=True
     )
@@ -111,7 +116,9 @@ def public_before_rows_delete(sender, rows, user, table, model, **kwargs):
         "deleted_rows_public_views": (
             row_checker.get_public_views_where_rows_are_visible(rows)
         ),
-        "deleted_rows": serialize_rows_for_response(rows, model),
+        "deleted_rows": serialize_rows_for_response(
+            rows, model, serialized_rows_cache=serialized_rows_cache
+        ),
     }
 
 
@@ -151,11 +158,21 @@ def public_before_rows_update(
 @receiver(row_signals.rows_updated)
 @baserow_trace(tracer)
 def public_rows_updated(
-    sender, rows, user, table, model, before_return, updated_field_ids, **kwargs
+    sender,
+    rows,
+    user,
+    table,
+    model,
+    before_return,
+    updated_field_ids,
+    serialized_rows_cache=None,
+    **kwargs,
 ):
     before_return_dict = dict(before_return)[public_before_rows_update]
     serialized_old_rows = dict(before_return)[serialize_rows_values]
-    serialized_updated_rows = serialize_rows_for_response(rows, model)
+    serialized_updated_rows = serialize_rows_for_response(
+        rows, model, serialized_rows_cache=serialized_rows_cache
+    )
 
     old_row_public_views: List[PublicViewRows] = before_return_dict[
         "old_rows_public_views"
@@ -0,0 +1,252 @@
+from typing import Any, Dict, List, Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+
+from django_redis import get_redis_connection
+from kombu.utils.json import dumps as json_dumps
+from kombu.utils.json import loads as json_loads
+from opentelemetry import metrics
+
+TABLE_EVENTS_KEY = "row_events_coalescer:table:{table_id}:events"
+TABLE_FLUSH_SCHEDULED_KEY = "row_events_coalescer:table:{table_id}:flush_scheduled"
+
+# The buffered events expire after this number of seconds, so that they don't stay
+# around forever if the task flushing them got lost.
+BUFFER_EXPIRY_SECONDS = 60
+
+# The types of the row events that can be merged with the previous event of the same
+# type.
+MERGEABLE_EVENT_TYPES = {"rows_created", "rows_updated", "rows_deleted"}
+
+# Appends an event to the buffer of a table. Returns 1 if no flush of the buffer was
+# scheduled yet, meaning that a task must be scheduled for it.
+BUFFER_EVENT_SCRIPT = """
+redis.call('RPUSH', KEYS[1], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+if redis.call('SET', KEYS[2], 1, 'NX', 'EX', ARGV[2]) then
+    return 1
+end
+return 0
+"""
+
+# Atomically takes all the buffered events of a table, so that events coming in
+# while they're sent schedule a new flush.
+CLAIM_EVENTS_SCRIPT = """
+local events = redis.call('LRANGE', KEYS[1], 0, -1)
+redis.call('DEL', KEYS[1], KEYS[2])
+return events
+"""
+
+
+def _get_redis_client():
+    return get_redis_connection("default")
+
+
+class RowEventCoalescer:
+    """
+    Buffers the realtime row events of a table page for
+    `BASEROW_WS_ROW_EVENTS_COALESCE_MS` in Redis, instead of broadcasting every event
+    right away. When the buffer is flushed, consecutive events of the same type are
+    merged into one message, updates to the same row are merged and updates of rows
+    that have been deleted afterwards are dropped. The other events of the table page
+    are added to the same buffer and flush it right away, so that they're never
+    received before the row events that happened before them.
+    """
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        # The events are buffered in Redis, so this only works if the cache is
+        # backed by Redis, which is the case if it supports locks.
+        return settings.BASEROW_WS_ROW_EVENTS_COALESCE_MS > 0 and hasattr(cache, "lock")
+
+    @classmethod
+    def get_flush_countdown(cls) -> float:
+        return settings.BASEROW_WS_ROW_EVENTS_COALESCE_MS / 1000
+
+    @classmethod
+    def _get_keys(cls, table_id: int) -> List[str]:
+        return [
+            TABLE_EVENTS_KEY.format(table_id=table_id),
+            TABLE_FLUSH_SCHEDULED_KEY.format(table_id=table_id),
+        ]
+
+    @classmethod
+    def buffer_event(
+        cls,
+        table_id: int,
+        payload: Dict[str, Any],
+        ignore_web_socket_id: Optional[str] = None,
+        exclude_user_ids: Optional[List[int]] = None,
+    ) -> bool:
+        """
+        Adds the event to the buffer of the table. The event is encoded the same way
+        as the arguments of the broadcast tasks, so that values like decimals and
+        dates in the payload are supported.
+
+        :param table_id: The id of the table the event belongs to.
+        :param payload: The payload of the realtime message.
+        :param ignore_web_socket_id: The web socket id that must not receive the
+            message, normally the one that made the change.
+        :param exclude_user_ids: The ids of the users that must not receive the
+            message.
+        :return: `True` if a flush of the buffer wasn't scheduled yet and a task must
+            be scheduled to flush it.
+        """
+
+        event = {
+            "payload": payload,
+            "ignore_web_socket_id": ignore_web_socket_id,
+            "exclude_user_ids": exclude_user_ids,
+        }
+        is_new = _get_redis_client().eval(
+            BUFFER_EVENT_SCRIPT,
+            2,
+            *cls._get_keys(table_id),
+            json_dumps(event),
+            BUFFER_EXPIRY_SECONDS,
+        )
+        row_events_counter.add(1, {"type": payload["type"]})
+        return bool(is_new)
+
+    @classmethod
+    def claim_events(cls, table_id: int) -> List[Dict[str, Any]]:
+        """
+        Removes all the buffered events of the table and returns them in the order in
+        which they were added.
+        """
+
+        events = _get_redis_client().eval(
+            CLAIM_EVENTS_SCRIPT, 2, *cls._get_keys(table_id)
+        )
+        return [json_loads(event) for event in events]
+
+    @classmethod
+    def flush(cls, table_id: int):
+        """
+        Broadcasts the coalesced buffered events of the table to the table page.
+
+        :param table_id: The id of the table to flush the events of.
+        """
+
+        from baserow.ws.registries import page_registry
+        from baserow.ws.tasks import broadcast_to_channel_group
+
+        group_name = page_registry.get("table").get_group_name(table_id=table_id)
+        events = cls.coalesce_events(cls.claim_events(table_id))
+        for event in events:
+            broadcast_to_channel_group(
+                group_name,
+                event["payload"],
+                event["ignore_web_socket_id"],
+                event.get("exclude_user_ids"),
+            )
+        row_event_messages_counter.add(len(events))
+
+    @classmethod
+    def coalesce_events(cls, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Merges the provided events into as few messages as possible, without changing
+        the outcome for the clients receiving them.
+
+        :param events: The buffered events, in the order in which they were added.
+        :return: The events that must be broadcast.
+        """
+
+        coalesced = []
+        for event in events:
+            payload = event["payload"]
+            if payload["type"] == "rows_deleted":
+                cls._remove_updates_of_rows(coalesced, set(payload["row_ids"]))
+
+            if coalesced and cls._can_merge(coalesced[-1], event):
+                cls._merge_payload(coalesced[-1]["payload"], payload)
+            else:
+                coalesced.append(event)
+        return coalesced
+
+    @classmethod
+    def _can_merge(cls, event: Dict[str, Any], next_event: Dict[str, Any]) -> bool:
+        payload, next_payload = event["payload"], next_event["payload"]
+        return (
+            payload["type"] in MERGEABLE_EVENT_TYPES
+            and payload["type"] == next_payload["type"]
+            and payload["table_id"] == next_payload["table_id"]
+            and payload.get("before_row_id") == next_payload.get("before_row_id")
+            and event["ignore_web_socket_id"] == next_event["ignore_web_socket_id"]
+            and event.get("exclude_user_ids") == next_event.get("exclude_user_ids")
+        )
+
+    @classmethod
+    def _merge_payload(cls, payload: Dict[str, Any], next_payload: Dict[str, Any]):
+        if payload["type"] == "rows_deleted":
+            row_ids = set(payload["row_ids"])
+            for row in next_payload["rows"]:
+                if row["id"] not in row_ids:
+                    payload["row_ids"].append(row["id"])
+                    payload["rows"].append(row)
+            return
+
+        payload["metadata"].update(next_payload["metadata"])
+        if payload["type"] == "rows_created":
+            payload["rows"].extend(next_payload["rows"])
+            return
+
+        # An update of a row that has already been updated replaces the new values,
+        # but keeps the values before the first update.
+        row_indexes = {row["id"]: index for index, row in enumerate(payload["rows"])}
+        for row, row_before_update in zip(
+            next_payload["rows"], next_payload["rows_before_update"]
+        ):
+            if row["id"] in row_indexes:
+                payload["rows"][row_indexes[row["id"]]] = row
+            else:
+                row_indexes[row["id"]] = len(payload["rows"])
+                payload["rows"].append(row)
+                payload["rows_before_update"].append(row_before_update)
+
+    @classmethod
+    def _remove_updates_of_rows(cls, events: List[Dict[str, Any]], row_ids: Set[int]):
+        """
+        Removes the updates of the provided rows from the events, because they're
+        superseded by the deletion of the rows. Events without rows left are removed.
+        """
+
+        for event in list(events):
+            payload = event["payload"]
+            if payload["type"] != "rows_updated":
+                continue
+
+            kept = [
+                (row, row_before_update)
+                for row, row_before_update in zip(
+                    payload["rows"], payload["rows_before_update"]
+                )
+                if row["id"] not in row_ids
+            ]
+            if not kept:
+                events.remove(event)
+                continue
+
+            payload["rows"] = [row for row, _ in kept]
+            payload["rows_before_update"] = [before for _, before in kept]
+            payload["metadata"] = {
+                row_id: metadata
+                for row_id, metadata in payload["metadata"].items()
+                if int(row_id) not in row_ids
+            }
+
+
+meter = metrics.get_meter(__name__)
+row_events_counter = meter.create_counter(
+    "baserow.ws.row_events_buffered",
+    unit="1",
+    description="The number of realtime row events that have been buffered to be "
+    "coalesced.",
+)
+row_event_messages_counter = meter.create_counter(
+    "baserow.ws.row_event_messages_sent",
+    unit="1",
+    description="The number of realtime messages sent after coalescing the buffered "
+    "row events.",
+)
@@ -5,16 +5,41 @@ from django.dispatch import receiver
 
 from baserow.contrib.database.api.rows.serializers import (
     RowHistorySerializer,
-    RowSerializer,
-    get_row_serializer_class,
     serialize_rows_for_response,
 )
 from baserow.contrib.database.rows import signals as row_signals
 from baserow.contrib.database.rows.registries import row_metadata_registry
 from baserow.contrib.database.table.models import GeneratedTableModel
+from baserow.contrib.database.ws.rows.coalescer import RowEventCoalescer
+from baserow.contrib.database.ws.rows.tasks import flush_coalesced_row_events
 from baserow.ws.registries import page_registry
 
 
+def broadcast_to_table_page(
+    payload: Dict[str, Any], ignore_web_socket_id: Optional[str] = None, **kwargs
+):
+    """
+    Broadcasts the row event to the table page. If coalescing is enabled, the event is
+    buffered and a task is scheduled to send it together with the other row events
+    of the table that come in before it runs. All the row events of the table page
+    go through here, so that they keep their order.
+
+    :param payload: The payload that must be broadcast to the table page.
+    :param ignore_web_socket_id: The web socket id that must not receive the payload.
+    :param kwargs: The parameters identifying the table page, containing `table_id`.
+    """
+
+    if not RowEventCoalescer.is_enabled():
+        page_registry.get("table").broadcast(payload, ignore_web_socket_id, **kwargs)
+        return
+
+    table_id = kwargs["table_id"]
+    if RowEventCoalescer.buffer_event(table_id, payload, ignore_web_socket_id):
+        flush_coalesced_row_events.apply_async(
+            (table_id,), countdown=RowEventCoalescer.get_flush_countdown()
+        )
+
+
 @receiver(row_signals.before_rows_update)
 def serialize_rows_values(
     sender, rows, user, table, model, updated_field_ids, **kwargs
@@ -32,19 +57,19 @@ def rows_created(
     model,
     send_realtime_update=True,
     send_webhook_events=True,
+    serialized_rows_cache=None,
     **kwargs,
 ):
     if not send_realtime_update:
         return
 
-    table_page_type = page_registry.get("table")
     transaction.on_commit(
-        lambda: table_page_type.broadcast(
+        lambda: broadcast_to_table_page(
             RealtimeRowMessages.rows_created(
                 table_id=table.id,
-                serialized_rows=get_row_serializer_class(
-                    model, RowSerializer, is_response=True
-                )(rows, many=True).data,
+                serialized_rows=serialize_rows_for_response(
+                    rows, model, serialized_rows_cache=serialized_rows_cache
+                ),
                 metadata=row_metadata_registry.generate_and_merge_metadata_for_rows(
                     user, table, [row.id for row in rows]
                 ),
@@ -65,18 +90,18 @@ def rows_updated(
     model,
     before_return,
     updated_field_ids,
+    serialized_rows_cache=None,
     **kwargs,
 ):
-    table_page_type = page_registry.get("table")
     before_rows_values = dict(before_return)[serialize_rows_values]
     transaction.on_commit(
-        lambda: table_page_type.broadcast(
+        lambda: broadcast_to_table_page(
             RealtimeRowMessages.rows_updated(
                 table_id=table.id,
                 serialized_rows_before_update=before_rows_values,
-                serialized_rows=get_row_serializer_class(
-                    model, RowSerializer, is_response=True
-                )(rows, many=True).data,
+                serialized_rows=serialize_rows_for_response(
+                    rows, model, serialized_rows_cache=serialized_rows_cache
+                ),
                 metadata=row_metadata_registry.generate_and_merge_metadata_for_rows(
                     user, table, [row.id for row in rows]
                 ),
@@ -91,9 +116,8 @@ def rows_updated(
 def rows_ai_values_generation_error(
     sender, user, rows, field, table, error_message, **kwargs
 ):
-    table_page_type = page_registry.get("table")
     transaction.on_commit(
-        lambda: table_page_type.broadcast(
+        lambda: broadcast_to_table_page(
             {
                 "type": "rows_ai_values_generation_error",
                 "field_id": field.id,
@@ -108,17 +132,18 @@ def rows_ai_values_generation_error(
 
 
 @receiver(row_signals.before_rows_delete)
-def before_rows_delete(sender, rows, user, table, model, **kwargs):
-    return get_row_serializer_class(model, RowSerializer, is_response=True)(
-        rows, many=True
-    ).data
+def before_rows_delete(
+    sender, rows, user, table, model, serialized_rows_cache=None, **kwargs
+):
+    return serialize_rows_for_response(
+        rows, model, serialized_rows_cache=serialized_rows_cache
+    )
 
 
 @receiver(row_signals.rows_deleted)
 def rows_deleted(sender, rows, user, table, model, before_return, **kwargs):
-    table_page_type = page_registry.get("table")
     transaction.on_commit(
-        lambda: table_page_type.broadcast(
+        lambda: broadcast_to_table_page(
             RealtimeRowMessages.rows_deleted(
                 table_id=table.id,
                 serialized_rows=dict(before_return)[before_rows_delete],
@@ -131,9 +156,8 @@ def rows_deleted(sender, rows, user, table, model, before_return, **kwargs):
 
 @receiver(row_signals.row_orders_recalculated)
 def row_orders_recalculated(sender, table, **kwargs):
-    table_page_type = page_registry.get("table")
     transaction.on_commit(
-        lambda: table_page_type.broadcast(
+        lambda: broadcast_to_table_page(
             RealtimeRowMessages.row_orders_recalculated(table_id=table.id),
             table_id=table.id,
         )
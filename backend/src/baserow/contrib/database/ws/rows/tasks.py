@@ -0,0 +1,15 @@
+from baserow.config.celery import app
+
+
+@app.task(bind=True)
+def flush_coalesced_row_events(self, table_id: int):
+    """
+    Broadcasts the row events of the table that have been buffered by the
+    `RowEventCoalescer` since the flush was scheduled.
+
+    :param table_id: The id of the table to flush the buffered events of.
+    """
+
+    from baserow.contrib.database.ws.rows.coalescer import RowEventCoalescer
+
+    RowEventCoalescer.flush(table_id)
@@ -0,0 +1,192 @@
+"""
+This file is responsible for caching the transformed result of the local Baserow list
+rows service dispatches. It's enabled by setting
+`BASEROW_LOCAL_BASEROW_DISPATCH_CACHE_TTL` to the number of seconds a result can be
+kept.
+
+Only the dispatches of published applications are cached, because they're shared
+by all the visitors. The services of a published application never change, because
+publishing creates a new copy of the application, so the cache key of a result only
+contains the service id and the values that are resolved for every dispatch. The
+formulas of the filters of a service are cached as well, so that finding the key of a
+result doesn't need any database query.
+
+Every table has a random dispatch cache version. A cached result is stored together
+with the versions of the dispatched table and of all the tables its fields read from,
+like the tables of link row fields, lookups and formulas. When rows, fields or views
+of a table change, the version is replaced after the transaction is committed, which
+makes all the cached results depending on the table outdated at once. A result is
+only used if all the stored versions are still the current ones, and it's eventually
+removed from the cache because of the TTL.
+"""
+import hashlib
+import json
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from baserow.version import VERSION as BASEROW_VERSION
+
+
+def is_dispatch_cache_enabled() -> bool:
+    return settings.BASEROW_LOCAL_BASEROW_DISPATCH_CACHE_TTL > 0
+
+
+def table_dispatch_cache_version_key(table_id: int) -> str:
+    return f"local_baserow_dispatch_version_{table_id}_{BASEROW_VERSION}"
+
+
+def get_table_dispatch_cache_version(table_id: int) -> str:
+    """
+    Returns the current dispatch cache version of the table and creates one if
+    there is none yet.
+
+    :param table_id: The id of the table.
+    :return: The version that must be part of the cache keys of the table.
+    """
+
+    return get_table_dispatch_cache_versions([table_id])[table_id]
+
+
+def get_table_dispatch_cache_versions(table_ids: Iterable[int]) -> Dict[int, str]:
+    """
+    Returns the current dispatch cache versions of the tables and creates the ones
+    that don't exist yet.
+
+    :param table_ids: The ids of the tables.
+    :return: The versions mapped by table id.
+    """
+
+    keys = {
+        table_dispatch_cache_version_key(table_id): table_id for table_id in table_ids
+    }
+    versions = cache.get_many(keys.keys())
+    for key in keys.keys() - versions.keys():
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        versions[key] = cache.get(key)
+    return {table_id: versions[key] for key, table_id in keys.items()}
+
+
+def get_dispatch_dependency_table_ids(table_id: int) -> Set[int]:
+    """
+    Returns the ids of the table and of all the tables that the values of its fields
+    are read from, directly or via other tables. These are the tables of the link row
+    fields and the tables of the fields that lookups and formulas depend on.
+
+    :param table_id: The id of the dispatched table.
+    :return: The ids of the tables a dispatch result of the table depends on.
+    """
+
+    from baserow.contrib.database.fields.dependencies.models import FieldDependency
+    from baserow.contrib.database.fields.models import LinkRowField
+
+    table_ids = {table_id}
+    pending = {table_id}
+    while pending:
+        related = set(
+            LinkRowField.objects.filter(table_id__in=pending).values_list(
+                "link_row_table_id", flat=True
+            )
+        )
+        related.update(
+            FieldDependency.objects.filter(
+                dependant__table_id__in=pending,
+                dependant__trashed=False,
+                dependency__isnull=False,
+            ).values_list("dependency__table_id", flat=True)
+        )
+        pending = related - table_ids - {None}
+        table_ids |= pending
+    return table_ids
+
+
+def invalidate_table_dispatch_cache(table_ids: Iterable[int]):
+    """
+    Makes all the cached dispatch results of the given tables unreachable once the
+    current transaction is committed, so that a concurrent dispatch can't cache the
+    data from before the commit with the new version.
+
+    :param table_ids: The ids of the tables that have changed.
+    """
+
+    if not is_dispatch_cache_enabled():
+        return
+
+    keys = {table_dispatch_cache_version_key(table_id) for table_id in table_ids}
+    transaction.on_commit(
+        lambda: cache.set_many({key: uuid.uuid4().hex for key in keys}, timeout=None)
+    )
+
+
+def dispatch_filter_formulas_cache_key(service_id: int) -> str:
+    return f"local_baserow_dispatch_filter_formulas_{service_id}_{BASEROW_VERSION}"
+
+
+def get_cached_dispatch_filter_formulas(service_id: int) -> Optional[List[str]]:
+    return cache.get(dispatch_filter_formulas_cache_key(service_id))
+
+
+def set_cached_dispatch_filter_formulas(service_id: int, formulas: List[str]):
+    cache.set(
+        dispatch_filter_formulas_cache_key(service_id),
+        formulas,
+        timeout=settings.BASEROW_LOCAL_BASEROW_DISPATCH_CACHE_TTL,
+    )
+
+
+def get_dispatch_cache_key(service_id: int, *parts: Any) -> str:
+    """
+    Returns the cache key of a dispatch result of the given service. All the
+    provided parts that influence the result are hashed into the key.
+
+    :param service_id: The id of the dispatched service.
+    :param parts: JSON serializable values like the resolved formula values.
+    :return: The cache key.
+    """
+
+    digest = hashlib.sha256(
+        json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return f"local_baserow_dispatch_{service_id}_{digest}_{BASEROW_VERSION}"
+
+
+def get_cached_dispatch_result(cache_key: str) -> Optional[Any]:
+    """
+    Returns the cached dispatch result if it has been stored for the current
+    versions of all the tables it depends on.
+
+    :param cache_key: The key returned by `get_dispatch_cache_key`.
+    :return: The cached result or None if there isn't an up-to-date one.
+    """
+
+    entry = cache.get(cache_key)
+    if entry is None:
+        return None
+
+    if get_table_dispatch_cache_versions(entry["versions"]) != entry["versions"]:
+        return None
+
+    return entry["result"]
+
+
+def set_cached_dispatch_result(
+    cache_key: str, table_versions: Dict[int, str], result: Any
+):
+    """
+    Caches the dispatch result together with the versions of the tables it depends
+    on.
+
+    :param cache_key: The key returned by `get_dispatch_cache_key`.
+    :param table_versions: The versions of the tables the result depends on, read
+        before the result has been queried.
+    :param result: The transformed result of the dispatch.
+    """
+
+    cache.set(
+        cache_key,
+        {"versions": table_versions, "result": result},
+        timeout=settings.BASEROW_LOCAL_BASEROW_DISPATCH_CACHE_TTL,
+    )
@@ -43,12 +43,23 @@ from baserow.contrib.database.rows.operations import ReadDatabaseRowOperationTyp
 from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.exceptions import TableDoesNotExist
 from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.table.models import Table
 from baserow.contrib.database.table.operations import ListRowsDatabaseTableOperationType
 from baserow.contrib.database.table.service import TableService
 from baserow.contrib.database.views.service import ViewService
 from baserow.contrib.integrations.local_baserow.api.serializers import (
     LocalBaserowTableServiceFieldMappingSerializer,
 )
+from baserow.contrib.integrations.local_baserow.cache import (
+    get_cached_dispatch_filter_formulas,
+    get_cached_dispatch_result,
+    get_dispatch_cache_key,
+    get_dispatch_dependency_table_ids,
+    get_table_dispatch_cache_versions,
+    is_dispatch_cache_enabled,
+    set_cached_dispatch_filter_formulas,
+    set_cached_dispatch_result,
+)
 from baserow.contrib.integrations.local_baserow.integration_types import (
     LocalBaserowIntegrationType,
 )
@@ -230,19 +241,30 @@ class LocalBaserowTableServiceType(LocalBaserowServiceType):
             has no `Table` associated with it, or if the table/database is trashed.
         """
 
+        table = self.get_service_table(service)
+        resolved_values = super().resolve_service_formulas(service, dispatch_context)
+        resolved_values["table"] = table
+
+        return resolved_values
+
+    def get_service_table(self, service: ServiceSubClass) -> Table:
+        """
+        Returns the table of the service.
+
+        :param service: A `LocalBaserowTableService` instance.
+        :raises ServiceImproperlyConfigured: When the service has no `Table` or if
+            the table/database is trashed.
+        :return: The table of the service.
+        """
+
         if service.table_id is None:
             raise ServiceImproperlyConfigured("The table property is missing.")
 
         try:
-            table = TableHandler().get_table(service.table_id)
+            return TableHandler().get_table(service.table_id)
         except TableDoesNotExist as e:
             raise ServiceImproperlyConfigured("The specified table is trashed") from e
 
-        resolved_values = super().resolve_service_formulas(service, dispatch_context)
-        resolved_values["table"] = table
-
-        return resolved_values
-
     def deserialize_property(
         self,
         prop_name: str,
@@ -835,6 +857,133 @@ class LocalBaserowListRowsUserServiceType(
             **kwargs,
         )
 
+    def check_list_rows_permission(self, service: LocalBaserowListRows, table):
+        """
+        Checks that the authorized user of the integration can list the rows of the
+        table.
+        """
+
+        integration = service.integration.specific
+
+        CoreHandler().check_permissions(
+            integration.authorized_user,
+            ListRowsDatabaseTableOperationType.type,
+            workspace=table.database.workspace,
+            context=table,
+        )
+
+    def is_dispatch_cacheable(self, service: LocalBaserowListRows) -> bool:
+        """
+        Only the dispatches of published applications are cached, because they're
+        the same for all the visitors. Published applications don't belong to a
+        workspace.
+
+        :param service: the local baserow list rows service.
+        :return: Whether the result of the dispatch can be cached.
+        """
+
+        integration = service.integration
+        return integration is not None and integration.application.workspace_id is None
+
+    def get_dispatch_cache_key(
+        self,
+        service: LocalBaserowListRows,
+        dispatch_context: DispatchContext,
+    ) -> str:
+        """
+        Returns the key under which the result of the dispatch is cached. The service
+        of a published application doesn't change, so the key only contains the
+        values that are resolved for every dispatch: the filter and search formulas,
+        the requested range and the role of the user source user. The filter
+        formulas are cached, so no database query is needed.
+
+        :param service: the local baserow list rows service.
+        :param dispatch_context: The context used for the dispatch.
+        :return: The cache key.
+        """
+
+        filter_formulas = get_cached_dispatch_filter_formulas(service.id)
+        if filter_formulas is None:
+            filter_formulas = [
+                service_filter.value
+                for service_filter in LocalBaserowTableServiceFilter.objects.filter(
+                    service=service, value_is_formula=True
+                )
+            ]
+            set_cached_dispatch_filter_formulas(service.id, filter_formulas)
+
+        filter_values = [
+            str(
+                resolve_formula(
+                    formula, formula_runtime_function_registry, dispatch_context
+                )
+            )
+            for formula in filter_formulas
+        ]
+
+        request = getattr(dispatch_context, "request", None)
+        user = getattr(request, "user_source_user", None)
+        role = user.role if user is not None and user.is_authenticated else ""
+
+        return get_dispatch_cache_key(
+            service.id,
+            filter_values,
+            self.get_dispatch_search(service, dispatch_context),
+            dispatch_context.range(service),
+            role,
+        )
+
+    def dispatch(
+        self,
+        service: LocalBaserowListRows,
+        dispatch_context: DispatchContext,
+    ) -> Any:
+        """
+        When the dispatch cache is enabled, the transformed result of a published
+        application is shared between all the dispatches with the same cache key until
+        the TTL expires or a table it depends on changes. The permissions are checked
+        for every dispatch, but the filters, sortings and dependencies of the service
+        are only loaded if the result isn't cached.
+
+        :param service: the local baserow list rows service.
+        :param dispatch_context: The context used for the dispatch.
+        :return: The list of rows.
+        """
+
+        if not is_dispatch_cache_enabled() or not self.is_dispatch_cacheable(service):
+            return super().dispatch(service, dispatch_context)
+
+        try:
+            cache_key = self.get_dispatch_cache_key(service, dispatch_context)
+        except Exception:
+            # The dispatch raises the right error if the formulas can't be resolved.
+            cache_key = None
+
+        if cache_key is not None:
+            result = get_cached_dispatch_result(cache_key)
+            if result is not None:
+                self.check_list_rows_permission(
+                    service, self.get_service_table(service)
+                )
+                return result
+
+        resolved_values = self.resolve_service_formulas(service, dispatch_context)
+        if cache_key is not None:
+            # The versions are read before the rows, so that a change committed in
+            # the meantime makes the result outdated straight away.
+            table_versions = get_table_dispatch_cache_versions(
+                get_dispatch_dependency_table_ids(resolved_values["table"].id)
+            )
+
+        result = self.dispatch_transform(
+            self.dispatch_data(service, resolved_values, dispatch_context)
+        )
+
+        if cache_key is not None:
+            set_cached_dispatch_result(cache_key, table_versions, result)
+
+        return result
+
     def dispatch_data(
         self,
         service: LocalBaserowListRows,
@@ -853,14 +1002,7 @@ class LocalBaserowListRowsUserServiceType(
 
         table = resolved_values["table"]
 
-        integration = service.integration.specific
-
-        CoreHandler().check_permissions(
-            integration.authorized_user,
-            ListRowsDatabaseTableOperationType.type,
-            workspace=table.database.workspace,
-            context=table,
-        )
+        self.check_list_rows_permission(service, table)
 
         model = table.get_model()
         queryset = model.objects.all().enhance_by_fields()
@@ -2,7 +2,34 @@ from typing import TYPE_CHECKING, Optional
 
 from django.dispatch import receiver
 
-from baserow.contrib.database.fields.signals import field_updated
+from baserow.contrib.database.fields.signals import (
+    field_created,
+    field_deleted,
+    field_restored,
+    field_updated,
+)
+from baserow.contrib.database.rows.signals import (
+    row_orders_recalculated,
+    rows_created,
+    rows_deleted,
+    rows_updated,
+)
+from baserow.contrib.database.table.signals import table_deleted, table_updated
+from baserow.contrib.database.views.signals import (
+    view_filter_created,
+    view_filter_deleted,
+    view_filter_group_created,
+    view_filter_group_deleted,
+    view_filter_group_updated,
+    view_filter_updated,
+    view_sort_created,
+    view_sort_deleted,
+    view_sort_updated,
+    view_updated,
+)
+from baserow.contrib.integrations.local_baserow.cache import (
+    invalidate_table_dispatch_cache,
+)
 from baserow.contrib.integrations.local_baserow.models import (
     LocalBaserowTableServiceFieldMapping,
 )
@@ -22,3 +49,58 @@ def local_baserow_upsert_row_handle_field_update(
         # then we'll delete the field mapping, as the value won't be used.
         if (field_type.type != old_field_type.type) and field_type.read_only:
             LocalBaserowTableServiceFieldMapping.objects.filter(field=field).delete()
+
+
+@receiver([rows_created, rows_updated, rows_deleted, row_orders_recalculated])
+def local_baserow_invalidate_dispatch_cache_on_rows_change(sender, table, **kwargs):
+    invalidate_table_dispatch_cache([table.id])
+
+
+@receiver([field_created, field_updated, field_deleted, field_restored])
+def local_baserow_invalidate_dispatch_cache_on_field_change(
+    sender, field: "Field", related_fields=None, **kwargs
+):
+    invalidate_table_dispatch_cache(
+        [field.table_id, *[f.table_id for f in related_fields or []]]
+    )
+
+
+@receiver(
+    [
+        view_filter_created,
+        view_filter_updated,
+        view_filter_deleted,
+        view_filter_group_created,
+        view_filter_group_updated,
+        view_filter_group_deleted,
+        view_sort_created,
+        view_sort_updated,
+        view_sort_deleted,
+    ]
+)
+def local_baserow_invalidate_dispatch_cache_on_view_change(sender, **kwargs):
+    instance = (
+        kwargs.get("view_filter")
+        or kwargs.get("view_filter_group")
+        or kwargs.get("view_sort")
+    )
+    invalidate_table_dispatch_cache([instance.view.table_id])
+
+
+@receiver(view_updated)
+def local_baserow_invalidate_dispatch_cache_on_view_updated(sender, view, **kwargs):
+    invalidate_table_dispatch_cache([view.table_id])
+
+
+@receiver(table_updated)
+def local_baserow_invalidate_dispatch_cache_on_table_updated(sender, table, **kwargs):
+    # Also sent with `force_table_refresh` when the values of the table have been
+    # changed without the rows signals.
+    invalidate_table_dispatch_cache([table.id])
+
+
+@receiver(table_deleted)
+def local_baserow_invalidate_dispatch_cache_on_table_deleted(
+    sender, table_id, **kwargs
+):
+    invalidate_table_dispatch_cache([table_id])
@@ -2,7 +2,8 @@
 Helpers for 0006_migrate_local_baserow_table_service_filter_formulas_to_value_is_formula
 """
 
-from baserow.core.formula import BaserowFormulaSyntaxError, get_parse_tree_for_formula
+from baserow.core.formula import BaserowFormulaSyntaxError
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
 
 
 def value_parses_as_formula(value: str) -> bool:
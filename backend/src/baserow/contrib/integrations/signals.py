@@ -1,7 +1,15 @@
 from baserow.contrib.integrations.local_baserow.signals import (
+    local_baserow_invalidate_dispatch_cache_on_field_change,
+    local_baserow_invalidate_dispatch_cache_on_rows_change,
+    local_baserow_invalidate_dispatch_cache_on_view_change,
+    local_baserow_invalidate_dispatch_cache_on_view_updated,
     local_baserow_upsert_row_handle_field_update,
 )
 
 __all__ = [
     "local_baserow_upsert_row_handle_field_update",
+    "local_baserow_invalidate_dispatch_cache_on_rows_change",
+    "local_baserow_invalidate_dispatch_cache_on_field_change",
+    "local_baserow_invalidate_dispatch_cache_on_view_change",
+    "local_baserow_invalidate_dispatch_cache_on_view_updated",
 ]
@@ -1,26 +1,45 @@
 import contextlib
+import hashlib
 from collections import defaultdict
-from decimal import Decimal
-from functools import cache
+from decimal import ROUND_DOWN, Decimal, localcontext
+from functools import cache, reduce
 from math import ceil
+from operator import or_
 from typing import (
     Any,
     Callable,
     Dict,
+    Generator,
     Generic,
     Iterable,
     List,
+    NamedTuple,
     Optional,
     Set,
     Tuple,
+    Type,
     TypeVar,
     Union,
 )
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.fields import ArrayField
+from django.core.exceptions import FieldDoesNotExist, FieldError
 from django.db import DEFAULT_DB_ALIAS, connection, transaction
-from django.db.models import ForeignKey, ManyToManyField, Max, Model, QuerySet
+from django.db.models import (
+    Expression,
+    F,
+    ForeignKey,
+    JSONField,
+    ManyToManyField,
+    Max,
+    Model,
+    OrderBy,
+    Q,
+    QuerySet,
+    Value,
+)
 from django.db.models.functions import Collate
 from django.db.models.sql.query import LOOKUP_SEP
 from django.db.transaction import Atomic, get_connection
@@ -28,6 +47,8 @@ from django.db.transaction import Atomic, get_connection
 from loguru import logger
 from psycopg2 import sql
 
+from .exceptions import CannotCalculateIntermediateOrder
+from .expressions import RowValueComparison
 from .utils import find_intermediate_order
 
 ModelInstance = TypeVar("ModelInstance", bound=object)
@@ -322,6 +343,135 @@ def get_unique_orders_before_item(
     return new_orders
 
 
+# The smallest gap between the orders that `get_spaced_orders_before_item` allocates.
+# Orders closer together can't reliably be told apart by `find_intermediate_order`
+# anymore, which works with fractions of a limited denominator.
+MIN_ORDER_GAP = Decimal("0.00001")
+
+
+def get_spaced_orders_before_item(
+    before: Model,
+    queryset: QuerySet,
+    amount: int = 1,
+    field: str = "order",
+    min_gap: Decimal = MIN_ORDER_GAP,
+) -> List[Decimal]:
+    """
+    Calculates a list of orders that are evenly spaced between the provided `before`
+    and the item before it. Contrary to `get_unique_orders_before_item`, the orders
+    of many items keep enough room between them to insert other items later.
+
+    :param before: The model instance where the before orders must be
+        calculated for.
+    :param queryset: The base queryset used to compute the value.
+    :param amount: The number of orders that must be requested.
+    :param field: The name of the order field.
+    :param min_gap: The minimum gap between the returned orders.
+    :raises CannotCalculateIntermediateOrder: If the gap between the orders would be
+        smaller than `min_gap`. The orders of the items before `before` must be
+        recalculated with `recalculate_orders_before_item` in this case.
+    :return: A list of decimals containing safe to use orders in order.
+    """
+
+    before_order = getattr(before, field)
+    adjacent_order = (
+        queryset.filter(**{f"{field}__lt": before_order})
+        .aggregate(max=Max(field))
+        .get("max")
+    ) or Decimal("0")
+
+    with localcontext() as context:
+        # The orders have up to 40 digits, which is more than the default precision.
+        context.prec = 40
+        gap = _round_order_down((before_order - adjacent_order) / (amount + 1))
+        if gap < min_gap:
+            raise CannotCalculateIntermediateOrder(
+                "The gap between the orders would be too small."
+            )
+        return [adjacent_order + gap * i for i in range(1, amount + 1)]
+
+
+def recalculate_orders_before_item(
+    before: Model,
+    model: Type[Model],
+    amount: int = 1,
+    field: str = "order",
+    min_gap: Decimal = MIN_ORDER_GAP,
+) -> bool:
+    """
+    Recalculates the orders of the items right before the provided `before`, so that
+    `amount` orders with a gap of at least `min_gap` fit between them. Contrary to
+    `recalculate_full_orders`, only the neighbourhood of `before` is updated. The
+    range of orders before it is doubled until its items can be spread out enough.
+
+    id     old_order    new_order   (before has order 2, amount is 1)
+    1      1.0000       1.0000
+    2      1.9999       1.2500
+    3      1.99999      1.5000
+
+    :param before: The model instance where room for the orders must be made.
+    :param model: The model we want to reorder the instances for. All the instances,
+        including the trashed ones, are reordered to keep their positions.
+    :param amount: The number of orders that must fit before `before`.
+    :param field: The order field name.
+    :param min_gap: The minimum gap between the orders.
+    :return: False if the items can't be spread out enough without changing the
+        orders of the items after `before`. All the orders must be recalculated with
+        `recalculate_full_orders` in that case.
+    """
+
+    queryset = model._base_manager.all()
+    before_order = getattr(before, field)
+
+    with localcontext() as context:
+        context.prec = 40
+        width = Decimal("1")
+        while True:
+            lower_order = max(before_order - width, Decimal("0"))
+            count = queryset.filter(
+                **{f"{field}__gt": lower_order, f"{field}__lt": before_order}
+            ).count()
+            gap = _round_order_down((before_order - lower_order) / (count + amount + 1))
+            if gap >= min_gap:
+                break
+            if lower_order <= 0:
+                return False
+            width *= 2
+
+    raw_query = """
+        update {table_name} c1
+            set {order_field} = %(lower_order)s + c2.seqnum * %(gap)s from (
+            select c2.id, row_number() over (
+                ORDER BY {order_params}
+            ) as seqnum from {table_name} c2
+            where c2.{order_field} > %(lower_order)s
+            and c2.{order_field} < %(before_order)s
+            ) c2
+        where c2.id = c1.id"""
+    with connection.cursor() as cursor:
+        sql_query = sql.SQL(raw_query).format(
+            order_field=sql.Identifier(field),
+            table_name=sql.Identifier(model._meta.db_table),
+            order_params=sql.SQL(", ").join(
+                [
+                    sql.SQL(".").join([sql.Identifier("c2"), sql.Identifier(o)])
+                    for o in model._meta.ordering
+                ]
+            ),
+        )
+        cursor.execute(
+            sql_query,
+            {"lower_order": lower_order, "gap": gap, "before_order": before_order},
+        )
+    return True
+
+
+def _round_order_down(order: Decimal) -> Decimal:
+    # Orders "only" store 20 decimal places. Rounding down makes sure that multiples
+    # of the value don't exceed the available room.
+    return order.quantize(Decimal("1e-20"), rounding=ROUND_DOWN)
+
+
 def get_highest_order_of_queryset(
     queryset: QuerySet,
     amount: int = 1,
@@ -794,3 +944,278 @@ class CombinedForeignKeyAndManyToManyMultipleFieldPrefetch:
                 row_id_to_field_name_to_target_ids[result[0]][result[1]] = result[2]
 
         return row_id_to_field_name_to_target_ids
+
+
+class KeysetColumn(NamedTuple):
+    expression: Expression
+    descending: bool
+    nulls_first: bool
+    # The name of the concrete, not nullable, model field if the column orders by it
+    # directly. These columns can be compared as one row value.
+    not_null_field_name: Optional[str]
+    # Whether the column holds a single value that can be compared in a condition.
+    # Arrays and JSON values can be ordered by, but not compared with a parameter.
+    scalar: bool = True
+
+
+class KeysetPaginator:
+    """
+    Paginates a queryset by seeking past the values of the ordering columns of the
+    last returned row, instead of using an `OFFSET`. This keeps the cost of every
+    page constant, no matter how deep into the queryset it is, and uses the
+    indexes of the ordering columns. The `id` is always added as the last ordering
+    column if not present already, to make sure the ordering is unique.
+
+    If the queryset is ordered by a value that can't be compared, like the array of
+    a lookup field, the pages are fetched by offset instead. The values returned
+    for a page then only contain the offset of the next page.
+
+    paginator = KeysetPaginator(Model.objects.order_by("order", "id"))
+    rows, after = paginator.get_page(None, 100)
+    next_rows, after = paginator.get_page(after, 100)
+    """
+
+    annotation_prefix = "_keyset_"
+
+    def __init__(self, queryset: QuerySet):
+        self.columns = self._get_columns(queryset)
+        self.can_seek = all(column.scalar for column in self.columns)
+        self.queryset = queryset.order_by(
+            *[
+                OrderBy(
+                    column.expression,
+                    descending=column.descending,
+                    nulls_first=True if column.nulls_first else None,
+                    nulls_last=None if column.nulls_first else True,
+                )
+                for column in self.columns
+            ]
+        ).annotate(
+            **{
+                f"{self.annotation_prefix}{index}": column.expression
+                for index, column in enumerate(self.columns)
+            }
+        )
+
+    @staticmethod
+    def _is_scalar(queryset: QuerySet, expression: Expression) -> bool:
+        # Resolve on a clone because resolving can add joins to the query.
+        try:
+            output_field = expression.resolve_expression(
+                queryset.query.clone()
+            ).output_field
+        except FieldError:
+            return True
+        return not isinstance(output_field, (ArrayField, JSONField))
+
+    @classmethod
+    def _get_columns(cls, queryset: QuerySet) -> List[KeysetColumn]:
+        query = queryset.query
+        ordering = list(query.order_by)
+        if not ordering and query.default_ordering:
+            ordering = list(queryset.model._meta.ordering)
+
+        columns = []
+        has_unique_column = False
+        for order in ordering:
+            if isinstance(order, str):
+                if order == "?":
+                    raise ValueError("A random ordering can't be paginated by keyset.")
+                descending = order.startswith("-")
+                name = order.lstrip("-+")
+                name = "id" if name == "pk" else name
+                expression = F(name)
+                nulls_first = descending
+                try:
+                    model_field = queryset.model._meta.get_field(name)
+                    not_null_field_name = None if model_field.null else name
+                except FieldDoesNotExist:
+                    not_null_field_name = None
+            else:
+                if not isinstance(order, OrderBy):
+                    order = order.asc()
+                descending = order.descending
+                expression = order.expression
+                nulls_first = bool(order.nulls_first) or (
+                    not order.nulls_last and descending
+                )
+                not_null_field_name = None
+
+            has_unique_column = has_unique_column or not_null_field_name == "id"
+            columns.append(
+                KeysetColumn(
+                    expression,
+                    descending,
+                    nulls_first,
+                    not_null_field_name,
+                    cls._is_scalar(queryset, expression),
+                )
+            )
+
+        if not has_unique_column:
+            columns.append(KeysetColumn(F("id"), False, False, "id"))
+
+        return columns
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        A short hash of the ordering columns, which can be used to check whether
+        keyset values have been generated for the same ordering.
+        """
+
+        description = repr([tuple(column) for column in self.columns])
+        return hashlib.sha1(description.encode("utf-8")).hexdigest()[:12]
+
+    def get_values(self, row: Model) -> List[Any]:
+        """
+        Returns the values of the ordering columns of a row returned by this
+        paginator, which can be used to get the next page.
+        """
+
+        return [
+            getattr(row, f"{self.annotation_prefix}{index}")
+            for index in range(len(self.columns))
+        ]
+
+    def _get_equal_condition(self, index: int, value: Any) -> Q:
+        name = f"{self.annotation_prefix}{index}"
+        if value is None:
+            return Q(**{f"{name}__isnull": True})
+        return Q(**{name: value})
+
+    def _get_after_condition(self, index: int, value: Any) -> Optional[Q]:
+        name = f"{self.annotation_prefix}{index}"
+        column = self.columns[index]
+        if value is None:
+            # Nothing can come after a null if they're sorted last.
+            return Q(**{f"{name}__isnull": False}) if column.nulls_first else None
+
+        lookup = "lt" if column.descending else "gt"
+        condition = Q(**{f"{name}__{lookup}": value})
+        if not column.nulls_first:
+            condition |= Q(**{f"{name}__isnull": True})
+        return condition
+
+    def get_after_condition(self, values: List[Any]) -> Q:
+        """
+        Constructs the condition that only matches the rows that come after the
+        provided values of the ordering columns. The trailing columns that are
+        concrete not nullable model fields with the same ordering direction, like
+        `order` and `id`, are compared as one row value, so that their index can be
+        used to seek to the start of the page.
+
+        :param values: The values of the ordering columns of the last row of the
+            previous page.
+        :raises ValueError: If the number of values doesn't match the ordering, or
+            the ordering columns can't be compared.
+        :return: A condition that can be used to filter the queryset.
+        """
+
+        if not self.can_seek:
+            raise ValueError("The ordering columns can't be compared.")
+
+        if len(values) != len(self.columns):
+            raise ValueError("The values don't match the ordering columns.")
+
+        split = len(self.columns)
+        while (
+            split > 0
+            and self.columns[split - 1].not_null_field_name is not None
+            and self.columns[split - 1].descending == self.columns[-1].descending
+            and values[split - 1] is not None
+        ):
+            split -= 1
+
+        conditions = []
+        equal_condition = Q()
+        for index in range(split):
+            after_condition = self._get_after_condition(index, values[index])
+            if after_condition is not None:
+                conditions.append(equal_condition & after_condition)
+            equal_condition &= self._get_equal_condition(index, values[index])
+
+        if split < len(self.columns):
+            model_meta = self.queryset.model._meta
+            tail = self.columns[split:]
+            conditions.append(
+                equal_condition
+                & Q(
+                    RowValueComparison(
+                        [F(column.not_null_field_name) for column in tail],
+                        [
+                            Value(
+                                model_meta.get_field(
+                                    column.not_null_field_name
+                                ).to_python(value)
+                            )
+                            for column, value in zip(tail, values[split:])
+                        ],
+                        "<" if tail[-1].descending else ">",
+                    )
+                )
+            )
+
+        if not conditions:
+            return Q(pk__in=[])
+
+        return reduce(or_, conditions)
+
+    def get_page(
+        self, after: Optional[List[Any]], size: int
+    ) -> Tuple[List[Model], Optional[List[Any]]]:
+        """
+        Returns the rows of the page that starts after the provided values.
+
+        :param after: The values returned for the previous page, or None to fetch
+            the first page.
+        :param size: The maximum number of rows in the page.
+        :raises ValueError: If the provided values are invalid.
+        :return: The rows of the page and the values that must be provided to get
+            the next page, or None if there isn't a next page.
+        """
+
+        offset = 0
+        queryset = self.queryset
+        if not self.can_seek:
+            if after is not None:
+                if (
+                    len(after) != 1
+                    or not isinstance(after[0], int)
+                    or isinstance(after[0], bool)
+                    or after[0] < 0
+                ):
+                    raise ValueError("The values don't contain a valid offset.")
+                offset = after[0]
+        elif after is not None:
+            queryset = queryset.filter(self.get_after_condition(after))
+
+        # Fetch one extra row to find out if there is a next page without counting.
+        rows = list(queryset[offset : offset + size + 1])
+        if len(rows) <= size:
+            return rows, None
+
+        rows = rows[:size]
+        if not self.can_seek:
+            return rows, [offset + size]
+        return rows, self.get_values(rows[-1])
+
+    def iterate_pages(
+        self, size: int
+    ) -> Generator[Tuple[List[Model], bool], None, None]:
+        """
+        Iterates over all the rows of the queryset in pages of the provided size.
+        Because every page is fetched as a separate queryset, any multi field
+        prefetches are executed per page.
+
+        :param size: The maximum number of rows in every page.
+        :return: A generator yielding the rows of every page and whether it's the
+            last page.
+        """
+
+        after = None
+        while True:
+            rows, after = self.get_page(after, size)
+            yield rows, after is None
+            if after is None:
+                break
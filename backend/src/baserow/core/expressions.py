@@ -1,4 +1,4 @@
-from django.db.models import DateTimeField, Expression, Func, Value
+from django.db.models import BooleanField, DateTimeField, Expression, Func, Value
 
 
 class Timezone(Expression):
@@ -71,3 +71,56 @@ class DateTrunc(Func):
 
     def __init__(self, trunc_type, field_expression, **extra):
         super(DateTrunc, self).__init__(Value(trunc_type), field_expression, **extra)
+
+
+class RowValueComparison(Expression):
+    """
+    Compares two row values in SQL, which allows to efficiently seek through an
+    index spanning multiple columns. It can for example be used like this:
+
+    ```
+    SomeModel.objects.filter(
+        RowValueComparison([F("order"), F("id")], [Value(1), Value(10)], ">")
+    )
+    ```
+
+    It will eventually result in `("order", "id") > (1, 10)`
+    """
+
+    conditional = True
+    operators = {">", ">=", "<", "<="}
+
+    def __init__(self, lhs, rhs, operator):
+        if len(lhs) != len(rhs) or len(lhs) == 0:
+            raise ValueError("Both row values must have the same, non zero, length.")
+        if operator not in self.operators:
+            raise ValueError(f"The operator {operator} is not supported.")
+
+        super().__init__(output_field=BooleanField())
+        self.lhs = self._parse_expressions(*lhs)
+        self.rhs = self._parse_expressions(*rhs)
+        self.operator = operator
+
+    def get_source_expressions(self):
+        return [*self.lhs, *self.rhs]
+
+    def set_source_expressions(self, exprs):
+        self.lhs = exprs[: len(self.lhs)]
+        self.rhs = exprs[len(self.lhs) :]
+
+    def __repr__(self):
+        return "{}({}, {}, {})".format(
+            self.__class__.__name__, self.lhs, self.rhs, self.operator
+        )
+
+    def as_sql(self, compiler, connection):
+        params = []
+        row_values = []
+        for expressions in (self.lhs, self.rhs):
+            parts = []
+            for expression in expressions:
+                expression_sql, expression_params = compiler.compile(expression)
+                parts.append(expression_sql)
+                params.extend(expression_params)
+            row_values.append(f"({', '.join(parts)})")
+        return f"{row_values[0]} {self.operator} {row_values[1]}", params
@@ -19,8 +19,7 @@ __all__ = [
     BaserowFormulaSyntaxError,
 ]
 
-from baserow.core.formula.parser.parser import get_parse_tree_for_formula
-from baserow.core.formula.parser.python_executor import BaserowPythonExecutor
+from baserow.core.formula.parser.python_compiler import compile_formula
 
 
 def resolve_formula(
@@ -39,5 +38,4 @@ def resolve_formula(
     if not formula:
         return ""
 
-    tree = get_parse_tree_for_formula(formula)
-    return BaserowPythonExecutor(functions, formula_context).visit(tree)
+    return compile_formula(formula, functions)(formula_context)
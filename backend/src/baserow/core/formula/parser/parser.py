@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+from django.conf import settings
+
 from antlr4 import CommonTokenStream, InputStream
 from antlr4.BufferedTokenStream import BufferedTokenStream
 from antlr4.error.ErrorListener import ErrorListener
@@ -30,12 +34,7 @@ def get_token_stream_for_formula(formula: str) -> BufferedTokenStream:
     return stream
 
 
-def get_parse_tree_for_formula(formula: str):
-    """
-    WARNING: This function is directly used by migration code. Please ensure
-    backwards compatibility .
-    """
-
+def _parse_formula(formula: str):
     lexer = BaserowFormulaLexer(InputStream(formula))
     stream = CommonTokenStream(lexer)
     parser = BaserowFormula(stream)
@@ -44,6 +43,39 @@ def get_parse_tree_for_formula(formula: str):
     return parser.root()
 
 
+# The parse trees are never modified by the visitors, so the same tree can safely be
+# shared between threads and visited many times. Formulas with a syntax error raise
+# an exception and are therefore never cached.
+_cached_parse_formula = lru_cache(
+    maxsize=settings.BASEROW_FORMULA_PARSE_TREE_CACHE_SIZE
+)(_parse_formula)
+
+
+def get_parse_tree_for_formula(formula: str):
+    """
+    WARNING: This function is directly used by migration code. Please ensure
+    backwards compatibility .
+
+    Returns the parse tree of the formula. Because the python ANTLR runtime is
+    slow, the parse trees of the most recently used formulas are cached in memory.
+    The returned tree must therefore never be modified.
+    """
+
+    return _cached_parse_formula(formula)
+
+
+def get_parse_tree_cache_info():
+    """
+    Returns the hits, misses, maximum and current size of the parse tree cache.
+    """
+
+    return _cached_parse_formula.cache_info()
+
+
+def clear_parse_tree_cache():
+    _cached_parse_formula.cache_clear()
+
+
 # noinspection DuplicatedCode
 def convert_string_literal_token_to_string(string_literal, is_single_q):
     literal_without_outer_quotes = string_literal[1:-1]
@@ -0,0 +1,149 @@
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, List, Type
+
+from django.conf import settings
+
+from baserow.core.formula import BaserowFormula, BaserowFormulaVisitor
+from baserow.core.formula.parser.exceptions import (
+    BaserowFormulaSyntaxError,
+    FieldByIdReferencesAreDeprecated,
+    FormulaFunctionTypeDoesNotExist,
+    UnknownOperator,
+)
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.parser.python_executor import BaserowPythonExecutor
+from baserow.core.formula.types import FormulaContext, FunctionCollection
+
+CompiledFormula = Callable[[FormulaContext], Any]
+
+BINARY_OPERATORS = [
+    ("PLUS", "add"),
+    ("MINUS", "minus"),
+    ("SLASH", "divide"),
+    ("EQUAL", "equal"),
+    ("BANG_EQUAL", "not_equal"),
+    ("STAR", "multiply"),
+    ("GT", "greater_than"),
+    ("LT", "less_than"),
+    ("GTE", "greater_than_or_equal"),
+    ("LTE", "less_than_or_equal"),
+]
+
+
+def _constant(value: Any) -> CompiledFormula:
+    return lambda context: value
+
+
+def _raise(exception_class: Type[Exception], *args: Any) -> CompiledFormula:
+    def compiled(context: FormulaContext):
+        raise exception_class(*args)
+
+    return compiled
+
+
+class BaserowPythonCompiler(BaserowFormulaVisitor):
+    """
+    Compiles a parse tree into a chain of closures bound to the provided functions.
+    Executing the returned callable with a formula context gives exactly the same
+    result as visiting the parse tree with the `BaserowPythonExecutor`, but the tree
+    only has to be walked once for every formula instead of for every execution.
+    Errors that the executor raises while visiting are raised when the compiled
+    formula is executed, so that they happen in the same order.
+    """
+
+    def __init__(self, functions: FunctionCollection):
+        self.functions = functions
+
+    def visitRoot(self, ctx: BaserowFormula.RootContext):
+        return ctx.expr().accept(self)
+
+    def visitStringLiteral(self, ctx: BaserowFormula.StringLiteralContext):
+        literal_without_outer_quotes = ctx.getText()[1:-1]
+        if ctx.SINGLEQ_STRING_LITERAL() is not None:
+            literal = literal_without_outer_quotes.replace("\\'", "'")
+        else:
+            literal = literal_without_outer_quotes.replace('\\"', '"')
+        return _constant(literal)
+
+    def visitDecimalLiteral(self, ctx: BaserowFormula.DecimalLiteralContext):
+        return _constant(Decimal(ctx.getText()))
+
+    def visitBooleanLiteral(self, ctx: BaserowFormula.BooleanLiteralContext):
+        return _constant(ctx.TRUE() is not None)
+
+    def visitIntegerLiteral(self, ctx: BaserowFormula.IntegerLiteralContext):
+        return _constant(int(ctx.getText()))
+
+    def visitBrackets(self, ctx: BaserowFormula.BracketsContext):
+        return ctx.expr().accept(self)
+
+    def visitLeftWhitespaceOrComments(
+        self, ctx: BaserowFormula.LeftWhitespaceOrCommentsContext
+    ):
+        return ctx.expr().accept(self)
+
+    def visitRightWhitespaceOrComments(
+        self, ctx: BaserowFormula.RightWhitespaceOrCommentsContext
+    ):
+        return ctx.expr().accept(self)
+
+    def visitFieldByIdReference(self, ctx: BaserowFormula.FieldByIdReferenceContext):
+        return _raise(FieldByIdReferencesAreDeprecated)
+
+    def visitFunctionCall(self, ctx: BaserowFormula.FunctionCallContext):
+        function_name = ctx.func_name().getText().lower()
+        return self._compile_func(ctx.expr(), function_name)
+
+    def visitBinaryOp(self, ctx: BaserowFormula.BinaryOpContext):
+        for token_name, op in BINARY_OPERATORS:
+            if getattr(ctx, token_name)():
+                return self._compile_func(ctx.expr(), op)
+
+        return _raise(UnknownOperator, ctx.getText())
+
+    def _compile_func(
+        self, function_argument_expressions: List, function_name: str
+    ) -> CompiledFormula:
+        compiled_args = [expr.accept(self) for expr in function_argument_expressions]
+
+        try:
+            formula_function_type = self.functions.get(function_name)
+        except FormulaFunctionTypeDoesNotExist:
+            formula_function_type = None
+
+        def compiled(context: FormulaContext):
+            args = [compiled_arg(context) for compiled_arg in compiled_args]
+            if formula_function_type is None:
+                raise BaserowFormulaSyntaxError(
+                    f"{function_name} is not a valid function"
+                )
+
+            formula_function_type.validate_args(args)
+            args_parsed = formula_function_type.parse_args(args)
+            return formula_function_type.execute(context, args_parsed)
+
+        return compiled
+
+    def visitChildren(self, node):
+        # Any other node is not used by the runtime formulas, so it's executed by
+        # the executor to make sure the result is the same.
+        functions = self.functions
+        return lambda context: node.accept(BaserowPythonExecutor(functions, context))
+
+
+@lru_cache(maxsize=settings.BASEROW_FORMULA_PARSE_TREE_CACHE_SIZE)
+def compile_formula(formula: str, functions: FunctionCollection) -> CompiledFormula:
+    """
+    Compiles the formula into a reusable callable that only has to be executed with
+    a formula context to resolve the formula. The compiled formulas are cached for
+    every function collection.
+
+    :param formula: The formula to compile.
+    :param functions: The functions that can be used by the formula.
+    :raises BaserowFormulaSyntaxError: If the formula has an invalid syntax.
+    :return: A callable accepting a formula context and returning the result.
+    """
+
+    tree = get_parse_tree_for_formula(formula)
+    return BaserowPythonCompiler(functions).visit(tree)
@@ -214,15 +214,18 @@ class JobHandler:
             seconds=(settings.BASEROW_JOB_SOFT_TIME_LIMIT + 1)
         )
 
-        (
-            Job.objects.filter(created_on__lte=limit_date)
-            .is_pending_or_running()
-            .update(
-                state=JOB_FAILED,
-                human_readable_error=(
-                    "Something went wrong during the file_import job execution."
-                ),
-                error="Unknown error",
-                updated_on=timezone.now(),
-            )
+        jobs_to_expire = list(
+            Job.objects.filter(created_on__lte=limit_date).is_pending_or_running()
+        )
+        Job.objects.filter(id__in=[job.id for job in jobs_to_expire]).update(
+            state=JOB_FAILED,
+            human_readable_error=(
+                "Something went wrong during the file_import job execution."
+            ),
+            error="Unknown error",
+            updated_on=timezone.now(),
         )
+        for expired_job in jobs_to_expire:
+            expired_job = expired_job.specific
+            job_type = job_type_registry.get_by_model(expired_job)
+            job_type.on_expired(expired_job)
@@ -96,6 +96,15 @@ class JobType(
         This method is do nothing by default.
         """
 
+    def on_expired(self, job: AnyJob):
+        """
+        This method is called after a pending or running job has been marked as failed
+        because it exceeded the time limit. It can be used to clean up what the job
+        left behind, because the job might never finish.
+
+        :param job: the specific instance of the related job instance
+        """
+
     def on_error(self, job: AnyJob, error: Exception):
         """
         This method gives the possibility to change the job after an exception has
@@ -87,6 +87,14 @@ class ImportExportConfig:
     """
     workspace_for_user_references: "Workspace" = None
 
+    """
+    Whether or not the rows of database tables may be copied with SQL queries from the
+    exported tables instead of being serialized. This only works if the export is
+    imported into the same database right away, like when duplicating or snapshotting
+    an application.
+    """
+    copy_rows_in_database: bool = False
+
 
 class Plugin(APIUrlsInstanceMixin, Instance):
     """
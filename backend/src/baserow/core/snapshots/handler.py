@@ -388,6 +388,7 @@ class SnapshotHandler:
             include_permission_data=True,
             reduce_disk_space_usage=True,
             workspace_for_user_references=workspace,
+            copy_rows_in_database=True,
         )
         try:
             exported_application = application_type.export_serialized(
@@ -446,7 +447,9 @@ class SnapshotHandler:
         application_type = application_type_registry.get_by_model(application)
 
         restore_snapshot_import_export_config = ImportExportConfig(
-            include_permission_data=True, reduce_disk_space_usage=False
+            include_permission_data=True,
+            reduce_disk_space_usage=False,
+            copy_rows_in_database=True,
         )
         # Temporary set the workspace for the application so that the permissions can
         # be correctly set during the import process.
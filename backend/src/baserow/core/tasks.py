@@ -8,6 +8,7 @@ from .telemetry.tasks import initialize_otel
 from .trash.tasks import (
     mark_old_trash_for_permanent_deletion,
     permanently_delete_marked_trash,
+    schedule_permanent_deletion_of_marked_trash,
     setup_period_trash_tasks,
 )
 from .usage.tasks import run_calculate_storage
@@ -30,6 +31,7 @@ def sync_templates_task(self):
 
 __all__ = [
     "permanently_delete_marked_trash",
+    "schedule_permanent_deletion_of_marked_trash",
     "mark_old_trash_for_permanent_deletion",
     "setup_period_trash_tasks",
     "cleanup_old_actions",
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AbstractUser
-from django.db import IntegrityError, OperationalError, transaction
+from django.db import IntegrityError, OperationalError, connection, transaction
 from django.db.models import Q, QuerySet
 from django.utils import timezone
 
@@ -276,37 +276,150 @@ class TrashHandler(metaclass=baserow_trace_methods(tracer)):
             raise e
 
     @staticmethod
-    def permanently_delete_marked_trash():
+    def permanently_delete_marked_trash(batch_size: Optional[int] = None):
         """
         Looks up every trash item marked for permanent deletion and removes them
         irreversibly from the database along with their corresponding trash entries.
+        The entries are deleted per application, or per workspace for the entries of
+        workspaces and applications, in batches of `batch_size` entries per
+        transaction. Multiple processes can call this method at the same time, every
+        application is only processed by one of them at a time.
+
+        :param batch_size: The maximum number of trash entries deleted in one
+            transaction. Defaults to `BASEROW_PERMANENT_TRASH_DELETION_BATCH_SIZE`. It's
+            halved when deleting a batch exceeds `max_locks_per_transaction`.
+        :raises PermanentDeletionMaxLocksExceededException: When deleting a single
+            trash entry exceeds `max_locks_per_transaction`.
         """
 
+        if batch_size is None:
+            batch_size = settings.BASEROW_PERMANENT_TRASH_DELETION_BATCH_SIZE
+
         trash_item_lookup_cache = {}
         deleted_count = 0
         while True:
-            with transaction.atomic():
-                # Perm deleting a workspace or application can cause cascading deletion
-                # of other trash entries hence we only look up one a time. If we instead
-                # looped over a single queryset lookup of all TrashEntries then we could
-                # end up trying to delete TrashEntries which have already been deleted
-                # by a previous cascading delete of a workspace or application.
-                trash_entry = TrashEntry.objects.filter(
-                    should_be_permanently_deleted=True
-                ).first()
-                if not trash_entry:
-                    break
-
-                TrashHandler.try_perm_delete_trash_entry(
-                    trash_entry, trash_item_lookup_cache
-                )
-                trash_entry.delete()
-                deleted_count += 1
+            try:
+                with transaction.atomic():
+                    batch_deleted_count = TrashHandler._permanently_delete_trash_batch(
+                        batch_size, trash_item_lookup_cache
+                    )
+            except PermanentDeletionMaxLocksExceededException:
+                if batch_size == 1:
+                    raise
+                batch_size = max(batch_size // 2, 1)
+                # The cache can contain models of items that have been deleted in the
+                # rolled back transaction.
+                trash_item_lookup_cache = {}
+                continue
+
+            if batch_deleted_count is None:
+                break
+            deleted_count += batch_deleted_count
         logger.info(
             f"Successfully deleted {deleted_count} trash entries and their associated "
             "trashed items."
         )
 
+    @staticmethod
+    def _permanently_delete_trash_batch(
+        batch_size: int, trash_item_lookup_cache: Dict[str, Any]
+    ) -> Optional[int]:
+        """
+        Claims an application or workspace with trash entries marked for permanent
+        deletion, that isn't being processed by another transaction, and permanently
+        deletes up to `batch_size` of its entries. Must be called in a transaction.
+
+        Deleting a workspace or an application cascades to the entries of its
+        children, so these entries are deleted while holding a lock on the workspace.
+        The other entries are deleted while holding a lock on their application and a
+        shared lock on the workspace, so that the applications of a workspace can be
+        processed concurrently, but never at the same time as a cascading delete.
+        None of the locks block rows referencing the workspace or application from
+        being created.
+
+        :param batch_size: The maximum number of trash entries to delete.
+        :param trash_item_lookup_cache: A dictionary used for caching during the
+            deletion of many trash entries.
+        :return: The number of deleted trash entries or `None` if there is no
+            application or workspace left to claim.
+        """
+
+        marked_trash_entries = TrashEntry.objects.filter(
+            should_be_permanently_deleted=True
+        )
+        cascading = Q(application__isnull=True) | Q(trash_item_type="application")
+
+        workspace = (
+            Workspace.objects_and_trash.filter(
+                id__in=marked_trash_entries.filter(cascading).values("workspace_id")
+            )
+            .select_for_update(no_key=True, skip_locked=True)
+            .order_by("id")
+            .first()
+        )
+        if workspace is not None:
+            trash_entries = marked_trash_entries.filter(cascading, workspace=workspace)
+        else:
+            application_id = TrashHandler._claim_application_with_marked_trash(
+                marked_trash_entries.exclude(cascading)
+            )
+            if application_id is None:
+                return None
+            trash_entries = marked_trash_entries.exclude(cascading).filter(
+                application_id=application_id
+            )
+
+        deleted_count = 0
+        for trash_entry in trash_entries.order_by("id")[:batch_size]:
+            # The entry could have been deleted by a cascading delete of a workspace
+            # or application earlier in this batch. Its item is then deleted as well,
+            # but could still be in the lookup cache.
+            if not TrashEntry.objects.filter(id=trash_entry.id).exists():
+                continue
+
+            TrashHandler.try_perm_delete_trash_entry(
+                trash_entry, trash_item_lookup_cache
+            )
+            trash_entry.delete()
+            deleted_count += 1
+        return deleted_count
+
+    @staticmethod
+    def _claim_application_with_marked_trash(
+        trash_entries: QuerySet[TrashEntry],
+    ) -> Optional[int]:
+        """
+        Locks the first application of the provided trash entries that isn't locked by
+        another transaction, together with a shared lock on the workspace of the
+        entries. Django
+        doesn't support different lock strengths in one query, so it's written in
+        SQL.
+
+        :param trash_entries: The trash entries to claim an application of.
+        :return: The id of the claimed application or `None` if there is none left.
+        """
+
+        entries_sql, params = trash_entries.values(
+            "application_id", "workspace_id"
+        ).query.sql_with_params()
+        application_table = Application._meta.db_table
+        workspace_table = Workspace._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT application.id
+                FROM {application_table} application, {workspace_table} workspace
+                WHERE (application.id, workspace.id) IN ({entries_sql})
+                ORDER BY application.id
+                LIMIT 1
+                FOR NO KEY UPDATE OF application SKIP LOCKED
+                FOR SHARE OF workspace SKIP LOCKED
+                """,  # nosec B608
+                params,
+            )
+            row = cursor.fetchone()
+        return row[0] if row else None
+
     @staticmethod
     def _permanently_delete_and_signal(
         trash_item_type: Any,
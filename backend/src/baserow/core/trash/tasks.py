@@ -25,6 +25,25 @@ def permanently_delete_marked_trash(self):
     TrashHandler.permanently_delete_marked_trash()
 
 
+# noinspection PyUnusedLocal
+@app.task(
+    bind=True,
+)
+def schedule_permanent_deletion_of_marked_trash(self):
+    """
+    Starts `BASEROW_PERMANENT_TRASH_DELETION_CONCURRENCY` tasks that permanently
+    delete the marked trash in parallel, if there is any.
+    """
+
+    from baserow.core.models import TrashEntry
+
+    if not TrashEntry.objects.filter(should_be_permanently_deleted=True).exists():
+        return
+
+    for _ in range(settings.BASEROW_PERMANENT_TRASH_DELETION_CONCURRENCY):
+        permanently_delete_marked_trash.delay()
+
+
 # noinspection PyUnusedLocal
 @app.on_after_finalize.connect
 def setup_period_trash_tasks(sender, **kwargs):
@@ -34,5 +53,5 @@ def setup_period_trash_tasks(sender, **kwargs):
     )
     sender.add_periodic_task(
         timedelta(minutes=settings.OLD_TRASH_CLEANUP_CHECK_INTERVAL_MINUTES),
-        permanently_delete_marked_trash.s(),
+        schedule_permanent_deletion_of_marked_trash.s(),
     )
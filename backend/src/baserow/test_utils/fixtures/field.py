@@ -43,7 +43,7 @@ class FieldFixtures:
             model_field = to_model._meta.get_field(field.db_column)
             schema_editor.add_field(to_model, model_field)
 
-        if field.tsvector_column_created:
+        if field.tsvector_column_created and not table.search_table_added:
             self.create_tsv_for_field(field)
 
     def create_tsv_for_field(self, field):
@@ -1,6 +1,9 @@
+from django.conf import settings
+
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.search.handler import SearchHandler
 from baserow.contrib.database.table.models import Table, TableUsage
 
 
@@ -18,6 +21,7 @@ class TableFixtures:
             kwargs["order"] = 0
 
         kwargs.setdefault("needs_background_update_column_added", True)
+        kwargs.setdefault("search_table_added", settings.USE_PG_FULLTEXT_SEARCH_TABLE)
 
         row_count = kwargs.pop("row_count", None)
         usage = {}
@@ -36,6 +40,8 @@ class TableFixtures:
             model = table.get_model(force_add_tsvectors=force_add_tsvectors)
             with safe_django_schema_editor() as schema_editor:
                 schema_editor.create_model(model)
+            if table.search_table_added:
+                SearchHandler.create_search_table(table)
 
         return table
 
@@ -6,6 +6,7 @@ from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 
 from baserow.ws.registries import PageType, page_registry
+from baserow.ws.utils import get_user_channel_group_name
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -149,10 +150,23 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
         self.scope["pages"] = SubscribedPages()
         await self.channel_layer.group_add("users", self.channel_name)
 
+        # Messages targeting specific users are sent to the channel groups of those
+        # users, so that they're only delivered to their connections.
+        if user.is_authenticated:
+            await self.channel_layer.group_add(
+                get_user_channel_group_name(user.id), self.channel_name
+            )
+
     async def disconnect(self, message):
         await self._remove_all_page_scopes(send_confirmation=False)
         await self.channel_layer.group_discard("users", self.channel_name)
 
+        user = self.scope["user"]
+        if user and user.is_authenticated:
+            await self.channel_layer.group_discard(
+                get_user_channel_group_name(user.id), self.channel_name
+            )
+
     async def receive_json(self, content, **parameters):
         """
         Processes incoming messages.
@@ -1,6 +1,13 @@
+import asyncio
 from typing import Any, Dict, Iterable, List, Optional
 
 from baserow.config.celery import app
+from baserow.core.utils import grouper
+from baserow.ws.utils import get_user_channel_group_name
+
+# The maximum number of channel groups that are sent a message concurrently, to limit
+# the number of simultaneous connections to the channel layer.
+MAX_CONCURRENT_CHANNEL_GROUP_SENDS = 100
 
 
 @app.task(bind=True)
@@ -20,13 +27,15 @@ def force_disconnect_users(
     from channels.layers import get_channel_layer
 
     channel_layer = get_channel_layer()
-    async_to_sync(send_message_to_channel_group)(
+    async_to_sync(send_messages_to_channel_groups)(
         channel_layer,
-        "users",
         {
-            "type": "force_disconnect_users",
-            "user_ids": user_ids,
-            "ignore_web_socket_ids": ignore_web_socket_ids,
+            get_user_channel_group_name(user_id): {
+                "type": "force_disconnect_users",
+                "user_ids": [user_id],
+                "ignore_web_socket_ids": ignore_web_socket_ids,
+            }
+            for user_id in set(user_ids)
         },
     )
 
@@ -47,7 +56,33 @@ async def send_message_to_channel_group(
     :param messsage: JSON to send.
     """
 
-    await channel_layer.group_send(channel_group_name, message)
+    await send_messages_to_channel_groups(channel_layer, {channel_group_name: message})
+
+
+async def send_messages_to_channel_groups(
+    channel_layer, messages: Dict[str, Dict[str, Any]]
+):
+    """
+    Sends a message to each of the provided channel groups. The messages are sent
+    concurrently in batches so that the round trips to the channel layer don't add up
+    when many groups, like the channel groups of individual users, must be reached.
+
+    All channel_layer.*send* methods must have close_pools called after due to a
+    bug in channels 4.0.0 as recommended on
+    https://github.com/django/channels_redis/issues/332
+
+    :param channel_layer: The channel layer instance to use.
+    :param messages: A mapping from the channel group name to the JSON message that
+        must be sent to that group.
+    """
+
+    for chunk in grouper(MAX_CONCURRENT_CHANNEL_GROUP_SENDS, messages.items()):
+        await asyncio.gather(
+            *[
+                channel_layer.group_send(channel_group_name, message)
+                for channel_group_name, message in chunk
+            ]
+        )
     if hasattr(channel_layer, "close_pools"):
         # The inmemory channel layer in tests does not have this function.
         await channel_layer.close_pools()
@@ -79,15 +114,34 @@ def broadcast_to_users(
     from channels.layers import get_channel_layer
 
     channel_layer = get_channel_layer()
-    async_to_sync(send_message_to_channel_group)(
+
+    if send_to_all_users:
+        async_to_sync(send_message_to_channel_group)(
+            channel_layer,
+            "users",
+            {
+                "type": "broadcast_to_users",
+                "user_ids": user_ids,
+                "payload": payload,
+                "ignore_web_socket_id": ignore_web_socket_id,
+                "send_to_all_users": send_to_all_users,
+            },
+        )
+        return
+
+    # Every user has its own channel group, so the message only has to be delivered
+    # to the connections of the provided users.
+    async_to_sync(send_messages_to_channel_groups)(
         channel_layer,
-        "users",
         {
-            "type": "broadcast_to_users",
-            "user_ids": user_ids,
-            "payload": payload,
-            "ignore_web_socket_id": ignore_web_socket_id,
-            "send_to_all_users": send_to_all_users,
+            get_user_channel_group_name(user_id): {
+                "type": "broadcast_to_users",
+                "user_ids": [user_id],
+                "payload": payload,
+                "ignore_web_socket_id": ignore_web_socket_id,
+                "send_to_all_users": False,
+            }
+            for user_id in set(user_ids)
         },
     )
 
@@ -161,8 +215,8 @@ def broadcast_to_users_individual_payloads(
     self, payload_map: Dict[str, any], ignore_web_socket_id: Optional[int] = None
 ):
     """
-    This task will broadcast different payloads to different users by just using one
-    message.
+    This task will broadcast different payloads to different users by sending every
+    payload to the channel group of the related user only.
 
     :param payload_map: A mapping from user_id to the payload that should be sent to
         the user. The id has to be stringified to not violate redis channel policy
@@ -175,13 +229,16 @@ def broadcast_to_users_individual_payloads(
     from channels.layers import get_channel_layer
 
     channel_layer = get_channel_layer()
-    async_to_sync(send_message_to_channel_group)(
+    # Only the payload of the user is sent to the channel group of that user.
+    async_to_sync(send_messages_to_channel_groups)(
         channel_layer,
-        "users",
         {
-            "type": "broadcast_to_users_individual_payloads",
-            "payload_map": payload_map,
-            "ignore_web_socket_id": ignore_web_socket_id,
+            get_user_channel_group_name(user_id): {
+                "type": "broadcast_to_users_individual_payloads",
+                "payload_map": {user_id: payload},
+                "ignore_web_socket_id": ignore_web_socket_id,
+            }
+            for user_id, payload in payload_map.items()
         },
     )
 
@@ -0,0 +1,11 @@
+def get_user_channel_group_name(user_id: int) -> str:
+    """
+    Returns the name of the channel group that all the web socket connections of the
+    user are added to, so that messages targeting specific users only have to be
+    delivered to their connections.
+
+    :param user_id: The id of the user.
+    :return: The name of the user's channel group.
+    """
+
+    return f"user-{user_id}"
@@ -1,3 +1,6 @@
+from unittest.mock import patch
+
+from django.db import connection
 from django.urls import reverse
 
 import pytest
@@ -10,6 +13,7 @@ from rest_framework.status import (
 )
 
 from baserow.contrib.builder.data_sources.models import DataSource
+from baserow.contrib.builder.data_sources.service import DataSourceService
 from baserow.core.services.models import Service
 from baserow.test_utils.helpers import AnyStr
 
@@ -975,3 +979,30 @@ def test_dispatch_data_sources(api_client, data_fixture):
             "'the end of the formula' expecting '('",
         },
     }
+
+
+@pytest.mark.django_db
+def test_dispatch_data_sources_in_transaction_unless_concurrent(
+    api_client, data_fixture, settings
+):
+    user, token = data_fixture.create_user_and_token()
+    page = data_fixture.create_builder_page(user=user)
+    url = reverse("api:builder:data_source:dispatch-all", kwargs={"page_id": page.id})
+    outer_atomic_blocks = len(connection.atomic_blocks)
+    atomic_blocks = []
+
+    def dispatch_page_data_sources(self, user, page, dispatch_context):
+        atomic_blocks.append(len(connection.atomic_blocks) - outer_atomic_blocks)
+        return {}
+
+    with patch.object(
+        DataSourceService, "dispatch_page_data_sources", dispatch_page_data_sources
+    ):
+        for workers in [1, 3]:
+            settings.BASEROW_BUILDER_DATA_SOURCES_DISPATCH_WORKERS = workers
+            response = api_client.post(
+                url, format="json", HTTP_AUTHORIZATION=f"JWT {token}"
+            )
+            assert response.status_code == HTTP_200_OK
+
+    assert atomic_blocks == [1, 0]
@@ -1,8 +1,12 @@
 from decimal import Decimal
-from unittest.mock import MagicMock
+from threading import Barrier, get_ident
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from baserow.contrib.builder.data_sources.builder_dispatch_context import (
+    BuilderDispatchContext,
+)
 from baserow.contrib.builder.data_sources.exceptions import DataSourceDoesNotExist
 from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.data_sources.models import DataSource
@@ -11,6 +15,7 @@ from baserow.contrib.integrations.local_baserow.models import (
     LocalBaserowListRows,
 )
 from baserow.core.exceptions import CannotCalculateIntermediateOrder
+from baserow.core.services.handler import ServiceHandler
 from baserow.core.services.registries import service_type_registry
 from baserow.test_utils.helpers import AnyStr
 
@@ -244,6 +249,166 @@ def test_dispatch_data_sources(data_fixture):
     assert isinstance(result[data_source3.id], Exception)
 
 
+@pytest.mark.django_db
+def test_get_data_source_dependencies(data_fixture):
+    page = data_fixture.create_builder_page()
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page, row_id=f"get('data_source.{data_source.id}.id')"
+    )
+    data_source3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page,
+        row_id=f"add(get('data_source.{data_source2.id}.id'), "
+        f"get('data_source_context.{data_source.id}.id'))",
+    )
+    data_source4 = data_fixture.create_builder_data_source(page=page)
+
+    handler = DataSourceHandler()
+
+    assert handler.get_data_source_dependencies(data_source) == set()
+    assert handler.get_data_source_dependencies(data_source2) == {data_source.id}
+    assert handler.get_data_source_dependencies(data_source3) == {data_source2.id}
+    assert handler.get_data_source_dependencies(data_source4) == set()
+
+
+def _create_data_sources_for_concurrent_dispatch(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"], ["Volkswagen"]],
+    )
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_sources = [
+        data_fixture.create_builder_local_baserow_get_row_data_source(
+            user=user,
+            page=page,
+            integration=integration,
+            table=table,
+            row_id=str(row.id),
+        )
+        for row in rows
+    ]
+    return page, fields, rows, data_sources
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_independent_data_sources_concurrently(data_fixture, settings):
+    settings.BASEROW_BUILDER_DATA_SOURCES_DISPATCH_WORKERS = 3
+    page, fields, rows, data_sources = _create_data_sources_for_concurrent_dispatch(
+        data_fixture
+    )
+
+    # Every dispatch waits until all the others have started, which can only happen
+    # if they are dispatched at the same time.
+    barrier = Barrier(len(data_sources), timeout=10)
+    original_dispatch_service = ServiceHandler.dispatch_service
+
+    def dispatch_service(self, service, dispatch_context):
+        barrier.wait()
+        return original_dispatch_service(self, service, dispatch_context)
+
+    dispatch_context = BuilderDispatchContext(MagicMock(), page)
+    with patch.object(ServiceHandler, "dispatch_service", dispatch_service):
+        result = DataSourceHandler().dispatch_data_sources(
+            data_sources, dispatch_context
+        )
+
+    assert list(result.keys()) == [data_source.id for data_source in data_sources]
+    for data_source, row in zip(data_sources, rows):
+        assert result[data_source.id]["id"] == row.id
+        assert (
+            dispatch_context.cache["data_source_contents"][data_source.id]
+            == result[data_source.id]
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_dependent_data_sources_concurrently(data_fixture, settings):
+    settings.BASEROW_BUILDER_DATA_SOURCES_DISPATCH_WORKERS = 3
+    page, fields, rows, data_sources = _create_data_sources_for_concurrent_dispatch(
+        data_fixture
+    )
+    dependent = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page,
+        integration=data_sources[0].service.integration,
+        table=data_sources[0].service.specific.table,
+        row_id=f"get('data_source.{data_sources[1].id}.id')",
+    )
+    recursive = data_fixture.create_builder_local_baserow_get_row_data_source(
+        page=page,
+        integration=data_sources[0].service.integration,
+        table=data_sources[0].service.specific.table,
+        row_id="1",
+    )
+    recursive_service = recursive.service.specific
+    recursive_service.row_id = f"get('data_source.{recursive.id}.id')"
+    recursive_service.save()
+
+    dispatched = []
+    original_dispatch_service = ServiceHandler.dispatch_service
+
+    def dispatch_service(self, service, dispatch_context):
+        dispatched.append(service.id)
+        return original_dispatch_service(self, service, dispatch_context)
+
+    dispatch_context = BuilderDispatchContext(MagicMock(), page)
+    with patch.object(ServiceHandler, "dispatch_service", dispatch_service):
+        result = DataSourceHandler().dispatch_data_sources(
+            [dependent, *data_sources], dispatch_context
+        )
+
+    assert result[dependent.id]["id"] == rows[1].id
+    # The dependency has been dispatched once and before the dependent data source.
+    assert dispatched.count(data_sources[1].service_id) == 1
+    assert dispatched.index(data_sources[1].service_id) < dispatched.index(
+        dependent.service_id
+    )
+
+    # Circular dependencies are still reported as errors.
+    result = DataSourceHandler().dispatch_data_sources(
+        [recursive, *data_sources], BuilderDispatchContext(MagicMock(), page)
+    )
+
+    assert isinstance(result[recursive.id], Exception)
+    assert result[data_sources[0].id]["id"] == rows[0].id
+
+
+@pytest.mark.django_db
+def test_dispatch_data_sources_sequentially_in_atomic_block(data_fixture, settings):
+    settings.BASEROW_BUILDER_DATA_SOURCES_DISPATCH_WORKERS = 3
+    page, fields, rows, data_sources = _create_data_sources_for_concurrent_dispatch(
+        data_fixture
+    )
+    # The row is not committed yet, so it's only visible to the connection of the
+    # current thread.
+    rows[0].refresh_from_db()
+    setattr(rows[0], fields[0].db_column, "Mercedes")
+    rows[0].save()
+
+    dispatched_by_threads = set()
+    original_dispatch_service = ServiceHandler.dispatch_service
+
+    def dispatch_service(self, service, dispatch_context):
+        dispatched_by_threads.add(get_ident())
+        return original_dispatch_service(self, service, dispatch_context)
+
+    dispatch_context = BuilderDispatchContext(MagicMock(), page)
+    with patch.object(ServiceHandler, "dispatch_service", dispatch_service):
+        result = DataSourceHandler().dispatch_data_sources(
+            data_sources, dispatch_context
+        )
+
+    assert dispatched_by_threads == {get_ident()}
+    assert result[data_sources[0].id][fields[0].db_column] == "Mercedes"
+
+
 @pytest.mark.django_db
 def test_update_data_source_invalid_values(data_fixture):
     data_source = data_fixture.create_builder_local_baserow_get_row_data_source()
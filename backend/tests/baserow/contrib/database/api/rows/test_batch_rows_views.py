@@ -2172,3 +2172,107 @@ def test_batch_delete_rows_num_of_queries(api_client, data_fixture):
     assert len(delete_one_row_ctx.captured_queries) == len(
         delete_multiple_rows_ctx.captured_queries
     )
+
+
+# Move
+
+
+@pytest.mark.django_db
+@pytest.mark.api_rows
+def test_batch_move_rows(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    model = table.get_model()
+    row_1 = model.objects.create(order=Decimal("1"))
+    row_2 = model.objects.create(order=Decimal("2"))
+    row_3 = model.objects.create(order=Decimal("3"))
+    row_4 = model.objects.create(order=Decimal("4"))
+    url = reverse("api:database:rows:batch-move", kwargs={"table_id": table.id})
+
+    response = api_client.patch(
+        url,
+        {"items": [row_4.id, row_3.id], "before_id": row_2.id},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert [item["id"] for item in response_json["items"]] == [row_4.id, row_3.id]
+    assert [item["order"] for item in response_json["items"]] == [
+        "1.33333333333333333333",
+        "1.66666666666666666666",
+    ]
+    assert list(model.objects.values_list("id", flat=True)) == [
+        row_1.id,
+        row_4.id,
+        row_3.id,
+        row_2.id,
+    ]
+
+    response = api_client.patch(
+        url,
+        {"items": [row_1.id]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["items"][0]["order"] == "3.00000000000000000000"
+    assert list(model.objects.values_list("id", flat=True)) == [
+        row_4.id,
+        row_3.id,
+        row_2.id,
+        row_1.id,
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.api_rows
+def test_batch_move_rows_invalid_request(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    model = table.get_model()
+    row_1 = model.objects.create()
+    row_2 = model.objects.create()
+    url = reverse("api:database:rows:batch-move", kwargs={"table_id": table.id})
+
+    response = api_client.patch(
+        url,
+        {"items": [row_1.id, row_1.id], "before_id": row_2.id},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_ROW_IDS_NOT_UNIQUE"
+
+    response = api_client.patch(
+        url,
+        {"items": [row_1.id, 999999], "before_id": row_2.id},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_ROW_DOES_NOT_EXIST"
+
+    response = api_client.patch(
+        url,
+        {"items": [row_1.id], "before_id": 999999},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_ROW_DOES_NOT_EXIST"
+
+    response = api_client.patch(
+        url,
+        {"items": []},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
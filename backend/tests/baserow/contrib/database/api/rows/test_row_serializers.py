@@ -5,13 +5,16 @@ from rest_framework import serializers
 
 from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
+    get_compiled_row_serializer,
     get_example_row_serializer_class,
     get_row_serializer_class,
     remap_serialized_row_to_user_field_names,
+    serialize_rows_for_response,
 )
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import SelectOption
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.rows.serialized_rows_cache import SerializedRowsCache
 from baserow.test_utils.helpers import setup_interesting_test_table
 
 
@@ -383,6 +386,91 @@ def test_get_row_serializer_with_user_field_names(data_fixture):
     )
 
 
+@pytest.mark.django_db
+def test_serialize_rows_for_response_is_identical_to_row_serializer(data_fixture):
+    table, user, row, blank_row, context = setup_interesting_test_table(data_fixture)
+    model = table.get_model()
+    rows = list(model.objects.all().enhance_by_fields())
+    assert len(rows) > 1
+
+    for user_field_names in [False, True]:
+        expected = get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=user_field_names
+        )(rows, many=True).data
+        result = serialize_rows_for_response(
+            rows, model, user_field_names=user_field_names
+        )
+        assert json.dumps(result) == json.dumps(expected)
+
+    field_ids = [
+        field_object["field"].id for field_object in model._field_objects.values()
+    ][::3]
+    expected = get_row_serializer_class(
+        model, RowSerializer, is_response=True, field_ids=field_ids
+    )(rows[0]).data
+    result = serialize_rows_for_response(
+        rows[0], model, many=False, field_ids=field_ids
+    )
+    assert json.dumps(result) == json.dumps(expected)
+
+    # The unsaved rows used for the webhook test calls are supported as well.
+    unsaved_row = model(id=0, order=0)
+    assert json.dumps(serialize_rows_for_response([unsaved_row], model)) == json.dumps(
+        get_row_serializer_class(model, RowSerializer, is_response=True)(
+            [unsaved_row], many=True
+        ).data
+    )
+
+
+@pytest.mark.django_db
+def test_get_compiled_row_serializer_is_cached_on_the_model(data_fixture):
+    table = data_fixture.create_database_table()
+    field = data_fixture.create_text_field(table=table)
+    data_fixture.create_text_field(table=table)
+    model = table.get_model()
+
+    serializer = get_compiled_row_serializer(model)
+    assert get_compiled_row_serializer(model) is serializer
+    assert get_compiled_row_serializer(model, field_ids=[field.id]) is not serializer
+    assert get_compiled_row_serializer(
+        model, field_ids=[field.id]
+    ) is get_compiled_row_serializer(model, field_ids={field.id})
+    assert get_compiled_row_serializer(table.get_model()) is not serializer
+
+
+@pytest.mark.django_db
+def test_serialize_rows_for_response_with_serialized_rows_cache(data_fixture):
+    table = data_fixture.create_database_table()
+    field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    row_1 = model.objects.create(**{f"field_{field.id}": "a"})
+    row_2 = model.objects.create(**{f"field_{field.id}": "b"})
+    serialized_rows_cache = SerializedRowsCache()
+
+    serialized_rows = serialize_rows_for_response(
+        [row_1], model, serialized_rows_cache=serialized_rows_cache
+    )
+    assert serialized_rows == serialize_rows_for_response([row_1], model)
+
+    # Rows that have already been serialized must be reused, the others serialized.
+    serialized_rows_2 = serialize_rows_for_response(
+        [row_2, row_1], model, serialized_rows_cache=serialized_rows_cache
+    )
+    assert serialized_rows_2[1] is serialized_rows[0]
+    assert serialized_rows_2[0][f"field_{field.id}"] == "b"
+
+    # A different field selection must not share the serialized rows.
+    serialized_row = serialize_rows_for_response(
+        row_1,
+        model,
+        many=False,
+        user_field_names=True,
+        serialized_rows_cache=serialized_rows_cache,
+    )
+    assert serialized_row is not serialized_rows[0]
+    assert serialized_row[field.name] == "a"
+
+
 @pytest.mark.django_db
 def test_remap_serialized_row_to_user_field_names(data_fixture):
     user = data_fixture.create_user()
@@ -414,6 +414,140 @@ def test_list_rows(api_client, data_fixture):
     assert response_json["error"] == "ERROR_USER_NOT_IN_GROUP"
 
 
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+    model = table.get_model(attribute_names=True)
+    row_1 = model.objects.create(name="b", order=Decimal("1"))
+    row_2 = model.objects.create(name="a", order=Decimal("2"))
+    row_3 = model.objects.create(name="b", order=Decimal("3"))
+    row_4 = model.objects.create(name=None, order=Decimal("4"))
+    row_5 = model.objects.create(name="c", order=Decimal("5"))
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    response = api_client.get(
+        f"{url}?cursor=&size=2", format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert "count" not in response_json
+    assert [r["id"] for r in response_json["results"]] == [row_1.id, row_2.id]
+
+    response = api_client.get(
+        f"{url}?cursor={response_json['next_cursor']}&size=2",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert [r["id"] for r in response_json["results"]] == [row_3.id, row_4.id]
+
+    response = api_client.get(
+        f"{url}?cursor={response_json['next_cursor']}&size=2",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert [r["id"] for r in response_json["results"]] == [row_5.id]
+    assert response_json["next_cursor"] is None
+
+    ids, cursor = [], ""
+    while cursor is not None:
+        response = api_client.get(
+            f"{url}?cursor={cursor}&size=2&order_by=-field_{field.id}",
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+        )
+        response_json = response.json()
+        ids.extend(r["id"] for r in response_json["results"])
+        cursor = response_json["next_cursor"]
+    assert ids == [row_5.id, row_1.id, row_3.id, row_2.id, row_4.id]
+
+    # A cursor generated for another ordering can't be used.
+    response = api_client.get(
+        f"{url}?cursor=&size=2", format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    response = api_client.get(
+        f"{url}?cursor={response.json()['next_cursor']}&order_by=field_{field.id}",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    response = api_client.get(
+        f"{url}?cursor=invalid", format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    response = api_client.get(
+        f"{url}?cursor=&size=201", format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_PAGE_SIZE_LIMIT"
+
+
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination_sorted_by_lookup_field(
+    api_client, data_fixture
+):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(name="Name", table=table, primary=True)
+    table_2 = data_fixture.create_database_table(user=user, database=table.database)
+    looked_up_field = data_fixture.create_text_field(table=table_2, primary=True)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=table_2
+    )
+    lookup_field = FieldHandler().create_field(
+        user,
+        table,
+        "lookup",
+        name="Lookup",
+        through_field_id=link_field.id,
+        target_field_id=looked_up_field.id,
+    )
+    related_rows = RowHandler().force_create_rows(
+        user,
+        table_2,
+        [{looked_up_field.db_column: value} for value in ["c", "a", "b"]],
+    )
+    rows = RowHandler().force_create_rows(
+        user,
+        table,
+        [{link_field.db_column: [related_rows[index].id]} for index in [0, 1, 2, 0, 1]],
+    )
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    ids, cursor = [], ""
+    while cursor is not None:
+        response = api_client.get(
+            f"{url}?cursor={cursor}&size=2&order_by=field_{lookup_field.id}",
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+        )
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        ids.extend(r["id"] for r in response_json["results"])
+        cursor = response_json["next_cursor"]
+    assert ids == [rows[index].id for index in [1, 4, 2, 0, 3]]
+
+    # A cursor generated for a scalar ordering can't be used.
+    response = api_client.get(
+        f"{url}?cursor=&size=2", format="json", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    response = api_client.get(
+        f"{url}?cursor={response.json()['next_cursor']}"
+        f"&order_by=field_{lookup_field.id}",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+
 @pytest.mark.django_db
 def test_list_rows_adhoc_filtering_query_param_null_character(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token()
@@ -209,6 +209,36 @@ def test_list_rows(api_client, data_fixture):
     assert response.status_code == HTTP_200_OK
 
 
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid, field=number_field, order="DESC")
+
+    model = table.get_model()
+    rows = [
+        model.objects.create(**{f"field_{number_field.id}": value})
+        for value in [1, None, 3, 1, 2]
+    ]
+    expected_ids = [rows[i].id for i in [2, 4, 0, 3, 1]]
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    ids, cursor = [], ""
+    while cursor is not None:
+        response = api_client.get(
+            f"{url}?cursor={cursor}&size=2", HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        response_json = response.json()
+        assert response.status_code == HTTP_200_OK
+        assert "count" not in response_json
+        ids.extend(row["id"] for row in response_json["results"])
+        cursor = response_json["next_cursor"]
+
+    assert ids == expected_ids
+
+
 @pytest.mark.django_db
 def test_list_rows_with_group_by(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
@@ -960,11 +990,13 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": None,
         "version": 1,
+        "partials": {"sum": None, "count": 0},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") is None
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 0,
         "version": 1,
+        "partials": {"count": 0},
     }
     assert (
         cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") is None
@@ -1062,11 +1094,13 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": 1210.0,
         "version": 4,
+        "partials": {"sum": Decimal(1210), "count": 3},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 4
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "partials": {"count": 2},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 6
 
@@ -1115,10 +1149,12 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1210),
         "version": 4,
+        "partials": {"sum": Decimal(1210), "count": 3},
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "partials": {"count": 2},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 5
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 7
@@ -1139,10 +1175,12 @@ def test_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1200),
         "version": 5,
+        "partials": {"sum": Decimal(1200), "count": 1},
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 1,
         "version": 7,
+        "partials": {"count": 1},
     }
 
     # Let's update the filter
@@ -1587,6 +1625,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "partials": {"sum": Decimal(1111), "count": 4},
     }
     assert (
         cache.get(
@@ -1602,10 +1641,11 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "partials": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(
         f"aggregation_value__{grid2.id}_{sum_formula_on_lookup_field.db_column}"
-    ) == {"value": None, "version": 5}
+    ) == {"value": None, "version": 5, "partials": {"sum": None, "count": 0}}
 
     cache.set(
         f"aggregation_value__{grid2.id}_{sum_formula_on_lookup_field.db_column}",
@@ -1626,6 +1666,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "partials": {"sum": Decimal(1111), "count": 4},
     }
 
     check_table_2_aggregation_values(
@@ -1635,12 +1676,14 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "partials": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(
         f"aggregation_value__{grid2.id}_{sum_formula_on_lookup_field.db_column}"
     ) == {
         "value": Decimal(2221),
         "version": 9,
+        "partials": {"sum": Decimal(2221), "count": 4},
     }
 
     update_value_of_table1(row2, 10000)
@@ -1648,6 +1691,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1111),
         "version": 5,
+        "partials": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 6
     assert cache.get(
@@ -1655,6 +1699,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(2221),
         "version": 9,
+        "partials": {"sum": Decimal(2221), "count": 4},
     }
     assert (
         cache.get(
@@ -1680,6 +1725,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal("1111"),
         "version": 5,
+        "partials": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 7
 
@@ -1698,6 +1744,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal("1111"),
         "version": 5,
+        "partials": {"sum": Decimal(1111), "count": 4},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 7
     assert cache.get(
@@ -1705,6 +1752,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22001),
         "version": 11,
+        "partials": {"sum": Decimal(22001), "count": 4},
     }
 
     # Restore delete row
@@ -1738,6 +1786,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 12,
+        "partials": {"sum": Decimal(22201), "count": 4},
     }
 
     # Update number field
@@ -1768,6 +1817,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 13,
+        "partials": {"sum": Decimal(22201), "count": 4},
     }
 
     # Delete number field
@@ -1785,6 +1835,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 13,
+        "partials": {"sum": Decimal(22201), "count": 4},
     }
     assert (
         cache.get(
@@ -1801,6 +1852,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 13,
+        "partials": {"sum": Decimal(22201), "count": 4},
     }
     assert (
         cache.get(
@@ -1837,6 +1889,7 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     ) == {
         "value": Decimal(22201),
         "version": 13,
+        "partials": {"sum": Decimal(22201), "count": 4},
     }
     assert (
         cache.get(
@@ -2098,11 +2151,13 @@ def test_public_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": None,
         "version": 1,
+        "partials": {"sum": None, "count": 0},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") is None
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 0,
         "version": 1,
+        "partials": {"count": 0},
     }
     assert (
         cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") is None
@@ -2198,11 +2253,13 @@ def test_public_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": 1210.0,
         "version": 4,
+        "partials": {"sum": Decimal(1210), "count": 3},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 4
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "partials": {"count": 2},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 6
 
@@ -2249,10 +2306,12 @@ def test_public_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1210),
         "version": 4,
+        "partials": {"sum": Decimal(1210), "count": 3},
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 2,
         "version": 6,
+        "partials": {"count": 2},
     }
     assert cache.get(f"aggregation_version__{grid.id}_{number_field.db_column}") == 5
     assert cache.get(f"aggregation_version__{grid.id}_{boolean_field.db_column}") == 7
@@ -2272,10 +2331,12 @@ def test_public_view_aggregations(api_client, data_fixture):
     assert cache.get(f"aggregation_value__{grid.id}_{number_field.db_column}") == {
         "value": Decimal(1200),
         "version": 5,
+        "partials": {"sum": Decimal(1200), "count": 1},
     }
     assert cache.get(f"aggregation_value__{grid.id}_{boolean_field.db_column}") == {
         "value": 1,
         "version": 7,
+        "partials": {"count": 1},
     }
 
     # Let's update the filter
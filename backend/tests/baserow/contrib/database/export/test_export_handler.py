@@ -101,6 +101,76 @@ def test_csv_is_sorted_by_sorts(storage_mock, data_fixture):
     assert contents == expected
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+@patch(
+    "baserow.contrib.database.export.file_writer.PaginatedExportJobFileWriter"
+    ".CHUNK_SIZE",
+    2,
+)
+def test_csv_is_sorted_by_sorts_across_chunks(storage_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text_field")
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    for value in ["B", None, "A", "B", "C"]:
+        model.objects.create(**{f"field_{text_field.id}": value})
+    data_fixture.create_view_sort(view=grid_view, field=text_field, order="DESC")
+
+    job, contents = run_export_job_with_mock_storage(
+        table, grid_view, storage_mock, user
+    )
+    bom = "\ufeff"
+    expected = bom + "id,text_field\r\n5,C\r\n1,B\r\n4,B\r\n3,A\r\n2,\r\n"
+    assert contents == expected
+    assert job.progress_percentage == 100
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.export.handler.default_storage")
+@patch(
+    "baserow.contrib.database.export.file_writer.PaginatedExportJobFileWriter"
+    ".CHUNK_SIZE",
+    2,
+)
+def test_csv_is_sorted_by_lookup_field_across_chunks(storage_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    table_2 = data_fixture.create_database_table(user=user, database=table.database)
+    looked_up_field = data_fixture.create_text_field(table=table_2, primary=True)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="link", link_row_table=table_2
+    )
+    lookup_field = FieldHandler().create_field(
+        user,
+        table,
+        "lookup",
+        name="lookup",
+        through_field_id=link_field.id,
+        target_field_id=looked_up_field.id,
+    )
+    related_rows = RowHandler().force_create_rows(
+        user,
+        table_2,
+        [{looked_up_field.db_column: value} for value in ["c", "a", "b"]],
+    )
+    rows = RowHandler().force_create_rows(
+        user,
+        table,
+        [{link_field.db_column: [related_rows[index].id]} for index in [0, 1, 2, 0, 1]],
+    )
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid_view, field=lookup_field, order="ASC")
+
+    job, contents = run_export_job_with_mock_storage(
+        table, grid_view, storage_mock, user
+    )
+    exported_ids = [int(line.split(",")[0]) for line in contents.splitlines()[1:]]
+    assert exported_ids == [rows[index].id for index in [1, 4, 2, 0, 3]]
+    assert job.progress_percentage == 100
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.export.handler.default_storage")
 def test_csv_is_filtered_by_filters(storage_mock, data_fixture):
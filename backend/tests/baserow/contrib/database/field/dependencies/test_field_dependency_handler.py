@@ -8,6 +8,11 @@ from baserow.contrib.database.fields.dependencies.exceptions import (
     CircularFieldDependencyError,
     SelfReferenceFieldDependencyError,
 )
+from baserow.contrib.database.fields.dependencies.graph import (
+    FieldDependencyGraph,
+    get_field_dependency_graph,
+    invalidate_field_dependency_graph,
+)
 from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
 from baserow.contrib.database.fields.dependencies.models import FieldDependency
 from baserow.contrib.database.fields.field_cache import FieldCache
@@ -396,13 +401,23 @@ def test_get_all_dependant_fields_with_type_num_queries(
     # Fetching it in the test, ensures that we see a correct number of queries after.
     ContentType.objects.get_for_model(LinkRowField)
 
-    with django_assert_num_queries(3):
-        FieldDependencyHandler.get_all_dependent_fields_with_type(
+    # Builds and caches the dependency graph of the database.
+    FieldDependencyHandler.get_all_dependent_fields_with_type(
+        table.id,
+        field_ids=[text_field_1.id],
+        field_cache=FieldCache(),
+        associated_relations_changed=True,
+    )
+
+    # Only the specific fields are fetched because the graph is cached.
+    with django_assert_num_queries(2):
+        dependants = FieldDependencyHandler.get_all_dependent_fields_with_type(
             table.id,
             field_ids=[text_field_1.id],
             field_cache=FieldCache(),
             associated_relations_changed=True,
         )
+    assert len(dependants) == 3
 
     text_field_1_dependency_3 = data_fixture.create_text_field(table=table)
     text_field_1_dependency_4 = data_fixture.create_number_field(table=table)
@@ -412,14 +427,18 @@ def test_get_all_dependant_fields_with_type_num_queries(
     FieldDependency.objects.create(
         dependency=text_field_1, dependant=text_field_1_dependency_4
     )
+    # The dependencies are created without the rebuilder, so the graph must be
+    # invalidated manually.
+    invalidate_field_dependency_graph(table.database_id)
 
     with django_assert_num_queries(3):
-        FieldDependencyHandler.get_all_dependent_fields_with_type(
+        dependants = FieldDependencyHandler.get_all_dependent_fields_with_type(
             table.id,
             field_ids=[text_field_1.id],
             field_cache=FieldCache(),
             associated_relations_changed=True,
         )
+    assert len(dependants) == 5
 
 
 @pytest.mark.django_db
@@ -428,7 +447,7 @@ def test_get_all_dependant_fields_with_type_via_field_num_queries(
     data_fixture, django_assert_num_queries
 ):
     table = data_fixture.create_database_table()
-    table2 = data_fixture.create_database_table()
+    table2 = data_fixture.create_database_table(database=table.database)
     text_field_1 = data_fixture.create_text_field(table=table)
     text_field_2 = data_fixture.create_text_field(table=table2)
     link_field_to_table = data_fixture.create_link_row_field(table=table)
@@ -439,7 +458,15 @@ def test_get_all_dependant_fields_with_type_via_field_num_queries(
         via=link_field_to_table,
     )
 
-    with django_assert_num_queries(3):
+    # Builds and caches the dependency graph of the database.
+    FieldDependencyHandler.get_all_dependent_fields_with_type(
+        table.id,
+        field_ids=[text_field_1.id],
+        field_cache=FieldCache(),
+        associated_relations_changed=True,
+    )
+
+    with django_assert_num_queries(2):
         dependant_fields = FieldDependencyHandler.get_all_dependent_fields_with_type(
             table.id,
             field_ids=[text_field_1.id],
@@ -818,3 +845,72 @@ def test_can_import_database_with_formula_dependencies(data_fixture):
 
     assert r2.lookup == [{"id": 1, "value": "A"}]
     assert r2.lookup2 == [{"id": 1, "value": "A"}]
+
+
+@pytest.mark.django_db
+def test_field_dependency_graph_is_invalidated_by_rebuilder(
+    data_fixture, django_capture_on_commit_callbacks, django_assert_num_queries
+):
+    table = data_fixture.create_database_table()
+    with django_capture_on_commit_callbacks(execute=True):
+        text_field = data_fixture.create_text_field(table=table, name="text")
+        formula_field = data_fixture.create_formula_field(
+            table=table, formula="field('text')"
+        )
+
+    graph = get_field_dependency_graph(table.database_id)
+    assert isinstance(graph, FieldDependencyGraph)
+    assert [d.id for d in graph.get_dependants(table.id, [text_field.id], False)] == [
+        formula_field.id
+    ]
+
+    # The snapshot is cached, so it's not rebuilt as long as nothing changes.
+    with django_assert_num_queries(0):
+        assert get_field_dependency_graph(table.database_id) is graph
+
+    with django_capture_on_commit_callbacks(execute=True):
+        second_formula_field = data_fixture.create_formula_field(
+            table=table, formula=f"field('{formula_field.name}')"
+        )
+        # Within the transaction that changed the dependencies, a private snapshot
+        # is used.
+        private_graph = get_field_dependency_graph(table.database_id)
+        assert private_graph is not graph
+        assert get_field_dependency_graph(table.database_id) is private_graph
+
+    new_graph = get_field_dependency_graph(table.database_id)
+    assert new_graph is not graph
+    assert new_graph is not private_graph
+    dependants = new_graph.get_dependants(table.id, [text_field.id], False)
+    assert [(d.id, d.dependency_ids, d.depth) for d in dependants] == [
+        (formula_field.id, [text_field.id], 1),
+        (second_formula_field.id, [text_field.id, formula_field.id], 2),
+    ]
+
+
+@pytest.mark.django_db
+def test_get_all_dependent_fields_with_outdated_field_dependency_graph(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    table = data_fixture.create_database_table()
+    with django_capture_on_commit_callbacks(execute=True):
+        text_field = data_fixture.create_text_field(table=table, name="text")
+        formula_field = data_fixture.create_formula_field(
+            table=table, formula="field('text')"
+        )
+        other_formula_field = data_fixture.create_formula_field(
+            table=table, formula="field('text')"
+        )
+
+    get_field_dependency_graph(table.database_id)
+    # Deleting the field directly doesn't go through the dependency rebuilder, so
+    # the cached graph still contains it.
+    formula_field.delete()
+
+    dependants = FieldDependencyHandler.get_all_dependent_fields_with_type(
+        table.id,
+        field_ids=[text_field.id],
+        field_cache=FieldCache(),
+        associated_relations_changed=False,
+    )
+    assert [field.id for field, _, _ in dependants] == [other_formula_field.id]
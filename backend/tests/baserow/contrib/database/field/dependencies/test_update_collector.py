@@ -485,3 +485,104 @@ def test_apply_updates_returns_only_last_updated_fields_but_update_collector_tra
         assert mock.call_args_list[0][1]["table"].id == table_1.id
         assert mock.call_args_list[1][1]["table"].id == table_2.id
         assert mock.call_args_list[2][1]["table"].id == table_3.id
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("pipeline", [True, False])
+def test_batched_update_statements_are_merged_per_table(
+    settings, data_fixture, django_assert_num_queries, pipeline
+):
+    settings.BASEROW_PIPELINE_FIELD_UPDATE_STATEMENTS = pipeline
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    first_table = data_fixture.create_database_table(database=database)
+    second_table = data_fixture.create_database_table(database=database)
+    first_table_primary_field = data_fixture.create_text_field(
+        name="primary", primary=True, table=first_table
+    )
+    second_table_primary_field = data_fixture.create_text_field(
+        name="primary", primary=True, table=second_table
+    )
+    second_table_other_field = data_fixture.create_text_field(
+        name="other", table=second_table
+    )
+    # noinspection PyTypeChecker
+    link_row_field: LinkRowField = FieldHandler().create_field(
+        user=user,
+        table=first_table,
+        type_name="link_row",
+        link_row_table=second_table,
+        name="link",
+    )
+    first_table_model = first_table.get_model(attribute_names=True)
+    second_table_model = second_table.get_model(attribute_names=True)
+
+    second_table_a_row = second_table_model.objects.create(primary="a", other="a")
+    second_table_b_row = second_table_model.objects.create(primary="b", other="b")
+    second_table_unlinked_row = second_table_model.objects.create(
+        primary="unlinked", other="unlinked"
+    )
+    first_table_1_row = first_table_model.objects.create(primary="1")
+    first_table_2_row = first_table_model.objects.create(primary="2")
+    first_table_1_row.link.add(second_table_a_row.id, second_table_b_row.id)
+    first_table_2_row.link.add(second_table_unlinked_row.id)
+
+    field_cache = FieldCache()
+    update_collector = FieldUpdateCollector(
+        second_table, starting_row_ids=[second_table_a_row.id], batch_updates=True
+    )
+    update_collector.add_field_with_pending_update_statement(
+        second_table_other_field, Value("updated")
+    )
+    update_collector.add_field_with_pending_update_statement(
+        first_table_primary_field,
+        Value("other"),
+        via_path_to_starting_table=[link_row_field],
+    )
+    update_collector.add_field_with_pending_update_statement(
+        second_table_primary_field,
+        Value("other"),
+        via_path_to_starting_table=[
+            link_row_field,
+            link_row_field.link_row_related_field,
+        ],
+    )
+    # Cache the models so we are only asserting about the update queries
+    field_cache.cache_model(first_table.get_model())
+    field_cache.cache_model(second_table.get_model())
+    # The two statements of the second table are merged, and the statements of both
+    # tables are executed at once if pipelined.
+    with django_assert_num_queries(1 if pipeline else 2):
+        assert update_collector.apply_updates(field_cache) == 3
+
+    first_table_1_row.refresh_from_db()
+    first_table_2_row.refresh_from_db()
+    assert first_table_1_row.primary == "other"
+    assert first_table_2_row.primary == "2"
+    assert [
+        (row.primary, row.other) for row in second_table_model.objects.order_by("id")
+    ] == [("other", "updated"), ("other", "b"), ("unlinked", "unlinked")]
+
+
+@pytest.mark.django_db
+@patch(
+    "baserow.contrib.database.fields.dependencies.update_collector"
+    ".update_collector_statements_histogram"
+)
+def test_update_collector_records_executed_statements(
+    mock_statements_histogram, data_fixture
+):
+    field = data_fixture.create_text_field(name="field")
+    model = field.table.get_model(attribute_names=True)
+    row = model.objects.create(field="starting value")
+
+    update_collector = FieldUpdateCollector(field.table, starting_row_ids=[row.id])
+    update_collector.add_field_with_pending_update_statement(field, Value("other"))
+    update_collector.apply_updates(FieldCache())
+
+    mock_statements_histogram.record.assert_called_once_with(1, {"batched": False})
+
+    # Nothing is recorded if there is nothing to update.
+    mock_statements_histogram.reset_mock()
+    FieldUpdateCollector(field.table).apply_updates(FieldCache())
+    mock_statements_histogram.record.assert_not_called()
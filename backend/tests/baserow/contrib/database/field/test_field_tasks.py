@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from unittest.mock import patch
 
 from django.test import override_settings
@@ -234,6 +234,112 @@ def test_run_field_type_updates_dependant_fields(data_fixture, settings):
         )
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.fields.field_types.periodic_update_rows_histogram")
+def test_run_periodic_fields_updates_skips_fields_until_their_value_can_change(
+    rows_histogram, data_fixture, settings
+):
+    settings.BASEROW_PERIODIC_FIELD_UPDATE_UNUSED_WORKSPACE_INTERVAL_MIN = 0
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    with freeze_time("2023-02-27 10:15"):
+        workspace.refresh_now()
+        now_field = data_fixture.create_formula_field(
+            table=table, formula="now()", date_include_time=True
+        )
+        today_field = data_fixture.create_formula_field(table=table, formula="today()")
+        dependant = data_fixture.create_formula_field(
+            table=table, formula=f"field('{today_field.name}')"
+        )
+        table_model = table.get_model()
+        row = RowHandler().create_row(user=user, table=table, model=table_model)
+        RowHandler().create_row(user=user, table=table, model=table_model)
+
+    # The first periodic update schedules the next update of the fields.
+    with freeze_time("2023-02-27 10:30"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    now_field.refresh_from_db()
+    today_field.refresh_from_db()
+    assert now_field.next_periodic_update_at is None
+    assert today_field.next_periodic_update_at == datetime(
+        2023, 2, 28, tzinfo=timezone.utc
+    )
+    rows_histogram.record.assert_called_once_with(2)
+    rows_histogram.reset_mock()
+
+    # The date didn't change, so only the `now()` field must be updated.
+    with patch.object(
+        FormulaFieldType,
+        "run_periodic_update",
+        autospec=True,
+        side_effect=FormulaFieldType.run_periodic_update,
+    ) as run_periodic_update, freeze_time("2023-02-27 23:59"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+        assert run_periodic_update.call_args[0][1] == [now_field]
+
+    row.refresh_from_db()
+    assert getattr(row, f"field_{now_field.id}") == datetime(
+        2023, 2, 27, 23, 59, tzinfo=timezone.utc
+    )
+    assert getattr(row, f"field_{today_field.id}") == date(2023, 2, 27)
+    rows_histogram.record.assert_called_once_with(2)
+    rows_histogram.reset_mock()
+
+    # After midnight UTC the date field and its dependants are updated again.
+    with freeze_time("2023-02-28 00:01"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    row.refresh_from_db()
+    assert getattr(row, f"field_{today_field.id}") == date(2023, 2, 28)
+    assert getattr(row, f"field_{dependant.id}") == date(2023, 2, 28)
+    today_field.refresh_from_db()
+    assert today_field.next_periodic_update_at == datetime(
+        2023, 3, 1, tzinfo=timezone.utc
+    )
+    # Both rows are rewritten once for the two formulas and once for the dependant.
+    rows_histogram.record.assert_called_once_with(4)
+
+    # Changing the formula makes the field due again.
+    today_field.formula = "now()"
+    today_field.save()
+    assert today_field.next_periodic_update_at is None
+
+
+@pytest.mark.django_db
+def test_run_field_type_updates_dependant_fields_in_multiple_tables(
+    data_fixture, settings
+):
+    settings.BASEROW_PERIODIC_FIELD_UPDATE_UNUSED_WORKSPACE_INTERVAL_MIN = 5
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+
+    rows_and_dependants = []
+    with freeze_time("2023-02-27 10:15"):
+        for _ in range(2):
+            table = data_fixture.create_database_table(database=database)
+            field = data_fixture.create_formula_field(
+                table=table, formula="now()", date_include_time=True
+            )
+            dependant = data_fixture.create_formula_field(
+                table=table, formula=f"field('{field.name}')", date_include_time=True
+            )
+            row = RowHandler().create_row(user=user, table=table)
+            rows_and_dependants.append((row, dependant))
+
+    with freeze_time("2023-02-27 10:45"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    for row, dependant in rows_and_dependants:
+        row.refresh_from_db()
+        assert getattr(row, f"field_{dependant.id}") == datetime(
+            2023, 2, 27, 10, 45, 0, tzinfo=timezone.utc
+        )
+
+
 @pytest.mark.django_db
 def test_workspace_updated_last_will_be_updated_first_this_time(data_fixture, settings):
     settings.BASEROW_PERIODIC_FIELD_UPDATE_UNUSED_WORKSPACE_INTERVAL_MIN = 0
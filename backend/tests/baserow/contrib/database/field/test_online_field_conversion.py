@@ -0,0 +1,323 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.db import connection, transaction
+
+import pytest
+from freezegun import freeze_time
+
+from baserow.contrib.database.fields.exceptions import (
+    FailedToLockFieldDueToConflict,
+    OnlineFieldConversionNotSupported,
+)
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.job_types import OnlineFieldConversionJobType
+from baserow.contrib.database.fields.models import (
+    FormulaField,
+    NumberField,
+    OnlineFieldConversionJob,
+)
+from baserow.contrib.database.fields.online_conversion import (
+    OnlineFieldConversionHandler,
+)
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.core.jobs.constants import JOB_FAILED, JOB_FINISHED, JOB_STARTED
+from baserow.core.jobs.handler import JobHandler
+from baserow.core.trash.handler import TrashHandler
+
+
+def _get_column_names(table):
+    with connection.cursor() as cursor:
+        return {
+            column.name
+            for column in connection.introspection.get_table_description(
+                cursor, table.get_database_table_name()
+            )
+        }
+
+
+def _get_conversion_function_count(field):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*) FROM pg_proc WHERE proname LIKE %s",
+            [f"baserow_online_conversion_{field.id}%"],
+        )
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+def test_convert_field_online_matches_regular_conversion(data_fixture, settings):
+    settings.BASEROW_ONLINE_FIELD_CONVERSION_BATCH_SIZE = 2
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    online_field = data_fixture.create_text_field(table=table, name="Online")
+    regular_field = data_fixture.create_text_field(table=table, name="Regular")
+    values = ["1", "2.56", "abc", None, "-3", "4,5"]
+    RowHandler().force_create_rows(
+        user,
+        table,
+        [
+            {online_field.db_column: value, regular_field.db_column: value}
+            for value in values
+        ],
+    )
+
+    field, _ = OnlineFieldConversionHandler().convert_field(
+        user,
+        online_field,
+        "number",
+        {"number_decimal_places": 1, "number_negative": True},
+    )
+    FieldHandler().update_field(
+        user,
+        regular_field,
+        "number",
+        number_decimal_places=1,
+        number_negative=True,
+    )
+
+    assert isinstance(field, NumberField)
+    assert field.number_decimal_places == 1
+    rows = table.get_model().objects.order_by("id")
+    online_values = [getattr(row, online_field.db_column) for row in rows]
+    assert online_values == [getattr(row, regular_field.db_column) for row in rows]
+    assert online_values == [
+        Decimal("1.0"),
+        Decimal("2.6"),
+        None,
+        None,
+        Decimal("-3.0"),
+        None,
+    ]
+    assert f"{online_field.db_column}_shadow" not in _get_column_names(table)
+    assert _get_conversion_function_count(online_field) == 0
+
+
+@pytest.mark.django_db
+def test_convert_field_online_to_not_null_column(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    online_field = data_fixture.create_text_field(table=table, name="Online")
+    regular_field = data_fixture.create_text_field(table=table, name="Regular")
+    values = ["yes", "no", None, "abc", "1"]
+    RowHandler().force_create_rows(
+        user,
+        table,
+        [
+            {online_field.db_column: value, regular_field.db_column: value}
+            for value in values
+        ],
+    )
+
+    field, _ = OnlineFieldConversionHandler().convert_field(
+        user, online_field, "boolean", {}
+    )
+    FieldHandler().update_field(user, regular_field, "boolean")
+
+    rows = table.get_model().objects.order_by("id")
+    online_values = [getattr(row, field.db_column) for row in rows]
+    assert online_values == [getattr(row, regular_field.db_column) for row in rows]
+    assert online_values == [True, False, False, False, True]
+    with connection.cursor() as cursor:
+        description = connection.introspection.get_table_description(
+            cursor, table.get_database_table_name()
+        )
+    column = next(column for column in description if column.name == field.db_column)
+    assert column.null_ok is False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*) FROM pg_constraint WHERE conname LIKE %s",
+            [f"%{field.db_column}_shadow_not_null"],
+        )
+        assert cursor.fetchone()[0] == 0
+
+
+@pytest.mark.django_db
+def test_online_field_conversion_converts_concurrent_writes(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    formula_field = data_fixture.create_formula_field(
+        table=table, formula=f"field('{field.name}')"
+    )
+    model = table.get_model()
+    row_1 = model.objects.create(**{field.db_column: "1"})
+    row_2 = model.objects.create(**{field.db_column: "2"})
+
+    handler = OnlineFieldConversionHandler()
+    handler.start_conversion(user, field, "number", {})
+    assert f"{field.db_column}_shadow" in _get_column_names(table)
+
+    # The rows that are created or updated while the conversion is in progress are
+    # converted by the trigger.
+    model.objects.create(**{field.db_column: "3"})
+    RowHandler().update_row_by_id(user, table, row_1.id, {field.db_column: "10"})
+    handler.backfill_shadow_column(field, batch_size=1)
+    RowHandler().update_row_by_id(user, table, row_2.id, {field.db_column: "20"})
+
+    # The formula still has the old type until the conversion is finished.
+    formula_field.refresh_from_db()
+    assert formula_field.formula_type == "text"
+
+    field, updated_fields = handler.finish_conversion(user, field, "number", {})
+
+    assert isinstance(field, NumberField)
+    assert [
+        getattr(row, field.db_column)
+        for row in table.get_model().objects.order_by("id")
+    ] == [Decimal("10"), Decimal("20"), Decimal("3")]
+    formula_field = FormulaField.objects.get(id=formula_field.id)
+    assert formula_field.formula_type == "number"
+    assert formula_field.id in [updated_field.id for updated_field in updated_fields]
+    assert f"{field.db_column}_shadow" not in _get_column_names(table)
+    assert _get_conversion_function_count(field) == 0
+
+
+@pytest.mark.django_db
+def test_online_field_conversion_cleans_up_if_it_fails(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    table.get_model().objects.create(**{field.db_column: "1"})
+
+    handler = OnlineFieldConversionHandler()
+    with patch.object(
+        OnlineFieldConversionHandler,
+        "finish_conversion",
+        side_effect=ValueError("failed"),
+    ), pytest.raises(ValueError):
+        handler.convert_field(user, field, "number", {})
+
+    assert f"{field.db_column}_shadow" not in _get_column_names(table)
+    assert _get_conversion_function_count(field) == 0
+    # Writes to the field don't use the removed trigger anymore.
+    table.get_model().objects.create(**{field.db_column: "2"})
+
+
+@pytest.mark.django_db
+def test_online_field_conversion_not_supported(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    single_select_field = data_fixture.create_single_select_field(table=table)
+
+    handler = OnlineFieldConversionHandler()
+    with pytest.raises(OnlineFieldConversionNotSupported):
+        handler.requires_online_conversion(user, text_field, "single_select", {})
+    with pytest.raises(OnlineFieldConversionNotSupported):
+        handler.requires_online_conversion(user, single_select_field, "text", {})
+    with pytest.raises(OnlineFieldConversionNotSupported):
+        handler.requires_online_conversion(
+            user, text_field, "formula", {"formula": "1"}
+        )
+
+    assert handler.requires_online_conversion(user, text_field, "number", {})
+    assert not handler.requires_online_conversion(
+        user, text_field, "text", {"name": "Renamed"}
+    )
+
+
+@pytest.mark.django_db
+def test_field_being_converted_online_cannot_be_changed(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    field = data_fixture.create_text_field(table=table)
+    OnlineFieldConversionJob.objects.create(user=user, field=field, new_type="number")
+
+    with pytest.raises(FailedToLockFieldDueToConflict):
+        FieldHandler().get_specific_field_for_update(field.id)
+    with pytest.raises(FailedToLockFieldDueToConflict):
+        FieldHandler().delete_field(user, field)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_online_field_conversion_job(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    table.get_model().objects.create(**{field.db_column: "12"})
+
+    with transaction.atomic():
+        job = JobHandler().create_and_start_job(
+            user,
+            OnlineFieldConversionJobType.type,
+            field_id=field.id,
+            new_type="number",
+            field_values={"name": "Amount", "number_decimal_places": 2},
+        )
+
+    job.refresh_from_db()
+    assert job.state == JOB_FINISHED
+    assert job.progress_percentage == 100
+
+    field = FieldHandler().get_field(field.id).specific
+    assert isinstance(field, NumberField)
+    assert field.name == "Amount"
+    row = table.get_model().objects.get()
+    assert getattr(row, field.db_column) == Decimal("12.00")
+
+    # The field can be changed again once the conversion has finished.
+    with transaction.atomic():
+        FieldHandler().get_specific_field_for_update(field.id)
+
+
+@pytest.mark.django_db
+def test_online_field_conversion_removes_leftovers_of_previous_conversion(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    table.get_model().objects.create(**{field.db_column: "1"})
+
+    # A previous conversion that was interrupted left the shadow column behind.
+    handler = OnlineFieldConversionHandler()
+    handler.start_conversion(user, field, "number", {})
+
+    field, _ = handler.convert_field(user, field, "number", {})
+
+    assert isinstance(field, NumberField)
+    assert f"{field.db_column}_shadow" not in _get_column_names(table)
+    assert _get_conversion_function_count(field) == 0
+
+
+@pytest.mark.django_db
+def test_expired_online_field_conversion_job_is_cleaned_up(data_fixture, settings):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    field = data_fixture.create_text_field(table=table)
+    with freeze_time("2020-01-01 12:00"):
+        OnlineFieldConversionJob.objects.create(
+            user=user, field=field, new_type="number", state=JOB_STARTED
+        )
+    OnlineFieldConversionHandler().start_conversion(user, field, "number", {})
+
+    with freeze_time("2020-01-02 12:00"):
+        JobHandler().clean_up_jobs()
+
+    assert f"{field.db_column}_shadow" not in _get_column_names(table)
+    assert _get_conversion_function_count(field) == 0
+    # The field is not locked by the failed conversion anymore.
+    FieldHandler().delete_field(user, field)
+
+
+@pytest.mark.django_db
+def test_permanently_deleting_field_removes_unfinished_online_conversion(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    field = data_fixture.create_text_field(table=table)
+    OnlineFieldConversionJob.objects.create(
+        user=user, field=field, new_type="number", state=JOB_FAILED
+    )
+    OnlineFieldConversionHandler().start_conversion(user, field, "number", {})
+
+    FieldHandler().delete_field(user, field)
+    TrashHandler.permanently_delete(field)
+
+    assert f"{field.db_column}_shadow" not in _get_column_names(table)
+    assert _get_conversion_function_count(field) == 0
@@ -14,6 +14,7 @@ from baserow.contrib.database.rows.actions import (
     DeleteRowsActionType,
     ImportRowsActionType,
     MoveRowActionType,
+    MoveRowsActionType,
     UpdateRowActionType,
     UpdateRowsActionType,
 )
@@ -688,6 +689,42 @@ def test_can_undo_redo_moving_row(data_fixture):
     assert row_2.order < row_3.order < row_1.order
 
 
+@pytest.mark.django_db
+@pytest.mark.undo_redo
+def test_can_undo_redo_moving_rows(data_fixture):
+    session_id = "session-id"
+    user = data_fixture.create_user(session_id=session_id)
+    table = data_fixture.create_database_table(name="Car", user=user)
+
+    handler = RowHandler()
+    row_1, row_2, row_3, row_4, row_5 = [
+        handler.create_row(user=user, table=table) for _ in range(5)
+    ]
+    model = table.get_model()
+
+    def get_row_ids():
+        return list(model.objects.values_list("id", flat=True))
+
+    action_type_registry.get_by_type(MoveRowsActionType).do(
+        user, table, [row_4.id, row_1.id, row_2.id], before_row=row_5
+    )
+    assert get_row_ids() == [row_3.id, row_4.id, row_1.id, row_2.id, row_5.id]
+
+    action_undone = ActionHandler.undo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+
+    assert_undo_redo_actions_are_valid(action_undone, [MoveRowsActionType])
+    assert get_row_ids() == [row_1.id, row_2.id, row_3.id, row_4.id, row_5.id]
+
+    action_redone = ActionHandler.redo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+
+    assert_undo_redo_actions_are_valid(action_redone, [MoveRowsActionType])
+    assert get_row_ids() == [row_3.id, row_4.id, row_1.id, row_2.id, row_5.id]
+
+
 @pytest.mark.django_db
 @pytest.mark.undo_redo
 def test_undo_moving_row_does_nothing_if_row_is_at_same_original_position(data_fixture):
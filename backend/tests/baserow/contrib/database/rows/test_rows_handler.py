@@ -15,7 +15,11 @@ from baserow.contrib.database.api.utils import (
     extract_user_field_names_from_params,
     get_include_exclude_fields,
 )
-from baserow.contrib.database.rows.exceptions import RowDoesNotExist
+from baserow.contrib.database.fields.dependencies.graph import (
+    get_field_dependency_graph,
+)
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.exceptions import RowDoesNotExist, RowIdsNotUnique
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.trash.handler import TrashHandler
@@ -1091,6 +1095,99 @@ def test_move_row(before_send_mock, send_mock, data_fixture):
     assert row_ids[2].id == row_3.id
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.rows_updated.send")
+@patch("baserow.contrib.database.rows.signals.before_rows_update.send")
+def test_move_rows(before_send_mock, send_mock, data_fixture):
+    workspace = data_fixture.create_workspace()
+    user = data_fixture.create_user()
+    user_2 = data_fixture.create_user()
+    data_fixture.create_user_workspace(workspace=workspace, user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(name="Car", user=user, database=database)
+
+    handler = RowHandler()
+    row_1, row_2, row_3, row_4, row_5 = [
+        handler.create_row(user=user, table=table) for _ in range(5)
+    ]
+
+    with pytest.raises(UserNotInWorkspace):
+        handler.move_rows_by_id(user=user_2, table=table, row_ids=[row_1.id])
+
+    with pytest.raises(RowDoesNotExist):
+        handler.move_rows_by_id(user=user, table=table, row_ids=[row_1.id, 99999])
+
+    with pytest.raises(RowIdsNotUnique):
+        handler.move_rows_by_id(user=user, table=table, row_ids=[row_1.id, row_1.id])
+
+    rows = handler.move_rows_by_id(
+        user=user, table=table, row_ids=[row_5.id, row_1.id], before_row=row_3
+    )
+    assert [row.id for row in rows] == [row_5.id, row_1.id]
+    assert [row.order for row in rows] == [
+        Decimal("2.33333333333333333333"),
+        Decimal("2.66666666666666666666"),
+    ]
+    assert list(table.get_model().objects.values_list("id", flat=True)) == [
+        row_2.id,
+        row_5.id,
+        row_1.id,
+        row_3.id,
+        row_4.id,
+    ]
+
+    before_send_mock.assert_called_once()
+    assert [r.id for r in before_send_mock.call_args[1]["rows"]] == [row_5.id, row_1.id]
+    send_mock.assert_called_once()
+    assert [r.id for r in send_mock.call_args[1]["rows"]] == [row_5.id, row_1.id]
+    assert send_mock.call_args[1]["user"].id == user.id
+    assert send_mock.call_args[1]["table"].id == table.id
+    assert send_mock.call_args[1]["before_return"] == before_send_mock.return_value
+
+    handler.move_rows_by_id(user=user, table=table, row_ids=[row_2.id, row_3.id])
+    assert list(table.get_model().objects.values_list("id", "order")) == [
+        (row_5.id, Decimal("2.33333333333333333333")),
+        (row_1.id, Decimal("2.66666666666666666666")),
+        (row_4.id, Decimal("4.00000000000000000000")),
+        (row_2.id, Decimal("5.00000000000000000000")),
+        (row_3.id, Decimal("6.00000000000000000000")),
+    ]
+
+
+@pytest.mark.django_db
+def test_move_rows_only_recalculates_the_orders_of_the_neighbouring_rows(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    model = table.get_model()
+    far_row = model.objects.create(order=Decimal("1.00000000000000000000"))
+    crowded_rows = [
+        model.objects.create(order=Decimal("10") + Decimal("0.000001") * i)
+        for i in range(5)
+    ]
+    before_row = model.objects.create(order=Decimal("10.00001000000000000000"))
+    rows_to_move = [model.objects.create(order=Decimal(20 + i)) for i in range(3)]
+
+    RowHandler().move_rows_by_id(
+        user, table, [row.id for row in rows_to_move], before_row=before_row
+    )
+
+    far_row.refresh_from_db()
+    before_row.refresh_from_db()
+    assert far_row.order == Decimal("1.00000000000000000000")
+    assert before_row.order == Decimal("10.00001000000000000000")
+    orders = list(model.objects.values_list("id", "order"))
+    assert [row_id for row_id, _ in orders] == [
+        far_row.id,
+        *[row.id for row in crowded_rows],
+        *[row.id for row in rows_to_move],
+        before_row.id,
+    ]
+    gaps = [order_2 - order_1 for (_, order_1), (_, order_2) in zip(orders, orders[1:])]
+    assert min(gaps[1:]) >= Decimal("0.00001")
+
+
 @pytest.mark.django_db
 @patch("baserow.contrib.database.rows.signals.rows_deleted.send")
 @patch("baserow.contrib.database.rows.signals.before_rows_delete.send")
@@ -1372,7 +1469,10 @@ def test_get_unique_orders_first_before_row(data_fixture):
 
 
 @pytest.mark.django_db
-def test_get_unique_orders_before_row_triggering_full_table_order_reset(data_fixture):
+@patch("baserow.contrib.database.rows.signals.row_orders_recalculated.send")
+def test_get_unique_orders_before_row_triggering_local_order_recalculation(
+    send_mock, data_fixture
+):
     user = data_fixture.create_user()
     database = data_fixture.create_database_application(user=user)
     table = data_fixture.create_database_table(
@@ -1387,8 +1487,8 @@ def test_get_unique_orders_before_row_triggering_full_table_order_reset(data_fix
 
     handler = RowHandler()
     assert handler.get_unique_orders_before_row(row_3, model, 2) == [
-        Decimal("3.50000000000000000000"),
-        Decimal("3.66666666666666651864"),
+        Decimal("2.49999999999999999999"),
+        Decimal("2.74999999999999999999"),
     ]
 
     row_1.refresh_from_db()
@@ -1396,10 +1496,73 @@ def test_get_unique_orders_before_row_triggering_full_table_order_reset(data_fix
     row_3.refresh_from_db()
     row_4.refresh_from_db()
 
+    # Only the row right before `row_3` is moved to make room.
+    assert row_1.order == Decimal("1.00000000000000000000")
+    assert row_2.order == Decimal("1.00000000000000001000")
+    assert row_3.order == Decimal("2.99999999999999999999")
+    assert row_4.order == Decimal("2.24999999999999999999")
+    send_mock.assert_called_once()
+    assert send_mock.call_args[1]["table"].id == table.id
+
+
+@pytest.mark.django_db
+def test_get_unique_orders_before_row_triggering_full_table_order_reset(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(
+        name="Table", user=user, database=database
+    )
+
+    model = table.get_model()
+    row_1 = model.objects.create(order=Decimal("0.00000000000000000001"))
+    row_2 = model.objects.create(order=Decimal("0.00000000000000000002"))
+    row_3 = model.objects.create(order=Decimal("3.00000000000000000000"))
+
+    handler = RowHandler()
+    assert handler.get_unique_orders_before_row(row_2, model) == [
+        Decimal("1.50000000000000000000")
+    ]
+
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    row_3.refresh_from_db()
+
     assert row_1.order == Decimal("1.00000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
-    assert row_3.order == Decimal("4.00000000000000000000")
-    assert row_4.order == Decimal("3.00000000000000000000")
+    assert row_3.order == Decimal("3.00000000000000000000")
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.row_orders_recalculated.send")
+def test_get_spaced_orders_before_row(send_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+
+    model = table.get_model()
+    row_1 = model.objects.create(order=Decimal("1.00000000000000000000"))
+    row_2 = model.objects.create(order=Decimal("2.00000000000000000000"))
+    row_3 = model.objects.create(order=Decimal("2.00001000000000000000"))
+
+    handler = RowHandler()
+    assert handler.get_spaced_orders_before_row(row_2, model, 3) == [
+        Decimal("1.25000000000000000000"),
+        Decimal("1.50000000000000000000"),
+        Decimal("1.75000000000000000000"),
+    ]
+    send_mock.assert_not_called()
+
+    # There is no room for 3 orders between row 2 and 3, so the rows before row 3 are
+    # spread out over the range of orders between 1.00001 and 2.00001.
+    assert handler.get_spaced_orders_before_row(row_3, model, 3) == [
+        Decimal("1.40001000000000000000"),
+        Decimal("1.60001000000000000000"),
+        Decimal("1.80001000000000000000"),
+    ]
+    send_mock.assert_called_once()
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    assert row_1.order == Decimal("1.00000000000000000000")
+    assert row_2.order == Decimal("1.20001000000000000000")
 
 
 @pytest.mark.django_db
@@ -1487,6 +1650,9 @@ def test_formula_referencing_fields_add_additional_queries_on_rows_created(
         formula="field('Name') + '-a'",
     )
     model = table.get_model()
+    # The new formula invalidated the dependency graph, so build it upfront to only
+    # count the queries needed for the rows.
+    get_field_dependency_graph(table.database_id)
 
     # An UPDATE query to set the formula field value + 1 query due
     # to FormulaFieldType.after_rows_created
@@ -1511,6 +1677,9 @@ def test_formula_referencing_fields_add_additional_queries_on_rows_created(
         formula="field('Name') + '-b'",
     )
     model = table.get_model()
+    # The new formula invalidated the dependency graph, so build it upfront to only
+    # count the queries needed for the rows.
+    get_field_dependency_graph(table.database_id)
 
     with django_assert_num_queries(len(captured.captured_queries) + 2):
         (r,) = RowHandler().force_create_rows(
@@ -1534,6 +1703,9 @@ def test_formula_referencing_fields_add_additional_queries_on_rows_created(
         formula="field('F1') + '-c'",
     )
     model = table.get_model()
+    # The new formula invalidated the dependency graph, so build it upfront to only
+    # count the queries needed for the rows.
+    get_field_dependency_graph(table.database_id)
 
     # Now a second UPDATE query is needed, so that F3 can use the result
     # of F1 to correctly calculate its value
@@ -1592,6 +1764,9 @@ def test_formula_referencing_fields_add_additional_queries_on_rows_updated(
         formula="field('Name') + '-a'",
     )
     model = table.get_model()
+    # The new formula invalidated the dependency graph, so build it upfront to only
+    # count the queries needed for the rows.
+    get_field_dependency_graph(table.database_id)
 
     # An UPDATE query to set the formula field value
     with django_assert_num_queries(len(captured.captured_queries) + 1):
@@ -1617,6 +1792,9 @@ def test_formula_referencing_fields_add_additional_queries_on_rows_updated(
         formula="field('Name') + '-b'",
     )
     model = table.get_model()
+    # The new formula invalidated the dependency graph, so build it upfront to only
+    # count the queries needed for the rows.
+    get_field_dependency_graph(table.database_id)
 
     with django_assert_num_queries(len(captured.captured_queries) + 1):
         res = RowHandler().force_update_rows(
@@ -1642,6 +1820,9 @@ def test_formula_referencing_fields_add_additional_queries_on_rows_updated(
         formula="field('F1') + '-c'",
     )
     model = table.get_model()
+    # The new formula invalidated the dependency graph, so build it upfront to only
+    # count the queries needed for the rows.
+    get_field_dependency_graph(table.database_id)
 
     # Now a second UPDATE query is needed, so that F3 can use the result
     # of F1 to correctly calculate its value
@@ -1700,3 +1881,72 @@ def test_can_move_rows_and_formulas_are_updated_correctly(data_fixture):
     row_a2.refresh_from_db()
     assert getattr(row_a1, lookup_a.db_column) == "b1"
     assert getattr(row_a2, lookup_a.db_column) == "b2"
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("pipeline", [True, False])
+def test_update_rows_batches_the_updates_of_dependant_fields(
+    data_fixture, settings, pipeline
+):
+    settings.BASEROW_PIPELINE_FIELD_UPDATE_STATEMENTS = pipeline
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table_a = data_fixture.create_database_table(database=database)
+    table_b = data_fixture.create_database_table(database=database)
+    table_c = data_fixture.create_database_table(database=database)
+    primary_a = data_fixture.create_text_field(table=table_a, primary=True)
+    data_fixture.create_text_field(table=table_b, primary=True)
+    data_fixture.create_text_field(table=table_c, primary=True)
+
+    field_handler = FieldHandler()
+    links, lookups = [], []
+    for table, name in [(table_b, "1"), (table_b, "2"), (table_c, "1")]:
+        link_field = field_handler.create_field(
+            user, table, "link_row", name=f"link {name}", link_row_table=table_a
+        )
+        links.append(link_field)
+        lookups.append(
+            field_handler.create_field(
+                user,
+                table,
+                "lookup",
+                name=f"lookup {name}",
+                through_field_id=link_field.id,
+                target_field_id=primary_a.id,
+            )
+        )
+
+    row_handler = RowHandler()
+    (row_a,) = row_handler.force_create_rows(
+        user, table_a, [{primary_a.db_column: "a"}]
+    )
+    (row_b,) = row_handler.force_create_rows(
+        user,
+        table_b,
+        [{links[0].db_column: [row_a.id], links[1].db_column: [row_a.id]}],
+    )
+    (row_c,) = row_handler.force_create_rows(
+        user, table_c, [{links[2].db_column: [row_a.id]}]
+    )
+
+    with CaptureQueriesContext(connection) as captured:
+        row_handler.force_update_rows(
+            user, table_a, [{"id": row_a.id, primary_a.db_column: "updated"}]
+        )
+
+    # The lookups of table B are updated with a single statement, and together with
+    # the lookup of table C if the statements are pipelined.
+    table_b_updates = [
+        query["sql"]
+        for query in captured.captured_queries
+        if f'UPDATE "database_table_{table_b.id}"' in query["sql"]
+    ]
+    assert len(table_b_updates) == 1
+    assert (f'UPDATE "database_table_{table_c.id}"' in table_b_updates[0]) == pipeline
+
+    row_b.refresh_from_db()
+    row_c.refresh_from_db()
+    for row, lookup in [(row_b, lookups[0]), (row_b, lookups[1]), (row_c, lookups[2])]:
+        assert [value["value"] for value in getattr(row, lookup.db_column)] == [
+            "updated"
+        ]
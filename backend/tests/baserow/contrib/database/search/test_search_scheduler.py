@@ -0,0 +1,141 @@
+from unittest.mock import patch
+
+import pytest
+from fakeredis import FakeRedis, FakeServer
+from freezegun import freeze_time
+
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.search.scheduler import (
+    TABLE_IN_FLIGHT_KEY,
+    TsvectorUpdateScheduler,
+)
+from baserow.contrib.database.search.tasks import run_scheduled_tsvector_update
+
+
+@pytest.fixture
+def fake_scheduler_redis(settings):
+    settings.TSV_UPDATE_DEBOUNCE_SECONDS = 2
+    settings.TSV_UPDATE_MAX_LATENCY_SECONDS = 10
+    redis_client = FakeRedis(server=FakeServer())
+    with patch(
+        "baserow.contrib.database.search.scheduler._get_redis_client",
+        lambda: redis_client,
+    ), patch.object(TsvectorUpdateScheduler, "is_enabled", lambda: True):
+        yield redis_client
+
+
+def test_tsvector_update_scheduler_is_opt_in(settings):
+    assert settings.TSV_UPDATE_DEBOUNCE_SECONDS == 0
+    assert TsvectorUpdateScheduler.is_enabled() is False
+
+
+def test_tsvector_update_requests_are_coalesced(fake_scheduler_redis):
+    with freeze_time("2020-01-01 12:00:00"):
+        assert TsvectorUpdateScheduler.request_update(1, True) is True
+        assert TsvectorUpdateScheduler.request_update(1, False, [10, 11]) is False
+        assert TsvectorUpdateScheduler.request_update(1, False, [11, 12]) is False
+        assert TsvectorUpdateScheduler.request_update(2, True) is True
+        assert TsvectorUpdateScheduler.get_queue_depth() == 2
+
+    pending_update = TsvectorUpdateScheduler.claim_update(1)
+    assert pending_update.changed_rows is True
+    assert pending_update.all_fields is False
+    assert pending_update.get_field_ids_to_update() == [10, 11, 12]
+    assert pending_update.must_update_changed_rows is True
+    assert TsvectorUpdateScheduler.claim_update(1) is None
+    assert TsvectorUpdateScheduler.get_queue_depth() == 1
+
+    # A request after the pending update has been claimed starts a new one.
+    assert TsvectorUpdateScheduler.request_update(1, False) is True
+    assert TsvectorUpdateScheduler.request_update(1, True) is False
+    pending_update = TsvectorUpdateScheduler.claim_update(1)
+    assert pending_update.get_field_ids_to_update() is None
+    # Updating all fields of all rows also updates the changed rows.
+    assert pending_update.must_update_changed_rows is False
+
+
+def test_tsvector_update_requests_are_debounced_with_max_latency(
+    fake_scheduler_redis,
+):
+    with freeze_time("2020-01-01 12:00:00"):
+        TsvectorUpdateScheduler.request_update(1, True)
+        assert TsvectorUpdateScheduler.get_seconds_until_due(1) == 2
+        assert TsvectorUpdateScheduler.run_due_update(1) == 2
+
+    # Every new request postpones the update.
+    with freeze_time("2020-01-01 12:00:01"):
+        TsvectorUpdateScheduler.request_update(1, True)
+        assert TsvectorUpdateScheduler.get_seconds_until_due(1) == 2
+        assert TsvectorUpdateScheduler.get_staleness() == 1
+
+    # But never further than the max latency after the first request.
+    with freeze_time("2020-01-01 12:00:09"):
+        TsvectorUpdateScheduler.request_update(1, True)
+        assert TsvectorUpdateScheduler.get_seconds_until_due(1) == 1
+
+    # If the scheduled task got lost, the update is picked up by the periodic check.
+    with freeze_time("2020-01-01 12:00:19"):
+        assert TsvectorUpdateScheduler.get_overdue_table_ids() == []
+    with freeze_time("2020-01-01 12:00:20"):
+        assert TsvectorUpdateScheduler.get_overdue_table_ids() == [1]
+
+    assert TsvectorUpdateScheduler.get_seconds_until_due(2) is None
+    assert TsvectorUpdateScheduler.run_due_update(2) is None
+
+
+@pytest.mark.django_db
+def test_run_due_tsvector_update(fake_scheduler_redis, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, primary=True)
+    model = table.get_model()
+    row = model.objects.create(**{field.db_column: "Tesla"})
+
+    with freeze_time("2020-01-01 12:00:00"):
+        TsvectorUpdateScheduler.request_update(table.id, True)
+
+    with freeze_time("2020-01-01 12:00:02"):
+        # Only one update per table can be in flight.
+        in_flight_lock = fake_scheduler_redis.lock(
+            TABLE_IN_FLIGHT_KEY.format(table_id=table.id)
+        )
+        in_flight_lock.acquire()
+        assert TsvectorUpdateScheduler.run_due_update(table.id) == 2
+        in_flight_lock.release()
+
+        assert TsvectorUpdateScheduler.run_due_update(table.id) is None
+
+    row.refresh_from_db()
+    assert getattr(row, field.tsv_db_column) == "'tesla':1"
+    assert row.needs_background_update is False
+    assert TsvectorUpdateScheduler.get_queue_depth() == 0
+    assert TsvectorUpdateScheduler.get_staleness() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@patch(
+    "baserow.contrib.database.search.tasks.run_scheduled_tsvector_update.apply_async"
+)
+def test_row_changes_schedule_one_coalesced_tsvector_update(
+    mock_apply_async, fake_scheduler_redis, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, primary=True)
+    mock_apply_async.reset_mock()
+
+    handler = RowHandler()
+    row = handler.create_row(user, table, {field.db_column: "Tesla"})
+    handler.update_row_by_id(user, table, row.id, {field.db_column: "Edison"})
+    handler.create_row(user, table, {field.db_column: "Curie"})
+
+    mock_apply_async.assert_called_once_with((table.id,), countdown=2)
+
+    with freeze_time("2100-01-01 12:00:00"):
+        run_scheduled_tsvector_update(table.id)
+
+    assert list(
+        table.get_model()
+        .objects.order_by("id")
+        .values_list(field.tsv_db_column, flat=True)
+    ) == ["'edison':1", "'curie':1"]
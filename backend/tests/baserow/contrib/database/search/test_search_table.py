@@ -0,0 +1,204 @@
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import override_settings
+
+import pytest
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.search.handler import SearchHandler
+from baserow.contrib.database.table.handler import TableHandler
+from baserow.core.trash.handler import TrashHandler
+
+
+def get_search_table_vectors(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT row_id, field_id, value FROM "{table.get_database_search_table_name()}"'
+            " ORDER BY row_id, field_id"
+        )
+        return cursor.fetchall()
+
+
+def search_table_exists(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT to_regclass(%s)", [table.get_database_search_table_name()]
+        )
+        return cursor.fetchone()[0] is not None
+
+
+def search(table, query):
+    model = table.get_model()
+    return list(
+        model.objects.all().pg_search(query).order_by("id").values_list("id", flat=True)
+    )
+
+
+@pytest.mark.django_db
+@override_settings(USE_PG_FULLTEXT_SEARCH_TABLE=True)
+def test_table_created_with_search_table(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+
+    table = TableHandler().create_table_and_fields(
+        user, database, "Table", [("Name", "text", {})]
+    )
+
+    assert table.search_table_added
+    assert search_table_exists(table)
+    model = table.get_model()
+    field = table.field_set.get()
+    assert field.tsvector_column_created
+    assert field.tsv_db_column not in [f.name for f in model._meta.get_fields()]
+
+
+@pytest.mark.django_db
+def test_search_table_update_and_search(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user, search_table_added=True)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+
+    rows = RowHandler().force_create_rows(
+        user,
+        table,
+        [
+            {text_field.db_column: "Tesla", number_field.db_column: 10},
+            {text_field.db_column: "Edison", number_field.db_column: 20},
+            {text_field.db_column: "", number_field.db_column: None},
+        ],
+    )
+    row_1, row_2, row_3 = rows
+    SearchHandler.update_tsvector_columns(
+        table, update_tsvectors_for_changed_rows_only=True
+    )
+
+    # Empty cells don't have a search vector.
+    assert get_search_table_vectors(table) == [
+        (row_1.id, text_field.id, "'tesla':1"),
+        (row_1.id, number_field.id, "'10':1"),
+        (row_2.id, text_field.id, "'edison':1"),
+        (row_2.id, number_field.id, "'20':1"),
+    ]
+    assert table.get_model().objects.filter(needs_background_update=True).count() == 0
+    assert search(table, "tes") == [row_1.id]
+    assert search(table, "20") == [row_2.id]
+    assert search(table, str(row_3.id)) == [row_3.id]
+    assert search(table, "nothing") == []
+    assert (
+        list(
+            table.get_model()
+            .objects.all()
+            .pg_search("tesla", only_search_by_field_ids=[number_field.id])
+        )
+        == []
+    )
+
+    RowHandler().update_rows(
+        user,
+        table,
+        [
+            {"id": row_1.id, text_field.db_column: ""},
+            {"id": row_3.id, text_field.db_column: "Tesla"},
+        ],
+    )
+    SearchHandler.update_tsvector_columns(
+        table, update_tsvectors_for_changed_rows_only=True
+    )
+
+    assert get_search_table_vectors(table) == [
+        (row_1.id, number_field.id, "'10':1"),
+        (row_2.id, text_field.id, "'edison':1"),
+        (row_2.id, number_field.id, "'20':1"),
+        (row_3.id, text_field.id, "'tesla':1"),
+    ]
+    assert search(table, "tesla") == [row_3.id]
+
+    # The search vectors of permanently deleted rows are removed with them.
+    table.get_model().objects.filter(id=row_2.id).delete()
+    assert get_search_table_vectors(table) == [
+        (row_1.id, number_field.id, "'10':1"),
+        (row_3.id, text_field.id, "'tesla':1"),
+    ]
+
+    # The search vectors of permanently deleted fields are removed as well.
+    FieldHandler().delete_field(user, number_field)
+    TrashHandler.permanently_delete(number_field)
+    assert get_search_table_vectors(table) == [
+        (row_3.id, text_field.id, "'tesla':1"),
+    ]
+
+    # The search table is dropped before the table itself.
+    TrashHandler.permanently_delete(table)
+    assert not search_table_exists(table)
+
+
+@pytest.mark.django_db
+def test_search_table_update_restricted_to_fields(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user, search_table_added=True)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    other_text_field = data_fixture.create_text_field(table=table)
+
+    model = table.get_model()
+    row = model.objects.create(
+        **{text_field.db_column: "Tesla", other_text_field.db_column: "Edison"}
+    )
+
+    SearchHandler.update_tsvector_columns(
+        table,
+        update_tsvectors_for_changed_rows_only=False,
+        field_ids_to_restrict_update_to=[other_text_field.id],
+    )
+
+    assert get_search_table_vectors(table) == [
+        (row.id, other_text_field.id, "'edison':1"),
+    ]
+    row.refresh_from_db()
+    assert row.needs_background_update is True
+
+
+@pytest.mark.django_db
+def test_migrate_table_tsvectors_to_search_table_and_back(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    trashed_field = data_fixture.create_text_field(table=table, trashed=True)
+
+    model = table.get_model()
+    row_1 = model.objects.create(**{text_field.db_column: "Tesla"})
+    row_2 = model.objects.create(**{text_field.db_column: "Edison"})
+    SearchHandler.update_tsvector_columns(
+        table, update_tsvectors_for_changed_rows_only=False
+    )
+    assert search(table, "tesla") == [row_1.id]
+
+    call_command("migrate_table_tsvectors", table.id)
+
+    table.refresh_from_db()
+    assert table.search_table_added
+    assert get_search_table_vectors(table) == [
+        (row_1.id, text_field.id, "'tesla':1"),
+        (row_2.id, text_field.id, "'edison':1"),
+    ]
+    with connection.cursor() as cursor:
+        columns = [
+            column.name
+            for column in connection.introspection.get_table_description(
+                cursor, table.get_database_table_name()
+            )
+        ]
+    assert text_field.tsv_db_column not in columns
+    assert trashed_field.tsv_db_column not in columns
+    assert search(table, "tesla") == [row_1.id]
+
+    call_command("migrate_table_tsvectors", table.id, "--to-columns")
+
+    table.refresh_from_db()
+    assert not table.search_table_added
+    assert not search_table_exists(table)
+    rows = table.get_model().objects.order_by("id")
+    assert getattr(rows[0], text_field.tsv_db_column) == "'tesla':1"
+    assert getattr(rows[1], text_field.tsv_db_column) == "'edison':1"
+    assert search(table, "edis") == [row_2.id]
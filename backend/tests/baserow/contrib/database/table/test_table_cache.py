@@ -1,9 +1,15 @@
+from threading import Thread
+
 from django.test.utils import override_settings
 
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.table.cache import get_cached_model_field_attrs
+from baserow.contrib.database.table.cache import (
+    GeneratedModelL1Cache,
+    generated_models_l1_cache,
+    get_cached_model_field_attrs,
+)
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -204,3 +210,129 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_MODEL_L1_CACHE_SIZE=10)
+def test_get_model_uses_in_process_model_cache(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        field = data_fixture.create_text_field()
+    table = field.table
+    generated_models_l1_cache.clear()
+    generated_models_l1_cache.reset_stats()
+
+    model = table.get_model()
+    assert table.get_model() is model
+    assert generated_models_l1_cache.stats()["hits"] == 1
+    assert generated_models_l1_cache.stats()["misses"] == 1
+
+    # Models that are specific to the caller are never cached.
+    assert table.get_model(field_ids=[field.id]) is not model
+    assert table.get_model(attribute_names=True) is not model
+
+    with django_capture_on_commit_callbacks(execute=True):
+        data_fixture.create_text_field(table=table)
+    table.refresh_from_db()
+    new_model = table.get_model()
+    assert new_model is not model
+    assert len(new_model._field_objects) == 2
+    assert table.get_model() is new_model
+
+    # The cached model is bound to the table instance of the caller.
+    table.name = "Renamed"
+    assert table.get_model().baserow_table is table
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_MODEL_L1_CACHE_SIZE=10)
+def test_in_process_model_cache_binds_table_per_thread(data_fixture):
+    table = data_fixture.create_database_table()
+    other_table = type(table).objects.get(id=table.id)
+    other_table.name = "Uncommitted name"
+    cache = GeneratedModelL1Cache()
+    model = table.get_model(use_cache=False)
+    cache.set(table.id, table.version, model)
+
+    tables_in_thread = []
+
+    def get_model_in_thread():
+        model_in_thread = cache.get(table.id, table=other_table)
+        tables_in_thread.append(model_in_thread.baserow_table)
+
+    thread = Thread(target=get_model_in_thread)
+    thread.start()
+    thread.join()
+
+    # The other thread doesn't change the table of the shared model class for this
+    # thread.
+    assert tables_in_thread == [other_table]
+    assert model.baserow_table is table
+    assert model.objects.create().baserow_table is table
+    assert cache.get(table.id, table=other_table).baserow_table is other_table
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_MODEL_L1_CACHE_SIZE=10)
+def test_in_process_model_cache_ignores_models_of_uncommitted_changes(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    table = data_fixture.create_database_table()
+    generated_models_l1_cache.clear()
+
+    model = table.get_model()
+    assert table.get_model() is model
+
+    # The new field can still be rolled back, so the model including it must not
+    # be cached until the transaction has been committed.
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        data_fixture.create_text_field(table=table)
+        table.refresh_from_db()
+        new_model = table.get_model()
+        assert len(new_model._field_objects) == 1
+        assert table.get_model() is not new_model
+
+    for callback in callbacks:
+        callback()
+
+    new_model = table.get_model()
+    assert table.get_model() is new_model
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_MODEL_L1_CACHE_SIZE=1)
+def test_in_process_model_cache_evicts_least_recently_used(data_fixture):
+    table_a = data_fixture.create_database_table()
+    table_b = data_fixture.create_database_table()
+    generated_models_l1_cache.clear()
+    generated_models_l1_cache.reset_stats()
+
+    model_a = table_a.get_model()
+    table_b.get_model()
+
+    assert generated_models_l1_cache.stats()["size"] == 1
+    assert generated_models_l1_cache.stats()["evictions"] == 1
+    assert table_a.get_model() is not model_a
+
+
+@override_settings(BASEROW_MODEL_L1_CACHE_SIZE=10)
+def test_in_process_model_cache_ignores_outdated_models():
+    cache = GeneratedModelL1Cache()
+    model_v1 = type("ModelV1", (), {"baserow_table": None})
+    model_v2 = type("ModelV2", (), {"baserow_table": None})
+
+    cache.set(1, "v1", model_v1)
+    assert cache.get(1, "v1") is model_v1
+    assert cache.get(1, "v2") is None
+
+    cache._handle_message({"data": '{"table_id": 1, "version": "v2"}'})
+    assert cache.get(1) is None
+
+    # A model generated for the old version while the new version was broadcast
+    # must not end up in the cache.
+    cache.set(1, "v1", model_v1)
+    assert cache.get(1) is None
+
+    cache.set(1, "v2", model_v2)
+    assert cache.get(1) is model_v2
@@ -7,20 +7,31 @@ from django.core.files.storage import FileSystemStorage
 import pytest
 from freezegun import freeze_time
 
+from baserow.contrib.database.api.rows.serializers import (
+    RowSerializer,
+    get_row_serializer_class,
+)
 from baserow.contrib.database.application_types import DatabaseApplicationType
-from baserow.contrib.database.fields.models import FormulaField, TextField
+from baserow.contrib.database.fields.field_types import TextFieldType
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import Field, FormulaField, TextField
+from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.table.models import Table
 from baserow.core.action.models import Action
 from baserow.core.action.registries import action_type_registry
 from baserow.core.actions import CreateApplicationActionType
+from baserow.core.db import specific_iterator
 from baserow.core.handler import CoreHandler
 from baserow.core.models import Template
 from baserow.core.registries import ImportExportConfig, application_type_registry
 from baserow.core.snapshots.handler import SnapshotHandler
 from baserow.core.utils import Progress
-from baserow.test_utils.helpers import setup_interesting_test_database
+from baserow.test_utils.helpers import (
+    assert_serialized_rows_contain_same_values,
+    setup_interesting_test_database,
+)
 
 
 @pytest.mark.django_db
@@ -254,3 +265,86 @@ def test_perform_restore_interesting_database(data_fixture):
         model = snapshotted_table.get_model()
         assert model.objects.count() == 2
     assert progress.progress == 100
+
+
+@pytest.mark.django_db
+def test_export_tables_serialized_only_skips_rows_that_can_be_copied(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True)
+    data_fixture.create_number_field(table=table)
+    table.get_model().objects.create()
+    database_type = application_type_registry.get("database")
+
+    serialized_tables = database_type.export_tables_serialized(
+        [table],
+        ImportExportConfig(include_permission_data=False, copy_rows_in_database=True),
+    )
+    assert serialized_tables[0]["copy_rows_in_database"] is True
+    assert serialized_tables[0]["rows"] == []
+
+    serialized_tables = database_type.export_tables_serialized(
+        [table], ImportExportConfig(include_permission_data=False)
+    )
+    assert "copy_rows_in_database" not in serialized_tables[0]
+    assert len(serialized_tables[0]["rows"]) == 1
+
+    # If any field doesn't support it, the rows must be serialized.
+    with patch.object(TextFieldType, "can_copy_rows_in_database", False):
+        serialized_tables = database_type.export_tables_serialized(
+            [table],
+            ImportExportConfig(
+                include_permission_data=False, copy_rows_in_database=True
+            ),
+        )
+    assert "copy_rows_in_database" not in serialized_tables[0]
+    assert len(serialized_tables[0]["rows"]) == 1
+
+
+@pytest.mark.django_db
+def test_duplicate_interesting_database_copies_rows_in_database(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = setup_interesting_test_database(
+        data_fixture, user=user, workspace=workspace, name="db"
+    )
+    # Remove the fields that don't support it, so that the rows of all the tables
+    # are copied in the database.
+    for field in specific_iterator(Field.objects.filter(table__database=database)):
+        if not field_type_registry.get_by_model(field).can_copy_rows_in_database:
+            FieldHandler().delete_field(user, field, permanently_delete_field=True)
+    table_a = database.table_set.get(name="A")
+    trashed_row = RowHandler().create_row(user=user, table=table_a, values={})
+    RowHandler().delete_row(user, table_a, trashed_row)
+
+    with patch.object(
+        DatabaseApplicationType,
+        "_copy_table_rows_in_database",
+        wraps=DatabaseApplicationType()._copy_table_rows_in_database,
+    ) as copy_table_rows_in_database:
+        duplicated_database = CoreHandler().duplicate_application(user, database)
+    assert copy_table_rows_in_database.call_count == database.table_set.count()
+
+    def table_key(table):
+        return table.name, tuple(sorted(table.field_set.values_list("name", flat=True)))
+
+    duplicated_tables = {
+        table_key(table): table for table in duplicated_database.table_set.all()
+    }
+    for table in database.table_set.all():
+        duplicated_table = duplicated_tables[table_key(table)]
+        model = table.get_model()
+        duplicated_model = duplicated_table.get_model()
+        serializer_class = get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=True
+        )
+        duplicated_serializer_class = get_row_serializer_class(
+            duplicated_model, RowSerializer, is_response=True, user_field_names=True
+        )
+        rows = serializer_class(model.objects.all(), many=True).data
+        duplicated_rows = duplicated_serializer_class(
+            duplicated_model.objects_and_trash.all(), many=True
+        ).data
+        assert len(rows) == len(duplicated_rows) > 0
+        for row, duplicated_row in zip(rows, duplicated_rows):
+            assert row["id"] == duplicated_row["id"]
+            assert_serialized_rows_contain_same_values(row, duplicated_row)
@@ -1,10 +1,14 @@
 import random
 from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.cache import cache
 
 import pytest
 
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
@@ -467,3 +471,158 @@ def test_aggregation_is_updated_when_view_is_trashed(data_fixture):
         user, grid_view_one
     )
     assert field.db_column not in aggregations_restored_view
+
+
+@pytest.mark.django_db
+def test_view_aggregations_are_maintained_with_deltas_on_row_changes(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=1
+    )
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=boolean_field, type="boolean", value="1"
+    )
+    for field, aggregation_type in [
+        (text_field, "empty_count"),
+        (number_field, "sum"),
+        (boolean_field, "not_empty_count"),
+    ]:
+        data_fixture.create_grid_view_field_option(
+            grid_view=grid_view,
+            field=field,
+            aggregation_type="whatever",
+            aggregation_raw_type=aggregation_type,
+        )
+
+    view_handler = ViewHandler()
+    row_handler = RowHandler()
+    model = table.get_model()
+    row_1, row_2 = row_handler.force_create_rows(
+        user,
+        table,
+        [
+            {
+                text_field.db_column: "a",
+                number_field.db_column: 1,
+                boolean_field.db_column: True,
+            },
+            {
+                text_field.db_column: "",
+                number_field.db_column: 2,
+                boolean_field.db_column: False,
+            },
+        ],
+        model=model,
+    )
+
+    def get_cached_values():
+        return {
+            field.db_column: cache.get(
+                view_handler._get_aggregation_value_cache_key(
+                    grid_view, field.db_column
+                )
+            )["value"]
+            for field in [text_field, number_field, boolean_field]
+        }
+
+    def assert_cache_matches_fresh_computation():
+        cached_values = get_cached_values()
+        view_handler.clear_full_aggregation_cache(grid_view)
+        assert cached_values == view_handler.get_view_field_aggregations(
+            user, grid_view
+        )
+
+    assert view_handler.get_view_field_aggregations(user, grid_view) == {
+        text_field.db_column: 0,
+        number_field.db_column: Decimal("1.0"),
+        boolean_field.db_column: 1,
+    }
+
+    with patch.object(
+        ViewHandler, "get_field_aggregations", wraps=view_handler.get_field_aggregations
+    ) as get_field_aggregations:
+        with django_capture_on_commit_callbacks(execute=True):
+            (row_3,) = row_handler.force_create_rows(
+                user,
+                table,
+                [
+                    {
+                        text_field.db_column: "",
+                        number_field.db_column: 10,
+                        boolean_field.db_column: True,
+                    }
+                ],
+                model=model,
+            )
+        with django_capture_on_commit_callbacks(execute=True):
+            row_handler.force_update_rows(
+                user,
+                table,
+                [
+                    {"id": row_1.id, number_field.db_column: 5},
+                    {"id": row_2.id, boolean_field.db_column: True},
+                ],
+                model=model,
+            )
+        with django_capture_on_commit_callbacks(execute=True):
+            row_handler.delete_rows(user, table, [row_3.id], model=model)
+
+        assert get_cached_values() == {
+            text_field.db_column: 1,
+            number_field.db_column: Decimal("7.0"),
+            boolean_field.db_column: 2,
+        }
+        # The values have been maintained without recomputing the aggregations.
+        assert view_handler.get_view_field_aggregations(user, grid_view) == (
+            get_cached_values()
+        )
+        get_field_aggregations.assert_not_called()
+
+    assert_cache_matches_fresh_computation()
+
+
+@pytest.mark.django_db
+def test_view_aggregations_without_delta_maintenance(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    formula_field = data_fixture.create_formula_field(
+        table=table, formula=f"field('{number_field.name}') * 2"
+    )
+    filtered_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=filtered_view, field=formula_field, type="higher_than", value="2"
+    )
+    view = data_fixture.create_grid_view(table=table)
+    for grid_view in [filtered_view, view]:
+        for field, aggregation_type in [
+            (number_field, "sum"),
+            (formula_field, "sum"),
+        ]:
+            data_fixture.create_grid_view_field_option(
+                grid_view=grid_view,
+                field=field,
+                aggregation_type="whatever",
+                aggregation_raw_type=aggregation_type,
+            )
+
+    # Values of read only fields can depend on other rows and views filtering on
+    # them can't know whether a row enters or leaves the view.
+    assert ViewHandler().get_aggregations_with_delta_maintenance(
+        table, table.get_model()
+    ) == [(view, [(number_field, "sum")])]
+
+    filtered_view.filters_disabled = True
+    filtered_view.save()
+    assert ViewHandler().get_aggregations_with_delta_maintenance(
+        table, table.get_model()
+    ) == [
+        (filtered_view, [(number_field, "sum")]),
+        (view, [(number_field, "sum")]),
+    ]
@@ -4001,6 +4001,61 @@ def test_get_group_by_metadata_in_rows(data_fixture):
     }
 
 
+@pytest.mark.django_db
+def test_get_group_by_metadata_in_rows_of_page(data_fixture, django_assert_num_queries):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, name="Color")
+    number_field = data_fixture.create_number_field(table=table, name="Horsepower")
+    boolean_field = data_fixture.create_boolean_field(table=table, name="For sale")
+
+    model = table.get_model()
+    for color, horsepower, for_sale in [
+        ("Green", 10, False),
+        ("Green", 10, True),
+        ("Green", 10, True),
+        ("Green", 20, True),
+        ("Orange", 10, True),
+        ("Red", 10, True),
+    ]:
+        model.objects.create(
+            **{
+                text_field.db_column: color,
+                number_field.db_column: horsepower,
+                boolean_field.db_column: for_sale,
+            }
+        )
+
+    queryset = model.objects.all().order_by("id")
+    # The rows outside the page must be counted as well, but the groups that
+    # don't have a row in the page must not be returned.
+    rows = list(queryset[1:3])
+
+    with django_assert_num_queries(1):
+        counts = ViewHandler().get_group_by_metadata_in_rows(
+            [text_field, number_field, boolean_field], rows, queryset
+        )
+
+    assert counts == {
+        text_field: [{text_field.db_column: "Green", "count": 4}],
+        number_field: [
+            {
+                text_field.db_column: "Green",
+                number_field.db_column: Decimal("10"),
+                "count": 3,
+            }
+        ],
+        boolean_field: [
+            {
+                text_field.db_column: "Green",
+                number_field.db_column: Decimal("10"),
+                boolean_field.db_column: True,
+                "count": 2,
+            }
+        ],
+    }
+    assert ViewHandler().get_group_by_metadata_in_rows([text_field], [], queryset) == {}
+
+
 @pytest.mark.django_db
 def test_get_group_by_on_all_fields_in_interesting_table(data_fixture):
     table, *_ = setup_interesting_test_table(data_fixture)
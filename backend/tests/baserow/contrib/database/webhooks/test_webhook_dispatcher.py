@@ -0,0 +1,262 @@
+import json
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from django.test import override_settings
+from django.utils import timezone
+
+import pytest
+
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.webhooks.dispatcher import WebhookDispatcher
+from baserow.contrib.database.webhooks.models import (
+    TableWebhookCall,
+    TableWebhookPendingCall,
+)
+from baserow.contrib.database.webhooks.tasks import dispatch_pending_webhook_calls
+
+
+class WebhookTargetServer(ThreadingHTTPServer):
+    """
+    A local HTTP server that stands in for the webhook targets. The path of the
+    request determines the response status code, and the maximum number of requests
+    that have been handled at the same time is tracked.
+    """
+
+    def __init__(self, delay=0.0):
+        super().__init__(("127.0.0.1", 0), WebhookTargetRequestHandler)
+        self.delay = delay
+        self.requests = []
+        self.concurrent_requests = 0
+        self.max_concurrent_requests = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class WebhookTargetRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        with server.lock:
+            server.concurrent_requests += 1
+            server.max_concurrent_requests = max(
+                server.max_concurrent_requests, server.concurrent_requests
+            )
+
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(server.delay)
+
+        with server.lock:
+            server.concurrent_requests -= 1
+            server.requests.append((self.path, dict(self.headers), json.loads(body)))
+
+        response = json.dumps({"received": True}).encode("utf-8")
+        self.send_response(500 if self.path == "/fail" else 200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def webhook_target_server():
+    servers = []
+
+    def start(delay=0.0):
+        server = WebhookTargetServer(delay=delay)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def get_call(webhook, url, event_id="00000000-0000-0000-0000-000000000000"):
+    return {
+        "webhook_id": webhook.id,
+        "event_id": event_id,
+        "event_type": "rows.created",
+        "method": "POST",
+        "url": url,
+        "headers": {"Baserow-header-1": "Value 1"},
+        "payload": {"type": "rows.created"},
+    }
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True)
+def test_dispatch_pending_webhook_calls(
+    data_fixture, webhook_target_server, enable_singleton_testing
+):
+    server = webhook_target_server()
+    webhook = data_fixture.create_table_webhook(failed_triggers=2)
+    failing_webhook = data_fixture.create_table_webhook()
+
+    WebhookDispatcher().enqueue_calls(
+        [
+            get_call(webhook, f"{server.url}/ok"),
+            get_call(failing_webhook, f"{server.url}/fail"),
+        ]
+    )
+
+    assert len(server.requests) == 2
+    path, headers, payload = sorted(server.requests)[1]
+    assert path == "/ok"
+    assert headers["Baserow-header-1"] == "Value 1"
+    assert payload == {"type": "rows.created"}
+
+    call = TableWebhookCall.objects.get(webhook=webhook)
+    assert call.event_type == "rows.created"
+    assert call.called_time
+    assert call.called_url == f"{server.url}/ok"
+    assert f"POST {server.url}/ok" in call.request
+    assert "Baserow-header-1: Value 1" in call.request
+    assert '"received": true' in call.response
+    assert call.response_status == 200
+    assert call.error == ""
+    webhook.refresh_from_db()
+    assert webhook.failed_triggers == 0
+    assert not TableWebhookPendingCall.objects.filter(webhook=webhook).exists()
+
+    # The failed call must be retried later with a backoff.
+    failed_call = TableWebhookCall.objects.get(webhook=failing_webhook)
+    assert failed_call.response_status == 500
+    failing_webhook.refresh_from_db()
+    assert failing_webhook.failed_triggers == 1
+    pending_call = TableWebhookPendingCall.objects.get(webhook=failing_webhook)
+    assert pending_call.attempts == 1
+    assert pending_call.next_attempt_at > timezone.now()
+
+    # Retrying the call updates the existing call log entry.
+    pending_call.next_attempt_at = timezone.now()
+    pending_call.save()
+    dispatch_pending_webhook_calls()
+    assert len(server.requests) == 3
+    assert TableWebhookCall.objects.filter(webhook=failing_webhook).count() == 1
+    pending_call.refresh_from_db()
+    assert pending_call.attempts == 2
+    failing_webhook.refresh_from_db()
+    assert failing_webhook.failed_triggers == 2
+
+
+@pytest.mark.django_db
+@override_settings(
+    BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True,
+    BASEROW_WEBHOOKS_MAX_RETRIES_PER_CALL=1,
+    BASEROW_WEBHOOKS_MAX_CONSECUTIVE_TRIGGER_FAILURES=1,
+)
+def test_dispatch_pending_webhook_calls_gives_up_and_deactivates_webhook(
+    data_fixture, webhook_target_server
+):
+    server = webhook_target_server()
+    webhook = data_fixture.create_table_webhook(failed_triggers=1)
+    TableWebhookPendingCall.objects.create(
+        **get_call(webhook, f"{server.url}/fail"),
+        attempts=1,
+        next_attempt_at=timezone.now() - timedelta(seconds=1),
+    )
+
+    WebhookDispatcher().dispatch_due_calls()
+
+    assert len(server.requests) == 1
+    assert not TableWebhookPendingCall.objects.exists()
+    webhook.refresh_from_db()
+    assert webhook.active is False
+
+
+@pytest.mark.django_db
+@override_settings(
+    BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True,
+    BASEROW_WEBHOOKS_BATCH_SIZE=4,
+    BASEROW_WEBHOOKS_BATCH_MAX_CONNECTIONS_PER_HOST=2,
+)
+def test_dispatch_pending_webhook_calls_limits_concurrency_per_host(
+    data_fixture, webhook_target_server
+):
+    server = webhook_target_server(delay=0.05)
+    webhook = data_fixture.create_table_webhook()
+    now = timezone.now()
+    TableWebhookPendingCall.objects.bulk_create(
+        [
+            TableWebhookPendingCall(
+                **get_call(webhook, f"{server.url}/ok", event_id=f"{i:032}"),
+                next_attempt_at=now,
+            )
+            for i in range(10)
+        ]
+    )
+
+    assert WebhookDispatcher().dispatch_due_calls() is None
+
+    assert len(server.requests) == 10
+    assert server.max_concurrent_requests == 2
+    assert TableWebhookCall.objects.filter(response_status=200).count() == 10
+
+
+@pytest.mark.django_db
+def test_dispatch_pending_webhook_calls_to_private_address_not_allowed(
+    data_fixture, webhook_target_server
+):
+    server = webhook_target_server()
+    webhook = data_fixture.create_table_webhook()
+    TableWebhookPendingCall.objects.create(
+        **get_call(webhook, f"{server.url}/ok"), next_attempt_at=timezone.now()
+    )
+
+    WebhookDispatcher().dispatch_due_calls()
+
+    assert len(server.requests) == 0
+    call = TableWebhookCall.objects.get(webhook=webhook)
+    assert call.error.startswith("UnacceptableAddressException")
+    assert call.request is None
+    assert call.response_status is None
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_WEBHOOKS_BATCH_DISPATCH=True)
+@patch("baserow.contrib.database.webhooks.registries.call_webhook")
+@patch(
+    "baserow.contrib.database.webhooks.tasks.schedule_pending_webhook_calls_dispatch"
+)
+def test_webhook_calls_are_enqueued_in_batch_dispatch_mode(
+    mock_schedule_dispatch, mock_call_webhook, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, primary=True)
+    webhook_1 = data_fixture.create_table_webhook(
+        table=table, include_all_events=True, use_user_field_names=False
+    )
+    webhook_2 = data_fixture.create_table_webhook(
+        table=table, include_all_events=True, use_user_field_names=False
+    )
+
+    row = RowHandler().create_row(
+        user=user, table=table, values={f"field_{field.id}": "Test"}
+    )
+
+    mock_call_webhook.delay.assert_not_called()
+    mock_schedule_dispatch.assert_called_once()
+    pending_calls = list(TableWebhookPendingCall.objects.all())
+    assert [call.webhook_id for call in pending_calls] == [webhook_1.id, webhook_2.id]
+    assert pending_calls[0].event_id == pending_calls[1].event_id
+    assert pending_calls[0].event_type == "rows.created"
+    assert pending_calls[0].method == "POST"
+    assert pending_calls[0].url == webhook_1.url
+    assert pending_calls[0].headers["X-Baserow-Event"] == "rows.created"
+    assert pending_calls[0].payload["items"][0]["id"] == row.id
+    assert pending_calls[0].attempts == 0
@@ -0,0 +1,210 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from fakeredis import FakeRedis, FakeServer
+
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.ws.rows.coalescer import RowEventCoalescer
+from baserow.contrib.database.ws.rows.tasks import flush_coalesced_row_events
+from baserow.ws.registries import page_registry
+
+
+@pytest.fixture
+def fake_coalescer_redis(settings):
+    settings.BASEROW_WS_ROW_EVENTS_COALESCE_MS = 50
+    redis_client = FakeRedis(server=FakeServer())
+    with patch(
+        "baserow.contrib.database.ws.rows.coalescer._get_redis_client",
+        lambda: redis_client,
+    ), patch.object(RowEventCoalescer, "is_enabled", lambda: True):
+        yield redis_client
+
+
+def _event(payload, ignore_web_socket_id="ws-1", exclude_user_ids=None):
+    return {
+        "payload": payload,
+        "ignore_web_socket_id": ignore_web_socket_id,
+        "exclude_user_ids": exclude_user_ids,
+    }
+
+
+def _rows_created(*row_ids, before_row_id=None):
+    return {
+        "type": "rows_created",
+        "table_id": 1,
+        "rows": [{"id": row_id} for row_id in row_ids],
+        "metadata": {},
+        "before_row_id": before_row_id,
+    }
+
+
+def _rows_updated(*rows):
+    return {
+        "type": "rows_updated",
+        "table_id": 1,
+        "rows_before_update": [
+            {"id": row_id, "v": before} for row_id, before, _ in rows
+        ],
+        "rows": [{"id": row_id, "v": after} for row_id, _, after in rows],
+        "metadata": {str(row_id): {"v": after} for row_id, _, after in rows},
+    }
+
+
+def _rows_deleted(*row_ids):
+    return {
+        "type": "rows_deleted",
+        "table_id": 1,
+        "row_ids": list(row_ids),
+        "rows": [{"id": row_id} for row_id in row_ids],
+    }
+
+
+def test_coalesce_row_events():
+    coalesced = RowEventCoalescer.coalesce_events(
+        [
+            _event(_rows_created(1)),
+            _event(_rows_created(2)),
+            _event(_rows_created(3, before_row_id=1)),
+            _event(_rows_updated((1, "a", "b"), (2, "a", "b"))),
+            _event(_rows_updated((1, "b", "c"), (3, "a", "b"))),
+            _event(_rows_updated((4, "a", "b")), ignore_web_socket_id="ws-2"),
+            _event({"type": "row_orders_recalculated", "table_id": 1}),
+            _event({"type": "row_orders_recalculated", "table_id": 1}),
+        ]
+    )
+
+    assert coalesced == [
+        _event(_rows_created(1, 2)),
+        _event(_rows_created(3, before_row_id=1)),
+        _event(
+            {
+                "type": "rows_updated",
+                "table_id": 1,
+                "rows_before_update": [
+                    {"id": 1, "v": "a"},
+                    {"id": 2, "v": "a"},
+                    {"id": 3, "v": "a"},
+                ],
+                "rows": [
+                    {"id": 1, "v": "c"},
+                    {"id": 2, "v": "b"},
+                    {"id": 3, "v": "b"},
+                ],
+                "metadata": {"1": {"v": "c"}, "2": {"v": "b"}, "3": {"v": "b"}},
+            }
+        ),
+        _event(_rows_updated((4, "a", "b")), ignore_web_socket_id="ws-2"),
+        _event({"type": "row_orders_recalculated", "table_id": 1}),
+        _event({"type": "row_orders_recalculated", "table_id": 1}),
+    ]
+
+
+def test_coalesce_row_events_drops_updates_of_deleted_rows():
+    coalesced = RowEventCoalescer.coalesce_events(
+        [
+            _event(_rows_updated((1, "a", "b"), (2, "a", "b"))),
+            _event(_rows_updated((3, "a", "b")), ignore_web_socket_id="ws-2"),
+            _event(_rows_deleted(1, 3)),
+            _event(_rows_deleted(3, 4)),
+        ]
+    )
+
+    assert coalesced == [
+        _event(_rows_updated((2, "a", "b"))),
+        _event(_rows_deleted(1, 3, 4)),
+    ]
+
+
+def test_row_events_are_buffered_until_flushed(fake_coalescer_redis):
+    assert RowEventCoalescer.buffer_event(1, _rows_created(1), "ws-1") is True
+    assert RowEventCoalescer.buffer_event(1, _rows_created(2), "ws-1") is False
+    assert RowEventCoalescer.buffer_event(2, _rows_created(3)) is True
+
+    assert RowEventCoalescer.claim_events(1) == [
+        _event(_rows_created(1)),
+        _event(_rows_created(2)),
+    ]
+    assert RowEventCoalescer.claim_events(1) == []
+
+    # An event after the buffer has been claimed needs a new flush.
+    assert RowEventCoalescer.buffer_event(1, _rows_created(4), "ws-1") is True
+    assert RowEventCoalescer.claim_events(2) == [_event(_rows_created(3), None)]
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.tasks.broadcast_to_channel_group")
+@patch("baserow.contrib.database.ws.rows.tasks.flush_coalesced_row_events.apply_async")
+def test_row_changes_are_broadcast_as_coalesced_messages(
+    mock_apply_async, mock_broadcast, fake_coalescer_redis, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, primary=True)
+
+    handler = RowHandler()
+    row_1 = handler.create_row(user, table, {field.db_column: "Tesla"})
+    row_2 = handler.create_row(user, table, {field.db_column: "Curie"})
+    handler.update_row_by_id(user, table, row_1.id, {field.db_column: "Edison"})
+    handler.update_row_by_id(user, table, row_1.id, {field.db_column: "Bohr"})
+    handler.update_row_by_id(user, table, row_2.id, {field.db_column: "Planck"})
+    handler.delete_row_by_id(user, table, row_2.id)
+
+    mock_apply_async.assert_called_once_with((table.id,), countdown=0.05)
+    mock_broadcast.assert_not_called()
+
+    flush_coalesced_row_events(table.id)
+
+    group_name = f"table-{table.id}"
+    assert [call.args[0] for call in mock_broadcast.call_args_list] == [group_name] * 3
+    created, updated, deleted = [call.args[1] for call in mock_broadcast.call_args_list]
+    assert created["type"] == "rows_created"
+    assert [row["id"] for row in created["rows"]] == [row_1.id, row_2.id]
+    assert updated["type"] == "rows_updated"
+    assert updated["rows_before_update"][0][field.db_column] == "Tesla"
+    assert updated["rows"][0][field.db_column] == "Bohr"
+    assert [row["id"] for row in updated["rows"]] == [row_1.id]
+    assert deleted == {
+        "type": "rows_deleted",
+        "table_id": table.id,
+        "row_ids": [row_2.id],
+        "rows": [deleted["rows"][0]],
+    }
+
+    mock_broadcast.reset_mock()
+    flush_coalesced_row_events(table.id)
+    mock_broadcast.assert_not_called()
+
+
+def test_buffered_row_events_keep_their_values(fake_coalescer_redis):
+    payload = _rows_created(1)
+    payload["rows"][0]["amount"] = Decimal("1.50")
+    payload["rows"][0]["updated_on"] = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+    RowEventCoalescer.buffer_event(1, payload, "ws-1")
+
+    assert RowEventCoalescer.claim_events(1) == [_event(payload)]
+
+
+@patch("baserow.ws.tasks.broadcast_to_channel_group")
+@patch("baserow.contrib.database.ws.rows.tasks.flush_coalesced_row_events.delay")
+def test_other_table_page_events_flush_the_buffered_row_events(
+    mock_delay, mock_broadcast, fake_coalescer_redis
+):
+    RowEventCoalescer.buffer_event(1, _rows_updated((1, "a", "b")), "ws-1")
+    field_deleted = {"type": "field_deleted", "table_id": 1, "field_id": 2}
+
+    page_registry.get("table").broadcast(
+        field_deleted, "ws-2", exclude_user_ids=[3], table_id=1
+    )
+
+    mock_delay.assert_called_once_with(1)
+    mock_broadcast.assert_not_called()
+
+    flush_coalesced_row_events(1)
+
+    assert [call.args for call in mock_broadcast.call_args_list] == [
+        ("table-1", _rows_updated((1, "a", "b")), "ws-1", None),
+        ("table-1", field_deleted, "ws-2", [3]),
+    ]
@@ -9,6 +9,7 @@ from freezegun import freeze_time
 from rest_framework import serializers
 from rest_framework.fields import Field
 
+from baserow.contrib.database.api.rows.serializers import CompiledRowSerializer
 from baserow.contrib.database.rows.actions import UpdateRowsActionType
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.rows.registries import (
@@ -162,6 +163,48 @@ def test_row_updated_with_metadata(mock_broadcast_to_channel_group, data_fixture
     assert args[0][1]["metadata"] == {1: {"row_id": row.id}}
 
 
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.contrib.database.webhooks.registries.call_webhook")
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_updated_are_serialized_once_for_all_receivers(
+    mock_broadcast_to_channel_group, mock_call_webhook, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table, primary=True)
+    data_fixture.create_grid_view(table=table, public=True)
+    data_fixture.create_table_webhook(
+        table=table, include_all_events=True, use_user_field_names=False
+    )
+    model = table.get_model()
+    rows = [model.objects.create(**{f"field_{field.id}": "a"}) for _ in range(3)]
+
+    with patch.object(
+        CompiledRowSerializer,
+        "to_representation",
+        autospec=True,
+        side_effect=CompiledRowSerializer.to_representation,
+    ) as mock_to_representation, transaction.atomic():
+        RowHandler().update_rows(
+            user,
+            table,
+            [{"id": row.id, f"field_{field.id}": "b"} for row in rows],
+            model=model,
+        )
+
+    # The rows are serialized once before and once after the update, even though
+    # the realtime, public view and webhook receivers all need them.
+    assert mock_to_representation.call_count == 6
+    assert mock_call_webhook.delay.call_count == 1
+    payload = mock_call_webhook.delay.call_args[1]["payload"]
+    assert [item[f"field_{field.id}"] for item in payload["items"]] == ["b"] * 3
+    assert [item[f"field_{field.id}"] for item in payload["old_items"]] == ["a"] * 3
+    broadcast_types = [
+        c[0][1]["type"] for c in mock_broadcast_to_channel_group.delay.call_args_list
+    ]
+    assert broadcast_types == ["rows_updated", "rows_updated"]
+
+
 @pytest.mark.django_db(transaction=True)
 @patch("baserow.ws.registries.broadcast_to_channel_group")
 def test_row_deleted(mock_broadcast_to_channel_group, data_fixture):
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -7,6 +7,7 @@ from baserow.contrib.builder.data_sources.service import DataSourceService
 from baserow.contrib.builder.elements.registries import element_type_registry
 from baserow.contrib.builder.elements.service import ElementService
 from baserow.contrib.builder.pages.service import PageService
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.handler import TableHandler
 from baserow.contrib.database.views.models import SORT_ORDER_ASC, SORT_ORDER_DESC
@@ -611,6 +612,182 @@ def test_local_baserow_list_rows_service_dispatch_data_with_pagination(
     assert dispatch_data["has_next_page"] is False
 
 
+@pytest.mark.django_db
+def test_local_baserow_list_rows_service_dispatch_cache(
+    data_fixture, settings, django_capture_on_commit_callbacks
+):
+    settings.BASEROW_LOCAL_BASEROW_DISPATCH_CACHE_TTL = 60
+    user = data_fixture.create_user()
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        application=builder, user=user
+    )
+    database = data_fixture.create_database_application(workspace=builder.workspace)
+    table = TableHandler().create_table_and_fields(
+        user=user,
+        database=database,
+        name=data_fixture.fake.name(),
+        fields=[("Ingredient", "text", {})],
+    )
+    field = table.field_set.get(name="Ingredient")
+    RowHandler().create_rows(user, table, rows_values=[{field.db_column: "Cheese"}])
+    linked_table = data_fixture.create_database_table(database=database)
+    linked_primary = data_fixture.create_text_field(table=linked_table, primary=True)
+    FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=linked_table
+    )
+
+    service_type = LocalBaserowListRowsUserServiceType()
+    service = data_fixture.create_local_baserow_list_rows_service(
+        table=table, integration=integration, search_query="get('test2')"
+    )
+    data_fixture.create_local_baserow_table_service_filter(
+        service=service,
+        field=field,
+        value="get('test999')",
+        value_is_formula=True,
+        order=0,
+    )
+
+    def dispatch(dispatch_context=None):
+        with patch.object(
+            service_type, "dispatch_data", wraps=service_type.dispatch_data
+        ) as dispatch_data:
+            result = service_type.dispatch(
+                service, dispatch_context or FakeDispatchContext()
+            )
+        return result, dispatch_data.called
+
+    # The dispatches in the editor are not cached.
+    assert dispatch()[1] is True
+    assert dispatch()[1] is True
+
+    # Only the dispatches of published applications are.
+    builder.workspace = None
+    builder.save()
+
+    result, queried = dispatch()
+    assert queried
+    assert result["results"] == []
+
+    # The same dispatch is served from the cache.
+    assert dispatch() == (result, False)
+
+    # A different resolved formula value, range or user role changes the key.
+    fake_dispatch = FakeDispatchContext()
+    fake_dispatch.range = Mock(return_value=[0, 5])
+    assert dispatch(fake_dispatch)[1] is True
+
+    fake_dispatch = FakeDispatchContext()
+    fake_dispatch.request = MagicMock()
+    fake_dispatch.request.user_source_user.is_authenticated = True
+    fake_dispatch.request.user_source_user.role = "Editor"
+    assert dispatch(fake_dispatch)[1] is True
+    assert dispatch(fake_dispatch)[1] is False
+
+    # Changing the rows of the table invalidates the cache once committed.
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().create_rows(user, table, rows_values=[{field.db_column: "999"}])
+
+    result, queried = dispatch()
+    assert queried
+    assert [r[field.db_column] for r in result["results"]] == ["999"]
+    assert dispatch() == (result, False)
+
+    # And so does changing the fields of the table.
+    with django_capture_on_commit_callbacks(execute=True):
+        FieldHandler().update_field(user, field.specific, new_name="Name")
+
+    assert dispatch()[1] is True
+    assert dispatch()[1] is False
+
+    # And changing the rows of a table that the fields of the table read from.
+    with django_capture_on_commit_callbacks(execute=True):
+        RowHandler().create_rows(
+            user, linked_table, rows_values=[{linked_primary.db_column: "Milk"}]
+        )
+
+    assert dispatch()[1] is True
+    assert dispatch()[1] is False
+
+    # Or updating the table.
+    with django_capture_on_commit_callbacks(execute=True):
+        TableHandler().update_table(user, linked_table, name="Renamed")
+
+    assert dispatch()[1] is True
+
+
+@pytest.mark.django_db
+def test_local_baserow_list_rows_service_dispatch_cache_checks_permissions(
+    data_fixture, settings
+):
+    settings.BASEROW_LOCAL_BASEROW_DISPATCH_CACHE_TTL = 60
+    user = data_fixture.create_user()
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        application=builder, user=user
+    )
+    database = data_fixture.create_database_application(workspace=builder.workspace)
+    table = data_fixture.create_database_table(database=database)
+    builder.workspace = None
+    builder.save()
+    service_type = LocalBaserowListRowsUserServiceType()
+    service = data_fixture.create_local_baserow_list_rows_service(
+        table=table, integration=integration
+    )
+
+    service_type.dispatch(service, FakeDispatchContext())
+
+    database.workspace.workspaceuser_set.all().delete()
+    service.integration.refresh_from_db()
+
+    with pytest.raises(PermissionException):
+        service_type.dispatch(service, FakeDispatchContext())
+
+
+@pytest.mark.django_db
+def test_local_baserow_list_rows_service_dispatch_cache_hit_queries(
+    data_fixture, settings, django_assert_num_queries
+):
+    settings.BASEROW_LOCAL_BASEROW_DISPATCH_CACHE_TTL = 60
+    user = data_fixture.create_user()
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        application=builder, user=user
+    )
+    database = data_fixture.create_database_application(workspace=builder.workspace)
+    table = data_fixture.create_database_table(database=database)
+    field = data_fixture.create_text_field(table=table, primary=True)
+    linked_table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(table=linked_table, primary=True)
+    FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=linked_table
+    )
+    service = data_fixture.create_local_baserow_list_rows_service(
+        table=table, integration=integration
+    )
+    data_fixture.create_local_baserow_table_service_filter(
+        service=service,
+        field=field,
+        value="get('test')",
+        value_is_formula=True,
+        order=0,
+    )
+    data_fixture.create_local_baserow_table_service_sort(
+        service=service, field=field, order_by=SORT_ORDER_ASC, order=0
+    )
+    builder.workspace = None
+    builder.save()
+    service_type = LocalBaserowListRowsUserServiceType()
+    result = service_type.dispatch(service, FakeDispatchContext())
+
+    # A hit only loads the integration, its application and the table, and checks
+    # the permissions. The filters, sortings, dependencies and rows aren't queried.
+    service = LocalBaserowListRows.objects.get(id=service.id)
+    with django_assert_num_queries(8):
+        assert service_type.dispatch(service, FakeDispatchContext()) == result
+
+
 @pytest.mark.django_db
 def test_local_baserow_list_rows_service_import_context_path(data_fixture):
     local_baserow_list_rows_service = LocalBaserowListRowsUserServiceType()
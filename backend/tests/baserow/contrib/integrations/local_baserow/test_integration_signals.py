@@ -3,6 +3,11 @@ import pytest
 from baserow.contrib.database.fields.field_types import UUIDFieldType
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.table.handler import TableHandler
+from baserow.contrib.database.views.handler import ViewHandler
+from baserow.contrib.integrations.local_baserow.cache import (
+    get_dispatch_dependency_table_ids,
+    get_table_dispatch_cache_version,
+)
 
 
 @pytest.mark.django_db()
@@ -29,3 +34,87 @@ def test_local_baserow_upsert_row_handle_field_mapping_field_changes(
     # Changing from a writable field to a read-only field deletes the mapping.
     FieldHandler().update_field(user, field, UUIDFieldType.type)
     assert service.field_mappings.filter(pk=mapping.pk).exists() is False
+
+
+@pytest.mark.django_db()
+def test_local_baserow_dispatch_cache_invalidated_on_view_changes(
+    data_fixture, settings, django_capture_on_commit_callbacks
+):
+    settings.BASEROW_LOCAL_BASEROW_DISPATCH_CACHE_TTL = 60
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(table=table)
+    view = data_fixture.create_grid_view(table=table)
+    version = get_table_dispatch_cache_version(table.id)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ViewHandler().create_filter(user, view, field, "equal", "test")
+
+    assert get_table_dispatch_cache_version(table.id) != version
+    version = get_table_dispatch_cache_version(table.id)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ViewHandler().create_sort(user, view, field, "ASC")
+
+    assert get_table_dispatch_cache_version(table.id) != version
+
+
+@pytest.mark.django_db()
+def test_local_baserow_dispatch_cache_invalidated_on_table_changes(
+    data_fixture, settings, django_capture_on_commit_callbacks
+):
+    settings.BASEROW_LOCAL_BASEROW_DISPATCH_CACHE_TTL = 60
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    version = get_table_dispatch_cache_version(table.id)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        TableHandler().update_table(user, table, name="Renamed")
+
+    assert get_table_dispatch_cache_version(table.id) != version
+    version = get_table_dispatch_cache_version(table.id)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        TableHandler().delete_table(user, table)
+
+    assert get_table_dispatch_cache_version(table.id) != version
+
+
+@pytest.mark.django_db()
+def test_local_baserow_dispatch_dependency_table_ids(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    linked_table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(table=linked_table, primary=True)
+    other_table = data_fixture.create_database_table(database=database)
+    other_primary = data_fixture.create_text_field(table=other_table, primary=True)
+    unrelated_table = data_fixture.create_database_table(database=database)
+
+    assert get_dispatch_dependency_table_ids(table.id) == {table.id}
+
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=linked_table
+    )
+    assert get_dispatch_dependency_table_ids(table.id) == {table.id, linked_table.id}
+
+    # The tables that the linked table reads from are dependencies as well.
+    other_link_field = FieldHandler().create_field(
+        user, linked_table, "link_row", name="Other", link_row_table=other_table
+    )
+    FieldHandler().create_field(
+        user,
+        linked_table,
+        "formula",
+        name="Lookup",
+        formula=f"lookup('{other_link_field.name}', '{other_primary.name}')",
+    )
+    assert get_dispatch_dependency_table_ids(table.id) == {
+        table.id,
+        linked_table.id,
+        other_table.id,
+    }
+    assert unrelated_table.id not in get_dispatch_dependency_table_ids(table.id)
+
+    FieldHandler().delete_field(user, link_field)
+    assert get_dispatch_dependency_table_ids(table.id) == {table.id}
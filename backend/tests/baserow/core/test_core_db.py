@@ -20,6 +20,7 @@ from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.models import GalleryView, GridView, View
 from baserow.core.db import (
     CombinedForeignKeyAndManyToManyMultipleFieldPrefetch,
+    KeysetPaginator,
     LockedAtomicTransaction,
     MultiFieldPrefetchQuerysetMixin,
     QuerySet,
@@ -646,3 +647,100 @@ def test_multiple_field_prefetch__many_to_many_missing_source(data_fixture):
     )
     row = rows[0]
     assert len(row.field.all()) == 1
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_matches_offset_pagination(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    model = table.get_model()
+    values = ["b", None, "a", "b", None, "c", "a", "b"]
+    numbers = [3, 1, None, 1, 2, None, 5, 3]
+    for text, number in zip(values, numbers):
+        model.objects.create(
+            **{f"field_{text_field.id}": text, f"field_{number_field.id}": number}
+        )
+
+    for order_string in [
+        "",
+        f"field_{text_field.id}",
+        f"-field_{text_field.id}",
+        f"field_{number_field.id},-field_{text_field.id}",
+        f"-field_{number_field.id},field_{text_field.id}",
+    ]:
+        queryset = model.objects.all()
+        if order_string:
+            queryset = queryset.order_by_fields_string(order_string)
+        expected_ids = [row.id for row in queryset]
+
+        paginator = KeysetPaginator(queryset)
+        ids, after = [], None
+        while True:
+            rows, after = paginator.get_page(after, 3)
+            ids.extend(row.id for row in rows)
+            if after is None:
+                break
+
+        assert ids == expected_ids, order_string
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_uses_row_value_comparison_for_order_and_id(
+    data_fixture,
+):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+
+    paginator = KeysetPaginator(model.objects.all())
+    condition = paginator.get_after_condition([1, 10])
+    sql = str(model.objects.filter(condition).query)
+
+    assert '("database_table_' in sql
+    assert '"order", ' in sql
+    assert ") > (" in sql
+
+
+@pytest.mark.django_db
+def test_keyset_paginator_uses_offset_for_array_ordering(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    table_2 = data_fixture.create_database_table(user=user, database=table.database)
+    looked_up_field = data_fixture.create_text_field(table=table_2, primary=True)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=table_2
+    )
+    lookup_field = FieldHandler().create_field(
+        user,
+        table,
+        "lookup",
+        name="Lookup",
+        through_field_id=link_field.id,
+        target_field_id=looked_up_field.id,
+    )
+    related_rows = RowHandler().force_create_rows(
+        user, table_2, [{looked_up_field.db_column: value} for value in ["b", "a"]]
+    )
+    RowHandler().force_create_rows(
+        user,
+        table,
+        [{link_field.db_column: [related_rows[index].id]} for index in [0, 1, 0, 1]],
+    )
+
+    queryset = (
+        table.get_model()
+        .objects.all()
+        .order_by_fields_string(f"field_{lookup_field.id}")
+    )
+    paginator = KeysetPaginator(queryset)
+    assert paginator.can_seek is False
+    assert KeysetPaginator(table.get_model().objects.all()).can_seek is True
+
+    rows, after = paginator.get_page(None, 3)
+    assert after == [3]
+    next_rows, after = paginator.get_page(after, 3)
+    assert after is None
+    assert [row.id for row in rows + next_rows] == [row.id for row in queryset]
+
+    with pytest.raises(ValueError):
+        paginator.get_page(["a", 1], 3)
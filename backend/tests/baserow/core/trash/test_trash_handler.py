@@ -1,4 +1,7 @@
-from django.db import OperationalError, connection
+import threading
+from unittest.mock import patch
+
+from django.db import OperationalError, connection, transaction
 from django.utils import timezone
 
 import pytest
@@ -15,6 +18,7 @@ from baserow.core.trash.exceptions import (
     PermanentDeletionMaxLocksExceededException,
 )
 from baserow.core.trash.handler import TrashHandler, _get_trash_entry
+from baserow.core.trash.tasks import schedule_permanent_deletion_of_marked_trash
 
 
 @pytest.mark.django_db
@@ -518,3 +522,190 @@ def test_permanently_delete_item_raises_operationalerror(
             TrashHandler.try_perm_delete_trash_entry(
                 trash_entry, trash_item_lookup_cache
             )
+
+
+@pytest.mark.django_db
+def test_perm_deleting_marked_trash_in_batches(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    other_workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    tables = [data_fixture.create_database_table(database=database) for _ in range(3)]
+    other_database = data_fixture.create_database_application(workspace=other_workspace)
+
+    for table in tables:
+        TrashHandler.trash(user, workspace, database, table)
+    TrashHandler.trash(user, workspace, database, database)
+    TrashHandler.trash(user, other_workspace, other_database, other_database)
+    TrashHandler.empty(user, workspace.id, None)
+    TrashHandler.empty(user, other_workspace.id, None)
+
+    TrashHandler.permanently_delete_marked_trash(batch_size=2)
+
+    assert TrashEntry.objects.count() == 0
+    assert Table.objects_and_trash.count() == 0
+    assert Application.objects_and_trash.count() == 0
+    for table in tables:
+        assert (
+            table.get_database_table_name()
+            not in connection.introspection.table_names()
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_perm_deleting_marked_trash_skips_workspaces_locked_by_another_transaction(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    locked_workspace = data_fixture.create_workspace(user=user)
+    workspace = data_fixture.create_workspace(user=user)
+    TrashHandler.trash(user, locked_workspace, None, locked_workspace)
+    TrashHandler.trash(user, workspace, None, workspace)
+    TrashEntry.objects.update(should_be_permanently_deleted=True)
+
+    locked = threading.Event()
+    release = threading.Event()
+
+    def lock_workspace():
+        with transaction.atomic():
+            Workspace.objects_and_trash.select_for_update(no_key=True).get(
+                id=locked_workspace.id
+            )
+            locked.set()
+            release.wait(timeout=10)
+        connection.close()
+
+    thread = threading.Thread(target=lock_workspace)
+    thread.start()
+    try:
+        assert locked.wait(timeout=10)
+        TrashHandler.permanently_delete_marked_trash()
+    finally:
+        release.set()
+        thread.join()
+
+    assert list(Workspace.objects_and_trash.values_list("id", flat=True)) == [
+        locked_workspace.id
+    ]
+    assert TrashEntry.objects.filter(workspace=locked_workspace).exists()
+
+    TrashHandler.permanently_delete_marked_trash()
+
+    assert Workspace.objects_and_trash.count() == 0
+    assert TrashEntry.objects.count() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_perm_deleting_marked_trash_processes_applications_of_a_workspace_concurrently(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    databases = [
+        data_fixture.create_database_application(workspace=workspace) for _ in range(3)
+    ]
+    tables = [
+        data_fixture.create_database_table(database=database)
+        for database in databases[:2]
+    ]
+    for table in tables:
+        TrashHandler.trash(user, workspace, table.database, table)
+    TrashHandler.empty(user, workspace.id, databases[0].id)
+    TrashHandler.empty(user, workspace.id, databases[1].id)
+
+    claimed = threading.Event()
+    release = threading.Event()
+    deleted_counts = []
+
+    def delete_batch_in_open_transaction():
+        with transaction.atomic():
+            deleted_counts.append(TrashHandler._permanently_delete_trash_batch(1, {}))
+            claimed.set()
+            release.wait(timeout=10)
+        connection.close()
+
+    thread = threading.Thread(target=delete_batch_in_open_transaction)
+    thread.start()
+    try:
+        assert claimed.wait(timeout=10)
+        # Deleting an application cascades, so it must wait for the transaction
+        # processing another application of the workspace.
+        TrashHandler.trash(user, workspace, databases[2], databases[2])
+        TrashHandler.empty(user, workspace.id, databases[2].id)
+        with transaction.atomic():
+            deleted_counts.append(TrashHandler._permanently_delete_trash_batch(1, {}))
+        with transaction.atomic():
+            assert TrashHandler._permanently_delete_trash_batch(1, {}) is None
+    finally:
+        release.set()
+        thread.join()
+
+    assert deleted_counts == [1, 1]
+    assert Table.objects_and_trash.count() == 0
+    assert Application.objects_and_trash.filter(id=databases[2].id).exists()
+
+    TrashHandler.permanently_delete_marked_trash()
+
+    assert TrashEntry.objects.count() == 0
+    assert not Application.objects_and_trash.filter(id=databases[2].id).exists()
+
+
+@pytest.mark.django_db
+def test_perm_deleting_marked_trash_halves_the_batch_size_if_max_locks_exceeded(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    tables = [data_fixture.create_database_table(database=database) for _ in range(3)]
+    for table in tables:
+        TrashHandler.trash(user, workspace, database, table)
+    TrashHandler.empty(user, workspace.id, database.id)
+
+    permanently_delete_trash_batch = TrashHandler._permanently_delete_trash_batch
+    batch_sizes = []
+
+    def permanently_delete_trash_batch_exceeding_locks(batch_size, *args):
+        batch_sizes.append(batch_size)
+        if batch_size > 1:
+            raise PermanentDeletionMaxLocksExceededException()
+        return permanently_delete_trash_batch(batch_size, *args)
+
+    with patch.object(
+        TrashHandler,
+        "_permanently_delete_trash_batch",
+        side_effect=permanently_delete_trash_batch_exceeding_locks,
+    ):
+        TrashHandler.permanently_delete_marked_trash(batch_size=4)
+
+        assert batch_sizes == [4, 2, 1, 1, 1, 1]
+        assert TrashEntry.objects.count() == 0
+        assert Table.objects_and_trash.count() == 0
+
+        TrashHandler.trash(user, workspace, database, database)
+        TrashHandler.empty(user, workspace.id, database.id)
+        with patch.object(
+            TrashHandler,
+            "try_perm_delete_trash_entry",
+            side_effect=PermanentDeletionMaxLocksExceededException(),
+        ), pytest.raises(PermanentDeletionMaxLocksExceededException):
+            TrashHandler.permanently_delete_marked_trash(batch_size=1)
+    assert TrashEntry.objects.count() == 1
+
+
+@pytest.mark.django_db
+@patch("baserow.core.trash.tasks.permanently_delete_marked_trash.delay")
+def test_schedule_permanent_deletion_of_marked_trash(
+    mock_delay, data_fixture, settings
+):
+    settings.BASEROW_PERMANENT_TRASH_DELETION_CONCURRENCY = 3
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    TrashHandler.trash(user, workspace, None, workspace)
+
+    schedule_permanent_deletion_of_marked_trash()
+    mock_delay.assert_not_called()
+
+    TrashHandler.empty(user, workspace.id, None)
+    schedule_permanent_deletion_of_marked_trash()
+    assert mock_delay.call_count == 3
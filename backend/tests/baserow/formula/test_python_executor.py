@@ -2,9 +2,15 @@ import pytest
 
 from baserow.core.formula.parser.exceptions import (
     BaserowFormulaSyntaxError,
+    FieldByIdReferencesAreDeprecated,
     InvalidNumberOfArguments,
 )
-from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.parser.parser import (
+    clear_parse_tree_cache,
+    get_parse_tree_cache_info,
+    get_parse_tree_for_formula,
+)
+from baserow.core.formula.parser.python_compiler import compile_formula
 from baserow.core.formula.parser.python_executor import BaserowPythonExecutor
 from baserow.core.formula.registries import formula_runtime_function_registry
 from baserow.test_utils.helpers import load_test_cases
@@ -38,6 +44,29 @@ def test_invalid_formulas(test_data):
         BaserowPythonExecutor(formula_runtime_function_registry, context).visit(tree)
 
 
+@pytest.mark.parametrize("test_data", VALID_FORMULA_TESTS)
+def test_compiled_formulas_give_the_same_result(test_data):
+    formula = test_data["formula"]
+    context = test_data["context"]
+
+    compiled = compile_formula(formula, formula_runtime_function_registry)
+    assert compiled(context) == test_data["result"]
+    assert compile_formula(formula, formula_runtime_function_registry) is compiled
+
+
+@pytest.mark.parametrize("test_data", INVALID_FORMULA_TESTS)
+def test_compiled_invalid_formulas_raise_the_same_error(test_data):
+    formula = test_data["formula"]
+    context = test_data["context"]
+
+    with pytest.raises(Exception) as executor_error:
+        tree = get_parse_tree_for_formula(formula)
+        BaserowPythonExecutor(formula_runtime_function_registry, context).visit(tree)
+
+    with pytest.raises(executor_error.type):
+        compile_formula(formula, formula_runtime_function_registry)(context)
+
+
 def test_formula_function_does_not_exist():
     with pytest.raises(BaserowFormulaSyntaxError):
         tree = get_parse_tree_for_formula("notExistingFunction(1,2,3)")
@@ -48,3 +77,42 @@ def test_invalid_number_of_arguments():
     with pytest.raises(InvalidNumberOfArguments):
         tree = get_parse_tree_for_formula("get(1,2)")
         BaserowPythonExecutor(formula_runtime_function_registry, {}).visit(tree)
+
+
+def test_parse_trees_are_cached():
+    clear_parse_tree_cache()
+
+    tree = get_parse_tree_for_formula("concat('a', 'b')")
+    assert get_parse_tree_for_formula("concat('a', 'b')") is tree
+    assert get_parse_tree_for_formula("concat('a', 'c')") is not tree
+
+    cache_info = get_parse_tree_cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 2
+
+    # The same tree can be executed multiple times with different contexts.
+    executor = BaserowPythonExecutor(formula_runtime_function_registry, {})
+    assert executor.visit(tree) == "ab"
+    assert executor.visit(tree) == "ab"
+
+
+def test_formulas_with_syntax_errors_are_not_cached():
+    clear_parse_tree_cache()
+
+    for _ in range(2):
+        with pytest.raises(BaserowFormulaSyntaxError):
+            get_parse_tree_for_formula("concat('a'")
+
+    assert get_parse_tree_cache_info().currsize == 0
+
+
+def test_compiled_formulas_raise_a_new_error_on_every_execution():
+    compiled = compile_formula("field_by_id(1)", formula_runtime_function_registry)
+
+    errors = []
+    for _ in range(2):
+        with pytest.raises(FieldByIdReferencesAreDeprecated) as error:
+            compiled({})
+        errors.append(error.value)
+
+    assert errors[0] is not errors[1]
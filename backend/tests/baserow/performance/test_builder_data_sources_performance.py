@@ -0,0 +1,68 @@
+import time
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+
+import pytest
+
+from baserow.contrib.builder.data_sources.builder_dispatch_context import (
+    BuilderDispatchContext,
+)
+from baserow.contrib.builder.data_sources.handler import DataSourceHandler
+from baserow.core.services.handler import ServiceHandler
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_dispatch_page_data_sources_concurrently_compared_to_sequentially(
+    data_fixture, settings
+):
+    user = data_fixture.create_user()
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+
+    # A dashboard page with six list rows data sources over different tables.
+    data_sources = []
+    for i in range(6):
+        table, _, _ = data_fixture.build_table(
+            user=user,
+            columns=[("Name", "text")],
+            rows=[[f"Row {n}"] for n in range(100)],
+        )
+        data_sources.append(
+            data_fixture.create_builder_local_baserow_list_rows_data_source(
+                user=user, page=page, integration=integration, table=table
+            )
+        )
+
+    original_dispatch_service = ServiceHandler.dispatch_service
+
+    def slow_dispatch_service(self, service, dispatch_context):
+        # Simulates the latency of a more expensive query on a bigger table.
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_sleep(0.05)")
+        return original_dispatch_service(self, service, dispatch_context)
+
+    def dispatch(workers):
+        settings.BASEROW_BUILDER_DATA_SOURCES_DISPATCH_WORKERS = workers
+        start = time.perf_counter()
+        for _ in range(10):
+            result = DataSourceHandler().dispatch_data_sources(
+                data_sources,
+                BuilderDispatchContext(MagicMock(), page, offset=0, count=20),
+            )
+            assert all(len(r["results"]) == 20 for r in result.values())
+        return (time.perf_counter() - start) / 10
+
+    with patch.object(ServiceHandler, "dispatch_service", slow_dispatch_service):
+        sequential = dispatch(1)
+        concurrent = dispatch(6)
+
+    print(f"Sequential dispatch of the page data sources took {sequential:.3f}s")
+    print(f"Concurrent dispatch of the page data sources took {concurrent:.3f}s")
@@ -0,0 +1,57 @@
+import time
+from io import BytesIO
+from unittest.mock import MagicMock
+
+from django.core.paginator import Paginator
+
+import pytest
+
+from baserow.contrib.database.export.file_writer import PaginatedExportJobFileWriter
+from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
+
+
+class OffsetPaginatedExportJobFileWriter(PaginatedExportJobFileWriter):
+    """
+    The previous implementation, using Django's offset based paginator, which is
+    kept here to compare the performance against.
+    """
+
+    def write_rows(self, queryset, write_row):
+        self.last_check = time.perf_counter()
+        paginator = Paginator(queryset.all(), self.CHUNK_SIZE)
+        i = 0
+        for page in paginator.page_range:
+            for row in paginator.page(page).object_list:
+                i = i + 1
+                write_row(row, i == paginator.count)
+                self._check_and_update_job(i, paginator.count)
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_keyset_export_writer_compared_to_offset_paginator(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    data_fixture.create_number_field(table=table)
+    data_fixture.create_boolean_field(table=table)
+    count = 100000
+    fill_table_rows(count, table)
+    queryset = table.get_model().objects.all().enhance_by_fields()
+
+    for writer_class in [
+        OffsetPaginatedExportJobFileWriter,
+        PaginatedExportJobFileWriter,
+    ]:
+        written = []
+        job = MagicMock(is_cancelled_or_expired=MagicMock(return_value=False))
+        writer = writer_class(BytesIO(), job)
+        start = time.perf_counter()
+        writer.write_rows(queryset, lambda row, _: written.append(row.id))
+        duration = time.perf_counter() - start
+
+        assert len(written) == count
+        print(f"{writer_class.__name__}: {count} rows in {duration:.2f}s")
@@ -1,3 +1,4 @@
+import time
 from decimal import Decimal
 
 from django.db import connection
@@ -11,6 +12,10 @@ from rest_framework.status import HTTP_200_OK
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.parser.python_compiler import compile_formula
+from baserow.core.formula.parser.python_executor import BaserowPythonExecutor
+from baserow.core.formula.registries import formula_runtime_function_registry
 from baserow.core.trash.handler import TrashHandler
 from baserow.test_utils.helpers import setup_interesting_test_table
 
@@ -366,3 +371,29 @@ def test_fanout(data_fixture, api_client, django_assert_num_queries):
             )
             print(profiler.output_text(unicode=True, color=True))
     print(results)
+
+
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_compiled_runtime_formula_compared_to_visiting_the_parse_tree():
+    formula = "concat(get('a'), ' - ', add(get('b'), 2), ' ', get('c'), 'x')"
+    contexts = [{"a": f"row {i}", "b": i, "c": "x"} for i in range(10000)]
+    tree = get_parse_tree_for_formula(formula)
+
+    start = time.perf_counter()
+    visited = [
+        BaserowPythonExecutor(formula_runtime_function_registry, context).visit(tree)
+        for context in contexts
+    ]
+    visitor_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = compile_formula(formula, formula_runtime_function_registry)
+    executed = [compiled(context) for context in contexts]
+    compiled_duration = time.perf_counter() - start
+
+    assert executed == visited
+    print(f"Visiting the parse tree: {visitor_duration:.3f}s")
+    print(f"Executing the compiled formula: {compiled_duration:.3f}s")
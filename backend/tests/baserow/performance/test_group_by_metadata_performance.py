@@ -0,0 +1,85 @@
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+from django.db import connection
+
+import pytest
+
+from baserow.contrib.database.views.handler import ViewHandler
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_group_by_metadata_of_filtered_view_with_high_cardinality(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+    date_field = data_fixture.create_date_field(table=table, date_include_time=True)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=boolean_field, type="boolean", value="1"
+    )
+    for field in [text_field, number_field, date_field]:
+        data_fixture.create_view_group_by(view=grid_view, field=field)
+
+    model = table.get_model()
+    model.objects.bulk_create(
+        [
+            model(
+                **{
+                    text_field.db_column: f"Group {i % 5000}",
+                    number_field.db_column: i % 50,
+                    date_field.db_column: datetime(
+                        2024, 1, 1, 0, i % 7, tzinfo=timezone.utc
+                    ),
+                    boolean_field.db_column: i % 3 > 0,
+                }
+            )
+            for i in range(100000)
+        ],
+        batch_size=5000,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {table.get_database_table_name()}")
+
+    handler = ViewHandler()
+    fields = [text_field, number_field, date_field]
+    queryset = handler.get_queryset(grid_view, model=model).order_by(
+        *[field.db_column for field in fields], "id"
+    )
+    repeat = 10
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rows = list(queryset[:100])
+    print(f"{(time.perf_counter() - start) / repeat * 1000:.1f}ms to fetch the page")
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        metadata = {
+            field: list(counts)
+            for field, counts in handler.get_group_by_metadata_in_rows(
+                fields, rows, queryset
+            ).items()
+        }
+    print(
+        f"{(time.perf_counter() - start) / repeat * 1000:.1f}ms to compute the "
+        f"group by metadata of {', '.join(str(len(m)) for m in metadata.values())} "
+        "groups per level"
+    )
+
+    expected_counts = Counter()
+    for row in queryset.values(*[field.db_column for field in fields]):
+        values = tuple(row.values())
+        for level in range(len(fields)):
+            expected_counts[values[: level + 1]] += 1
+    for field, counts in metadata.items():
+        for count in counts:
+            values = tuple(v for k, v in count.items() if k != "count")
+            assert count["count"] == expected_counts[values]
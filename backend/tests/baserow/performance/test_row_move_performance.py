@@ -0,0 +1,57 @@
+import time
+from decimal import Decimal
+
+import pytest
+from pyinstrument import Profiler
+
+from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
+from baserow.contrib.database.rows.handler import RowHandler
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+@pytest.mark.parametrize("count", [10000, 1000000])
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_moving_many_rows_into_crowded_orders_is_fast(data_fixture, count):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, name="Name", primary=True)
+    data_fixture.create_number_field(table=table, name="Number")
+    fill_table_rows(count, table, batch_size=10000)
+
+    model = table.get_model()
+    row_ids = list(model.objects.order_by("id").values_list("id", flat=True))
+    # Crowd the orders of the rows in the middle of the table together, so that
+    # moving rows in between them exhausts the available precision.
+    middle = row_ids[count // 2]
+    model.objects.filter(id__gt=middle, id__lte=middle + 100).update(
+        order=Decimal(middle) + Decimal("0.00000000000000000001")
+    )
+    before_row = model.objects.get(id=middle + 1)
+    rows = list(model.objects.filter(id__in=row_ids[:200]))
+
+    profiler = Profiler()
+    profiler.start()
+    start = time.perf_counter()
+    RowHandler().move_rows(user, table, rows, before_row=before_row, model=model)
+    move_duration = time.perf_counter() - start
+    profiler.stop()
+    # Add -s also the additional args to see the profiling output!
+    print(profiler.output_text(unicode=True, color=True))
+
+    profiler = Profiler()
+    profiler.start()
+    start = time.perf_counter()
+    RowHandler().recalculate_row_orders(table, model=model)
+    recalculate_duration = time.perf_counter() - start
+    profiler.stop()
+    # The full order reset that was needed before the orders were recalculated
+    # locally, for comparison.
+    print(profiler.output_text(unicode=True, color=True))
+
+    print(
+        f"{count} rows: moving {len(rows)} rows took {move_duration:.3f}s, "
+        f"recalculating all row orders took {recalculate_duration:.3f}s."
+    )
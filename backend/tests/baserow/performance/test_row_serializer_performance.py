@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+from baserow.contrib.database.api.rows.serializers import (
+    RowSerializer,
+    get_row_serializer_class,
+    serialize_rows_for_response,
+)
+from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_compiled_row_serializer_compared_to_row_serializer_class(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(table=table, primary=True)
+    linked_table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(table=linked_table, primary=True)
+    fill_table_rows(20, linked_table)
+    for i in range(10):
+        data_fixture.create_text_field(table=table)
+        data_fixture.create_long_text_field(table=table)
+        data_fixture.create_number_field(table=table, number_decimal_places=2)
+        data_fixture.create_boolean_field(table=table)
+        data_fixture.create_date_field(table=table)
+        single_select = data_fixture.create_single_select_field(table=table)
+        multiple_select = data_fixture.create_multiple_select_field(table=table)
+        for select_field in [single_select, multiple_select]:
+            for color in ["red", "blue", "green"]:
+                data_fixture.create_select_option(field=select_field, color=color)
+        data_fixture.create_link_row_field(table=table, link_row_table=linked_table)
+    fill_table_rows(200, table)
+
+    rows = list(table.get_model().objects.all().enhance_by_fields())
+    repeat = 10
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        # A new model is generated for every request.
+        model = table.get_model()
+        serializer_class = get_row_serializer_class(
+            model, RowSerializer, is_response=True
+        )
+        expected = serializer_class(rows, many=True).data
+    serializer_class_duration = (time.perf_counter() - start) / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        model = table.get_model()
+        result = serialize_rows_for_response(rows, model)
+    compiled_duration = (time.perf_counter() - start) / repeat
+
+    assert result == expected
+    print(f"Row serializer class: {serializer_class_duration:.3f}s per page")
+    print(f"Compiled row serializer: {compiled_duration:.3f}s per page")
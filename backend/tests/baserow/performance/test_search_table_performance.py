@@ -0,0 +1,113 @@
+import time
+
+from django.db import connection
+from django.db.models import Value
+
+import pytest
+
+from baserow.contrib.database.management.commands.fill_table_rows import fill_table_rows
+from baserow.contrib.database.search.handler import SearchHandler
+from baserow.contrib.database.table.constants import (
+    ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME,
+)
+
+
+def create_search_benchmark_table(data_fixture, user, search_table_added):
+    table = data_fixture.create_database_table(
+        user=user, search_table_added=search_table_added
+    )
+    data_fixture.create_text_field(table=table, primary=True)
+    for _ in range(10):
+        data_fixture.create_text_field(table=table)
+        data_fixture.create_long_text_field(table=table)
+        data_fixture.create_number_field(table=table)
+        data_fixture.create_email_field(table=table)
+    fill_table_rows(5000, table)
+    return table
+
+
+def get_disk_usage(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_total_relation_size(%s::regclass) "
+            "+ coalesce(pg_total_relation_size(to_regclass(%s)), 0)",
+            [table.get_database_table_name(), table.get_database_search_table_name()],
+        )
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_tsvector_update_columns_compared_to_search_table(data_fixture):
+    user = data_fixture.create_user()
+
+    for search_table_added in [False, True]:
+        table = create_search_benchmark_table(data_fixture, user, search_table_added)
+        model = table.get_model()
+        storage = "Search table" if search_table_added else "Columns"
+
+        start = time.perf_counter()
+        SearchHandler.update_tsvector_columns(
+            table, update_tsvectors_for_changed_rows_only=False
+        )
+        print(f"{storage}: {time.perf_counter() - start:.3f}s to index all rows")
+
+        # The typical background update after a batch of rows has been edited.
+        model.objects.filter(id__lte=1000).update(
+            **{ROW_NEEDS_BACKGROUND_UPDATE_COLUMN_NAME: Value(True)}
+        )
+        start = time.perf_counter()
+        SearchHandler.update_tsvector_columns(
+            table, update_tsvectors_for_changed_rows_only=True
+        )
+        print(
+            f"{storage}: {time.perf_counter() - start:.3f}s to update 1000 changed rows"
+        )
+
+        # The update after the values of a single field have been converted.
+        field = table.field_set.get(primary=True)
+        start = time.perf_counter()
+        SearchHandler.update_tsvector_columns(
+            table,
+            update_tsvectors_for_changed_rows_only=False,
+            field_ids_to_restrict_update_to=[field.id],
+        )
+        print(f"{storage}: {time.perf_counter() - start:.3f}s to update one field")
+        print(f"{storage}: {get_disk_usage(table) / 1024 / 1024:.1f}MB on disk")
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_pg_search_columns_compared_to_search_table(data_fixture):
+    user = data_fixture.create_user()
+    repeat = 20
+
+    for search_table_added in [False, True]:
+        table = create_search_benchmark_table(data_fixture, user, search_table_added)
+        SearchHandler.update_tsvector_columns(
+            table, update_tsvectors_for_changed_rows_only=False
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE "{table.get_database_table_name()}"')
+            if search_table_added:
+                cursor.execute(f'ANALYZE "{table.get_database_search_table_name()}"')
+        model = table.get_model()
+        storage = "Search table" if search_table_added else "Columns"
+
+        for search in ["a", "john", "gmail", "nothing matches this"]:
+            start = time.perf_counter()
+            for _ in range(repeat):
+                queryset = model.objects.all().pg_search(search)
+                count = queryset.count()
+                page = list(queryset.order_by("id")[:100])
+            duration = (time.perf_counter() - start) / repeat
+            print(
+                f"{storage}: {duration * 1000:.1f}ms to count {count} rows and fetch "
+                f"a page of {len(page)} for {search!r}"
+            )
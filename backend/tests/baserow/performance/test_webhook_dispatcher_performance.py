@@ -0,0 +1,60 @@
+import threading
+import time
+
+from django.test import override_settings
+from django.utils import timezone
+
+import pytest
+
+from baserow.contrib.database.webhooks.dispatcher import WebhookDispatcher
+from baserow.contrib.database.webhooks.models import (
+    TableWebhookCall,
+    TableWebhookPendingCall,
+)
+from baserow.contrib.database.webhooks.tasks import call_webhook
+from tests.baserow.contrib.database.webhooks.test_webhook_dispatcher import (
+    WebhookTargetServer,
+    get_call,
+)
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+@override_settings(BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True)
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_batched_webhook_dispatcher_compared_to_call_webhook_tasks(data_fixture):
+    # A target that takes 20ms to respond, called by the 5 webhooks of a table for
+    # 100 events, like a bulk import would do.
+    server = WebhookTargetServer(delay=0.02)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    table = data_fixture.create_database_table()
+    webhooks = [data_fixture.create_table_webhook(table=table) for _ in range(5)]
+    calls = [
+        get_call(webhook, f"{server.url}/ok", event_id=f"{i:032}")
+        for i in range(100)
+        for webhook in webhooks
+    ]
+
+    try:
+        start = time.perf_counter()
+        for call in calls:
+            call_webhook.run(**call)
+        tasks_duration = time.perf_counter() - start
+
+        TableWebhookCall.objects.all().delete()
+        now = timezone.now()
+        TableWebhookPendingCall.objects.bulk_create(
+            [TableWebhookPendingCall(**call, next_attempt_at=now) for call in calls]
+        )
+        start = time.perf_counter()
+        WebhookDispatcher().dispatch_due_calls()
+        dispatcher_duration = time.perf_counter() - start
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(server.requests) == 2 * len(calls)
+    print(f"call_webhook tasks: {tasks_duration:.3f}s for {len(calls)} calls")
+    print(f"Batched dispatcher: {dispatcher_duration:.3f}s for {len(calls)} calls")
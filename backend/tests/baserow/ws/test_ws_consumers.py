@@ -1,6 +1,7 @@
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from channels.layers import get_channel_layer
 from channels.testing import WebsocketCommunicator
 
 from baserow.config.asgi import application
@@ -96,7 +97,14 @@ async def test_core_consumer_connect_authenticated(data_fixture):
     assert response["type"] == "authentication"
     assert response["success"] is True
     assert response["web_socket_id"] is not None
+
+    channel_layer = get_channel_layer()
+    user_group_channels = set(channel_layer.groups[f"user-{user_1.id}"])
+    assert len(user_group_channels) == 1
+    assert user_group_channels.issubset(channel_layer.groups["users"])
+
     await communicator.disconnect()
+    assert f"user-{user_1.id}" not in channel_layer.groups
 
 
 @pytest.mark.asyncio
@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
+from channels.layers import get_channel_layer
 from channels.testing import WebsocketCommunicator
 
 from baserow.config.asgi import application
@@ -507,3 +510,69 @@ async def test_broadcast_to_users_individual_payloads(data_fixture):
 
     await communicator_1.disconnect()
     await communicator_2.disconnect()
+
+
+def test_targeted_broadcasts_are_only_sent_to_the_user_channel_groups():
+    channel_layer = get_channel_layer()
+
+    with patch.object(
+        channel_layer, "group_send", wraps=channel_layer.group_send
+    ) as group_send:
+        broadcast_to_users([1, 2, 2], {"message": "test"}, "web_socket_id")
+    assert sorted(call.args for call in group_send.call_args_list) == [
+        (
+            "user-1",
+            {
+                "type": "broadcast_to_users",
+                "user_ids": [1],
+                "payload": {"message": "test"},
+                "ignore_web_socket_id": "web_socket_id",
+                "send_to_all_users": False,
+            },
+        ),
+        (
+            "user-2",
+            {
+                "type": "broadcast_to_users",
+                "user_ids": [2],
+                "payload": {"message": "test"},
+                "ignore_web_socket_id": "web_socket_id",
+                "send_to_all_users": False,
+            },
+        ),
+    ]
+
+    with patch.object(
+        channel_layer, "group_send", wraps=channel_layer.group_send
+    ) as group_send:
+        broadcast_to_users([1], {"message": "test"}, send_to_all_users=True)
+    assert [call.args[0] for call in group_send.call_args_list] == ["users"]
+
+    with patch.object(
+        channel_layer, "group_send", wraps=channel_layer.group_send
+    ) as group_send:
+        broadcast_to_users_individual_payloads({"1": {"a": 1}, "2": {"b": 2}})
+    assert sorted(call.args for call in group_send.call_args_list) == [
+        (
+            "user-1",
+            {
+                "type": "broadcast_to_users_individual_payloads",
+                "payload_map": {"1": {"a": 1}},
+                "ignore_web_socket_id": None,
+            },
+        ),
+        (
+            "user-2",
+            {
+                "type": "broadcast_to_users_individual_payloads",
+                "payload_map": {"2": {"b": 2}},
+                "ignore_web_socket_id": None,
+            },
+        ),
+    ]
+
+    with patch.object(
+        channel_layer, "group_send", wraps=channel_layer.group_send
+    ) as group_send:
+        force_disconnect_users([3])
+    assert [call.args[0] for call in group_send.call_args_list] == ["user-3"]
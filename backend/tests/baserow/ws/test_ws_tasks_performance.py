@@ -0,0 +1,92 @@
+import time
+
+import pytest
+import redis
+from asgiref.sync import async_to_sync
+from channels.layers import channel_layers, get_channel_layer
+
+from baserow.ws.tasks import broadcast_to_users, send_message_to_channel_group
+from baserow.ws.utils import get_user_channel_group_name
+
+
+def _get_redis_traffic(redis_client):
+    stats = redis_client.info("stats")
+    return (
+        stats["total_commands_processed"],
+        stats["total_net_input_bytes"],
+        stats["total_net_output_bytes"],
+    )
+
+
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args. A Redis server must be available at the `REDIS_URL`.
+def test_targeted_broadcast_redis_channel_layer_traffic(settings):
+    settings.CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "channels_redis.core.RedisChannelLayer",
+            "CONFIG": {"hosts": [settings.REDIS_URL]},
+        }
+    }
+    channel_layers.backends = {}
+    channel_layer = get_channel_layer()
+    redis_client = redis.Redis.from_url(settings.REDIS_URL)
+
+    # 8000 connected web sockets, two for every user.
+    users_count, connections_per_user = 4000, 2
+
+    async def connect_web_sockets():
+        for user_id in range(1, users_count + 1):
+            for _ in range(connections_per_user):
+                channel_name = await channel_layer.new_channel()
+                await channel_layer.group_add("users", channel_name)
+                await channel_layer.group_add(
+                    get_user_channel_group_name(user_id), channel_name
+                )
+        await channel_layer.close_pools()
+
+    async_to_sync(connect_web_sockets)()
+
+    user_ids = [1, 2, 3]
+    payload = {"type": "notification_created", "notification": {"id": 1}}
+
+    try:
+        # Before: the message was sent to the group containing every connection.
+        traffic_before = _get_redis_traffic(redis_client)
+        start = time.perf_counter()
+        async_to_sync(send_message_to_channel_group)(
+            channel_layer,
+            "users",
+            {
+                "type": "broadcast_to_users",
+                "user_ids": user_ids,
+                "payload": payload,
+                "ignore_web_socket_id": None,
+                "send_to_all_users": False,
+            },
+        )
+        duration = time.perf_counter() - start
+        traffic_after = _get_redis_traffic(redis_client)
+        print(
+            f"all users group: {duration * 1000:.1f}ms, "
+            f"{traffic_after[0] - traffic_before[0]} commands, "
+            f"{traffic_after[1] - traffic_before[1]} bytes in, "
+            f"{traffic_after[2] - traffic_before[2]} bytes out"
+        )
+
+        # After: the message is only sent to the channel groups of the users.
+        traffic_before = _get_redis_traffic(redis_client)
+        start = time.perf_counter()
+        broadcast_to_users(user_ids, payload)
+        duration = time.perf_counter() - start
+        traffic_after = _get_redis_traffic(redis_client)
+        print(
+            f"user groups: {duration * 1000:.1f}ms, "
+            f"{traffic_after[0] - traffic_before[0]} commands, "
+            f"{traffic_after[1] - traffic_before[1]} bytes in, "
+            f"{traffic_after[2] - traffic_before[2]} bytes out"
+        )
+    finally:
+        async_to_sync(channel_layer.flush)()
+        channel_layers.backends = {}
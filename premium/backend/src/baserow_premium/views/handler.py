@@ -1,9 +1,22 @@
+import operator
 from collections import defaultdict
 from datetime import date, datetime
+from functools import reduce
 from typing import Dict, List, Optional, Tuple, Union
 from zoneinfo import ZoneInfo
 
-from django.db.models import Count, Q, QuerySet
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    Q,
+    QuerySet,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import RowNumber, TruncDate
 from django.utils import timezone
 from django.utils.timezone import utc
 
@@ -83,10 +96,9 @@ def get_rows_grouped_by_single_select_field(
     else:
         base_option_queryset = ViewHandler().apply_filters(view, base_queryset)
 
-    all_filters = Q()
-    count_aggregates = {}
     all_options = list(single_select_field.select_options.all())
     all_option_ids = [option.id for option in all_options]
+    option_field_name = f"field_{single_select_field.id}_id"
 
     def get_id_and_string(option):
         return (
@@ -94,6 +106,10 @@ def get_rows_grouped_by_single_select_field(
             str(option.id) if option else "null",
         )
 
+    # The rows that don't have one of the select options of the field are grouped
+    # into the `null` option.
+    option_filters = {}
+    option_slices = {}
     for select_option in [None] + all_options:
         option_id, option_string = get_id_and_string(select_option)
 
@@ -105,44 +121,81 @@ def get_rows_grouped_by_single_select_field(
         option_setting = option_settings.get(option_string, {})
         limit = option_setting.get("limit", default_limit)
         offset = option_setting.get("offset", default_offset)
-
-        if option_id is None:
-            # Somehow the `Count` aggregate doesn't support an empty `__in` lookup.
-            # That's why we always add the `-1` value that never exists to make sure
-            # there is always a value in there.
-            filters = ~Q(
-                **{f"field_{single_select_field.id}_id__in": all_option_ids + [-1]}
+        option_slices[option_string] = (offset, limit)
+        option_filters[option_string] = Q(
+            **(
+                {"kanban_option__isnull": True}
+                if option_id is None
+                else {"kanban_option": option_id}
             )
-        else:
-            filters = Q(**{f"field_{single_select_field.id}_id": option_id})
-
-        # We don't want to execute a single query for each select option,
-        # so we create a subquery that finds the ids of the rows related to the
-        # option group. After the single query has been executed we can group the rows.
-        sub_queryset = base_option_queryset.filter(filters).values_list(
-            "id", flat=True
-        )[offset : offset + limit]
-        all_filters |= Q(id__in=sub_queryset)
-
-        # Same goes for fetching the total count. We will construct a single query,
-        # that calculates to total amount of rows per option.
-        count_aggregates[option_string] = Count(
-            "pk",
-            filter=filters,
         )
 
-    queryset = list(base_queryset.filter(all_filters))
-    counts = base_option_queryset.aggregate(**count_aggregates)
+    if len(option_slices) == 0:
+        return defaultdict(lambda: {"count": 0, "results": []})
+
+    queryset = base_option_queryset.annotate(
+        kanban_option=Case(
+            When(
+                **{f"{option_field_name}__in": all_option_ids},
+                then=F(option_field_name),
+            ),
+            default=Value(None),
+            output_field=IntegerField(),
+        )
+    )
+    if len(option_slices) < len(all_options) + 1:
+        queryset = queryset.filter(reduce(operator.or_, option_filters.values(), Q()))
+
+    def get_slice_expression(get_value):
+        default = get_value(default_offset, default_limit)
+        return Case(
+            *[
+                When(option_filters[option_string], then=Value(value))
+                for option_string, value in (
+                    (option_string, get_value(*option_slice))
+                    for option_string, option_slice in option_slices.items()
+                )
+                if value != default
+            ],
+            default=Value(default),
+            output_field=IntegerField(),
+        )
+
+    # The rows of every option are numbered in the order of the queryset, so that
+    # the slice of each option, and the total count per option, can be fetched in a
+    # single query. The first row of every option is always included because it
+    # carries the count of options of which the slice is empty.
+    order_by = base_queryset.query.order_by or model._meta.ordering
+    partition_by = F("kanban_option")
+    queryset = queryset.annotate(
+        # The end of the slice is annotated separately because Django fails to
+        # filter on an expression combining annotations next to window functions.
+        kanban_option_start=get_slice_expression(lambda offset, limit: offset),
+        kanban_option_end=get_slice_expression(lambda offset, limit: offset + limit),
+        kanban_option_row_number=Window(
+            RowNumber(), partition_by=partition_by, order_by=order_by
+        ),
+        kanban_option_count=Window(Count("id"), partition_by=partition_by),
+    ).filter(
+        Q(kanban_option_row_number=1)
+        | Q(
+            kanban_option_row_number__gt=F("kanban_option_start"),
+            kanban_option_row_number__lte=F("kanban_option_end"),
+        )
+    )
 
     rows = defaultdict(lambda: {"count": 0, "results": []})
 
-    for row in queryset:
-        option_id = getattr(row, f"field_{single_select_field.id}_id")
-        option_string = str(option_id) if option_id in all_option_ids else "null"
-        rows[option_string]["results"].append(row)
+    # The requested options without any rows must be returned with a zero count.
+    for option_string in option_slices.keys():
+        rows[option_string]["count"] = 0
 
-    for key, value in counts.items():
-        rows[key]["count"] = value
+    for row in queryset:
+        option_string = "null" if row.kanban_option is None else str(row.kanban_option)
+        offset, limit = option_slices[option_string]
+        rows[option_string]["count"] = row.kanban_option_count
+        if offset < row.kanban_option_row_number <= offset + limit:
+            rows[option_string]["results"].append(row)
 
     return rows
 
@@ -202,8 +255,7 @@ def get_rows_grouped_by_date_field(
     if search is not None:
         base_queryset = base_queryset.search_all_fields(search, search_mode=search_mode)
     base_option_queryset = ViewHandler().apply_filters(view, base_queryset)
-    all_filters = Q()
-    count_aggregates = {}
+    date_field_name = f"field_{date_field.id}"
 
     # Target timezone is the timezone that will be used
     # for aggregation of the results into date buckets
@@ -213,6 +265,15 @@ def get_rows_grouped_by_date_field(
         target_timezone_info = ZoneInfo(target_timezone) if target_timezone else None
         from_timestamp = from_timestamp.astimezone(tz=target_timezone_info)
         to_timestamp = to_timestamp.astimezone(tz=target_timezone_info)
+        # The day of a row is the date of its value in the target timezone, which
+        # matches the per day intervals that start at midnight in that timezone.
+        # Without a target timezone, the local timezone of the server is used,
+        # which can only be passed to the database as an offset.
+        day_expression = TruncDate(
+            date_field_name,
+            tzinfo=target_timezone_info
+            or timezone.get_fixed_timezone(from_timestamp.utcoffset()),
+        )
     else:
         # If our field is just representing dates, then it makes no sense to split it
         # by timezone as a date on its own cannot have a timezone.
@@ -223,33 +284,44 @@ def get_rows_grouped_by_date_field(
         # date < 2023-01-01 so we add one to make sure to include those.
         to_timestamp = (to_timestamp + timezone.timedelta(days=1)).date()
         from_timestamp = from_timestamp.date()
+        day_expression = F(date_field_name)
 
-    for start, end in generate_per_day_intervals(from_timestamp, to_timestamp):
-        date_filters = Q(
-            **{
-                f"field_{date_field.id}__gte": start,
-                f"field_{date_field.id}__lt": end,
-            }
-        )
-
-        sub_queryset = base_option_queryset.filter(date_filters).values_list(
-            "id", flat=True
-        )[offset : offset + limit]
-        all_filters |= Q(id__in=sub_queryset)
-
-        start_date = start.date() if isinstance(start, datetime) else start
-        count_aggregates[str(start_date)] = Count(
-            "pk",
-            filter=date_filters,
+    range_queryset = base_option_queryset.filter(
+        **{
+            f"{date_field_name}__gte": from_timestamp,
+            f"{date_field_name}__lt": to_timestamp,
+        }
+    ).annotate(calendar_day=day_expression)
+
+    # The first rows of every day are selected in one query by numbering the rows
+    # per day in the order of the queryset.
+    order_by = base_queryset.query.order_by or model._meta.ordering
+    queryset = list(
+        range_queryset.annotate(
+            calendar_day_row_number=Window(
+                RowNumber(), partition_by=F("calendar_day"), order_by=order_by
+            )
+        ).filter(
+            calendar_day_row_number__gt=offset,
+            calendar_day_row_number__lte=offset + limit,
         )
-
-    queryset = list(base_queryset.filter(all_filters))
-    counts = base_option_queryset.aggregate(**count_aggregates)
+    )
+    counts = {
+        str(start.date() if isinstance(start, datetime) else start): 0
+        for start, _ in generate_per_day_intervals(from_timestamp, to_timestamp)
+    }
+    counts.update(
+        (str(day), count)
+        for day, count in range_queryset.order_by()
+        .values("calendar_day")
+        .annotate(count=Count("id"))
+        .values_list("calendar_day", "count")
+    )
 
     rows = defaultdict(lambda: {"count": 0, "results": []})
 
     for row in queryset:
-        date_field_value = getattr(row, f"field_{date_field.id}")
+        date_field_value = getattr(row, date_field_name)
         if isinstance(date_field_value, date):
             date_value = str(date_field_value)
         if isinstance(date_field_value, datetime):
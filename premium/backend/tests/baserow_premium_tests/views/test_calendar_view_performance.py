@@ -0,0 +1,64 @@
+import time
+from datetime import datetime, timezone
+
+from django.db import connection
+
+import pytest
+from baserow_premium.views.handler import get_rows_grouped_by_date_field
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+@pytest.mark.view_calendar
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_get_rows_grouped_by_date_field_of_month_on_large_table(
+    premium_data_fixture,
+):
+    table = premium_data_fixture.create_database_table()
+    date_field = premium_data_fixture.create_date_field(
+        table=table, date_include_time=True
+    )
+    calendar_view = premium_data_fixture.create_calendar_view(
+        table=table, date_field=date_field
+    )
+    table_name = table.get_database_table_name()
+    with connection.cursor() as cursor:
+        # One million rows spread over a year, so that a month contains about 85k.
+        cursor.execute(
+            f"""
+            INSERT INTO {table_name} (
+                "order", created_on, updated_on, trashed, needs_background_update,
+                {date_field.db_column}
+            )
+            SELECT
+                i, now(), now(), false, false,
+                timestamptz '2023-01-01 00:00+00' + (i * 31.536) * interval '1 second'
+            FROM generate_series(1, 1000000) AS i
+            """
+        )
+        cursor.execute(f"CREATE INDEX ON {table_name} ({date_field.db_column})")
+        cursor.execute(f"ANALYZE {table_name}")
+
+    model = table.get_model()
+    repeat = 5
+    for user_timezone in ["UTC", "Europe/Amsterdam", "Pacific/Auckland"]:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            grouped_rows = get_rows_grouped_by_date_field(
+                calendar_view,
+                date_field,
+                # A month view also shows the surrounding weeks.
+                from_timestamp=datetime(2023, 2, 27, tzinfo=timezone.utc),
+                to_timestamp=datetime(2023, 4, 10, tzinfo=timezone.utc),
+                user_timezone=user_timezone,
+                limit=3,
+                model=model,
+            )
+        duration = (time.perf_counter() - start) / repeat
+        print(
+            f"{user_timezone}: {duration * 1000:.1f}ms to fetch "
+            f"{len(grouped_rows)} days with "
+            f"{sum(day['count'] for day in grouped_rows.values())} rows"
+        )
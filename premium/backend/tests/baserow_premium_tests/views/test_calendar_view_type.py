@@ -658,6 +658,54 @@ def test_calendar_timezone_test_cases(
     assert dict(grouped_rows) == test_case["expected_result"]
 
 
+@pytest.mark.django_db
+@pytest.mark.view_calendar
+def test_get_rows_grouped_by_date_field_limit_offset_per_day(
+    premium_data_fixture, django_assert_num_queries
+):
+    table = premium_data_fixture.create_database_table()
+    date_field = premium_data_fixture.create_date_field(
+        table=table, date_include_time=True
+    )
+    calendar_view = premium_data_fixture.create_calendar_view(
+        table=table, date_field=date_field
+    )
+    model = table.get_model()
+    rows = {
+        day: [
+            model.objects.create(
+                **{
+                    date_field.db_column: datetime(
+                        2023, 1, day, hour, tzinfo=timezone.utc
+                    )
+                }
+            )
+            for hour in [20, 10, 15]
+        ]
+        for day in [1, 2]
+    }
+
+    # Two queries to fetch the view filters, one for the rows of all days and one for
+    # the counts of all days.
+    with django_assert_num_queries(4):
+        grouped_rows = get_rows_grouped_by_date_field(
+            calendar_view,
+            date_field,
+            from_timestamp=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            to_timestamp=datetime(2023, 1, 4, tzinfo=timezone.utc),
+            user_timezone="UTC",
+            limit=1,
+            offset=1,
+            model=model,
+        )
+
+    assert dict(grouped_rows) == {
+        "2023-01-01": {"count": 3, "results": [rows[1][2]]},
+        "2023-01-02": {"count": 3, "results": [rows[2][2]]},
+        "2023-01-03": {"count": 0, "results": []},
+    }
+
+
 @pytest.mark.view_calendar
 def test_to_midnight():
     assert to_midnight(datetime(2023, 1, 9, 23, 0, 0, 0)) == datetime(
@@ -0,0 +1,71 @@
+import time
+
+from django.db import connection
+
+import pytest
+from baserow_premium.views.handler import get_rows_grouped_by_single_select_field
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_get_rows_grouped_by_single_select_field_with_many_options(
+    premium_data_fixture,
+):
+    table = premium_data_fixture.create_database_table()
+    premium_data_fixture.create_text_field(table=table, primary=True)
+    single_select_field = premium_data_fixture.create_single_select_field(table=table)
+    options = [
+        premium_data_fixture.create_select_option(
+            field=single_select_field, value=f"Option {i}", order=i
+        )
+        for i in range(80)
+    ]
+    kanban_view = premium_data_fixture.create_kanban_view(
+        table=table, single_select_field=single_select_field
+    )
+    table_name = table.get_database_table_name()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table_name} (
+                "order", created_on, updated_on, trashed, needs_background_update,
+                {single_select_field.db_column}
+            )
+            SELECT
+                i, now(), now(), false, false,
+                (%s::int[])[1 + i %% (array_length(%s::int[], 1) + 1)]
+            FROM generate_series(1, 200000) AS i
+            """,
+            [[option.id for option in options]] * 2,
+        )
+        cursor.execute(f"ANALYZE {table_name}")
+
+    model = table.get_model()
+    repeat = 5
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rows = get_rows_grouped_by_single_select_field(
+            kanban_view, single_select_field, model=model
+        )
+    print(
+        f"{(time.perf_counter() - start) / repeat * 1000:.1f}ms to fetch the first "
+        f"rows of {len(rows)} columns"
+    )
+
+    # Loading more rows of a single column.
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rows = get_rows_grouped_by_single_select_field(
+            kanban_view,
+            single_select_field,
+            option_settings={str(options[0].id): {"limit": 20, "offset": 1000}},
+            model=model,
+        )
+    print(
+        f"{(time.perf_counter() - start) / repeat * 1000:.1f}ms to fetch "
+        f"{len(rows[str(options[0].id)]['results'])} more rows of one column"
+    )
@@ -66,7 +66,7 @@ def test_get_rows_grouped_by_single_select_field(
     )
 
     # The amount of queries including
-    with django_assert_num_queries(6):
+    with django_assert_num_queries(5):
         rows = get_rows_grouped_by_single_select_field(
             view, single_select_field, model=model
         )